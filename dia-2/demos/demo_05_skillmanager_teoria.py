@@ -17,11 +17,23 @@ Visión: El SkillManager permite crear agentes que pueden:
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from instantneo import InstantNeo
 from instantneo.skills import skill, SkillManager
 from instantneo.skills.skill_manager_operations import SkillManagerOperations
 
+# skills_infra vive en dia-2/ejercicios
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[1] / "ejercicios")
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
+
+from skills_infra.indice_tags import SkillManagerConTags
+from skills_infra.metricas import SkillManagerConMetricas
+from skills_infra.skill_rapida import skill_rapida
+from skills_infra.vistas_skills import OperacionesVista
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -412,6 +424,7 @@ def parte_5_operaciones_conjunto():
     - intersection(): Skills comunes
     - difference(): Skills únicos de un manager
     - symmetric_difference(): Skills únicos de cada manager
+    - OperacionesVista: las mismas operaciones como vistas, sin copiar skills
     """
     print("\n" + "="*70)
     print("PARTE 5: OPERACIONES DE CONJUNTO")
@@ -475,6 +488,23 @@ def parte_5_operaciones_conjunto():
     print(f"Diferencia simétrica (A Δ B) - Skills no compartidos:")
     print(f"  {sm_sym_diff.get_skill_names()}")
 
+    # 5.5 - Vistas con copia al escribir
+    print("\n" + "-"*70)
+    print("5.5 - OperacionesVista: operaciones sin copiar el registry")
+    print("-"*70)
+
+    vista = OperacionesVista.difference(
+        OperacionesVista.union(sm_matematicas, sm_conversiones), sm_interseccion
+    )
+    print(f"(A ∪ B) - (A ∩ B) como vista:")
+    print(f"  {vista.get_skill_names()}")
+    print(f"  ¿Materializada? {vista.materializada} (lee los registries de A y B)")
+
+    vista.remove_skill("obtener_resumen_texto")
+    print(f"Después de quitar 'obtener_resumen_texto' de la vista:")
+    print(f"  Vista: {vista.get_skill_names()} (materializada: {vista.materializada})")
+    print(f"  B sigue igual: {sm_conversiones.get_skill_names()}")
+
 
 # ============================================================================
 # PARTE 6: EJEMPLO PRÁCTICO COMPLETO
@@ -675,13 +705,19 @@ def parte_4_5_filtrado_avanzado():
     print("   Nota: Retorna todas menos 'capitalizar'")
 
     print("\n4. Filtrar skills de geometría 2D (con tags 'geometry' Y '2d'):")
-    print("   Para AND lógico, filtra manualmente:")
+    print("   Para AND lógico, filtra manualmente con los tags de cada skill:")
     geo_skills = sm.get_skills_by_tag("geometry")
-    skills_2d = [name for name in geo_skills if "2d" in sm.get_all_skills_metadata()]
+    skills_2d = [name for name in geo_skills if "2d" in sm.get_skill_metadata_by_name(name)["tags"]]
     print(f"   Geometría 2D: {skills_2d}")
     print("   Nota: Solo 'area_circulo' tiene ambos tags")
 
-    print("\n5. Obtener skill específica por nombre:")
+    print("\n5. Expresiones de tags con SkillManagerConTags (índice de bitsets):")
+    sm_tags = SkillManagerConTags(skills=[area_circulo, volumen_esfera, resolver_ecuacion, capitalizar])
+    for expresion in ["geometry and 2d", "math and not geometry", "(algebra or text) and not formatting"]:
+        print(f"   {expresion!r}: {sm_tags.filtrar_por_tags(expresion)}")
+    print("   Nota: el índice se actualiza al registrar o quitar skills y no recorre el registry")
+
+    print("\n6. Obtener skill específica por nombre:")
     skill_especifica = sm.get_skill_by_name("resolver_ecuacion")
     print(f"   Skill: {skill_especifica.__name__}")
     # print(f"   Metadata: tags={skill_especifica.metadata.get('tags', [])}")
@@ -704,6 +740,8 @@ def parte_7_tracking_ejecucion():
 
     Cada skill decorada trackea automáticamente su última ejecución.
     Usa contextvars para ser thread-safe.
+    SkillManagerConMetricas acumula además llamadas, errores y latencias;
+    skill_rapida quita el tracking de las skills que se llaman en lote.
     """
     separador("PARTE 7: TRACKING DE EJECUCIÓN")
 
@@ -743,6 +781,34 @@ def parte_7_tracking_ejecucion():
     print(f"     exception: {last_call['exception']}")
     print(f"     result: {last_call['result']}")
 
+    print("\n7.3 - Métricas de todas las llamadas (SkillManagerConMetricas):")
+    sm = SkillManagerConMetricas()
+    sm.register_skill(calcular_impuesto)
+    sm.register_skill(dividir)
+    for monto in (100, 250, 400):
+        sm.get_skill_by_name("calcular_impuesto")(monto, 0.16)
+    for b in (2, 0):
+        try:
+            sm.get_skill_by_name("dividir")(10, b)
+        except ValueError:
+            pass
+    for metricas in sm.metricas.copias():
+        print(f"   {metricas.nombre}: {metricas.llamadas} llamadas, errores {metricas.errores},"
+              f" p99 <= {metricas.percentil(0.99) * 1e6:.0f}us")
+    print("   sm.metricas.exportar_prometheus() y sm.metricas.snapshot_json() las exportan")
+
+    print("\n7.4 - Skills sin tracking para llamadas en lote (skill_rapida):")
+
+    @skill_rapida(description="Convierte Celsius a Fahrenheit")
+    def celsius_a_fahrenheit(celsius: float) -> float:
+        return celsius * 9 / 5 + 32
+
+    print(f"   celsius_a_fahrenheit(36.6) = {celsius_a_fahrenheit(36.6):.2f}")
+    print(f"   get_last_call(): {celsius_a_fahrenheit.get_last_call()}  (sin contextvar por llamada)")
+    print(f"   metadata: track={celsius_a_fahrenheit.skill_metadata['track']},"
+          f" sample_rate={celsius_a_fahrenheit.skill_metadata['sample_rate']}")
+    print("   sample_rate=0.01 trackea 1 de cada 100 llamadas; track=True es igual que @skill")
+
     print("\n💡 CASOS DE USO:")
     print("   - Debugging: Ver qué parámetros causaron un error")
     print("   - Logging: Registrar historial de ejecuciones")
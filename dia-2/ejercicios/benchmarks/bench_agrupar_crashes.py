@@ -0,0 +1,105 @@
+"""
+Benchmark: diagnosticar cada crash vs. agrupar por firma
+========================================================
+
+Genera los crashes de una release (pocos bugs distintos, cada uno con miles de
+ocurrencias que varían en números de línea y sufijos de lambdas) y compara
+llamar a ``analizar_crash_log`` una vez por reporte contra ``agrupar_crashes``,
+que diagnostica un solo representante por bucket. También compara el tamaño de
+la respuesta, que es lo que termina en el contexto del agente.
+
+Por último escribe los reportes a disco (un archivo por crash) y mide
+``registrar_crashes``: la primera pasada, otra sin cambios y otra con un 5% de
+reportes nuevos, como en sesiones de triage sucesivas.
+
+Uso:
+    python benchmarks/bench_agrupar_crashes.py [cantidad_de_reportes]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from mobile.analizar_crash import agrupar_crashes, analizar_crash_log, consultar_crashes, registrar_crashes
+
+REPORTES_POR_DEFECTO = 5000
+BUGS = 25
+
+EXCEPCIONES = (
+    "java.lang.NullPointerException", "java.lang.IllegalStateException",
+    "java.lang.IndexOutOfBoundsException", "java.lang.ClassCastException",
+)
+
+
+def generar_reportes(cantidad: int) -> list:
+    azar = random.Random(42)
+    bugs = [(EXCEPCIONES[b % len(EXCEPCIONES)], f"Pantalla{b}") for b in range(BUGS)]
+    reportes = []
+    for i in range(cantidad):
+        # Unos pocos bugs concentran la mayoría de los crashes
+        excepcion, pantalla = bugs[min(int(azar.expovariate(0.25)), BUGS - 1)]
+        lineas = [f"{excepcion}: detalle {i}"]
+        lineas += [
+            f"    at com.miapp.ui.{pantalla}$1.lambda$onClick${azar.randint(0, 3)}({pantalla}.java:{azar.randint(40, 60)})",
+            f"    at com.miapp.ui.{pantalla}.cargar({pantalla}.java:{azar.randint(100, 120)})",
+        ]
+        lineas += [f"    at android.os.Handler.dispatchMessage(Handler.java:{n})" for n in range(30)]
+        reportes.append({"stack_trace": "\n".join(lineas), "momento": 1_700_000_000 + i, "id": f"crash-{i}"})
+    return reportes
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else REPORTES_POR_DEFECTO
+    reportes = generar_reportes(cantidad)
+    print(f"{cantidad} reportes de crash de {BUGS} bugs\n")
+
+    inicio = time.perf_counter()
+    uno_por_uno = [analizar_crash_log(r["stack_trace"]) for r in reportes]
+    t_uno_por_uno = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    agrupado = agrupar_crashes(reportes, max_buckets=BUGS)
+    t_agrupado = time.perf_counter() - inicio
+
+    tamano_uno_por_uno = len(json.dumps(uno_por_uno, ensure_ascii=False))
+    tamano_agrupado = len(json.dumps(agrupado, ensure_ascii=False))
+    print(f"{'modo':<22} {'tiempo':>9} {'respuesta':>12}")
+    print(f"{'analizar_crash_log':<22} {t_uno_por_uno:>8.2f}s {tamano_uno_por_uno / 1e3:>10.0f}KB")
+    print(f"{'agrupar_crashes':<22} {t_agrupado:>8.2f}s {tamano_agrupado / 1e3:>10.0f}KB")
+    print(f"\n{agrupado['total_buckets']} buckets; el mayor tiene {agrupado['buckets'][0]['cantidad']} crashes")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        crashes = os.path.join(directorio, "crashes")
+        os.makedirs(crashes)
+        ruta_almacen = os.path.join(directorio, "crashes.sqlite")
+
+        def escribir(desde, hasta):
+            for i in range(desde, hasta):
+                with open(os.path.join(crashes, f"crash{i}.txt"), "w", encoding="utf-8") as f:
+                    f.write(f"App version: 4.{i * 3 // cantidad}.0\n" + reportes[i % cantidad]["stack_trace"])
+
+        escribir(0, cantidad)
+        print(f"\n{'registrar_crashes':<22} {'tiempo':>9} {'nuevos':>8}")
+        for etapa in ("primera pasada", "sin cambios", "5% nuevos"):
+            if etapa == "5% nuevos":
+                escribir(cantidad, cantidad + cantidad // 20)
+            inicio = time.perf_counter()
+            resultado = registrar_crashes(crashes, ruta_almacen=ruta_almacen)
+            print(f"{etapa:<22} {time.perf_counter() - inicio:>8.2f}s {resultado['nuevos']:>8}")
+
+        inicio = time.perf_counter()
+        consulta = consultar_crashes("4.2.0", solo_nuevos=True, ruta_almacen=ruta_almacen)
+        print(f"{'consultar_crashes':<22} {time.perf_counter() - inicio:>8.2f}s"
+              f"   ({consulta['total_buckets']} buckets nuevos en 4.2.0)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: auditoría de sitio completo en un proceso vs. pool de procesos
+========================================================================
+
+Genera un build estático de ejemplo (páginas HTML y bundles JavaScript) y lo
+audita con ``auditar_sitio_web`` usando 1 proceso y luego todos los CPUs
+(en una máquina de un solo CPU corre una vez).
+Equivale a llamar validar_html, analizar_seo_html y analizar_codigo_javascript
+archivo por archivo, pero en una sola llamada de skill.
+
+Después mide el cache por contenido: una auditoría en frío, otra sin cambios y
+otra tras modificar el 5% de los archivos (como entre dos deploys).
+
+Uso:
+    python benchmarks/bench_auditoria_sitio.py [cantidad_de_archivos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from webapp.auditoria_sitio import auditar_sitio_web
+
+ARCHIVOS_POR_DEFECTO = 500
+
+PAGINA = (
+    "<html><head><title>Producto {n} - Tienda de ejemplo con envío gratis</title>"
+    "<meta name='description' content='Descripción del producto {n} con detalles, medidas y opiniones de clientes.'>"
+    "</head><body><h1>Producto {n}</h1>" + "<div class='item'><h2>Detalle</h2><p>Texto <b>largo</b> "
+    "<img src='foto.png'><a href='/comprar'>Comprar</a></p></div>" * 150 + "</body></html>"
+)
+
+BUNDLE = (
+    'function n(e,t){{var r="{n}";try{{if(e==t)return/x/g.test(r)}}catch(o){{}}return e/t}}'
+    'var s=function(e){{return t.map(function(n){{return n.id===e?n:null}})}};' * 400
+)
+
+
+def generar_sitio(directorio: str, cantidad: int) -> None:
+    for n in range(cantidad):
+        carpeta = os.path.join(directorio, f"seccion{n % 20}")
+        os.makedirs(carpeta, exist_ok=True)
+        if n % 4 == 3:
+            with open(os.path.join(carpeta, f"app{n}.js"), "w", encoding="utf-8") as f:
+                f.write(BUNDLE.format(n=n))
+        else:
+            with open(os.path.join(carpeta, f"pagina{n}.html"), "w", encoding="utf-8") as f:
+                f.write(PAGINA.format(n=n))
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVOS_POR_DEFECTO
+    with tempfile.TemporaryDirectory() as directorio:
+        generar_sitio(directorio, cantidad)
+        tamano_mb = sum(f.stat().st_size for f in Path(directorio).rglob("*") if f.is_file()) / 1e6
+        print(f"Sitio de {cantidad} archivos ({tamano_mb:.1f} MB)\n")
+
+        print(f"{'procesos':>8} {'tiempo':>10} {'archivos/s':>11} {'media':>6}")
+        base = None
+        for procesos in sorted({1, os.cpu_count() or 1}):
+            inicio = time.perf_counter()
+            reporte = auditar_sitio_web(directorio, procesos=procesos, usar_cache=False)
+            segundos = time.perf_counter() - inicio
+            base = base or segundos
+            print(f"{procesos:>8} {segundos:>9.2f}s {cantidad / segundos:>11.0f} {reporte['puntuacion_media']:>6}"
+                  f"   ({base / segundos:.1f}x)")
+
+        print(f"\nReglas más frecuentes: {[r['regla'] for r in reporte['reglas'][:3]]}")
+
+        ruta_cache = os.path.join(directorio, ".cache", "resultados.sqlite")
+        print(f"\n{'cache':>16} {'tiempo':>10} {'analizados':>11}")
+        for etapa in ("en frío", "sin cambios", "5% modificado"):
+            if etapa == "5% modificado":
+                for ruta in sorted(Path(directorio).rglob("*.html"))[::20]:
+                    with open(ruta, "a", encoding="utf-8") as f:
+                        f.write("<!-- deploy -->")
+            inicio = time.perf_counter()
+            reporte = auditar_sitio_web(directorio, ruta_cache=ruta_cache)
+            segundos = time.perf_counter() - inicio
+            print(f"{etapa:>16} {segundos:>9.2f}s {reporte['analizados']:>11}")
+
+
+if __name__ == "__main__":
+    main()
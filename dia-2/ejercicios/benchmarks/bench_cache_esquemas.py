@@ -0,0 +1,99 @@
+"""
+Benchmark: from_folder() vs. cache de esquemas
+==============================================
+
+Genera carpetas de 10, 100 y 1000 skills (diez por archivo, con type hints y
+docstrings como las de ``skills_biblioteca``) y mide en un intérprete nuevo
+cuánto tarda registrarlas:
+
+- ``load_skills.from_folder()``: importa cada módulo y ``@skill`` inspecciona
+  cada función;
+- ``CacheEsquemas`` vacío: lo mismo, más guardar la metadata;
+- ``CacheEsquemas`` con la carpeta sin cambios: registra proxies con la
+  metadata guardada, sin importar ni inspeccionar nada.
+
+Uso:
+    python benchmarks/bench_cache_esquemas.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+
+SKILLS_POR_ARCHIVO = 10
+REPETICIONES = 5
+
+PLANTILLA_SKILL = '''
+@skill(tags=["bench", "grupo{archivo}"])
+def skill_{archivo}_{numero}(numeros: List[float], factor: float = 1.0, etiqueta: Optional[str] = None) -> Dict[str, float]:
+    """
+    Escala y resume una lista de números (skill sintética {numero} del archivo {archivo}).
+
+    Args:
+        numeros: Valores a resumir
+        factor: Multiplicador aplicado a cada valor
+        etiqueta: Nombre opcional para el resultado
+
+    Returns:
+        Suma, mínimo y máximo de los valores escalados
+    """
+    escalados = [n * factor for n in numeros]
+    return {{"suma": sum(escalados), "minimo": min(escalados), "maximo": max(escalados)}}
+'''
+
+MEDIR = """
+import sys, time
+sys.path.insert(0, {ejercicios!r})
+from instantneo.skills import SkillManager
+manager = SkillManager()
+inicio = time.perf_counter()
+if {con_cache}:
+    from skills_infra.cache_esquemas import CacheEsquemas
+    with CacheEsquemas({cache!r}) as cache:
+        cache.cargar_carpeta(manager, {carpeta!r})
+else:
+    manager.load_skills.from_folder({carpeta!r})
+print(time.perf_counter() - inicio, len(manager.get_skill_names()))
+"""
+
+
+def generar_carpeta(carpeta: str, cantidad: int) -> None:
+    os.makedirs(carpeta)
+    for archivo in range(cantidad // SKILLS_POR_ARCHIVO):
+        with open(os.path.join(carpeta, f"skills_{archivo:03d}.py"), "w", encoding="utf-8") as salida:
+            salida.write("from typing import Dict, List, Optional\n\nfrom instantneo.skills import skill\n")
+            for numero in range(SKILLS_POR_ARCHIVO):
+                salida.write(PLANTILLA_SKILL.format(archivo=archivo, numero=numero))
+
+
+def medir(carpeta: str, con_cache: bool = False, cache: str = "", repeticiones: int = REPETICIONES) -> float:
+    """Mediana en milisegundos, en intérpretes nuevos."""
+    codigo = MEDIR.format(ejercicios=str(RUTA_EJERCICIOS), con_cache=con_cache, cache=cache, carpeta=carpeta)
+    muestras = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout
+        segundos, _cantidad = salida.split()
+        muestras.append(float(segundos) * 1000)
+    return sorted(muestras)[len(muestras) // 2]
+
+
+def main():
+    print(f"{'skills':>6} {'from_folder':>12} {'cache vacío':>12} {'cache vigente':>14}")
+    with tempfile.TemporaryDirectory() as temporal:
+        for cantidad in (10, 100, 1000):
+            carpeta = os.path.join(temporal, f"skills_{cantidad}")
+            generar_carpeta(carpeta, cantidad)
+            cache = os.path.join(temporal, f"esquemas_{cantidad}.sqlite")
+
+            from_folder = medir(carpeta)
+            vacio = medir(carpeta, con_cache=True, cache=cache, repeticiones=1)
+            vigente = medir(carpeta, con_cache=True, cache=cache)
+            print(f"{cantidad:>6} {from_folder:>10.1f}ms {vacio:>10.1f}ms {vigente:>12.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: analizar_codigo_javascript con lexer de una pasada vs. regex sueltos
+==============================================================================
+
+Genera bundles JavaScript minificados de distintos tamaños y compara:
+
+1. El análisis anterior: siete pasadas de regex sobre el código completo
+   (var, console.log, ==, funciones anónimas, try/catch con DOTALL, eval e
+   indentación), que además encuentran coincidencias dentro de strings y
+   comentarios
+2. El lexer de una sola pasada que usa ahora la skill: salta strings,
+   templates, regex y comentarios, y lee el archivo por bloques
+
+El caso "try sin cierre" repite ``try{`` sin llaves de cierre cercanas: el
+regex de try/catch vuelve a recorrer el resto del texto desde cada ``try``.
+
+Uso:
+    python benchmarks/bench_debug_javascript.py
+"""
+
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from skills_infra.lexer_js import analizar_archivo
+from webapp.debug_javascript import analizar_codigo_javascript
+
+TAMANOS_KB = (100, 1024, 5120)
+TRY_SIN_CIERRE = 20000
+
+FRAGMENTO = (
+    'function n(e,t){var r="a==b // no es código";try{if(e==t)return/x\\/y/g.test(r)}'
+    'catch(o){}console.log(`v=${e}`);return e/t}/* var z; eval(x) */'
+    'var s=function(e){return t.map(function(n){return n.id===e?n:null})};'
+)
+
+PATRONES_ANTERIORES = [
+    re.compile(r'\bvar\s+\w+'),
+    re.compile(r'console\.log\('),
+    re.compile(r'[^=!<>]==[^=]'),
+    re.compile(r'function\s*\('),
+    re.compile(r'try\s*{[^}]*}\s*catch\s*\([^)]*\)\s*{([^}]*)}', re.DOTALL),
+    re.compile(r'\beval\s*\('),
+]
+
+
+def bundle(tamano_kb: int) -> str:
+    return FRAGMENTO * (tamano_kb * 1024 // len(FRAGMENTO))
+
+
+def analisis_anterior(codigo: str) -> int:
+    """Las pasadas de regex que hacía analizar_codigo_javascript antes."""
+    total = sum(len(patron.findall(codigo)) for patron in PATRONES_ANTERIORES)
+    max(len(linea) - len(linea.lstrip()) for linea in codigo.split("\n"))
+    return total
+
+
+def medir(funcion, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    casos = [(f"{tamano_kb}KB", bundle(tamano_kb)) for tamano_kb in TAMANOS_KB]
+    casos.append((f"try sin cierre x{TRY_SIN_CIERRE}", "try{a=b;" * TRY_SIN_CIERRE))
+
+    print(f"{'caso':<24} {'anterior':>10} {'hallazgos':>10} {'lexer':>10} {'hallazgos':>10} {'MB/s':>6}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for nombre, codigo in casos:
+            ms_anterior, hallazgos_anteriores = medir(analisis_anterior, codigo)
+
+            ruta = Path(carpeta) / "bundle.js"
+            ruta.write_text(codigo, encoding="utf-8")
+            ms_lexer, analizador = medir(analizar_archivo, str(ruta))
+            hallazgos = sum(analizador.conteos.values())
+            mb_por_segundo = len(codigo) / 1e6 / (ms_lexer / 1000)
+            print(f"{nombre:<24} {ms_anterior:>8.0f}ms {hallazgos_anteriores:>10} "
+                  f"{ms_lexer:>8.0f}ms {hallazgos:>10} {mb_por_segundo:>6.1f}")
+
+    print("\nLos hallazgos anteriores incluyen coincidencias dentro de strings y comentarios.")
+
+    codigo = bundle(TAMANOS_KB[-1])
+    ms_skill, _ = medir(analizar_codigo_javascript, codigo)
+    print(f"analizar_codigo_javascript sobre {TAMANOS_KB[-1]}KB en memoria: {ms_skill:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
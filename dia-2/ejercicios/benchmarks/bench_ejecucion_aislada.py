@@ -0,0 +1,73 @@
+"""
+Benchmark: costo de ejecutar skills en procesos aislados
+========================================================
+
+Compara el tiempo por llamada de ``validar_html`` y ``regresion_lineal_simple``
+(las dos con ``isolation="process"``) en el proceso del agente y en un
+``SkillManagerAislado``: la diferencia es el envío de argumentos y resultados
+entre procesos. Después lanza una regresión sobre muchos puntos con un timeout
+corto y mide cuánto tarda en volver el error, y que el pool sigue atendiendo.
+
+Uso:
+    python benchmarks/bench_ejecucion_aislada.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager
+
+from skills_infra.ejecucion_aislada import PoolAislado, SkillManagerAislado, skill_aislada
+
+LLAMADAS = 200
+HTML = "<html lang='es'><head><title>Demo</title></head><body>" + "<div><p>Hola <img src='a.png'></p></div>" * 200 + "</body></html>"
+PUNTOS = 20000
+
+
+def por_llamada(funcion, *argumentos, llamadas: int = LLAMADAS) -> float:
+    """Milisegundos por llamada."""
+    inicio = time.perf_counter()
+    for _ in range(llamadas):
+        funcion(*argumentos)
+    return (time.perf_counter() - inicio) / llamadas * 1000
+
+
+def main():
+    carpetas = [RUTA_EJERCICIOS / "skills" / "webapp", RUTA_EJERCICIOS / "skills_biblioteca" / "ml"]
+    local, aislado = SkillManager(), SkillManagerAislado(procesos=2)
+    for manager in (local, aislado):
+        for carpeta in carpetas:
+            manager.load_skills.from_folder(str(carpeta))
+
+    x = [float(numero) for numero in range(PUNTOS)]
+    y = [2 * valor + 1 for valor in x]
+    casos = [("validar_html", (HTML,)), ("regresion_lineal_simple", (x, y))]
+    print(f"{'skill':<26} {'en el proceso':>14} {'aislada':>10}")
+    for nombre, argumentos in casos:
+        # La primera llamada importa el módulo en cada trabajador
+        aislado.get_skill_by_name(nombre)(*argumentos)
+        aislado.get_skill_by_name(nombre)(*argumentos)
+        en_proceso = por_llamada(local.get_skill_by_name(nombre), *argumentos)
+        en_pool = por_llamada(aislado.get_skill_by_name(nombre), *argumentos)
+        print(f"{nombre:<26} {en_proceso:>12.2f}ms {en_pool:>8.2f}ms")
+
+    # Una regresión sobre muchos puntos con un timeout corto no bloquea al que llama
+    with PoolAislado(procesos=1, timeout=0.2) as pool:
+        regresion = skill_aislada(local.get_skill_by_name("regresion_lineal_simple"), pool)
+        grandes = [float(numero) for numero in range(3000000)]
+        inicio = time.perf_counter()
+        error = regresion(grandes, grandes)
+        print(f"\nregresión de {len(grandes)} puntos con timeout 0.2s:"
+              f" {error['error']} en {time.perf_counter() - inicio:.2f}s")
+        inicio = time.perf_counter()
+        regresion(x[:100], y[:100])
+        print(f"siguiente llamada (trabajador nuevo): {(time.perf_counter() - inicio) * 1000:.1f}ms")
+    aislado.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: costo del historial de llamadas por skill
+====================================================
+
+Mide cuánto agrega ``SkillManagerConHistorial`` a cada llamada de una skill
+con ``@skill``, con la capacidad y el muestreo por defecto, y con tracemalloc
+cuánta memoria queda retenida después de llenar el buffer y seguir llamando:
+una vez lleno, el historial no debería crecer.
+
+También mide cuánto tarda consultar las últimas 100 fallas.
+
+Uso:
+    python benchmarks/bench_historial.py
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager, skill
+
+from skills_infra.historial import CAPACIDAD, SkillManagerConHistorial
+
+LLAMADAS = 200000
+
+
+@skill(description="Divide dos números", historial=True)
+def dividir(a: float, b: float) -> float:
+    return a / b
+
+
+def por_llamada(funcion, llamadas: int) -> float:
+    """Microsegundos por llamada, el mejor de tres intentos."""
+    mejores = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for numero in range(llamadas):
+            funcion(numero, 2)
+        mejores.append((time.perf_counter() - inicio) / llamadas * 1e6)
+    return min(mejores)
+
+
+def main():
+    base, con_historial = SkillManager(), SkillManagerConHistorial()
+    base.register_skill(dividir)
+    con_historial.register_skill(dividir)
+    sin = por_llamada(base.get_skill_by_name("dividir"), LLAMADAS)
+    con = por_llamada(con_historial.get_skill_by_name("dividir"), LLAMADAS)
+    print(f"por llamada: {sin:.2f}us sin historial, {con:.2f}us con historial ({con - sin:+.2f}us)")
+
+    # Con el buffer ya lleno, otras llamadas solo sobrescriben posiciones
+    funcion = con_historial.get_skill_by_name("dividir")
+    gc.collect()
+    tracemalloc.start()
+    funcion(1, 2)
+    antes = tracemalloc.get_traced_memory()[0]
+    for numero in range(LLAMADAS):
+        funcion(numero, 2)
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"memoria retenida tras {LLAMADAS} llamadas más: {despues - antes:+d} bytes")
+
+    for numero in range(CAPACIDAD):
+        try:
+            funcion(numero, numero % 4)
+        except ZeroDivisionError:
+            pass
+    inicio = time.perf_counter()
+    fallas = con_historial.ultimas_fallas(100)
+    print(f"últimas {len(fallas)} fallas de {CAPACIDAD} llamadas: {(time.perf_counter() - inicio) * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
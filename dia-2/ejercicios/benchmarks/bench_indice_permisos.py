@@ -0,0 +1,130 @@
+"""
+Benchmark: recorrer la base de problemas vs. índice difuso
+==========================================================
+
+Arma bases de problemas de permisos de distintos tamaños (como las que se cargan
+desde ``check_permisos.datos.json``) y compara, por descripción:
+
+- la búsqueda anterior de ``diagnosticar_problema_permisos``: recorrer todas
+  las claves preguntando si aparecen tal cual en la descripción;
+- una búsqueda difusa sin índice: recorrer todas las claves y alias midiendo
+  qué parte de sus palabras aparece en la descripción;
+- ``IndiceDifuso``, que además pondera las palabras por IDF y tolera errores
+  de tipeo, pero solo visita las entradas que comparten palabras raras con
+  la descripción.
+
+Uso:
+    python benchmarks/bench_indice_permisos.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from skills_infra.indice_difuso import IndiceDifuso, normalizar_texto
+
+FUNCIONALIDADES = (
+    "camara", "ubicacion", "microfono", "contactos", "calendario", "galeria", "bluetooth", "wifi",
+    "nfc", "huella", "biometria", "almacenamiento", "notificaciones", "alarmas", "sensores",
+    "actividad fisica", "llamadas", "sms", "portapapeles", "accesibilidad", "superposicion",
+    "segundo plano", "bateria", "instalacion de paquetes", "cuentas", "salud", "recordatorios",
+    "dispositivos cercanos", "rastreo publicitario", "red local", "fotos", "video", "audio",
+    "descargas", "sincronizacion", "widgets", "teclado", "vpn", "localizacion precisa", "escaner qr",
+)
+SINTOMAS = (
+    "no funciona", "no disponible", "permiso denegado", "falla al iniciar", "se cierra al pedir permiso",
+    "no responde", "queda en negro", "no llega", "muy lento", "bloqueado por el sistema",
+    "pide permiso cada vez", "error de configuracion", "desactivado por el usuario",
+    "no aparece en ajustes", "revocado tras actualizar",
+)
+CONTEXTOS = (
+    "", "en segundo plano", "tras actualizar", "en android 14", "en tablets", "con modo ahorro", "al reiniciar",
+    "en el primer inicio", "con perfil de trabajo", "en modo avion", "con la pantalla bloqueada",
+    "en dispositivos plegables", "tras restaurar copia", "con varias cuentas",
+)
+PANTALLAS = (
+    "login", "checkout", "perfil", "chat", "mapa de tiendas", "escaner", "feed", "ajustes", "onboarding",
+    "reproductor", "historial", "carrito", "favoritos", "soporte", "pagos", "reservas", "rutas", "catalogo",
+    "videollamada", "notas de voz", "agenda", "entrenamiento", "recetas", "facturas", "envios", "cupones",
+    "billetera", "tienda", "comunidad", "podcast",
+)
+
+DESCRIPCIONES = [
+    "Desde la última versión la cámara queda en negro cuando el usuario abre el escáner de códigos",
+    "Los usuarios reportan que el permiso de ubicación precisa se revoca tras actualizar, en el mapa de tiendas",
+    "El bluetooth no funciona en segundo plano en la pantalla de entrenamiento",
+    "No llegan las notificaciones de envios en tablets con modo ahorro de batería",
+]
+
+
+def generar_problemas(cantidad: int, azar: random.Random) -> list:
+    problemas, vistos = [], set()
+    while len(problemas) < cantidad:
+        partes = (azar.choice(FUNCIONALIDADES), azar.choice(SINTOMAS), "en " + azar.choice(PANTALLAS), azar.choice(CONTEXTOS))
+        clave = " ".join(filter(None, partes))
+        if clave not in vistos:
+            vistos.add(clave)
+            problemas.append((clave, ()))
+    return problemas
+
+
+def buscar_subcadena(problemas: list, descripcion: str):
+    descripcion_lower = descripcion.lower()
+    for clave, _ in problemas:
+        if clave in descripcion_lower:
+            return clave
+    return None
+
+
+def buscar_recorriendo(problemas: list, descripcion: str, minimo: float = 0.5):
+    palabras = set(normalizar_texto(descripcion).split())
+    mejor, mejor_puntaje = None, minimo
+    for clave, alias in problemas:
+        for nombre in (clave, *alias):
+            del_nombre = set(normalizar_texto(nombre).split())
+            puntaje = len(del_nombre & palabras) / len(del_nombre)
+            if puntaje > mejor_puntaje:
+                mejor, mejor_puntaje = clave, puntaje
+    return mejor
+
+
+def medir(funcion, *argumentos, repeticiones: int) -> float:
+    """Microsegundos por descripción."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        for descripcion in DESCRIPCIONES:
+            funcion(*argumentos, descripcion)
+    return (time.perf_counter() - inicio) / (repeticiones * len(DESCRIPCIONES)) * 1e6
+
+
+def main():
+    azar = random.Random(42)
+    print(f"{'problemas':>9} {'subcadena':>11} {'recorriendo':>12} {'índice':>9} {'armado':>9}")
+    for cantidad in (10, 100, 1000, 5000):
+        problemas = generar_problemas(cantidad, azar)
+        inicio = time.perf_counter()
+        indice = IndiceDifuso(("android", clave, alias) for clave, alias in problemas)
+        armado = time.perf_counter() - inicio
+
+        def buscar_indice(descripcion):
+            return indice.mejor(descripcion, grupo="android", dentro_del_texto=True)
+
+        repeticiones = max(5, 20000 // cantidad)
+        print(f"{cantidad:>9} {medir(buscar_subcadena, problemas, repeticiones=repeticiones):>9.1f}us"
+              f" {medir(buscar_recorriendo, problemas, repeticiones=max(2, repeticiones // 10)):>10.1f}us"
+              f" {medir(buscar_indice, repeticiones=repeticiones):>7.1f}us {armado * 1000:>7.1f}ms")
+
+    print("\nMejor coincidencia con la base de 5000 problemas:")
+    for descripcion in DESCRIPCIONES:
+        coincidencia = indice.mejor(descripcion, grupo="android", dentro_del_texto=True)
+        encontrada = f"{coincidencia.clave!r} ({coincidencia.puntaje})" if coincidencia else "ninguna"
+        print(f"  {descripcion[:60]:<60} -> {encontrada}")
+
+
+if __name__ == "__main__":
+    main()
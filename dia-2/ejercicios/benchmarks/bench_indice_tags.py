@@ -0,0 +1,101 @@
+"""
+Benchmark: filtrar skills por tags recorriendo el registry vs. bitsets
+=====================================================================
+
+Registra 1000 y 10000 skills con entre 3 y 6 tags de un vocabulario de 300
+(unos pocos muy comunes y muchos raros, como en un catálogo real) y compara:
+
+- ``get_skills_by_tag()`` de SkillManager y el filtro a mano por metadata para
+  expresiones con AND, OR y NOT, que recorren todo el registry;
+- ``SkillManagerConTags``, que resuelve las mismas consultas con bitsets.
+
+También mide cuánto agrega el índice a registrar y a quitar skills.
+
+Uso:
+    python benchmarks/bench_indice_tags.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager
+
+from skills_infra.indice_tags import SkillManagerConTags
+from skills_infra.manifiesto import crear_proxy
+
+TAGS = [f"tag{numero:03d}" for numero in range(300)]
+PESOS = [1 / (posicion + 1) for posicion in range(len(TAGS))]
+
+# (expresión para el índice, filtro equivalente sobre el set de tags de una skill)
+CONSULTAS = [
+    ("tag000", lambda tags: "tag000" in tags),
+    ("tag001 and tag004", lambda tags: "tag001" in tags and "tag004" in tags),
+    ("(tag002 or tag010) and not tag000", lambda tags: ("tag002" in tags or "tag010" in tags) and "tag000" not in tags),
+    ("tag150 or tag151 or tag152", lambda tags: bool({"tag150", "tag151", "tag152"} & tags)),
+]
+
+
+def crear_skills(cantidad: int, azar: random.Random) -> list:
+    skills = []
+    for numero in range(cantidad):
+        tags = sorted(set(azar.choices(TAGS, weights=PESOS, k=azar.randint(3, 6))))
+        metadata = {"name": f"skill_{numero}", "description": "", "parameters": {}, "required": [], "tags": tags}
+        skills.append(crear_proxy(".", {"nombre": f"skill_{numero}", "archivo": "sinteticas.py", "sha256": "", "metadata": metadata}))
+    return skills
+
+
+def filtrar_a_mano(manager: SkillManager, filtro) -> list:
+    return [
+        funcion.__name__ for funcion in manager.registry.values()
+        if filtro(set(funcion.tool_metadata.get("tags", ())))
+    ]
+
+
+def medir(funcion, *argumentos, repeticiones: int) -> float:
+    """Microsegundos por llamada."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(*argumentos)
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def main():
+    azar = random.Random(11)
+    for cantidad in (1000, 10000):
+        skills = crear_skills(cantidad, azar)
+        base, indexado = SkillManager(), SkillManagerConTags()
+        registro_base = medir(lambda: [base.register_tool(s) for s in skills], repeticiones=1) / cantidad
+        registro_indexado = medir(lambda: [indexado.register_tool(s) for s in skills], repeticiones=1) / cantidad
+
+        print(f"\n{cantidad} skills, {len(indexado.indice_tags.tags)} tags en uso")
+        print(f"registrar: {registro_base:.2f}us sin índice, {registro_indexado:.2f}us con índice por skill")
+        repeticiones = max(20, 200000 // cantidad)
+        print(f"{'consulta':<36} {'resultado':>9} {'recorriendo':>12} {'bitsets':>9}")
+
+        un_tag = sorted(base.get_skills_by_tag("tag000"))
+        assert un_tag == sorted(indexado.get_skills_by_tag("tag000"))
+        print(f"{'get_skills_by_tag(tag000)':<36} {len(un_tag):>9}"
+              f" {medir(base.get_skills_by_tag, 'tag000', repeticiones=repeticiones):>10.0f}us"
+              f" {medir(indexado.get_skills_by_tag, 'tag000', repeticiones=repeticiones):>7.0f}us")
+        for expresion, filtro in CONSULTAS:
+            esperado = filtrar_a_mano(base, filtro)
+            assert indexado.filtrar_por_tags(expresion) == esperado, expresion
+            print(f"{expresion:<36} {len(esperado):>9}"
+                  f" {medir(filtrar_a_mano, base, filtro, repeticiones=repeticiones):>10.0f}us"
+                  f" {medir(indexado.filtrar_por_tags, expresion, repeticiones=repeticiones):>7.0f}us")
+
+        # Quitar la mitad de las skills (con renumeraciones incluidas)
+        nombres = [s.__name__ for s in skills[::2]]
+        quitar_base = medir(lambda: [base.remove_skill(n) for n in nombres], repeticiones=1) / len(nombres)
+        quitar_indexado = medir(lambda: [indexado.remove_skill(n) for n in nombres], repeticiones=1) / len(nombres)
+        assert indexado.filtrar_por_tags("tag000") == filtrar_a_mano(base, CONSULTAS[0][1])
+        print(f"quitar: {quitar_base:.2f}us sin índice, {quitar_indexado:.2f}us con índice por skill")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: from_folder() vs. manifiesto con proxies perezosos
+=============================================================
+
+Mide el arranque en frío (un intérprete nuevo por medición, para que ningún
+módulo esté ya importado) de registrar las skills de cada carpeta:
+
+- ``load_skills.from_folder()``, que importa todos los módulos;
+- ``registrar_desde_manifiesto()``, que solo lee el manifiesto y registra proxies.
+
+También mide la primera llamada a una skill registrada desde el manifiesto, que
+es cuando se paga la importación de su módulo (y solo de ese).
+
+Uso:
+    python benchmarks/bench_manifiesto.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from skills_infra.manifiesto import generar_manifiesto
+
+CARPETAS = ["skills/api", "skills/webapp", "skills/mobile", "skills_biblioteca/basicas", "skills_biblioteca/estadisticas"]
+REPETICIONES = 5
+
+MEDIR_FROM_FOLDER = """
+import time
+from instantneo.skills import SkillManager
+manager = SkillManager()
+inicio = time.perf_counter()
+manager.load_skills.from_folder({carpeta!r})
+print(time.perf_counter() - inicio, len(manager.get_skill_names()))
+"""
+
+MEDIR_MANIFIESTO = """
+import time
+from instantneo.skills import SkillManager
+from skills_infra.manifiesto import registrar_desde_manifiesto
+manager = SkillManager()
+inicio = time.perf_counter()
+registrar_desde_manifiesto(manager, {carpeta!r}, {manifiesto!r})
+registrado = time.perf_counter() - inicio
+proxy = manager.get_tool_by_name({skill!r})
+inicio = time.perf_counter()
+proxy.cargar()
+print(registrado, len(manager.get_skill_names()), time.perf_counter() - inicio)
+"""
+
+
+def medir(codigo: str) -> list:
+    """Mediana de cada valor impreso por el código, en intérpretes nuevos."""
+    muestras = []
+    for _ in range(REPETICIONES):
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=RUTA_EJERCICIOS, capture_output=True, text=True, check=True
+        ).stdout.split()
+        muestras.append([float(valor) for valor in salida])
+    return [sorted(columna)[len(columna) // 2] for columna in zip(*muestras)]
+
+
+def main():
+    print(f"{'carpeta':<31} {'skills':>6} {'from_folder':>12} {'manifiesto':>11} {'1ra llamada':>12}")
+    with tempfile.TemporaryDirectory() as temporal:
+        for carpeta in CARPETAS:
+            manifiesto = os.path.join(temporal, carpeta.replace("/", "_") + ".json")
+            skill = generar_manifiesto(os.path.join(RUTA_EJERCICIOS, carpeta), manifiesto)["skills"][0]["nombre"]
+            with open(manifiesto, encoding="utf-8") as archivo:
+                assert json.load(archivo)["skills"]
+
+            from_folder, cantidad = medir(MEDIR_FROM_FOLDER.format(carpeta=carpeta))
+            registrado, cantidad_manifiesto, primera = medir(
+                MEDIR_MANIFIESTO.format(carpeta=carpeta, manifiesto=manifiesto, skill=skill)
+            )
+            assert cantidad == cantidad_manifiesto, carpeta
+            print(f"{carpeta:<31} {cantidad:>6.0f} {from_folder * 1000:>10.1f}ms {registrado * 1000:>9.2f}ms"
+                  f" {primera * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: costo de las métricas por skill
+==========================================
+
+Mide cuánto agrega ``SkillManagerConMetricas`` a cada llamada de una skill con
+``@skill`` (que ya guarda su última llamada en un contextvar), con una skill
+trivial y con una que hace algo de trabajo, y cuánto cuesta exportar las
+métricas de 200 skills como texto de Prometheus y como snapshot JSON.
+
+Uso:
+    python benchmarks/bench_metricas.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager, skill
+
+from skills_infra.metricas import SkillManagerConMetricas
+
+LLAMADAS = 200000
+SKILLS_EXPORTADAS = 200
+
+
+@skill(description="Suma dos números")
+def sumar(a: float, b: float) -> float:
+    return a + b
+
+
+@skill(description="Ordena una lista de números")
+def ordenar(numeros: list) -> list:
+    return sorted(numeros)
+
+
+def por_llamada(funcion, *argumentos, llamadas: int) -> float:
+    """Microsegundos por llamada, el mejor de tres intentos."""
+    mejores = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            funcion(*argumentos)
+        mejores.append((time.perf_counter() - inicio) / llamadas * 1e6)
+    return min(mejores)
+
+
+def main():
+    base, medido = SkillManager(), SkillManagerConMetricas()
+    for manager in (base, medido):
+        manager.register_tool(sumar)
+        manager.register_tool(ordenar)
+
+    numeros = list(range(500, 0, -1))
+    print(f"{'skill':<10} {'sin métricas':>13} {'con métricas':>13} {'agregado':>10}")
+    for nombre, argumentos, llamadas in (("sumar", (1, 2), LLAMADAS), ("ordenar", (numeros,), LLAMADAS // 10)):
+        sin = por_llamada(base.get_skill_by_name(nombre), *argumentos, llamadas=llamadas)
+        con = por_llamada(medido.get_skill_by_name(nombre), *argumentos, llamadas=llamadas)
+        print(f"{nombre:<10} {sin:>11.2f}us {con:>11.2f}us {con - sin:>8.2f}us")
+
+    exportado = SkillManagerConMetricas()
+    for numero in range(SKILLS_EXPORTADAS):
+        copia = skill(description="Suma dos números")(lambda a, b: a + b)
+        copia.__name__ = copia.tool_metadata["name"] = f"sumar_{numero}"
+        exportado.register_tool(copia)
+    for funcion in exportado.registry.values():
+        for _ in range(100):
+            funcion(1, 2)
+
+    inicio = time.perf_counter()
+    texto = exportado.metricas.exportar_prometheus()
+    prometheus = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    snapshot = exportado.metricas.snapshot_json()
+    json_ms = time.perf_counter() - inicio
+    print(f"\nexportar {SKILLS_EXPORTADAS} skills: Prometheus {prometheus * 1000:.1f}ms"
+          f" ({len(texto.splitlines())} líneas, {len(texto) / 1024:.0f}KB),"
+          f" JSON {json_ms * 1000:.1f}ms ({len(snapshot) / 1024:.0f}KB)")
+
+
+if __name__ == "__main__":
+    main()
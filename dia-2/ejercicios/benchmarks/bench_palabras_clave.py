@@ -0,0 +1,164 @@
+"""
+Benchmark: MotorPalabrasClave vs. búsquedas palabra por palabra
+===============================================================
+
+1. Los lugares que ahora usan el motor, contra su versión anterior, con textos
+   de tamaño realista: tickets de soporte (detectar_producto), respuestas del
+   agente (puede_procesar, detectar_skill_necesaria) y stack traces de Android
+   (tipo de excepción en analizar_crash_log). Antes cada llamada rearmaba sus
+   listas de palabras y, en detectar_skill_necesaria, buscaba con re.search.
+2. Cómo escala la búsqueda con la cantidad de palabras clave: ``palabra in texto``
+   por cada palabra contra el autómata de Aho-Corasick, que recorre el texto una
+   sola vez. De ahí sale ``UMBRAL_AUTOMATA``.
+
+Uso:
+    python benchmarks/bench_palabras_clave.py
+"""
+
+import contextlib
+import io
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+sys.path.insert(0, str(RUTA_SKILLS.parent.parent / "soluciones"))
+
+from mobile.analizar_crash import _MOTORES_CRASH, TABLAS
+from skills_infra.palabras_clave import UMBRAL_AUTOMATA, MotorPalabrasClave
+
+# Las soluciones imprimen el modelo configurado al importarse
+with contextlib.redirect_stdout(io.StringIO()):
+    import ejercicio_04_multimodo_SOLUCION as ejercicio_04
+    import ejercicio_05_autoexpansivo_SOLUCION as ejercicio_05
+
+TICKET = (
+    "Hola, desde ayer a la tarde la pantalla de checkout queda en blanco para algunos clientes. "
+    "En la consola del navegador aparece un error de JavaScript y el formulario no responde. "
+    "Probamos en Chrome y Firefox con el mismo resultado; en la app todo funciona. "
+    "Adjunto captura y el HTML de la página. Es urgente porque afecta las ventas."
+)
+RESPUESTA_AGENTE = (
+    "Entiendo que necesitas calcular la desviación estándar de los datos de ventas del último "
+    "trimestre. Revisé las herramientas que tengo cargadas: puedo sumar y promediar listas de "
+    "números, pero para la desviación estándar no tengo una función específica. Si cargas una "
+    "skill de estadística podría hacerlo, o puedo darte la fórmula para que la apliques a mano."
+)
+STACK_TRACE = "\n".join(
+    ["FATAL EXCEPTION: main", "Process: com.miapp, PID: 4242",
+     "java.lang.RuntimeException: Unable to start activity ComponentInfo{com.miapp/com.miapp.ui.Perfil}"]
+    + [f"    at android.app.ActivityThread.performLaunchActivity(ActivityThread.java:{3400 + i})" for i in range(40)]
+    + ["Caused by: java.lang.IllegalStateException: Fragment not attached to a context."]
+    + [f"    at com.miapp.ui.Perfil$1.lambda$onClick$0(Perfil.java:{80 + i})" for i in range(40)]
+)
+
+PALABRAS_PRODUCTO = {
+    "api": ["endpoint", "api", "rest", "http", "status code", "logs api", "servicio", "backend", "servidor"],
+    "webapp": ["html", "javascript", "css", "dom", "navegador", "frontend", "página", "web", "accesibilidad", "seo"],
+    "mobile": ["app", "móvil", "android", "ios", "crash", "permisos", "cámara", "mobile", "smartphone", "tablet"],
+}
+FRASES_NEGATIVAS = [
+    "no puedo", "no tengo", "no dispongo", "no cuento con", "no está disponible", "no tengo acceso",
+    "no tengo la capacidad", "no tengo esa habilidad", "no tengo esa skill", "no tengo esa función",
+    "no es posible", "no me es posible",
+]
+
+
+def detectar_producto_anterior(descripcion_ticket: str) -> str:
+    descripcion = descripcion_ticket.lower()
+    grupos = {producto: list(palabras) for producto, palabras in PALABRAS_PRODUCTO.items()}
+    puntajes = {producto: sum(1 for kw in palabras if kw in descripcion) for producto, palabras in grupos.items()}
+    mejor = max(puntajes, key=puntajes.get)
+    return mejor if puntajes[mejor] else "desconocido"
+
+
+def puede_procesar_anterior(respuesta: str) -> bool:
+    respuesta_lower = respuesta.lower()
+    frases_negativas = list(FRASES_NEGATIVAS)
+    for frase in frases_negativas:
+        if frase in respuesta_lower:
+            return False
+    return True
+
+
+def detectar_skill_anterior(query: str, respuesta_agente: str) -> str:
+    texto_completo = (query + " " + respuesta_agente).lower()
+    skills_keywords = [
+        ("regresion|regresión|regression", "regresion"),
+        ("desviacion|desviación|std|estandar|estándar|standard deviation", "desviacion"),
+        ("mediana|median", "mediana"),
+        ("promedio|media|average|mean", "promedio"),
+        ("suma|sum", "suma"),
+    ]
+    for patron, skill_name in skills_keywords:
+        if re.search(patron, texto_completo):
+            return skill_name
+    return None
+
+
+def tipo_crash_anterior(stack_trace: str) -> str:
+    for crash in TABLAS["crashes_android"]:
+        if any(patron in stack_trace for patron in crash["patrones"]):
+            return crash["tipo"]
+    return "Desconocido"
+
+
+def tipo_crash_motor(stack_trace: str) -> str:
+    indice = _MOTORES_CRASH["android"].primero(stack_trace)
+    return TABLAS["crashes_android"][indice]["tipo"] if indice is not None else "Desconocido"
+
+
+def medir(funcion, *argumentos, repeticiones: int = 20000) -> float:
+    """Microsegundos por llamada."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(*argumentos)
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def comparar_llamadas() -> None:
+    casos = [
+        ("detectar_producto", TICKET, (TICKET,),
+         detectar_producto_anterior, ejercicio_04.detectar_producto),
+        ("puede_procesar", RESPUESTA_AGENTE, (RESPUESTA_AGENTE,),
+         puede_procesar_anterior, ejercicio_05.puede_procesar),
+        ("detectar_skill_necesaria", RESPUESTA_AGENTE, ("calcula la desviación", RESPUESTA_AGENTE),
+         detectar_skill_anterior, ejercicio_05.detectar_skill_necesaria),
+        ("tipo de crash", STACK_TRACE, (STACK_TRACE,),
+         tipo_crash_anterior, tipo_crash_motor),
+    ]
+    print(f"{'llamada':<26} {'texto':>7} {'antes':>9} {'motor':>9}")
+    for nombre, texto, argumentos, anterior, nueva in casos:
+        assert anterior(*argumentos) == nueva(*argumentos), nombre
+        print(f"{nombre:<26} {len(texto):>6}c {medir(anterior, *argumentos):>7.1f}us {medir(nueva, *argumentos):>7.1f}us")
+
+
+def comparar_escala() -> None:
+    azar = random.Random(7)
+    texto = " ".join(
+        "".join(azar.choice(string.ascii_lowercase) for _ in range(azar.randint(2, 9))) for _ in range(800)
+    )
+    print(f"\nTexto de {len(texto)} caracteres; el motor usa el autómata desde {UMBRAL_AUTOMATA} palabras\n")
+    print(f"{'palabras':>8} {'una por una':>12} {'autómata':>10}")
+    for cantidad in (10, 30, 100, 300, 1000):
+        palabras = ["".join(azar.choice(string.ascii_lowercase) for _ in range(azar.randint(4, 10)))
+                    for _ in range(cantidad)]
+        por_palabra = MotorPalabrasClave({"g": palabras}, automata=False)
+        automata = MotorPalabrasClave({"g": palabras}, automata=True)
+        assert por_palabra.puntuar(texto) == automata.puntuar(texto)
+        print(f"{cantidad:>8} {medir(por_palabra.puntuar, texto, repeticiones=200):>10.0f}us"
+              f" {medir(automata.puntuar, texto, repeticiones=200):>8.0f}us")
+
+
+def main():
+    comparar_llamadas()
+    comparar_escala()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: recargar skills por ticket vs. pool de SkillManagers
+===============================================================
+
+Rutea tickets de soporte como el ejercicio 4 (sin llamar al modelo) y mide
+cuántos por segundo se atienden:
+
+- antes: ``clear_registry()`` + ``load_skills.from_folder()`` del producto en
+  cada ticket, que vuelve a ejecutar todos los módulos de la carpeta;
+- pool: ``PoolSkills`` carga cada carpeta una vez y cada ticket solo cambia
+  el SkillManager activo del agente.
+
+Uso:
+    python benchmarks/bench_pool_skills.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+sys.path.insert(0, str(RUTA_SKILLS.parent.parent / "soluciones"))
+
+from instantneo import InstantNeo
+
+from skills_infra.pool_skills import PoolSkills
+
+# Las soluciones imprimen el modelo configurado al importarse
+with contextlib.redirect_stdout(io.StringIO()):
+    import ejercicio_04_multimodo_SOLUCION as ejercicio_04
+
+TICKETS = [ticket["problema"] for ticket in ejercicio_04.tickets] * 10
+
+
+def crear_agente() -> InstantNeo:
+    return InstantNeo(provider="openai", api_key="sin-uso", model="gpt-4o-mini", role_setup="Soporte técnico")
+
+
+def rutear_recargando(agente: InstantNeo, problema: str) -> list:
+    producto = ejercicio_04.detectar_producto(problema)
+    agente.skill_manager.clear_registry()
+    agente.skill_manager.load_skills.from_folder(os.path.join(RUTA_SKILLS, producto))
+    return agente.skill_manager.get_skill_names()
+
+
+def rutear_con_pool(agente: InstantNeo, pool: PoolSkills, problema: str) -> list:
+    producto = ejercicio_04.detectar_producto(problema)
+    return pool.activar(agente, producto).get_skill_names()
+
+
+def tickets_por_segundo(funcion, *argumentos, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        for problema in TICKETS:
+            funcion(*argumentos, problema)
+    return repeticiones * len(TICKETS) / (time.perf_counter() - inicio)
+
+
+def main():
+    inicio = time.perf_counter()
+    pool = PoolSkills(str(RUTA_SKILLS), ejercicio_04.PRODUCTOS)
+    armado = time.perf_counter() - inicio
+
+    anterior, nuevo = crear_agente(), crear_agente()
+    for problema in TICKETS[:len(ejercicio_04.tickets)]:
+        assert sorted(rutear_recargando(anterior, problema)) == sorted(rutear_con_pool(nuevo, pool, problema))
+
+    recargando = tickets_por_segundo(rutear_recargando, anterior, repeticiones=3)
+    con_pool = tickets_por_segundo(rutear_con_pool, nuevo, pool, repeticiones=300)
+    print(f"Pool de {len(pool)} productos armado en {armado * 1000:.1f}ms\n")
+    print(f"{'ruteo':<22} {'tickets/s':>12} {'por ticket':>12}")
+    print(f"{'clear + from_folder':<22} {recargando:>12,.0f} {1e6 / recargando:>10.1f}us")
+    print(f"{'pool':<22} {con_pool:>12,.0f} {1e6 / con_pool:>10.1f}us")
+    print(f"\nEl pool se amortiza desde el ticket {armado * recargando:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: enviar todas las skills vs. las k más relevantes (BM25)
+==================================================================
+
+Registra las skills reales (``skills/`` y ``skills_biblioteca/``) junto con
+cientos de skills sintéticas de otros dominios, y para prompts de soporte cuya
+skill correcta se conoce mide:
+
+- si la skill correcta queda entre las k elegidas por ``IndiceSkills``;
+- cuántos tokens de esquema se envían con k skills frente a todas;
+- cuánto tarda armar el índice y elegir las skills de un prompt.
+
+Uso:
+    python benchmarks/bench_recuperacion_skills.py
+"""
+
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager
+
+from skills_infra.recuperacion_skills import IndiceSkills
+
+CARPETAS_REALES = [
+    "skills/api", "skills/webapp", "skills/mobile",
+    "skills_biblioteca/basicas", "skills_biblioteca/estadisticas", "skills_biblioteca/ml",
+]
+
+PROMPTS = [
+    ("El endpoint /api/usuarios devuelve 503 desde esta mañana, ¿está caído?", {"verificar_endpoint", "diagnosticar_error_http"}),
+    ("Calcula la desviación estándar de las ventas: 10, 12, 15, 20", {"calcular_desviacion_estandar"}),
+    ("¿Cuál es la mediana de estos tiempos de respuesta?", {"calcular_mediana"}),
+    ("La app crashea al abrir la cámara en Android, te paso el stack trace", {"analizar_crash_log"}),
+    ("Valida el HTML de la página de login, creo que hay etiquetas sin cerrar", {"validar_html"}),
+    ("Qué permisos tengo que declarar para usar la ubicación en iOS", {"verificar_permisos_requeridos"}),
+    ("Ajusta una regresión lineal entre la inversión y las ventas", {"regresion_lineal_simple"}),
+    ("Explícame el error TypeError: undefined is not a function", {"explicar_error_javascript"}),
+    ("Busca en los logs de la API los errores entre las 10 y las 11", {"consultar_logs_indexados", "analizar_logs_api"}),
+    ("Agrupa los crashes de la última versión por firma", {"agrupar_crashes"}),
+]
+
+VERBOS = ["Exporta", "Importa", "Sincroniza", "Valida", "Resume", "Archiva", "Notifica", "Calcula", "Traduce", "Clasifica"]
+OBJETOS = ["facturas", "pedidos", "clientes", "contratos", "empleados", "inventario", "reservas", "tickets",
+           "campañas", "proveedores", "nóminas", "envíos", "cupones", "reseñas", "turnos"]
+DESTINOS = ["a CSV", "con el ERP", "en la base de datos", "por correo", "en el CRM", "a PDF", "en la hoja de cálculo"]
+
+PLANTILLA = '''
+@skill(tags=["{tag}", "negocio"])
+def {nombre}(identificador: str, fecha_desde: str = "", incluir_archivados: bool = False) -> dict:
+    """
+    {descripcion}.
+
+    Args:
+        identificador: Identificador del registro o del lote
+        fecha_desde: Fecha mínima en formato YYYY-MM-DD
+        incluir_archivados: Incluir registros archivados
+
+    Returns:
+        Resumen de la operación
+    """
+    return {{}}
+'''
+
+
+def generar_sinteticas(carpeta: str, cantidad: int) -> None:
+    azar = random.Random(3)
+    combinaciones = list(itertools.product(VERBOS, OBJETOS, DESTINOS))
+    azar.shuffle(combinaciones)
+    with open(os.path.join(carpeta, "negocio.py"), "w", encoding="utf-8") as salida:
+        salida.write("from instantneo.skills import skill\n")
+        for numero, (verbo, objeto, destino) in enumerate(combinaciones[:cantidad]):
+            salida.write(PLANTILLA.format(
+                tag=objeto, nombre=f"{verbo.lower()}_{numero}", descripcion=f"{verbo} {objeto} {destino}"
+            ))
+
+
+def main():
+    for cantidad in (0, 300, 1000):
+        manager = SkillManager()
+        for carpeta in CARPETAS_REALES:
+            manager.load_skills.from_folder(str(RUTA_EJERCICIOS / carpeta))
+        with tempfile.TemporaryDirectory() as temporal:
+            if cantidad:
+                generar_sinteticas(temporal, cantidad)
+                manager.load_skills.from_folder(temporal)
+
+        inicio = time.perf_counter()
+        indice = IndiceSkills(manager)
+        armado = time.perf_counter() - inicio
+
+        print(f"\n{len(indice)} skills registradas, índice armado en {armado * 1000:.1f}ms")
+        print(f"{'k':>3} {'aciertos':>9} {'tokens todas':>13} {'tokens k':>9} {'ahorro':>7} {'por prompt':>11}")
+        for k in (3, 5):
+            aciertos, enviados = 0, 0
+            inicio = time.perf_counter()
+            for _ in range(20):
+                selecciones = [indice.seleccionar(prompt, k) for prompt, _ in PROMPTS]
+            por_prompt = (time.perf_counter() - inicio) / (20 * len(PROMPTS))
+            for (_, esperadas), seleccion in zip(PROMPTS, selecciones):
+                aciertos += bool(esperadas & set(seleccion.skills))
+                enviados += seleccion.tokens_enviadas
+            todas = selecciones[0].tokens_todas
+            promedio = enviados / len(PROMPTS)
+            print(f"{k:>3} {aciertos:>5}/{len(PROMPTS):<3} {todas:>13,} {promedio:>9,.0f}"
+                  f" {1 - promedio / todas:>6.1%} {por_prompt * 1e6:>9.0f}us")
+
+
+if __name__ == "__main__":
+    main()
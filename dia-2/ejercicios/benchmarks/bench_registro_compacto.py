@@ -0,0 +1,129 @@
+"""
+Benchmark: memoria del registry con proxies vs. SkillCompacta
+=============================================================
+
+Genera manifiestos de 1k, 10k y 100k skills sintéticas como las de una
+biblioteca armada desde plantillas (descripción propia; parámetros, tags y
+``supported_formats`` tomados de vocabularios comunes) y mide con tracemalloc
+la memoria que queda retenida al registrarlas:
+
+- con ``registrar_desde_manifiesto()`` (un proxy con su dict de metadata por skill,
+  la misma metadata que tendría la función real con ``@skill``);
+- con ``SkillManagerCompacto.registrar_manifiesto()``.
+
+También mide el tiempo de registrar y de ``get_all_skills_metadata()``, que en
+el registro compacto arma los dicts en cada llamada.
+
+Uso:
+    python benchmarks/bench_registro_compacto.py
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager
+
+from skills_infra.manifiesto import VERSION_MANIFIESTO, registrar_desde_manifiesto
+from skills_infra.registro_compacto import SkillManagerCompacto
+
+SKILLS_POR_ARCHIVO = 100
+PARAMETROS = [
+    ("identificador", "string", "Identificador del registro o del lote"),
+    ("fecha_desde", "string", "Fecha mínima en formato YYYY-MM-DD"),
+    ("fecha_hasta", "string", "Fecha máxima en formato YYYY-MM-DD"),
+    ("incluir_archivados", "boolean", "Incluir registros archivados"),
+    ("limite", "integer", "Cantidad máxima de resultados"),
+    ("formato", "string", "Formato de salida"),
+    ("plataforma", "string", "Plataforma (android, ios o web)"),
+    ("version", "string", "Versión de la aplicación"),
+]
+TAGS = [f"dominio_{numero}" for numero in range(200)] + ["negocio", "reportes", "integraciones", "debugging"]
+FORMATOS = [["csv", "json"], ["pdf"], ["csv", "json", "xlsx"], ["html", "pdf"]]
+
+
+def entrada_sintetica(numero: int, azar: random.Random) -> dict:
+    nombre = f"skill_{numero}"
+    parametros = azar.sample(PARAMETROS, azar.randint(2, 4))
+    return {
+        "nombre": nombre,
+        "archivo": f"biblioteca_{numero // SKILLS_POR_ARCHIVO}.py",
+        "sha256": f"{numero // SKILLS_POR_ARCHIVO:064x}",
+        "metadata": {
+            "name": nombre,
+            "description": f"Procesa el lote {numero} del catálogo y devuelve un resumen",
+            "parameters": {
+                nombre_param: {"type": tipo, "description": descripcion}
+                for nombre_param, tipo, descripcion in parametros
+            },
+            "required": [parametros[0][0]],
+            "tags": sorted(azar.sample(TAGS, azar.randint(3, 5))),
+            "version": "1.0",
+            "supported_formats": azar.choice(FORMATOS),
+        },
+    }
+
+
+def medir(registrar) -> tuple:
+    """(manager, MB retenidos, segundos); el tiempo se toma aparte, sin tracemalloc."""
+    inicio = time.perf_counter()
+    registrar()
+    duracion = time.perf_counter() - inicio
+    gc.collect()
+    tracemalloc.start()
+    manager = registrar()
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return manager, memoria / 1e6, duracion
+
+
+def main():
+    azar = random.Random(17)
+    print(f"{'skills':>7} {'proxies':>10} {'compacto':>10} {'ahorro':>7}"
+          f" {'registrar':>17} {'get_all_skills_metadata':>25}")
+    for cantidad in (1000, 10000, 100000):
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "manifiesto.json")
+            with open(ruta, "w", encoding="utf-8") as salida:
+                json.dump({"version": VERSION_MANIFIESTO,
+                           "skills": [entrada_sintetica(numero, azar) for numero in range(cantidad)]}, salida)
+
+            def con_proxies():
+                manager = SkillManager()
+                registrar_desde_manifiesto(manager, carpeta, ruta)
+                return manager
+
+            def compacto():
+                manager = SkillManagerCompacto()
+                manager.registrar_manifiesto(carpeta, ruta)
+                return manager
+
+            proxies, memoria_proxies, tiempo_proxies = medir(con_proxies)
+            metadata_proxies = time.perf_counter()
+            esperada = proxies.get_all_skills_metadata()
+            metadata_proxies = time.perf_counter() - metadata_proxies
+            del proxies
+            compactas, memoria_compacto, tiempo_compacto = medir(compacto)
+            metadata_compacto = time.perf_counter()
+            assert compactas.get_all_skills_metadata() == esperada
+            metadata_compacto = time.perf_counter() - metadata_compacto
+            del compactas, esperada
+
+        print(f"{cantidad:>7} {memoria_proxies:>8.1f}MB {memoria_compacto:>8.1f}MB"
+              f" {1 - memoria_compacto / memoria_proxies:>6.0%}"
+              f" {tiempo_proxies:>7.2f}s/{tiempo_compacto:.2f}s"
+              f" {metadata_proxies * 1000:>12.0f}ms/{metadata_compacto * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
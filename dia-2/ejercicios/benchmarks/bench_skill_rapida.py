@@ -0,0 +1,74 @@
+"""
+Benchmark: costo del tracking de @skill por llamada
+===================================================
+
+Mide el tiempo por llamada de skills mínimas (``sumar``, ``multiplicar`` y una
+conversión de unidades, como las del día 1 y la demo 05) en cuatro variantes:
+
+- la función sin decorar;
+- con ``@skill``, que guarda cada llamada en un contextvar;
+- con ``skill_rapida(sample_rate=0.01)``, que trackea 1 de cada 100 llamadas;
+- con ``skill_rapida()``, sin tracking ni envoltorio.
+
+Uso:
+    python benchmarks/bench_skill_rapida.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import skill
+
+from skills_infra.skill_rapida import skill_rapida
+
+LLAMADAS = 1000000
+
+
+def sumar(a: int, b: int) -> int:
+    """Suma dos números enteros."""
+    return a + b
+
+
+def multiplicar(a: int, b: int) -> int:
+    """Multiplica dos números enteros."""
+    return a * b
+
+
+def celsius_a_fahrenheit(celsius: float) -> float:
+    """Convierte grados Celsius a Fahrenheit."""
+    return celsius * 9 / 5 + 32
+
+
+VARIANTES = [
+    ("sin decorar", lambda func: func),
+    ("@skill", skill()),
+    ("sample_rate=0.01", skill_rapida(sample_rate=0.01)),
+    ("track=False", skill_rapida()),
+]
+
+
+def por_llamada(funcion, argumentos: tuple) -> float:
+    """Nanosegundos por llamada, el mejor de tres intentos."""
+    mejores = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for _ in range(LLAMADAS):
+            funcion(*argumentos)
+        mejores.append((time.perf_counter() - inicio) / LLAMADAS * 1e9)
+    return min(mejores)
+
+
+def main():
+    print(f"{'skill':<22}" + "".join(f"{nombre:>18}" for nombre, _ in VARIANTES))
+    for func, argumentos in ((sumar, (45, 67)), (multiplicar, (847, 921)), (celsius_a_fahrenheit, (36.6,))):
+        tiempos = [por_llamada(decorar(func), argumentos) for _, decorar in VARIANTES]
+        print(f"{func.__name__:<22}" + "".join(f"{tiempo:>16.0f}ns" for tiempo in tiempos))
+    print(f"\n{LLAMADAS} llamadas por variante; el mejor de tres intentos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: tablas de conocimiento precompiladas
+===============================================
+
+Mide el overhead por llamada de las skills de debugging antes y después de
+construir sus tablas y patrones una sola vez al importar.
+
+- Tablas: "antes" suma a cada llamada el costo de construir el literal de la
+  tabla, que es lo que hacía la versión anterior en cada invocación. El literal
+  se toma del propio código de la skill (argumento de ``cargar_tablas``).
+- Patrones: "antes" resuelve cada patrón por su string con ``re.search``
+  (búsqueda en la cache interna de ``re``), "después" usa el patrón compilado.
+
+Uso:
+    python benchmarks/bench_tablas_conocimiento.py
+"""
+
+import ast
+import re
+import sys
+import timeit
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from api import analizar_logs_api, verificar_endpoint
+from mobile import analizar_crash, check_permisos
+from webapp import debug_javascript, validar_html
+
+REPETICIONES = 2000
+
+CASOS_TABLAS = [
+    (verificar_endpoint, "diagnosticar_error_http", (503,)),
+    (debug_javascript, "explicar_error_javascript", ("", "TypeError: x is undefined")),
+    (check_permisos, "verificar_permisos_requeridos", ("ubicacion", "Android")),
+    (check_permisos, "diagnosticar_problema_permisos", ("la camara no funciona", "iOS")),
+    (analizar_crash, "sugerir_herramientas_debugging", ("network", "Android")),
+    (analizar_crash, "analizar_crash_log", ("java.lang.IllegalStateException\n    at com.app.Main(Main.java:7)",)),
+]
+
+TEXTO_MUESTRA = (
+    '<html><head><title>Inicio</title></head><body><h1>Hola</h1><img src="a.png">'
+    'var x = 1; if (x == 2) { console.log(x) }\n'
+    '2024-01-15 10:00:00 ERROR timeout connecting to db response_time: 350ms\n'
+)
+
+
+def constructor_literal(modulo):
+    """Compila el literal de tablas del módulo en una función que lo construye."""
+    arbol = ast.parse(Path(modulo.__file__).read_text(encoding="utf-8"))
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Call) and getattr(nodo.func, "id", "") == "cargar_tablas":
+            codigo = compile(ast.Expression(nodo.args[2]), modulo.__file__, "eval")
+            return lambda: eval(codigo)
+    raise ValueError(f"{modulo.__name__} no define tablas con cargar_tablas")
+
+
+def patrones_de(modulo):
+    """Patrones compilados a nivel de módulo (sueltos, en tuplas o en dicts)."""
+    encontrados = []
+    for valor in vars(modulo).values():
+        candidatos = valor.values() if isinstance(valor, dict) else valor if isinstance(valor, tuple) else [valor]
+        for candidato in candidatos:
+            if isinstance(candidato, tuple):
+                candidato = candidato[-1]
+            if isinstance(candidato, re.Pattern):
+                encontrados.append(candidato)
+    return encontrados
+
+
+def microsegundos(funcion):
+    return min(timeit.repeat(funcion, number=REPETICIONES, repeat=5)) / REPETICIONES * 1e6
+
+
+def main():
+    print(f"Tablas de conocimiento ({REPETICIONES} llamadas, mejor de 5)\n")
+    print(f"{'skill':<34} {'antes':>10} {'después':>10} {'mejora':>8}")
+    for modulo, nombre, args in CASOS_TABLAS:
+        skill = getattr(modulo, nombre)
+        construir = constructor_literal(modulo)
+        despues = microsegundos(lambda: skill(*args))
+        antes = despues + microsegundos(construir)
+        print(f"{nombre:<34} {antes:>8.2f}µs {despues:>8.2f}µs {antes / despues:>7.1f}x")
+
+    print(f"\nPatrones regex sobre un texto de {len(TEXTO_MUESTRA)} caracteres\n")
+    print(f"{'módulo':<34} {'antes':>10} {'después':>10} {'patrones':>8}")
+    for modulo in (validar_html, debug_javascript, analizar_logs_api, analizar_crash):
+        patrones = patrones_de(modulo)
+        antes = microsegundos(lambda: [re.search(p.pattern, TEXTO_MUESTRA, p.flags) for p in patrones])
+        despues = microsegundos(lambda: [p.search(TEXTO_MUESTRA) for p in patrones])
+        nombre = modulo.__name__.split(".")[-1]
+        print(f"{nombre:<34} {antes:>8.2f}µs {despues:>8.2f}µs {len(patrones):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: validar_html con pila de una sola pasada vs. conteo de etiquetas
+==========================================================================
+
+Genera páginas HTML de distintos tamaños y compara:
+
+1. El algoritmo anterior: re.findall de aperturas y cierres y
+   ``lista.count(tag)`` por cada etiqueta (cuadrático)
+2. validar_html actual: html.parser con pila de elementos abiertos (lineal)
+
+El algoritmo anterior solo se corre hasta ``LIMITE_ANTERIOR`` bytes.
+
+Al final mide una auditoría completa (validar_html + analizar_seo_html) sobre la
+misma página: la segunda skill reutiliza el documento ya parseado.
+
+Uso:
+    python benchmarks/bench_validar_html.py
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+RUTA_SKILLS = Path(__file__).resolve().parent.parent / "skills"
+sys.path.insert(0, str(RUTA_SKILLS))
+sys.path.insert(0, str(RUTA_SKILLS.parent))
+
+from skills_infra.documento_html import limpiar_cache
+from webapp.validar_html import analizar_seo_html, validar_html
+
+TAMANOS_KB = (50, 200, 500, 2048)
+LIMITE_ANTERIOR = 200 * 1024
+
+FRAGMENTO = (
+    '<div class="producto"><h2>Producto</h2><p>Descripción <b>corta</b>'
+    '<img src="foto.png"><a href="/comprar">Comprar</a><ul><li>Envío<li>Garantía</ul></div>\n'
+)
+
+
+def pagina(tamano_kb: int) -> str:
+    repeticiones = tamano_kb * 1024 // len(FRAGMENTO.encode())
+    return f"<html><head><title>Catálogo</title></head><body><h1>Catálogo</h1>{FRAGMENTO * repeticiones}</body></html>"
+
+
+def conteo_anterior(html: str) -> list:
+    """Chequeo de etiquetas sin cerrar tal como lo hacía validar_html antes."""
+    abiertas = re.findall(r'<(\w+)[^>]*>', html)
+    cerradas = re.findall(r'</(\w+)>', html)
+    auto_cerradas = {'img', 'br', 'hr', 'input', 'meta', 'link'}
+    return [
+        f"Etiqueta <{tag}> no está cerrada correctamente"
+        for tag in abiertas
+        if tag not in auto_cerradas and abiertas.count(tag) > cerradas.count(tag)
+    ]
+
+
+def medir(funcion, html):
+    inicio = time.perf_counter()
+    resultado = funcion(html)
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    print(f"{'tamaño':>8} {'etiquetas':>10} {'anterior':>12} {'errores':>8} {'actual':>10} {'errores':>8}")
+    for tamano_kb in TAMANOS_KB:
+        html = pagina(tamano_kb)
+        etiquetas = html.count("<") - html.count("</")
+
+        if len(html) <= LIMITE_ANTERIOR:
+            ms_anterior, errores_anterior = medir(conteo_anterior, html)
+            anterior = f"{ms_anterior:>10.0f}ms {len(errores_anterior):>8}"
+        else:
+            anterior = f"{'(omitido)':>12} {'-':>8}"
+
+        limpiar_cache()
+        ms_actual, resultado = medir(validar_html, html)
+        print(f"{tamano_kb:>6}KB {etiquetas:>10} {anterior} {ms_actual:>8.0f}ms {resultado['total_errores']:>8}")
+
+    html = pagina(TAMANOS_KB[-1])
+    limpiar_cache()
+    ms_validar, _ = medir(validar_html, html)
+    ms_seo, _ = medir(analizar_seo_html, html)
+    print(f"\nAuditoría de {TAMANOS_KB[-1]}KB: validar_html {ms_validar:.0f}ms + analizar_seo_html {ms_seo:.1f}ms (documento en cache)")
+
+
+if __name__ == "__main__":
+    main()
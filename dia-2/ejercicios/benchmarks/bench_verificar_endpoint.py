@@ -0,0 +1,68 @@
+"""
+Benchmark: verificar_endpoint con y sin pool de conexiones
+==========================================================
+
+Corre contra el servidor stub local (sin internet) y compara:
+
+1. Secuencial, una conexión nueva por solicitud (sin keep-alive)
+2. Secuencial, reutilizando conexiones del pool
+3. Concurrente, con pool y límite de concurrencia por host
+
+Uso:
+    python benchmarks/bench_verificar_endpoint.py [solicitudes]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from skills_infra.cliente_http import ClienteHTTP
+from skills_infra.servidor_stub import ServidorStub
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+async def secuencial(url, n, keepalive_max):
+    cliente = ClienteHTTP(keepalive_max=keepalive_max)
+    mediciones = [await cliente.solicitar(url) for _ in range(n)]
+    await cliente.cerrar()
+    return mediciones, cliente.conexiones_creadas
+
+
+async def concurrente(url, n, limite):
+    cliente = ClienteHTTP(limite_por_host=limite)
+    mediciones = await asyncio.gather(*[cliente.solicitar(url) for _ in range(n)])
+    await cliente.cerrar()
+    return mediciones, cliente.conexiones_creadas
+
+
+def medir(nombre, corrutina):
+    inicio = time.perf_counter()
+    mediciones, conexiones = asyncio.run(corrutina)
+    duracion = time.perf_counter() - inicio
+    totales = [m.total_ms for m in mediciones]
+    errores = sum(1 for m in mediciones if m.error)
+    print(f"{nombre:<38} {len(mediciones) / duracion:>9.0f} req/s"
+          f"  p50={percentil(totales, 0.50):6.2f}ms  p95={percentil(totales, 0.95):6.2f}ms"
+          f"  conexiones={conexiones:<4} errores={errores}")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with ServidorStub() as servidor:
+        url = servidor.url("/salud")
+        print(f"{n} solicitudes contra {url}\n")
+        medir("Secuencial, sin keep-alive", secuencial(url, n, keepalive_max=0))
+        medir("Secuencial, con pool", secuencial(url, n, keepalive_max=30))
+        medir("Concurrente (8 por host), con pool", concurrente(url, n, limite=8))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: catálogos por cliente con copias vs. vistas
+======================================================
+
+Arma dos bibliotecas compartidas grandes (2000 y 1000 skills sintéticas) y, para
+cada cliente, un catálogo ``(base ∪ extras) - bloqueadas`` con unas pocas
+skills propias y bloqueadas. Compara ``SkillManagerOperations``, que copia el
+registry en cada operación, con ``OperacionesVista``:
+
+- tiempo para crear el catálogo de un cliente;
+- memoria por catálogo vivo (tracemalloc);
+- tiempo de recorrerlo (``get_tool_names()``, lo que hace ``run()``) y de
+  materializarlo al modificarlo;
+- tiempo de buscar skills por nombre como ``run()`` con cada tool
+  (``get_tool_metadata_by_name()`` y ``get_tool_by_name()``).
+
+Uso:
+    python benchmarks/bench_vistas_skills.py
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+RUTA_EJERCICIOS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUTA_EJERCICIOS))
+
+from instantneo.skills import SkillManager
+from instantneo.skills.skill_manager_operations import SkillManagerOperations
+
+from skills_infra.manifiesto import crear_proxy
+from skills_infra.vistas_skills import OperacionesVista
+
+CLIENTES = 100
+BUSQUEDAS_POR_CLIENTE = 20
+
+
+def crear_biblioteca(prefijo: str, cantidad: int) -> SkillManager:
+    manager = SkillManager()
+    for numero in range(cantidad):
+        nombre = f"{prefijo}_{numero}"
+        metadata = {"name": nombre, "description": "", "parameters": {}, "required": [], "tags": [prefijo]}
+        manager.register_tool(crear_proxy(".", {"nombre": nombre, "archivo": f"{prefijo}.py", "sha256": "", "metadata": metadata}))
+    return manager
+
+
+def crear_clientes(operaciones, base, compartida, azar: random.Random) -> list:
+    funciones_base = list(base.registry.values())
+    clientes = []
+    for _ in range(CLIENTES):
+        extras = SkillManager()
+        for funcion in azar.sample(funciones_base, 5):
+            extras.register_tool(funcion)
+        bloqueadas = SkillManager()
+        for funcion in azar.sample(funciones_base, 20):
+            bloqueadas.register_tool(funcion)
+        clientes.append(operaciones.difference(operaciones.union(compartida, extras), bloqueadas))
+    return clientes
+
+
+def medir_clientes(operaciones, base, compartida):
+    """(catálogos, KB por catálogo vivo)."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    clientes = crear_clientes(operaciones, base, compartida, random.Random(5))
+    memoria = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    return clientes, memoria / CLIENTES / 1e3
+
+
+def main():
+    base = crear_biblioteca("base", 2000)
+    compartida = crear_biblioteca("compartida", 1000)
+    print(f"bibliotecas: {len(base.registry)} + {len(compartida.registry)} skills, {CLIENTES} clientes")
+
+    # Sin tracemalloc: mide solo el tiempo de creación
+    for nombre, operaciones in (("copias", SkillManagerOperations), ("vistas", OperacionesVista)):
+        inicio = time.perf_counter()
+        crear_clientes(operaciones, base, compartida, random.Random(5))
+        print(f"{nombre}: {(time.perf_counter() - inicio) / CLIENTES * 1000:.3f}ms por cliente")
+
+    copias, memoria_copias = medir_clientes(SkillManagerOperations, base, compartida)
+    vistas, memoria_vistas = medir_clientes(OperacionesVista, base, compartida)
+    print(f"memoria por catálogo: {memoria_copias:.1f}KB copias, {memoria_vistas:.1f}KB vistas"
+          " (incluye los managers de extras y bloqueadas)")
+
+    for copia, vista in zip(copias, vistas):
+        assert sorted(copia.get_tool_names()) == sorted(vista.get_tool_names())
+    print(f"skills por catálogo: {len(vistas[0].get_tool_names())}")
+
+    for nombre, clientes in (("copias", copias), ("vistas", vistas)):
+        inicio = time.perf_counter()
+        for cliente in clientes:
+            cliente.get_tool_names()
+        print(f"get_tool_names() {nombre}: {(time.perf_counter() - inicio) / CLIENTES * 1000:.2f}ms por cliente")
+
+    nombres = random.Random(7).sample(vistas[0].get_tool_names(), BUSQUEDAS_POR_CLIENTE)
+    for nombre, clientes in (("copias", copias), ("vistas", vistas)):
+        inicio = time.perf_counter()
+        for cliente in clientes:
+            for skill in nombres:
+                cliente.get_tool_metadata_by_name(skill)
+                cliente.get_tool_by_name(skill)
+        por_busqueda = (time.perf_counter() - inicio) / (CLIENTES * BUSQUEDAS_POR_CLIENTE) * 1e6
+        print(f"búsqueda por nombre {nombre}: {por_busqueda:.1f}µs")
+
+    inicio = time.perf_counter()
+    for vista in vistas:
+        vista.materializar()
+    print(f"materializar una vista: {(time.perf_counter() - inicio) / CLIENTES * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
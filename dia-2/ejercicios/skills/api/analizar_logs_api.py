@@ -2,7 +2,33 @@
 
 from instantneo.skills import skill
 from datetime import datetime
+from pathlib import Path
+import os
 import re
+import sys
+
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
+
+from skills_infra.indice_logs import obtener_indice
+
+# Patrones comunes en logs, compilados una sola vez al importar.
+# Cada patrón alimenta una categoría de hallazgos de analizar_logs_api. Solo importa
+# si la línea coincide, así que no llevan ".*" alrededor: un ".*" inicial vuelve
+# cuadrática la búsqueda en líneas largas.
+PATRONES_LOG = (
+    ("errores", re.compile(r"ERROR|error|Error")),
+    ("warnings", re.compile(r"WARNING|warning|Warning")),
+    ("timeouts", re.compile(r"timeout|timed out|TIMEOUT")),
+    ("problemas_conexion", re.compile(r"connection refused|connection failed|cannot connect")),
+    ("rate_limits", re.compile(r"rate limit|too many requests|429")),
+)
+
+# Tiempos de respuesta (ej: "response_time: 123ms")
+_RE_TIEMPO_RESPUESTA = re.compile(r"response[_\s]time[:\s]+(\d+)ms")
 
 
 @skill(
@@ -20,15 +46,6 @@ def analizar_logs_api(log_texto: str, buscar_errores: bool = True) -> dict:
     Returns:
         Diccionario con análisis de logs y hallazgos
     """
-    # Patrones comunes en logs
-    patrones = {
-        "error": r"(ERROR|error|Error).*",
-        "warning": r"(WARNING|warning|Warning).*",
-        "timeout": r".*(timeout|timed out|TIMEOUT).*",
-        "connection": r".*(connection refused|connection failed|cannot connect).*",
-        "rate_limit": r".*(rate limit|too many requests|429).*"
-    }
-
     hallazgos = {
         "errores": [],
         "warnings": [],
@@ -40,16 +57,9 @@ def analizar_logs_api(log_texto: str, buscar_errores: bool = True) -> dict:
     lineas = log_texto.split('\n')
 
     for linea in lineas:
-        if re.search(patrones["error"], linea):
-            hallazgos["errores"].append(linea.strip())
-        if re.search(patrones["warning"], linea):
-            hallazgos["warnings"].append(linea.strip())
-        if re.search(patrones["timeout"], linea):
-            hallazgos["timeouts"].append(linea.strip())
-        if re.search(patrones["connection"], linea):
-            hallazgos["problemas_conexion"].append(linea.strip())
-        if re.search(patrones["rate_limit"], linea):
-            hallazgos["rate_limits"].append(linea.strip())
+        for categoria, patron in PATRONES_LOG:
+            if patron.search(linea):
+                hallazgos[categoria].append(linea.strip())
 
     total_problemas = sum(len(v) for v in hallazgos.values())
 
@@ -78,9 +88,7 @@ def extraer_metricas_rendimiento(log_texto: str) -> dict:
     Returns:
         Diccionario con métricas calculadas
     """
-    # Buscar patrones de tiempo de respuesta (ej: "response_time: 123ms")
-    patron_tiempo = r"response[_\s]time[:\s]+(\d+)ms"
-    tiempos = [int(t) for t in re.findall(patron_tiempo, log_texto)]
+    tiempos = [int(t) for t in _RE_TIEMPO_RESPUESTA.findall(log_texto)]
 
     if not tiempos:
         return {
@@ -106,3 +114,58 @@ def extraer_metricas_rendimiento(log_texto: str) -> dict:
         "requests_lentos": len([t for t in tiempos if t > 1000]),
         "rendimiento": "EXCELENTE" if promedio < 100 else "BUENO" if promedio < 500 else "NECESITA_OPTIMIZACION"
     }
+
+
+@skill(
+    description="Consulta un archivo de log por rango horario, nivel y componente usando un índice en disco",
+    tags=["api", "debugging", "logs", "performance"]
+)
+def consultar_logs_indexados(
+    ruta_log: str,
+    desde: str = "",
+    hasta: str = "",
+    nivel: str = "",
+    componente: str = "",
+    limite: int = 200
+) -> dict:
+    """
+    Responde preguntas de seguimiento sobre un mismo log sin volver a recorrerlo.
+
+    La primera consulta construye un índice junto al log (<log>.idx.json);
+    las siguientes lo reutilizan mientras el log no cambie de tamaño ni de mtime.
+
+    Args:
+        ruta_log: Ruta al archivo de log
+        desde: Inicio del rango ("2024-01-15 03:00" o solo "03:00")
+        hasta: Fin del rango, inclusive ("04:00")
+        nivel: Nivel de log a filtrar (ERROR, WARNING, INFO, DEBUG)
+        componente: Componente entre corchetes a filtrar (ej: "auth" para [auth])
+        limite: Máximo de líneas a devolver
+
+    Returns:
+        Diccionario con las líneas encontradas y datos del índice usado
+    """
+    if not os.path.isfile(ruta_log):
+        return {"error": f"No se encontró el archivo de log '{ruta_log}'"}
+
+    indice, reconstruido = obtener_indice(ruta_log)
+
+    try:
+        resultado = indice.consultar(desde, hasta, nivel, componente, limite)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    return {
+        "archivo": ruta_log,
+        "indice_reconstruido": reconstruido,
+        "lineas_indexadas": indice.total_lineas,
+        "filtros": {
+            "desde": desde,
+            "hasta": hasta,
+            "nivel": nivel,
+            "componente": componente
+        },
+        "total_coincidencias": resultado["total"],
+        "coincidencias": resultado["lineas"],
+        "truncado": resultado["total"] > len(resultado["lineas"])
+    }
@@ -1,58 +1,25 @@
 """Skills para verificación de endpoints de API"""
 
 from instantneo.skills import skill
-import json
+from pathlib import Path
+import asyncio
+import sys
+from typing import List, Optional
 
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
 
-@skill(
-    description="Verifica el estado y disponibilidad de un endpoint de API",
-    tags=["api", "debugging", "monitoring"]
-)
-def verificar_endpoint(url: str, metodo: str = "GET") -> dict:
-    """
-    Verifica si un endpoint de API está respondiendo correctamente.
-
-    Args:
-        url: URL del endpoint a verificar
-        metodo: Método HTTP a usar (GET, POST, PUT, DELETE)
-
-    Returns:
-        Diccionario con el estado del endpoint
-    """
-    # Simulación de verificación de endpoint
-    endpoints_validos = {
-        "https://api.ejemplo.com/usuarios": {"status": 200, "tiempo_respuesta": "45ms"},
-        "https://api.ejemplo.com/productos": {"status": 200, "tiempo_respuesta": "32ms"},
-        "https://api.ejemplo.com/pedidos": {"status": 503, "tiempo_respuesta": "timeout"},
-    }
+from skills_infra.cliente_http import cliente_compartido, ejecutar
+from skills_infra.tablas import cargar_tablas, ruta_datos
 
-    resultado = endpoints_validos.get(url, {"status": 404, "tiempo_respuesta": "N/A"})
-
-    return {
-        "url": url,
-        "metodo": metodo,
-        "status_code": resultado["status"],
-        "tiempo_respuesta": resultado["tiempo_respuesta"],
-        "disponible": resultado["status"] == 200
-    }
-
-
-@skill(
-    description="Analiza los códigos de respuesta HTTP de una API y sugiere soluciones",
-    tags=["api", "debugging", "troubleshooting"]
-)
-def diagnosticar_error_http(status_code: int, endpoint: str = "") -> dict:
-    """
-    Analiza un código de error HTTP y proporciona diagnóstico y soluciones.
+VERSION_DATOS = 1
 
-    Args:
-        status_code: Código de estado HTTP recibido
-        endpoint: URL del endpoint que generó el error (opcional)
-
-    Returns:
-        Diccionario con diagnóstico y soluciones recomendadas
-    """
-    diagnosticos = {
+# Base de conocimiento, construida una sola vez al importar (ver skills_infra.tablas)
+TABLAS = cargar_tablas(ruta_datos(__file__), VERSION_DATOS, {
+    "diagnosticos_http": {
         400: {
             "tipo": "Bad Request",
             "causa": "La solicitud tiene sintaxis incorrecta o parámetros inválidos",
@@ -108,8 +75,228 @@ def diagnosticar_error_http(status_code: int, endpoint: str = "") -> dict:
             ]
         }
     }
+})
+
+METODOS_HTTP = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
+# Límites superiores (ms) de los buckets del histograma de latencia
+BUCKETS_LATENCIA_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+# Fallos listados individualmente en el resumen del lote; el resto solo se cuenta
+MAX_FALLOS_LISTADOS = 50
+
+
+def _parsear_endpoints(endpoints: list, archivo: str) -> list:
+    """
+    Normaliza la entrada a una lista de (metodo, url).
+
+    Acepta strings "URL" o "METODO URL" y dicts {"url": ..., "metodo": ...}.
+    En el archivo va un endpoint por línea; las vacías y las que empiezan
+    con # se ignoran.
+    """
+    entradas = list(endpoints or [])
+    if archivo:
+        with open(archivo, "r", encoding="utf-8") as f:
+            entradas.extend(linea.strip() for linea in f if linea.strip() and not linea.lstrip().startswith("#"))
+
+    resultado = []
+    for entrada in entradas:
+        if isinstance(entrada, dict):
+            resultado.append((str(entrada.get("metodo", "GET")).upper(), str(entrada.get("url", ""))))
+            continue
+        partes = str(entrada).split()
+        if len(partes) >= 2 and partes[0].upper() in METODOS_HTTP:
+            resultado.append((partes[0].upper(), partes[1]))
+        elif partes:
+            resultado.append(("GET", partes[0]))
+    return resultado
+
+
+def _clase_status(status) -> str:
+    return "error" if status is None else f"{status // 100}xx"
+
+
+def _percentil(ordenados: list, p: float) -> float:
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
 
-    diagnostico = diagnosticos.get(
+def _histograma_latencias(latencias: list) -> dict:
+    """Cuenta latencias por bucket; el último bucket acumula todo lo que excede el mayor límite."""
+    etiquetas = [f"<={limite}ms" for limite in BUCKETS_LATENCIA_MS] + [f">{BUCKETS_LATENCIA_MS[-1]}ms"]
+    conteos = [0] * len(etiquetas)
+    for latencia in latencias:
+        indice = len(BUCKETS_LATENCIA_MS)
+        for i, limite in enumerate(BUCKETS_LATENCIA_MS):
+            if latencia <= limite:
+                indice = i
+                break
+        conteos[indice] += 1
+    return dict(zip(etiquetas, conteos))
+
+
+async def _verificar_todos(pares: list, concurrencia: int, timeout: float) -> list:
+    cliente = cliente_compartido()
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async def verificar(metodo, url):
+        async with semaforo:
+            return await cliente.solicitar(url, metodo, timeout=timeout)
+
+    return await asyncio.gather(*[verificar(metodo, url) for metodo, url in pares])
+
+
+@skill(
+    description="Verifica el estado y disponibilidad de un endpoint de API",
+    tags=["api", "debugging", "monitoring"]
+)
+def verificar_endpoint(url: str, metodo: str = "GET", timeout: float = 10.0) -> dict:
+    """
+    Verifica si un endpoint de API está respondiendo correctamente.
+
+    Hace una solicitud HTTP real reutilizando conexiones keep-alive entre
+    llamadas y mide el tiempo de cada fase (DNS, conexión, TTFB y total).
+
+    Args:
+        url: URL del endpoint a verificar
+        metodo: Método HTTP a usar (GET, POST, PUT, DELETE)
+        timeout: Segundos máximos de espera por la respuesta
+
+    Returns:
+        Diccionario con el estado del endpoint
+    """
+    medicion = ejecutar(cliente_compartido().solicitar(url, metodo, timeout=timeout))
+
+    if medicion.error == "timeout":
+        tiempo_respuesta = "timeout"
+    elif medicion.status is None:
+        tiempo_respuesta = "N/A"
+    else:
+        tiempo_respuesta = f"{round(medicion.total_ms)}ms"
+
+    return {
+        "url": url,
+        "metodo": metodo,
+        "status_code": medicion.status,
+        "tiempo_respuesta": tiempo_respuesta,
+        "tiempos_ms": medicion.tiempos(),
+        "conexion_reutilizada": medicion.conexion_reutilizada,
+        "disponible": medicion.status is not None and 200 <= medicion.status < 300,
+        "error": medicion.error
+    }
+
+
+@skill(
+    description="Verifica muchos endpoints de API en paralelo y devuelve un resumen compacto",
+    tags=["api", "debugging", "monitoring", "performance"]
+)
+def verificar_endpoints_lote(
+    endpoints: Optional[List[str]] = None,
+    archivo: str = "",
+    concurrencia: int = 20,
+    timeout: float = 10.0,
+    top_lentos: int = 5
+) -> dict:
+    """
+    Verifica un lote de endpoints en paralelo en una sola llamada.
+
+    Pensada para health checks de cientos de endpoints: en lugar de una
+    llamada a verificar_endpoint por URL, devuelve solo el resumen.
+
+    Args:
+        endpoints: Lista de URLs, "METODO URL" o {"url": ..., "metodo": ...}
+        archivo: Ruta a un archivo con un endpoint por línea (opcional)
+        concurrencia: Máximo de solicitudes simultáneas en total
+        timeout: Segundos máximos de espera por endpoint
+        top_lentos: Cantidad de endpoints más lentos a incluir
+
+    Returns:
+        Diccionario con disponibilidad por clase de status, histograma de
+        latencias, los endpoints más lentos y los fallos diagnosticados
+    """
+    try:
+        pares = _parsear_endpoints(endpoints, archivo)
+    except OSError as e:
+        return {"error": f"No se pudo leer '{archivo}': {e}"}
+    if not pares:
+        return {"error": "No se indicaron endpoints para verificar"}
+
+    mediciones = ejecutar(_verificar_todos(pares, max(1, concurrencia), timeout))
+
+    por_clase = {}
+    for medicion in mediciones:
+        clase = _clase_status(medicion.status)
+        por_clase[clase] = por_clase.get(clase, 0) + 1
+
+    respondidas = [m for m in mediciones if m.status is not None]
+    latencias = sorted(m.total_ms for m in respondidas)
+    latencia = {"histograma": _histograma_latencias(latencias)}
+    if latencias:
+        latencia.update({
+            "p50": round(_percentil(latencias, 0.50), 2),
+            "p90": round(_percentil(latencias, 0.90), 2),
+            "p99": round(_percentil(latencias, 0.99), 2),
+            "max": round(latencias[-1], 2)
+        })
+
+    mas_lentos = [
+        {"url": m.url, "metodo": m.metodo, "status_code": m.status, "tiempo_ms": round(m.total_ms, 2)}
+        for m in sorted(respondidas, key=lambda m: m.total_ms, reverse=True)[:max(0, top_lentos)]
+    ]
+
+    # Los fallos HTTP se agrupan por código para diagnosticar cada uno una sola vez
+    fallos = []
+    total_fallos = 0
+    diagnosticos = {}
+    for medicion in mediciones:
+        if medicion.status is not None and medicion.status < 400:
+            continue
+        total_fallos += 1
+        if len(fallos) < MAX_FALLOS_LISTADOS:
+            fallos.append({
+                "url": medicion.url,
+                "metodo": medicion.metodo,
+                "status_code": medicion.status,
+                "error": medicion.error
+            })
+        if medicion.status is not None:
+            if medicion.status not in diagnosticos:
+                diagnostico = diagnosticar_error_http(medicion.status)
+                diagnosticos[medicion.status] = {
+                    "tipo_error": diagnostico["tipo_error"],
+                    "causa_probable": diagnostico["causa_probable"],
+                    "soluciones_recomendadas": diagnostico["soluciones_recomendadas"],
+                    "endpoints": 0
+                }
+            diagnosticos[medicion.status]["endpoints"] += 1
+
+    return {
+        "total": len(mediciones),
+        "disponibles": por_clase.get("2xx", 0),
+        "por_clase": dict(sorted(por_clase.items())),
+        "latencia_ms": latencia,
+        "mas_lentos": mas_lentos,
+        "total_fallos": total_fallos,
+        "fallos": fallos,
+        "diagnosticos": diagnosticos
+    }
+
+
+@skill(
+    description="Analiza los códigos de respuesta HTTP de una API y sugiere soluciones",
+    tags=["api", "debugging", "troubleshooting"]
+)
+def diagnosticar_error_http(status_code: int, endpoint: str = "") -> dict:
+    """
+    Analiza un código de error HTTP y proporciona diagnóstico y soluciones.
+
+    Args:
+        status_code: Código de estado HTTP recibido
+        endpoint: URL del endpoint que generó el error (opcional)
+
+    Returns:
+        Diccionario con diagnóstico y soluciones recomendadas
+    """
+    diagnostico = TABLAS["diagnosticos_http"].get(
         status_code,
         {
             "tipo": f"Error {status_code}",
@@ -123,5 +310,5 @@ def diagnosticar_error_http(status_code: int, endpoint: str = "") -> dict:
         "endpoint": endpoint,
         "tipo_error": diagnostico["tipo"],
         "causa_probable": diagnostico["causa"],
-        "soluciones_recomendadas": diagnostico["soluciones"]
+        "soluciones_recomendadas": list(diagnostico["soluciones"])
     }
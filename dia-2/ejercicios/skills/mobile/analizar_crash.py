@@ -1,187 +1,150 @@
 """Skills para análisis de crashes en aplicaciones móviles"""
 
 from instantneo.skills import skill
+from datetime import datetime
+from pathlib import Path
+import os
 import re
+import sys
 
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
 
-@skill(
-    description="Analiza stack traces de crashes móviles y sugiere causas probables",
-    tags=["mobile", "debugging", "crash", "troubleshooting"]
-)
-def analizar_crash_log(stack_trace: str, plataforma: str = "Android") -> dict:
-    """
-    Analiza un stack trace de crash y proporciona diagnóstico.
+from skills_infra.almacen_crashes import RUTA_ALMACEN_POR_DEFECTO, AlmacenCrashes
+from skills_infra.archivos import listar_archivos
+from skills_infra.firmas_crash import TOP_FRAMES, AgrupadorCrashes
+from skills_infra.palabras_clave import MotorPalabrasClave
+from skills_infra.tablas import cargar_tablas, ruta_datos
 
-    Args:
-        stack_trace: Texto del stack trace del crash
-        plataforma: Plataforma móvil (Android o iOS)
+# Líneas del stack trace que se consideran relevantes
+PREFIJOS_ANDROID = ('com.', 'java.', 'android.')
+KEYWORDS_IOS = ('Thread', 'libsystem', 'Foundation', 'UIKit')
 
-    Returns:
-        Diccionario con análisis del crash y soluciones sugeridas
-    """
-    analisis = {
-        "tipo_crash": "Desconocido",
-        "causa_probable": "",
-        "lineas_relevantes": [],
-        "soluciones": []
-    }
+# Archivo y línea donde ocurrió el crash, compilados una sola vez al importar
+_RE_UBICACION = {
+    "android": re.compile(r'at\s+[\w.]+\(([\w.]+):(\d+)\)'),
+    "ios": re.compile(r'([\w.]+)\s+(\d+)\s+[\w.]+'),
+}
+
+# Archivos que se leen como reportes de crash al agrupar un directorio
+EXTENSIONES_CRASH = (".txt", ".log", ".crash", ".trace")
 
-    if plataforma.lower() == "android":
-        # Detectar tipo de excepción
-        if "NullPointerException" in stack_trace or "NPE" in stack_trace:
-            analisis["tipo_crash"] = "NullPointerException"
-            analisis["causa_probable"] = "Intento de acceder a un objeto o variable que es null"
-            analisis["soluciones"] = [
+# Límites de la respuesta de agrupar_crashes
+MAX_ERRORES_LISTADOS = 20
+
+VERSION_DATOS = 1
+
+# Base de conocimiento, construida una sola vez al importar (ver skills_infra.tablas).
+# Las listas de crashes están en orden de prioridad: gana la primera coincidencia.
+TABLAS = cargar_tablas(ruta_datos(__file__), VERSION_DATOS, {
+    "crashes_android": [
+        {
+            "patrones": ["NullPointerException", "NPE"],
+            "tipo": "NullPointerException",
+            "causa": "Intento de acceder a un objeto o variable que es null",
+            "soluciones": [
                 "Agregar null checks antes de usar objetos",
                 "Usar safe call operator (?.) en Kotlin",
                 "Inicializar variables antes de usarlas",
                 "Revisar lifecycle de Activities/Fragments"
             ]
-
-        elif "OutOfMemoryError" in stack_trace or "OOM" in stack_trace:
-            analisis["tipo_crash"] = "OutOfMemoryError"
-            analisis["causa_probable"] = "La aplicación se quedó sin memoria disponible"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["OutOfMemoryError", "OOM"],
+            "tipo": "OutOfMemoryError",
+            "causa": "La aplicación se quedó sin memoria disponible",
+            "soluciones": [
                 "Optimizar carga de imágenes (usar Glide/Picasso)",
                 "Implementar paginación en listas grandes",
                 "Liberar recursos en onDestroy()",
                 "Revisar memory leaks con LeakCanary",
                 "Reducir tamaño de bitmaps antes de cargar"
             ]
-
-        elif "ClassCastException" in stack_trace:
-            analisis["tipo_crash"] = "ClassCastException"
-            analisis["causa_probable"] = "Intento de cast inválido entre tipos incompatibles"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["ClassCastException"],
+            "tipo": "ClassCastException",
+            "causa": "Intento de cast inválido entre tipos incompatibles",
+            "soluciones": [
                 "Verificar tipos antes de hacer cast",
                 "Usar 'is' operator en Kotlin para verificar tipo",
                 "Revisar generics en colecciones",
                 "Validar datos de Intent extras"
             ]
-
-        elif "IndexOutOfBoundsException" in stack_trace:
-            analisis["tipo_crash"] = "IndexOutOfBoundsException"
-            analisis["causa_probable"] = "Acceso a índice inválido en array o lista"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["IndexOutOfBoundsException"],
+            "tipo": "IndexOutOfBoundsException",
+            "causa": "Acceso a índice inválido en array o lista",
+            "soluciones": [
                 "Verificar tamaño de lista antes de acceder",
                 "Usar getOrNull() en Kotlin",
                 "Validar índices en loops",
                 "Comprobar que la lista no esté vacía"
             ]
-
-        elif "IllegalStateException" in stack_trace:
-            analisis["tipo_crash"] = "IllegalStateException"
-            analisis["causa_probable"] = "Operación llamada en momento o estado inválido"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["IllegalStateException"],
+            "tipo": "IllegalStateException",
+            "causa": "Operación llamada en momento o estado inválido",
+            "soluciones": [
                 "Revisar lifecycle de componentes",
                 "No llamar UI operations después de onSaveInstanceState()",
                 "Verificar estado de Fragment antes de transactions",
                 "Usar commitAllowingStateLoss() con precaución"
             ]
-
-        # Extraer líneas relevantes del stack trace
-        lines = stack_trace.split('\n')
-        for line in lines[:10]:  # Primeras 10 líneas son generalmente las más relevantes
-            if 'at ' in line and ('com.', 'java.', 'android.') in line:
-                analisis["lineas_relevantes"].append(line.strip())
-
-    elif plataforma.lower() == "ios":
-        # Detectar tipo de crash en iOS
-        if "SIGSEGV" in stack_trace or "SEGV" in stack_trace:
-            analisis["tipo_crash"] = "SIGSEGV (Segmentation Fault)"
-            analisis["causa_probable"] = "Acceso a memoria inválida o liberada"
-            analisis["soluciones"] = [
+        }
+    ],
+    "crashes_ios": [
+        {
+            "patrones": ["SIGSEGV", "SEGV"],
+            "tipo": "SIGSEGV (Segmentation Fault)",
+            "causa": "Acceso a memoria inválida o liberada",
+            "soluciones": [
                 "Revisar strong/weak references",
                 "Verificar acceso a objetos deallocated",
                 "Usar Address Sanitizer en Xcode",
                 "Revisar crashes en background threads"
             ]
-
-        elif "EXC_BAD_ACCESS" in stack_trace:
-            analisis["tipo_crash"] = "EXC_BAD_ACCESS"
-            analisis["causa_probable"] = "Acceso a memoria que ya fue liberada (zombie object)"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["EXC_BAD_ACCESS"],
+            "tipo": "EXC_BAD_ACCESS",
+            "causa": "Acceso a memoria que ya fue liberada (zombie object)",
+            "soluciones": [
                 "Habilitar Zombie Objects en Xcode",
                 "Revisar retain cycles con Instruments",
                 "Verificar delegates como weak",
                 "Comprobar acceso a self en closures"
             ]
-
-        elif "NSInvalidArgumentException" in stack_trace:
-            analisis["tipo_crash"] = "NSInvalidArgumentException"
-            analisis["causa_probable"] = "Argumento inválido pasado a un método"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["NSInvalidArgumentException"],
+            "tipo": "NSInvalidArgumentException",
+            "causa": "Argumento inválido pasado a un método",
+            "soluciones": [
                 "Validar parámetros antes de llamar métodos",
                 "Verificar tipos de datos en Objective-C",
                 "Comprobar que objetos no sean nil",
                 "Revisar configuración de xibs/storyboards"
             ]
-
-        elif "fatal error: unexpectedly found nil" in stack_trace:
-            analisis["tipo_crash"] = "Unwrapping nil Optional"
-            analisis["causa_probable"] = "Force unwrap (!) de un Optional que es nil"
-            analisis["soluciones"] = [
+        },
+        {
+            "patrones": ["fatal error: unexpectedly found nil"],
+            "tipo": "Unwrapping nil Optional",
+            "causa": "Force unwrap (!) de un Optional que es nil",
+            "soluciones": [
                 "Usar optional binding (if let / guard let)",
                 "Evitar force unwrapping (!)",
                 "Usar nil coalescing operator (??)",
                 "Inicializar optionals correctamente"
             ]
-
-        # Extraer líneas relevantes
-        lines = stack_trace.split('\n')
-        for line in lines[:10]:
-            if any(keyword in line for keyword in ['Thread', 'libsystem', 'Foundation', 'UIKit']):
-                analisis["lineas_relevantes"].append(line.strip())
-
-    # Intentar extraer archivo y línea donde ocurrió
-    archivo_crash = None
-    linea_crash = None
-
-    if plataforma.lower() == "android":
-        match = re.search(r'at\s+[\w.]+\(([\w.]+):(\d+)\)', stack_trace)
-        if match:
-            archivo_crash = match.group(1)
-            linea_crash = match.group(2)
-    elif plataforma.lower() == "ios":
-        match = re.search(r'([\w.]+)\s+(\d+)\s+[\w.]+', stack_trace)
-        if match:
-            archivo_crash = match.group(1)
-            linea_crash = match.group(2)
-
-    return {
-        "plataforma": plataforma,
-        "tipo_crash": analisis["tipo_crash"],
-        "causa_probable": analisis["causa_probable"],
-        "archivo": archivo_crash,
-        "linea": linea_crash,
-        "stack_trace_relevante": analisis["lineas_relevantes"][:5],
-        "soluciones_recomendadas": analisis["soluciones"],
-        "herramientas_debugging": [
-            "Android Studio Debugger" if plataforma.lower() == "android" else "Xcode Debugger",
-            "Crashlytics/Firebase para tracking",
-            "LeakCanary" if plataforma.lower() == "android" else "Instruments",
-            "Logs del sistema (logcat/Console)"
-        ],
-        "siguiente_paso": "Reproducir el crash localmente usando el debugger y breakpoints"
-    }
-
-
-@skill(
-    description="Sugiere herramientas y técnicas para debugging de crashes específicos",
-    tags=["mobile", "debugging", "crash", "tools"]
-)
-def sugerir_herramientas_debugging(tipo_problema: str, plataforma: str = "Android") -> dict:
-    """
-    Sugiere herramientas específicas para debugging según el tipo de problema.
-
-    Args:
-        tipo_problema: Tipo de problema a debuggear (memory, ui, network, crash, etc.)
-        plataforma: Plataforma móvil (Android o iOS)
-
-    Returns:
-        Diccionario con herramientas y técnicas recomendadas
-    """
-    herramientas = {
+        }
+    ],
+    "herramientas": {
         "Android": {
             "memory": {
                 "herramientas": [
@@ -298,10 +261,111 @@ def sugerir_herramientas_debugging(tipo_problema: str, plataforma: str = "Androi
                 ]
             }
         }
+    },
+    "mejores_practicas": [
+        "Debuggear en múltiples dispositivos y versiones de OS",
+        "Mantener logs detallados pero no excesivos",
+        "Usar analytics para detectar patrones",
+        "Implementar feature flags para rollback rápido"
+    ]
+})
+
+# Patrones de excepción por plataforma; cada grupo es el índice de su entrada en la tabla
+_MOTORES_CRASH = {
+    plataforma: MotorPalabrasClave(
+        {i: crash["patrones"] for i, crash in enumerate(TABLAS["crashes_" + plataforma])},
+        ignorar_mayusculas=False
+    )
+    for plataforma in ("android", "ios")
+}
+
+
+@skill(
+    description="Analiza stack traces de crashes móviles y sugiere causas probables",
+    tags=["mobile", "debugging", "crash", "troubleshooting"]
+)
+def analizar_crash_log(stack_trace: str, plataforma: str = "Android") -> dict:
+    """
+    Analiza un stack trace de crash y proporciona diagnóstico.
+
+    Args:
+        stack_trace: Texto del stack trace del crash
+        plataforma: Plataforma móvil (Android o iOS)
+
+    Returns:
+        Diccionario con análisis del crash y soluciones sugeridas
+    """
+    plataforma_lower = plataforma.lower()
+    analisis = {
+        "tipo_crash": "Desconocido",
+        "causa_probable": "",
+        "lineas_relevantes": [],
+        "soluciones": []
+    }
+
+    if plataforma_lower in ("android", "ios"):
+        # Detectar tipo de excepción: gana la primera entrada de la tabla que aparezca
+        indice = _MOTORES_CRASH[plataforma_lower].primero(stack_trace)
+        if indice is not None:
+            crash = TABLAS["crashes_" + plataforma_lower][indice]
+            analisis["tipo_crash"] = crash["tipo"]
+            analisis["causa_probable"] = crash["causa"]
+            analisis["soluciones"] = list(crash["soluciones"])
+
+        # Extraer líneas relevantes: las primeras 10 líneas son generalmente las más relevantes
+        for line in stack_trace.split('\n')[:10]:
+            if plataforma_lower == "android":
+                relevante = 'at ' in line and any(prefijo in line for prefijo in PREFIJOS_ANDROID)
+            else:
+                relevante = any(keyword in line for keyword in KEYWORDS_IOS)
+            if relevante:
+                analisis["lineas_relevantes"].append(line.strip())
+
+    # Intentar extraer archivo y línea donde ocurrió
+    archivo_crash = None
+    linea_crash = None
+
+    patron_ubicacion = _RE_UBICACION.get(plataforma_lower)
+    match = patron_ubicacion.search(stack_trace) if patron_ubicacion else None
+    if match:
+        archivo_crash = match.group(1)
+        linea_crash = match.group(2)
+
+    return {
+        "plataforma": plataforma,
+        "tipo_crash": analisis["tipo_crash"],
+        "causa_probable": analisis["causa_probable"],
+        "archivo": archivo_crash,
+        "linea": linea_crash,
+        "stack_trace_relevante": analisis["lineas_relevantes"][:5],
+        "soluciones_recomendadas": analisis["soluciones"],
+        "herramientas_debugging": [
+            "Android Studio Debugger" if plataforma_lower == "android" else "Xcode Debugger",
+            "Crashlytics/Firebase para tracking",
+            "LeakCanary" if plataforma_lower == "android" else "Instruments",
+            "Logs del sistema (logcat/Console)"
+        ],
+        "siguiente_paso": "Reproducir el crash localmente usando el debugger y breakpoints"
     }
 
+
+@skill(
+    description="Sugiere herramientas y técnicas para debugging de crashes específicos",
+    tags=["mobile", "debugging", "crash", "tools"]
+)
+def sugerir_herramientas_debugging(tipo_problema: str, plataforma: str = "Android") -> dict:
+    """
+    Sugiere herramientas específicas para debugging según el tipo de problema.
+
+    Args:
+        tipo_problema: Tipo de problema a debuggear (memory, ui, network, crash, etc.)
+        plataforma: Plataforma móvil (Android o iOS)
+
+    Returns:
+        Diccionario con herramientas y técnicas recomendadas
+    """
     tipo_lower = tipo_problema.lower()
-    plataforma_tools = herramientas.get(plataforma, {})
+    plataforma_tools = TABLAS["herramientas"].get(plataforma, {})
     info = plataforma_tools.get(tipo_lower)
 
     if not info:
@@ -314,18 +378,259 @@ def sugerir_herramientas_debugging(tipo_problema: str, plataforma: str = "Androi
     return {
         "plataforma": plataforma,
         "tipo_problema": tipo_problema,
-        "herramientas_recomendadas": info["herramientas"],
-        "tecnicas_debugging": info["tecnicas"],
+        "herramientas_recomendadas": list(info["herramientas"]),
+        "tecnicas_debugging": list(info["tecnicas"]),
         "recursos_adicionales": [
             f"Documentación oficial de {'Android' if plataforma == 'Android' else 'Apple'}",
             "Stack Overflow - busca errores específicos",
             "Medium/Dev.to - artículos de debugging",
             "Comunidad de desarrolladores en Discord/Slack"
         ],
-        "mejores_practicas": [
-            "Debuggear en múltiples dispositivos y versiones de OS",
-            "Mantener logs detallados pero no excesivos",
-            "Usar analytics para detectar patrones",
-            "Implementar feature flags para rollback rápido"
-        ]
+        "mejores_practicas": list(TABLAS["mejores_practicas"])
+    }
+
+
+def _momento(valor) -> float:
+    """Timestamp de un reporte: número (epoch) o fecha ISO 8601."""
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    return datetime.fromisoformat(str(valor).replace("Z", "+00:00")).timestamp()
+
+
+def _fecha(momento) -> str:
+    return datetime.fromtimestamp(momento).isoformat(timespec="seconds") if momento is not None else None
+
+
+def _diagnostico(stack_trace: str, plataforma: str) -> dict:
+    """Las claves de analizar_crash_log que hacen falta para resumir un bucket."""
+    diagnostico = analizar_crash_log(stack_trace, plataforma)
+    return {
+        "tipo_crash": diagnostico["tipo_crash"],
+        "causa_probable": diagnostico["causa_probable"],
+        "archivo": diagnostico["archivo"],
+        "linea": diagnostico["linea"],
+        "soluciones_recomendadas": diagnostico["soluciones_recomendadas"]
+    }
+
+
+def _leer_reportes(reportes: list, directorio: str, errores: list) -> list:
+    """
+    Normaliza la entrada a una lista de (stack_trace, momento, origen).
+
+    Los reportes que no se pueden leer se agregan a ``errores``.
+    """
+    leidos = []
+    for i, reporte in enumerate(reportes or []):
+        if isinstance(reporte, str):
+            leidos.append((reporte, None, f"#{i}"))
+            continue
+        try:
+            momento = _momento(reporte["momento"]) if reporte.get("momento") is not None else None
+            leidos.append((reporte["stack_trace"], momento, str(reporte.get("id", f"#{i}"))))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            errores.append({"origen": f"#{i}", "error": f"Reporte inválido: {type(e).__name__}: {e}"})
+
+    if directorio:
+        for ruta in listar_archivos(directorio, EXTENSIONES_CRASH):
+            origen = os.path.relpath(ruta, directorio)
+            try:
+                with open(ruta, "r", encoding="utf-8", errors="replace") as f:
+                    leidos.append((f.read(), os.path.getmtime(ruta), origen))
+            except OSError as e:
+                errores.append({"origen": origen, "error": str(e)})
+    return leidos
+
+
+@skill(
+    description="Agrupa miles de crashes móviles por firma de stack trace y diagnostica un representante por grupo",
+    tags=["mobile", "debugging", "crash", "troubleshooting", "performance"]
+)
+def agrupar_crashes(
+    reportes: list = None,
+    directorio: str = "",
+    plataforma: str = "Android",
+    top_frames: int = TOP_FRAMES,
+    paquetes_app: list = None,
+    max_buckets: int = 10
+) -> dict:
+    """
+    Agrupa reportes de crash en buckets con la misma firma (tipo de excepción y
+    primeros frames de la app, sin direcciones, números de línea ni sufijos de
+    lambdas) y analiza con analizar_crash_log solo un reporte por bucket.
+
+    Args:
+        reportes: Stack traces como texto o {"stack_trace", "momento", "id"};
+            momento es un timestamp o una fecha ISO 8601
+        directorio: Carpeta con un reporte por archivo (.txt, .log, .crash, .trace);
+            el momento de cada reporte es la fecha de modificación del archivo
+        plataforma: Plataforma móvil (Android o iOS)
+        top_frames: Frames de la app que forman la firma
+        paquetes_app: Paquetes (Android, "com.miapp.") o imágenes (iOS, "MiApp") de
+            la app; si se omiten, cuenta todo lo que no sea de la plataforma
+        max_buckets: Cantidad de buckets a incluir, del más frecuente al menos
+
+    Returns:
+        Diccionario con totales y, por bucket, firma, cantidad, primera y última
+        aparición, frames y el diagnóstico de su reporte representativo
+    """
+    if directorio and not os.path.isdir(directorio):
+        return {"error": f"No se encontró el directorio '{directorio}'"}
+
+    errores = []
+    leidos = _leer_reportes(reportes, directorio, errores)
+    if not leidos:
+        return {"error": "No se indicaron reportes de crash para agrupar"}
+
+    agrupador = AgrupadorCrashes(plataforma, max(1, top_frames), paquetes_app or ())
+    for stack_trace, momento, origen in leidos:
+        agrupador.agregar(stack_trace, momento, origen)
+
+    buckets = []
+    for bucket in agrupador.buckets()[:max(0, max_buckets)]:
+        buckets.append({
+            "firma": bucket.firma.firma,
+            "cantidad": bucket.cantidad,
+            "porcentaje": round(100 * bucket.cantidad / agrupador.total, 1),
+            "tipo_excepcion": bucket.firma.tipo_excepcion,
+            "frames": list(bucket.firma.frames),
+            "primera_vez": _fecha(bucket.primera_vez),
+            "ultima_vez": _fecha(bucket.ultima_vez),
+            "ejemplos": list(bucket.ejemplos),
+            "diagnostico": _diagnostico(bucket.representante, plataforma)
+        })
+
+    return {
+        "plataforma": plataforma,
+        "total_reportes": agrupador.total,
+        "total_buckets": len(agrupador),
+        "buckets": buckets,
+        "total_errores": len(errores),
+        "errores": errores[:MAX_ERRORES_LISTADOS]
+    }
+
+
+@skill(
+    description="Registra crashes nuevos de un directorio en el almacén persistente de buckets por versión y plataforma",
+    tags=["mobile", "debugging", "crash", "performance"]
+)
+def registrar_crashes(
+    directorio: str = "",
+    reportes: list = None,
+    version_app: str = "",
+    plataforma: str = "",
+    ruta_almacen: str = ""
+) -> dict:
+    """
+    Agrega crashes al almacén SQLite de buckets. Los archivos ya registrados
+    que no cambiaron no se vuelven a leer y los reportes repetidos no se cuentan
+    dos veces, así que se puede llamar sobre la misma carpeta en cada sesión.
+
+    Args:
+        directorio: Carpeta con un reporte por archivo (.txt, .log, .crash, .trace)
+        reportes: Reportes sueltos: stack traces o {"stack_trace", "version_app",
+            "plataforma", "momento", "id"}
+        version_app: Versión de la app para los reportes que no la declaran
+            (por ejemplo con una línea "App version: 4.2.0")
+        plataforma: Plataforma (Android o iOS) si no se deduce del reporte
+        ruta_almacen: Archivo SQLite del almacén (por defecto en ~/.cache/skills_infra)
+
+    Returns:
+        Diccionario con archivos leídos y salteados, reportes nuevos y repetidos,
+        buckets nuevos y las versiones registradas
+    """
+    if directorio and not os.path.isdir(directorio):
+        return {"error": f"No se encontró el directorio '{directorio}'"}
+    if not directorio and not reportes:
+        return {"error": "No se indicaron reportes de crash para registrar"}
+
+    sueltos = []
+    for i, reporte in enumerate(reportes or []):
+        if isinstance(reporte, str):
+            reporte = {"stack_trace": reporte}
+        if not isinstance(reporte, dict) or not isinstance(reporte.get("stack_trace"), str):
+            return {"error": f"Reporte #{i} inválido: se esperaba texto o un dict con 'stack_trace'"}
+        try:
+            momento = _momento(reporte["momento"]) if reporte.get("momento") is not None else None
+        except ValueError as e:
+            return {"error": f"Reporte #{i} inválido: {e}"}
+        sueltos.append({
+            "stack_trace": reporte["stack_trace"],
+            "version_app": reporte.get("version_app") or version_app,
+            "plataforma": reporte.get("plataforma") or plataforma,
+            "momento": momento,
+            "origen": str(reporte.get("id", f"#{i}"))
+        })
+
+    with AlmacenCrashes(ruta_almacen or RUTA_ALMACEN_POR_DEFECTO) as almacen:
+        resultado = {"archivos": 0, "sin_cambios": 0, "nuevos": 0, "repetidos": 0, "buckets_nuevos": 0, "errores": []}
+        if directorio:
+            resultado = almacen.registrar_directorio(directorio, version_app, plataforma)
+        if sueltos:
+            for clave, valor in almacen.registrar(sueltos).items():
+                resultado[clave] += valor
+        versiones = almacen.versiones()
+
+    errores = resultado.pop("errores")
+    return {
+        **resultado,
+        "total_errores": len(errores),
+        "errores": errores[:MAX_ERRORES_LISTADOS],
+        "versiones": versiones
+    }
+
+
+@skill(
+    description="Consulta los buckets de crashes registrados: los más frecuentes o los nuevos de una versión",
+    tags=["mobile", "debugging", "crash", "troubleshooting"]
+)
+def consultar_crashes(
+    version_app: str = "",
+    plataforma: str = "",
+    solo_nuevos: bool = False,
+    max_buckets: int = 10,
+    diagnosticar: bool = True,
+    ruta_almacen: str = ""
+) -> dict:
+    """
+    Resume el almacén de crashes sin leer los reportes originales. Por ejemplo,
+    "top de crashes nuevos en 4.2.0" es consultar_crashes("4.2.0", solo_nuevos=True).
+
+    Args:
+        version_app: Contar solo esta versión de la app (vacío: todas)
+        plataforma: Contar solo esta plataforma (Android o iOS; vacío: ambas)
+        solo_nuevos: Solo buckets que no aparecieron en versiones anteriores
+            (requiere version_app)
+        max_buckets: Cantidad de buckets a incluir, del más frecuente al menos
+        diagnosticar: Incluir el diagnóstico de analizar_crash_log del
+            reporte representativo de cada bucket
+        ruta_almacen: Archivo SQLite del almacén (por defecto en ~/.cache/skills_infra)
+
+    Returns:
+        Diccionario con reportes y buckets del filtro, las versiones registradas
+        y por bucket: cantidad, primera y última aparición, reportes por versión
+        y diagnóstico
+    """
+    ruta_almacen = ruta_almacen or RUTA_ALMACEN_POR_DEFECTO
+    if not os.path.isfile(ruta_almacen):
+        return {"error": "No hay crashes registrados; usa registrar_crashes primero"}
+
+    with AlmacenCrashes(ruta_almacen) as almacen:
+        try:
+            totales = almacen.contar(version_app, plataforma, solo_nuevos)
+            buckets = almacen.top_buckets(version_app, plataforma, solo_nuevos, max_buckets)
+        except ValueError as e:
+            return {"error": str(e)}
+        versiones = almacen.versiones(plataforma)
+        for bucket in buckets:
+            bucket["primera_vez"] = _fecha(bucket["primera_vez"])
+            bucket["ultima_vez"] = _fecha(bucket["ultima_vez"])
+            if diagnosticar:
+                bucket["diagnostico"] = _diagnostico(almacen.representante(bucket["firma"]), bucket["plataforma"])
+
+    return {
+        "filtros": {"version_app": version_app, "plataforma": plataforma, "solo_nuevos": solo_nuevos},
+        "total_reportes": totales["reportes"],
+        "total_buckets": totales["buckets"],
+        "versiones": versiones,
+        "buckets": buckets
     }
@@ -1,27 +1,33 @@
 """Skills para verificación de permisos en aplicaciones móviles"""
 
 from instantneo.skills import skill
+from pathlib import Path
+import sys
 
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
 
-@skill(
-    description="Verifica qué permisos necesita una funcionalidad de app móvil y si están configurados",
-    tags=["mobile", "debugging", "permissions"]
-)
-def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android") -> dict:
-    """
-    Verifica los permisos necesarios para una funcionalidad específica de app móvil.
+from skills_infra.indice_difuso import IndiceDifuso
+from skills_infra.tablas import cargar_tablas, ruta_datos
 
-    Args:
-        funcionalidad: Funcionalidad a verificar (ej: "camara", "ubicacion", "notificaciones")
-        plataforma: Plataforma móvil (Android o iOS)
+VERSION_DATOS = 1
 
-    Returns:
-        Diccionario con permisos necesarios y configuración
-    """
-    # Base de conocimiento de permisos por funcionalidad
-    permisos_android = {
+# Puntaje desde el que una búsqueda difusa se toma como la funcionalidad o el
+# problema pedido; por debajo se devuelve como sugerencia
+SIMILITUD_FUNCIONALIDAD = 0.6
+COBERTURA_PROBLEMA = 0.7
+MAX_SUGERENCIAS = 3
+
+# Base de conocimiento, construida una sola vez al importar (ver skills_infra.tablas)
+TABLAS = cargar_tablas(ruta_datos(__file__), VERSION_DATOS, {
+    # Permisos por funcionalidad
+    "permisos_android": {
         "camara": {
             "permisos": ["android.permission.CAMERA"],
+            "alias": ["camera", "foto", "video", "escanear codigo qr"],
             "permisos_runtime": True,
             "desde_api": 23,
             "manifest": '<uses-permission android:name="android.permission.CAMERA" />',
@@ -32,6 +38,7 @@ def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android
                 "android.permission.ACCESS_FINE_LOCATION",
                 "android.permission.ACCESS_COARSE_LOCATION"
             ],
+            "alias": ["location", "gps", "geolocalizacion", "mapa"],
             "permisos_runtime": True,
             "desde_api": 23,
             "manifest": '<uses-permission android:name="android.permission.ACCESS_FINE_LOCATION" />',
@@ -42,6 +49,7 @@ def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android
                 "android.permission.READ_EXTERNAL_STORAGE",
                 "android.permission.WRITE_EXTERNAL_STORAGE"
             ],
+            "alias": ["storage", "archivos", "galeria", "guardar archivos"],
             "permisos_runtime": True,
             "desde_api": 23,
             "manifest": '<uses-permission android:name="android.permission.WRITE_EXTERNAL_STORAGE" />',
@@ -49,16 +57,17 @@ def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android
         },
         "notificaciones": {
             "permisos": ["android.permission.POST_NOTIFICATIONS"],
+            "alias": ["notifications", "push", "notificaciones push"],
             "permisos_runtime": True,
             "desde_api": 33,
             "manifest": '<uses-permission android:name="android.permission.POST_NOTIFICATIONS" />',
             "codigo_ejemplo": 'NotificationManagerCompat.from(context).notify()'
         }
-    }
-
-    permisos_ios = {
+    },
+    "permisos_ios": {
         "camara": {
             "permisos": ["NSCameraUsageDescription"],
+            "alias": ["camera", "foto", "video", "escanear codigo qr"],
             "archivo_config": "Info.plist",
             "ejemplo_plist": '<key>NSCameraUsageDescription</key><string>Necesitamos acceso a la cámara para...</string>',
             "codigo_ejemplo": 'AVCaptureDevice.requestAccess(for: .video)'
@@ -68,96 +77,36 @@ def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android
                 "NSLocationWhenInUseUsageDescription",
                 "NSLocationAlwaysUsageDescription"
             ],
+            "alias": ["location", "gps", "geolocalizacion", "mapa"],
             "archivo_config": "Info.plist",
             "ejemplo_plist": '<key>NSLocationWhenInUseUsageDescription</key><string>Necesitamos tu ubicación para...</string>',
             "codigo_ejemplo": 'CLLocationManager().requestWhenInUseAuthorization()'
         },
         "notificaciones": {
             "permisos": ["Push Notifications Capability"],
+            "alias": ["notifications", "push", "notificaciones push", "apns"],
             "archivo_config": "Capabilities en Xcode",
             "codigo_ejemplo": 'UNUserNotificationCenter.current().requestAuthorization()',
             "nota_adicional": "Requiere certificado APNs configurado"
         }
-    }
-
-    funcionalidad_lower = funcionalidad.lower()
-
-    if plataforma.lower() == "android":
-        info = permisos_android.get(funcionalidad_lower)
-        if not info:
-            return {
-                "error": f"Funcionalidad '{funcionalidad}' no encontrada en base de datos",
-                "funcionalidades_disponibles": list(permisos_android.keys())
-            }
-
-        return {
-            "plataforma": "Android",
-            "funcionalidad": funcionalidad,
-            "permisos_requeridos": info["permisos"],
-            "requiere_runtime_permission": info["permisos_runtime"],
-            "desde_api_level": info.get("desde_api"),
-            "configuracion_manifest": info.get("manifest"),
-            "ejemplo_codigo": info.get("codigo_ejemplo"),
-            "nota_adicional": info.get("nota_adicional", ""),
-            "pasos_implementacion": [
-                "1. Agregar permisos al AndroidManifest.xml",
-                "2. Solicitar permisos en runtime (API 23+)",
-                "3. Manejar respuesta del usuario (granted/denied)",
-                "4. Implementar fallback si se niega el permiso"
-            ]
-        }
-
-    elif plataforma.lower() == "ios":
-        info = permisos_ios.get(funcionalidad_lower)
-        if not info:
-            return {
-                "error": f"Funcionalidad '{funcionalidad}' no encontrada en base de datos",
-                "funcionalidades_disponibles": list(permisos_ios.keys())
-            }
-
-        return {
-            "plataforma": "iOS",
-            "funcionalidad": funcionalidad,
-            "keys_requeridas": info["permisos"],
-            "archivo_configuracion": info["archivo_config"],
-            "ejemplo_configuracion": info.get("ejemplo_plist"),
-            "ejemplo_codigo": info.get("codigo_ejemplo"),
-            "nota_adicional": info.get("nota_adicional", ""),
-            "pasos_implementacion": [
-                "1. Agregar keys de privacidad al Info.plist",
-                "2. Incluir descripción clara del uso del permiso",
-                "3. Solicitar permiso programáticamente",
-                "4. Revisar estado del permiso antes de usar funcionalidad"
-            ]
-        }
-
-    return {
-        "error": f"Plataforma '{plataforma}' no soportada",
-        "plataformas_disponibles": ["Android", "iOS"]
-    }
-
-
-@skill(
-    description="Diagnostica problemas comunes relacionados con permisos en apps móviles",
-    tags=["mobile", "debugging", "permissions", "troubleshooting"]
-)
-def diagnosticar_problema_permisos(
-    descripcion_problema: str,
-    plataforma: str = "Android"
-) -> dict:
-    """
-    Diagnostica y sugiere soluciones para problemas comunes de permisos.
-
-    Args:
-        descripcion_problema: Descripción del problema que está ocurriendo
-        plataforma: Plataforma móvil (Android o iOS)
-
-    Returns:
-        Diccionario con diagnóstico y soluciones
-    """
-    problemas_comunes = {
+    },
+    "pasos_android": [
+        "1. Agregar permisos al AndroidManifest.xml",
+        "2. Solicitar permisos en runtime (API 23+)",
+        "3. Manejar respuesta del usuario (granted/denied)",
+        "4. Implementar fallback si se niega el permiso"
+    ],
+    "pasos_ios": [
+        "1. Agregar keys de privacidad al Info.plist",
+        "2. Incluir descripción clara del uso del permiso",
+        "3. Solicitar permiso programáticamente",
+        "4. Revisar estado del permiso antes de usar funcionalidad"
+    ],
+    # Problemas comunes por plataforma, en orden de prioridad de detección
+    "problemas_comunes": {
         "Android": {
             "permiso denegado": {
+                "alias": ["permission denied", "permiso rechazado", "sin permiso", "no me deja dar permiso"],
                 "causas": [
                     "Usuario denegó el permiso en el diálogo",
                     "Permiso no declarado en AndroidManifest.xml",
@@ -172,6 +121,7 @@ def diagnosticar_problema_permisos(
                 "codigo_util": "if (shouldShowRequestPermissionRationale()) { /* Mostrar explicación */ }"
             },
             "camara no funciona": {
+                "alias": ["camera not working", "camara en negro", "no abre la camara", "no puedo usar la camara"],
                 "causas": [
                     "Falta permiso CAMERA en manifest",
                     "Usuario denegó el permiso",
@@ -185,6 +135,7 @@ def diagnosticar_problema_permisos(
                 ]
             },
             "ubicacion no disponible": {
+                "alias": ["location unavailable", "gps no funciona", "no obtiene la ubicacion", "ubicacion incorrecta"],
                 "causas": [
                     "GPS desactivado",
                     "Permisos de ubicación denegados",
@@ -200,6 +151,7 @@ def diagnosticar_problema_permisos(
         },
         "iOS": {
             "permiso denegado": {
+                "alias": ["permission denied", "permiso rechazado", "sin permiso", "no me deja dar permiso"],
                 "causas": [
                     "Falta descripción en Info.plist",
                     "Usuario denegó el permiso",
@@ -214,6 +166,7 @@ def diagnosticar_problema_permisos(
                 "codigo_util": "UIApplication.shared.open(URL(string: UIApplication.openSettingsURLString)!)"
             },
             "camara no funciona": {
+                "alias": ["camera not working", "camara en negro", "no abre la camara", "no puedo usar la camara"],
                 "causas": [
                     "Falta NSCameraUsageDescription",
                     "Usuario denegó acceso",
@@ -227,6 +180,7 @@ def diagnosticar_problema_permisos(
                 ]
             },
             "notificaciones no llegan": {
+                "alias": ["push notifications not received", "no llegan las push", "no recibo notificaciones"],
                 "causas": [
                     "Usuario no autorizó notificaciones",
                     "Certificado APNs mal configurado",
@@ -240,39 +194,140 @@ def diagnosticar_problema_permisos(
                 ]
             }
         }
+    },
+    "recomendacion_general": [
+        "Verificar logs del sistema",
+        "Revisar configuración de permisos en Settings",
+        "Comprobar que los permisos estén correctamente declarados"
+    ]
+})
+
+# Índices sobre claves y alias de ambas plataformas, armados una vez al importar:
+# cada consulta visita solo las entradas que comparten palabras con el texto
+_INDICE_FUNCIONALIDADES = IndiceDifuso(
+    (plataforma, funcionalidad, info.get("alias", ()))
+    for plataforma, tabla in (("android", TABLAS["permisos_android"]), ("ios", TABLAS["permisos_ios"]))
+    for funcionalidad, info in tabla.items()
+)
+_INDICE_PROBLEMAS = IndiceDifuso(
+    (plataforma.lower(), problema, info.get("alias", ()))
+    for plataforma, problemas in TABLAS["problemas_comunes"].items()
+    for problema, info in problemas.items()
+)
+
+
+@skill(
+    description="Verifica qué permisos necesita una funcionalidad de app móvil y si están configurados",
+    tags=["mobile", "debugging", "permissions"]
+)
+def verificar_permisos_requeridos(funcionalidad: str, plataforma: str = "Android") -> dict:
+    """
+    Verifica los permisos necesarios para una funcionalidad específica de app móvil.
+
+    Args:
+        funcionalidad: Funcionalidad a verificar (ej: "camara", "ubicacion", "notificaciones")
+        plataforma: Plataforma móvil (Android o iOS)
+
+    Returns:
+        Diccionario con permisos necesarios y configuración
+    """
+    plataforma_lower = plataforma.lower()
+    if plataforma_lower not in ("android", "ios"):
+        return {
+            "error": f"Plataforma '{plataforma}' no soportada",
+            "plataformas_disponibles": ["Android", "iOS"]
+        }
+
+    tabla = TABLAS[f"permisos_{plataforma_lower}"]
+    clave = funcionalidad.lower()
+    detectada = {}
+    if clave not in tabla:
+        # Acentos, sinónimos ("gps", "camera") o errores de tipeo
+        coincidencias = _INDICE_FUNCIONALIDADES.buscar(funcionalidad, grupo=plataforma_lower, limite=MAX_SUGERENCIAS)
+        if not coincidencias or coincidencias[0].puntaje < SIMILITUD_FUNCIONALIDAD:
+            return {
+                "error": f"Funcionalidad '{funcionalidad}' no encontrada en base de datos",
+                "funcionalidades_disponibles": list(tabla.keys()),
+                "sugerencias": [{"funcionalidad": c.clave, "puntaje": c.puntaje} for c in coincidencias]
+            }
+        clave = coincidencias[0].clave
+        detectada = {"funcionalidad_detectada": clave, "similitud": coincidencias[0].puntaje}
+    info = tabla[clave]
+
+    if plataforma_lower == "android":
+        return {
+            "plataforma": "Android",
+            "funcionalidad": funcionalidad,
+            **detectada,
+            "permisos_requeridos": list(info["permisos"]),
+            "requiere_runtime_permission": info["permisos_runtime"],
+            "desde_api_level": info.get("desde_api"),
+            "configuracion_manifest": info.get("manifest"),
+            "ejemplo_codigo": info.get("codigo_ejemplo"),
+            "nota_adicional": info.get("nota_adicional", ""),
+            "pasos_implementacion": list(TABLAS["pasos_android"])
+        }
+
+    return {
+        "plataforma": "iOS",
+        "funcionalidad": funcionalidad,
+        **detectada,
+        "keys_requeridas": list(info["permisos"]),
+        "archivo_configuracion": info["archivo_config"],
+        "ejemplo_configuracion": info.get("ejemplo_plist"),
+        "ejemplo_codigo": info.get("codigo_ejemplo"),
+        "nota_adicional": info.get("nota_adicional", ""),
+        "pasos_implementacion": list(TABLAS["pasos_ios"])
     }
 
-    # Detectar el problema en la descripción
-    descripcion_lower = descripcion_problema.lower()
-    plataforma_info = problemas_comunes.get(plataforma, {})
 
-    diagnostico_encontrado = None
-    clave_problema = None
+@skill(
+    description="Diagnostica problemas comunes relacionados con permisos en apps móviles",
+    tags=["mobile", "debugging", "permissions", "troubleshooting"]
+)
+def diagnosticar_problema_permisos(
+    descripcion_problema: str,
+    plataforma: str = "Android"
+) -> dict:
+    """
+    Diagnostica y sugiere soluciones para problemas comunes de permisos.
+
+    Args:
+        descripcion_problema: Descripción del problema que está ocurriendo
+        plataforma: Plataforma móvil (Android o iOS)
 
-    for problema, info in plataforma_info.items():
-        if problema in descripcion_lower:
-            diagnostico_encontrado = info
-            clave_problema = problema
-            break
+    Returns:
+        Diccionario con diagnóstico y soluciones
+    """
+    # Detectar el problema en la descripción: la parte de las palabras de cada
+    # problema (o de sus alias) que aparece en el texto
+    nombre_plataforma = next((p for p in TABLAS["problemas_comunes"] if p.lower() == plataforma.lower()), plataforma)
+    plataforma_info = TABLAS["problemas_comunes"].get(nombre_plataforma, {})
+    coincidencias = _INDICE_PROBLEMAS.buscar(
+        descripcion_problema, grupo=nombre_plataforma.lower(), limite=MAX_SUGERENCIAS + 1, dentro_del_texto=True
+    )
 
-    if not diagnostico_encontrado:
+    if not coincidencias or coincidencias[0].puntaje < COBERTURA_PROBLEMA:
         return {
             "plataforma": plataforma,
             "problema_detectado": "No se pudo detectar automáticamente",
             "sugerencia": "Revisa los problemas comunes listados",
             "problemas_comunes": list(plataforma_info.keys()),
-            "recomendacion_general": [
-                "Verificar logs del sistema",
-                "Revisar configuración de permisos en Settings",
-                "Comprobar que los permisos estén correctamente declarados"
-            ]
+            "problemas_similares": [{"problema": c.clave, "puntaje": c.puntaje} for c in coincidencias[:MAX_SUGERENCIAS]],
+            "recomendacion_general": list(TABLAS["recomendacion_general"])
         }
 
+    mejor = coincidencias[0]
+    diagnostico_encontrado = plataforma_info[mejor.clave]
     return {
         "plataforma": plataforma,
-        "problema_detectado": clave_problema,
-        "causas_probables": diagnostico_encontrado["causas"],
-        "soluciones_recomendadas": diagnostico_encontrado["soluciones"],
+        "problema_detectado": mejor.clave,
+        "similitud": mejor.puntaje,
+        "causas_probables": list(diagnostico_encontrado["causas"]),
+        "soluciones_recomendadas": list(diagnostico_encontrado["soluciones"]),
         "codigo_util": diagnostico_encontrado.get("codigo_util", ""),
-        "documentacion": f"https://developer.{'android' if plataforma == 'Android' else 'apple'}.com/documentation"
+        "otros_posibles": [
+            {"problema": c.clave, "puntaje": c.puntaje} for c in coincidencias[1:] if c.puntaje >= COBERTURA_PROBLEMA
+        ],
+        "documentacion": f"https://developer.{'android' if nombre_plataforma == 'Android' else 'apple'}.com/documentation"
     }
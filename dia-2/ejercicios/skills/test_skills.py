@@ -0,0 +1,1358 @@
+"""
+Script de prueba para verificar las skills de soporte multi-producto (api, webapp, mobile)
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Permite importar los paquetes api/, webapp/ y mobile/ y skills_infra desde cualquier directorio
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _escribir_log(directorio: str) -> str:
+    """Crea un log de ejemplo con varios componentes y niveles."""
+    ruta = os.path.join(directorio, "api.log")
+    componentes = ["auth", "db", "payments"]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for minuto in range(0, 24 * 60, 2):
+            hora = f"{minuto // 60:02d}:{minuto % 60:02d}:00"
+            componente = componentes[minuto % 3]
+            nivel = "ERROR" if minuto % 10 == 0 else "INFO"
+            archivo.write(f"2024-01-15 {hora} {nivel} [{componente}] request procesado response_time: {minuto % 900}ms\n")
+            if nivel == "ERROR":
+                archivo.write("    at handler (server.js:42)\n")
+    return ruta
+
+
+def test_logs_indexados():
+    """Prueba el índice en disco de consultar_logs_indexados"""
+
+    print("\n[TEST] Logs indexados")
+    print("-" * 70)
+
+    from api.analizar_logs_api import consultar_logs_indexados
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = _escribir_log(directorio)
+
+        primera = consultar_logs_indexados(ruta, desde="03:00", hasta="04:00", nivel="ERROR", componente="auth")
+        print(f"Errores de auth entre 03:00 y 04:00: {primera['total_coincidencias']}")
+        assert primera["indice_reconstruido"] is True
+        assert os.path.exists(ruta + ".idx.json"), "El índice debe guardarse junto al log"
+        # Entre 03:00 y 04:00 hay errores cada 10 minutos; auth es minuto % 3 == 0
+        esperados = [m for m in range(180, 241, 2) if m % 10 == 0 and m % 3 == 0]
+        assert primera["total_coincidencias"] == len(esperados), primera
+
+        segunda = consultar_logs_indexados(ruta, desde="03:00", hasta="03:10")
+        assert segunda["indice_reconstruido"] is False, "La segunda consulta debe reutilizar el índice"
+        # 6 entradas (03:00..03:10 cada 2 min) + 2 líneas de stack trace de los errores
+        assert segunda["total_coincidencias"] == 8, segunda
+
+        # Modificar el log invalida el índice
+        with open(ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("2024-01-15 23:59:30 ERROR [auth] token expirado\n")
+        tercera = consultar_logs_indexados(ruta, desde="23:59", nivel="error")
+        assert tercera["indice_reconstruido"] is True
+        assert tercera["coincidencias"][-1].endswith("token expirado")
+
+    print("✓ consultar_logs_indexados funciona correctamente")
+
+
+def test_verificar_endpoint():
+    """Prueba verificar_endpoint contra el servidor stub local"""
+
+    print("\n[TEST] verificar_endpoint")
+    print("-" * 70)
+
+    import asyncio
+    from api.verificar_endpoint import verificar_endpoint
+    from skills_infra.cliente_http import ClienteHTTP
+    from skills_infra.servidor_stub import ServidorStub
+
+    with ServidorStub() as servidor:
+        ok = verificar_endpoint(servidor.url("/usuarios"))
+        print(f"GET /usuarios: {ok['status_code']} en {ok['tiempo_respuesta']} {ok['tiempos_ms']}")
+        assert ok["status_code"] == 200 and ok["disponible"] is True
+        assert ok["tiempos_ms"]["total"] >= ok["tiempos_ms"]["ttfb"] > 0
+
+        caido = verificar_endpoint(servidor.url("/status/503"), metodo="POST")
+        assert caido["status_code"] == 503 and caido["disponible"] is False
+        assert caido["conexion_reutilizada"] is True, "Debe reutilizar la conexión keep-alive"
+        assert servidor.conexiones == 1, f"Se esperaba 1 conexión, hubo {servidor.conexiones}"
+
+        lento = verificar_endpoint(servidor.url("/lento/500"), timeout=0.1)
+        assert lento["tiempo_respuesta"] == "timeout" and lento["error"] == "timeout"
+
+        # El servidor cierra la conexión: la siguiente solicitud abre una nueva
+        verificar_endpoint(servidor.url("/cerrar"))
+        despues = verificar_endpoint(servidor.url("/"))
+        assert despues["status_code"] == 200
+
+        # Límite de concurrencia por host
+        async def rafaga():
+            cliente = ClienteHTTP(limite_por_host=2)
+            mediciones = await asyncio.gather(*[cliente.solicitar(servidor.url("/lento/100")) for _ in range(6)])
+            await cliente.cerrar()
+            return cliente, mediciones
+
+        conexiones_antes = servidor.conexiones
+        inicio = time.perf_counter()
+        cliente, mediciones = asyncio.run(rafaga())
+        duracion_ms = (time.perf_counter() - inicio) * 1000
+        assert all(m.status == 200 for m in mediciones)
+        assert cliente.conexiones_creadas == 2, cliente.conexiones_creadas
+        assert servidor.conexiones - conexiones_antes == 2
+        assert duracion_ms >= 250, "6 solicitudes de 100ms con límite 2 deben tomar ~300ms"
+        # La espera en cola no se cuenta como latencia de cada solicitud
+        assert max(m.total_ms for m in mediciones) < 250
+
+    rechazado = verificar_endpoint(servidor.url("/"), timeout=2)
+    assert rechazado["status_code"] is None and rechazado["error"], rechazado
+    print(f"Servidor detenido: {rechazado['error']}")
+
+    print("✓ verificar_endpoint funciona correctamente")
+
+
+def test_verificar_endpoints_lote():
+    """Prueba verificar_endpoints_lote contra el servidor stub local"""
+
+    print("\n[TEST] verificar_endpoints_lote")
+    print("-" * 70)
+
+    from api.verificar_endpoint import verificar_endpoints_lote
+
+    from skills_infra.servidor_stub import ServidorStub
+
+    with ServidorStub() as servidor:
+        endpoints = [servidor.url(f"/usuarios/{i}") for i in range(40)]
+        endpoints += [f"POST {servidor.url('/status/503')}", {"url": servidor.url("/status/404"), "metodo": "delete"}]
+        endpoints += [servidor.url("/lento/300")]
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "endpoints.txt")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write("# health checks\n\n")
+                archivo.write(f"HEAD {servidor.url('/status/500')}\n")
+
+            inicio = time.perf_counter()
+            resumen = verificar_endpoints_lote(endpoints, archivo=ruta, concurrencia=10, timeout=0.2, top_lentos=3)
+            duracion = time.perf_counter() - inicio
+
+        print(f"{resumen['total']} endpoints en {duracion * 1000:.0f}ms: {resumen['por_clase']}")
+        assert resumen["total"] == 44
+        assert resumen["por_clase"] == {"2xx": 40, "4xx": 1, "5xx": 2, "error": 1}, resumen["por_clase"]
+        assert resumen["disponibles"] == 40
+        assert sum(resumen["latencia_ms"]["histograma"].values()) == 43
+        assert len(resumen["mas_lentos"]) == 3
+        assert resumen["total_fallos"] == 4 and len(resumen["fallos"]) == 4
+        assert {f["error"] for f in resumen["fallos"] if f["status_code"] is None} == {"timeout"}
+        assert set(resumen["diagnosticos"]) == {404, 500, 503}
+        assert resumen["diagnosticos"][503]["tipo_error"] == "Service Unavailable"
+        assert servidor.conexiones <= 10, f"La concurrencia debe estar acotada: {servidor.conexiones} conexiones"
+
+    assert "error" in verificar_endpoints_lote([])
+    assert "error" in verificar_endpoints_lote(archivo="/no/existe.txt")
+
+    print("✓ verificar_endpoints_lote funciona correctamente")
+
+
+def test_tablas_conocimiento():
+    """Prueba las tablas de conocimiento congeladas y su archivo de datos opcional"""
+
+    print("\n[TEST] Tablas de conocimiento")
+    print("-" * 70)
+
+    import json
+    import warnings
+    from api.verificar_endpoint import TABLAS, diagnosticar_error_http
+    from mobile.analizar_crash import analizar_crash_log
+    from webapp.debug_javascript import explicar_error_javascript
+    from skills_infra.tablas import cargar_tablas, exportar_tablas
+
+    # Las tablas no se pueden modificar desde una llamada
+    try:
+        TABLAS["diagnosticos_http"][418] = {}
+        raise AssertionError("Las tablas deberían ser inmutables")
+    except TypeError:
+        pass
+
+    # Las respuestas siguen siendo serializables y las listas no comparten estado
+    diagnostico = diagnosticar_error_http(404)
+    diagnostico["soluciones_recomendadas"].append("modificado")
+    assert "modificado" not in diagnosticar_error_http(404)["soluciones_recomendadas"]
+    json.dumps(explicar_error_javascript("", "TypeError: x is not a function"))
+
+    crash = analizar_crash_log(
+        "java.lang.NullPointerException\n    at com.app.MainActivity.onCreate(MainActivity.java:42)"
+    )
+    assert crash["tipo_crash"] == "NullPointerException"
+    assert crash["archivo"] == "MainActivity.java" and crash["linea"] == "42"
+    assert crash["stack_trace_relevante"] == ["at com.app.MainActivity.onCreate(MainActivity.java:42)"]
+
+    por_defecto = {"codigos": {400: {"tipo": "Bad Request"}}, "pasos": ["a", "b"]}
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = Path(directorio) / "skill.datos.json"
+        assert cargar_tablas(ruta, 1, por_defecto)["pasos"] == ("a", "b")
+
+        # El archivo de datos sobrescribe tablas y recupera las claves enteras
+        exportar_tablas(ruta, 1, {"codigos": {418: {"tipo": "I'm a teapot"}}})
+        tablas = cargar_tablas(ruta, 1, por_defecto)
+        assert tablas["codigos"][418]["tipo"] == "I'm a teapot"
+        assert tablas["pasos"] == ("a", "b")
+
+        # Una versión distinta se ignora con un warning
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            tablas = cargar_tablas(ruta, 2, por_defecto)
+        assert 400 in tablas["codigos"] and avisos
+
+    print("✓ Tablas de conocimiento funcionan correctamente")
+
+
+def test_validar_html():
+    """Prueba el validador HTML de una sola pasada"""
+
+    print("\n[TEST] validar_html")
+    print("-" * 70)
+
+    from webapp.validar_html import validar_html
+    from skills_infra.validador_html import ValidadorHTML
+
+    html = (
+        "<html><body><h1>Tienda</h1><div><p>uno<p>dos</div>"
+        "<a href='/vacio'> </a><a href='/logo'><img src='logo.png' alt=''></a>"
+        "<img src='sin-alt.png'><label>Email</label><input><input type='text'/>"
+        "<script>if (a < b) { document.write('<div>'); }</script><br/><span/>"
+        "</body></html>"
+    )
+    resultado = validar_html(html)
+    print(f"Errores: {resultado['errores']}")
+    assert resultado["errores"] == [
+        "Etiqueta <p> no está cerrada correctamente (2 veces)",
+        "1 enlaces sin texto de contenido"
+    ], resultado["errores"]
+    assert resultado["warnings"] == [
+        "Encontradas 1 imágenes sin atributo alt (problema de accesibilidad)",
+        "1 inputs sin label asociado (problema de accesibilidad)"
+    ], resultado["warnings"]
+
+    # Alimentar el documento por partes da el mismo resultado
+    validador = ValidadorHTML()
+    for i in range(0, len(html), 7):
+        validador.feed(html[i:i + 7])
+    validador.close()
+    assert validador.sin_cerrar == {"p": 2} and validador.enlaces_vacios == 1
+
+    # Miles de elementos sin cerrar no vuelven cuadrático el recorrido
+    grande = "<h1>x</h1>" + "<li><p>item</li>" * 20000
+    inicio = time.perf_counter()
+    resultado = validar_html(grande)
+    duracion = time.perf_counter() - inicio
+    print(f"{len(grande) // 1024} KB con 20000 <p> sin cerrar: {duracion * 1000:.0f}ms")
+    assert resultado["errores"] == ["Etiqueta <p> no está cerrada correctamente (20000 veces)"]
+    assert duracion < 5
+
+    print("✓ validar_html funciona correctamente")
+
+
+def test_documento_html():
+    """Prueba el documento HTML compartido entre validar_html y analizar_seo_html"""
+
+    print("\n[TEST] Documento HTML compartido")
+    print("-" * 70)
+
+    from webapp.validar_html import analizar_seo_html, validar_html
+    from skills_infra.documento_html import estadisticas_cache, limpiar_cache, obtener_documento
+
+    html = (
+        "<html><head><title>Zapatillas de running para asfalto y montaña</title>"
+        "<meta name='Description' content='" + "Zapatillas livianas. " * 7 + "'>"
+        "<meta name='viewport' content='width=device-width'><meta charset='utf-8'></head>"
+        "<body><h1>Zapatillas</h1><h2>Asfalto</h2><h3>Modelo <em>X</em></h3><h2>Montaña</h2>"
+        "<a href='/carrito'><img src='carrito.svg' alt='Carrito'></a><a href='/ofertas'>Ofertas</a>"
+        "</body></html>"
+    )
+
+    limpiar_cache()
+    validacion = validar_html(html)
+    seo = analizar_seo_html(html)
+    print(f"SEO: {seo['puntuacion_seo']} {seo['estado']}, cache: {estadisticas_cache()}")
+    assert estadisticas_cache() == {"aciertos": 1, "fallos": 1, "documentos": 1}, "Debe parsear una sola vez"
+
+    assert validacion["html_valido"] is True and validacion["total_warnings"] == 0, validacion
+    assert seo["problemas_criticos"] == [] and seo["puntuacion_seo"] == 100, seo
+    assert "Tiene 2 H2 (buena estructura)" in seo["puntos_positivos"]
+
+    documento = obtener_documento(html)
+    assert documento.encabezados == ((1, "Zapatillas"), (2, "Asfalto"), (3, "Modelo X"), (2, "Montaña"))
+    assert documento.metas["charset"] == "utf-8" and "description" in documento.metas
+    assert [e["href"] for e in documento.enlaces] == ["/carrito", "/ofertas"]
+    assert documento.enlaces_vacios == 0, "Un enlace con una imagen dentro no está vacío"
+    try:
+        documento.metas["title"] = "otro"
+        raise AssertionError("El documento compartido debería ser inmutable")
+    except TypeError:
+        pass
+
+    sin_title = analizar_seo_html("<html><head><title></title></head><body><h1>a</h1><h1>b</h1></body></html>")
+    assert "Falta etiqueta <title>" in sin_title["problemas_criticos"]
+    assert "Tiene 2 H1 (debería tener solo uno)" in sin_title["problemas_criticos"]
+
+    print("✓ Documento HTML compartido funciona correctamente")
+
+
+def test_analizar_codigo_javascript():
+    """Prueba el lexer de una pasada detrás de analizar_codigo_javascript"""
+
+    print("\n[TEST] Analizar código JavaScript")
+    print("-" * 70)
+
+    from webapp.debug_javascript import analizar_codigo_javascript
+    from skills_infra.lexer_js import AnalizadorJS, analizar_archivo
+
+    codigo = (
+        "var total = 0;\n"
+        "// var comentado; if (a == b) eval(x); console.log(x)\n"
+        "const texto = \"var x == 1; eval(y)\", plantilla = `a == ${total == 0 ? 'b' : `c${ {d: 1}.d }`}`;\n"
+        "const patron = /==\\/ var [/]/g, mitad = total / 2 / 1;\n"
+        "if (total == 1) { console.log(total) }\n"
+        "try { cargar() } catch (e) {}\n"
+        "try { cargar() } catch (e) { /* se ignora a propósito */ }\n"
+        "promesa.catch(function (e) {});\n"
+    )
+
+    resultado = analizar_codigo_javascript(codigo)
+    print(f"Calidad: {resultado['calidad_codigo']}, ubicaciones: {resultado['ubicaciones']}")
+    assert resultado["ubicaciones"] == {
+        "var": [1],
+        "console_log": [5],
+        "igualdad_debil": [3, 5],
+        "funciones_anonimas": [8],
+        "catch_vacio": [6],
+    }, "Nada dentro de strings, comentarios o regex debe contar"
+    assert resultado["errores"] == ["Bloque catch vacío encontrado (línea 6) - los errores están siendo silenciados"]
+    assert "Uso de '==' encontrado (2 veces, líneas 3, 5). Usa '===' para comparación estricta" in resultado["warnings"]
+
+    # Cortado en bloques de cualquier tamaño da el mismo resultado
+    completo = AnalizadorJS()
+    completo.feed(codigo)
+    completo.close()
+    for tamano in (1, 3, 17):
+        por_bloques = AnalizadorJS()
+        for i in range(0, len(codigo), tamano):
+            por_bloques.feed(codigo[i:i + tamano])
+        por_bloques.close()
+        assert por_bloques.conteos == completo.conteos and por_bloques.lineas == completo.lineas, tamano
+
+    # Bundle minificado de ~1MB en una sola línea, leído desde archivo
+    fragmento = 'function n(e,t){var r="a==b";try{if(e==t)return/x/g.test(r)}catch(o){}return e/t}'
+    repeticiones = 1024 * 1024 // len(fragmento)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "bundle.min.js")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(fragmento * repeticiones)
+        inicio = time.perf_counter()
+        analizador = analizar_archivo(ruta)
+        segundos = time.perf_counter() - inicio
+        bundle = analizar_codigo_javascript(archivo=ruta)
+
+    print(f"Bundle de 1MB: {segundos:.2f}s, conteos: {analizador.conteos}")
+    assert analizador.conteos["igualdad_debil"] == repeticiones
+    assert analizador.conteos["catch_vacio"] == repeticiones
+    assert analizador.lineas_totales == 1 and bundle["lineas_analizadas"] == 1
+    assert bundle["errores"] == [
+        f"Bloques catch vacíos encontrados ({repeticiones} veces, líneas 1, 1, 1, 1, 1, ...) - los errores están siendo silenciados"
+    ]
+    assert segundos < 10, "El análisis debe ser lineal"
+
+    assert "error" in analizar_codigo_javascript(archivo="/no/existe.js")
+
+    print("✓ Análisis de JavaScript funciona correctamente")
+
+
+def test_auditar_sitio_web():
+    """Prueba la auditoría en paralelo de un directorio de build"""
+
+    print("\n[TEST] Auditar sitio web")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from webapp.auditoria_sitio import auditar_sitio_web
+
+    pagina_buena = (
+        "<html><head><title>Zapatillas de running para asfalto y montaña</title>"
+        "<meta name='description' content='" + "Zapatillas livianas. " * 7 + "'>"
+        "<meta name='viewport' content='width=device-width'></head>"
+        "<body><h1>Zapatillas</h1><h2>Asfalto</h2><h2>Montaña</h2></body></html>"
+    )
+    pagina_rota = "<html><body><div><img src='a.png'><p>Sin cerrar</body></html>"
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for carpeta in ("blog", "assets", "node_modules/libreria"):
+            os.makedirs(os.path.join(directorio, carpeta))
+        for i in range(30):
+            with open(os.path.join(directorio, "blog", f"post{i:02d}.html"), "w", encoding="utf-8") as f:
+                f.write(pagina_rota if i % 10 == 0 else pagina_buena)
+        for i in range(10):
+            with open(os.path.join(directorio, "assets", f"app{i}.js"), "w", encoding="utf-8") as f:
+                f.write("var a = 1; if (a == 2) { eval('x') }" if i == 0 else "const a = 1;")
+        with open(os.path.join(directorio, "node_modules", "libreria", "index.js"), "w", encoding="utf-8") as f:
+            f.write("eval(codigo)")
+
+        secuencial = auditar_sitio_web(directorio, procesos=1, top_peores=4, usar_cache=False)
+        # 40 archivos en lotes de 32: dos lotes repartidos entre dos procesos
+        paralelo = auditar_sitio_web(directorio, procesos=2, top_peores=4, usar_cache=False)
+
+        manager = SkillManager()
+        manager.load_skills.from_folder(str(Path(__file__).parent / "webapp"))
+        desde_carpeta = manager.get_skill_by_name("auditar_sitio_web")(directorio, procesos=2, top_peores=4, usar_cache=False)
+
+    print(f"{paralelo['total_archivos']} archivos en {paralelo['duracion_segundos']}s, media {paralelo['puntuacion_media']}")
+    assert paralelo["por_tipo"] == {"html": 30, "js": 10}, "node_modules no se audita"
+    for reporte in (secuencial, desde_carpeta):
+        reporte.pop("duracion_segundos")
+    paralelo.pop("duracion_segundos")
+    assert secuencial == paralelo == desde_carpeta, "El reporte no debe depender de la cantidad de procesos"
+
+    peores = [p["ruta"] for p in paralelo["peores"]]
+    assert peores == [os.path.join("blog", f"post{i:02d}.html") for i in (0, 10, 20)] + [os.path.join("assets", "app0.js")], peores
+    reglas = {r["regla"]: r["archivos"] for r in paralelo["reglas"]}
+    assert reglas["Etiqueta <div> no está cerrada correctamente"] == 3
+    assert reglas["Uso de eval() detectado - esto es un riesgo de seguridad"] == 1
+    assert paralelo["total_errores"] == 0
+
+    assert "error" in auditar_sitio_web("/no/existe")
+
+    print("✓ auditar_sitio_web funciona correctamente")
+
+
+def test_cache_auditoria():
+    """Prueba que la auditoría solo vuelve a analizar los archivos modificados"""
+
+    print("\n[TEST] Cache de auditoría")
+    print("-" * 70)
+
+    from skills_infra.cache_resultados import CacheResultados
+    from webapp.auditoria_sitio import auditar_sitio_web
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_cache = os.path.join(directorio, "cache", "resultados.sqlite")
+        sitio = os.path.join(directorio, "sitio")
+        os.makedirs(sitio)
+        for i in range(12):
+            with open(os.path.join(sitio, f"pagina{i}.html"), "w", encoding="utf-8") as f:
+                f.write(f"<html><head><title>Página {i}</title></head><body><h1>Hola</h1></body></html>")
+        with open(os.path.join(sitio, "app.js"), "w", encoding="utf-8") as f:
+            f.write("const a = 1;")
+
+        primera = auditar_sitio_web(sitio, procesos=1, ruta_cache=ruta_cache)
+        segunda = auditar_sitio_web(sitio, procesos=1, ruta_cache=ruta_cache)
+        assert (primera["analizados"], primera["desde_cache"]) == (13, 0)
+        assert (segunda["analizados"], segunda["desde_cache"]) == (0, 13)
+
+        with open(os.path.join(sitio, "app.js"), "w", encoding="utf-8") as f:
+            f.write("var a = 1; eval('a')")
+        tercera = auditar_sitio_web(sitio, procesos=1, ruta_cache=ruta_cache)
+        sin_cache = auditar_sitio_web(sitio, procesos=1, usar_cache=False)
+        print(f"Primera: {primera['analizados']} analizados, segunda: {segunda['desde_cache']} desde cache, "
+              f"tras editar app.js: {tercera['analizados']} analizado")
+        assert (tercera["analizados"], tercera["desde_cache"]) == (1, 12)
+
+        for reporte in (primera, segunda, tercera, sin_cache):
+            for clave in ("duracion_segundos", "analizados", "desde_cache"):
+                reporte.pop(clave)
+        assert primera == segunda, "El reporte desde cache debe ser idéntico"
+        assert tercera == sin_cache, "Los archivos modificados se vuelven a analizar"
+
+        # Versiones: una nueva versión no ve los resultados anteriores y purga solo los suyos
+        with CacheResultados(os.path.join(directorio, "versiones.sqlite")) as cache:
+            cache.guardar([("h1", {"puntuacion": 90})], "auditoria-1-aaa")
+            cache.guardar([("h1", {"puntuacion": 80})], "otra-1-aaa")
+            assert cache.buscar(["h1", "h2"], "auditoria-1-aaa") == {"h1": {"puntuacion": 90}}
+            assert cache.buscar(["h1"], "auditoria-1-bbb") == {}
+            assert cache.purgar_otras_versiones("auditoria-1-bbb") == 1
+            assert len(cache) == 1
+
+    print("✓ El cache de auditoría funciona correctamente")
+
+
+def test_agrupar_crashes():
+    """Prueba el agrupamiento de crashes por firma"""
+
+    print("\n[TEST] Agrupar crashes")
+    print("-" * 70)
+
+    from mobile.analizar_crash import agrupar_crashes
+    from skills_infra.firmas_crash import firma_crash, normalizar_frame
+
+    assert normalizar_frame("com.app.Lista$1.lambda$onClick$0") == "com.app.Lista$.lambda$onClick$"
+    assert normalizar_frame("com.app.Lista$$ExternalSyntheticLambda2.run") == "com.app.Lista$$Lambda.run"
+
+    npe = (
+        "java.lang.RuntimeException: Unable to start activity\n"
+        "    at android.app.ActivityThread.performLaunchActivity(ActivityThread.java:3449)\n"
+        "Caused by: java.lang.NullPointerException: Attempt to invoke virtual method\n"
+        "    at com.app.Perfil$1.lambda$onClick${lambda}(Perfil.java:{linea})\n"
+        "    at com.app.Perfil.onCreate(Perfil.java:42)\n"
+        "    at android.app.Activity.performCreate(Activity.java:8000)"
+    )
+    oom = "java.lang.OutOfMemoryError: Failed to allocate\n    at com.app.Galeria.cargar(Galeria.java:{linea})"
+
+    # La firma ignora líneas y sufijos de lambdas, y usa la excepción raíz
+    firma = firma_crash(npe.replace("{lambda}", "0").replace("{linea}", "88"))
+    assert firma.tipo_excepcion == "java.lang.NullPointerException"
+    assert firma.frames == ("com.app.Perfil$.lambda$onClick$", "com.app.Perfil.onCreate")
+    assert firma_crash(npe.replace("{lambda}", "3").replace("{linea}", "91")).firma == firma.firma
+    assert firma_crash(oom.replace("{linea}", "7")).firma != firma.firma
+
+    reportes = [
+        {"stack_trace": npe.replace("{lambda}", str(i % 3)).replace("{linea}", str(80 + i)),
+         "momento": f"2024-05-{1 + i:02d}T10:00:00Z", "id": f"npe-{i}"}
+        for i in range(7)
+    ]
+    reportes.append(reportes[0]["stack_trace"])
+    reportes.append({"sin_stack_trace": True})
+    with tempfile.TemporaryDirectory() as directorio:
+        for i in range(4):
+            with open(os.path.join(directorio, f"oom{i}.txt"), "w", encoding="utf-8") as f:
+                f.write(oom.replace("{linea}", str(i)))
+        resultado = agrupar_crashes(reportes, directorio=directorio)
+
+    print(f"{resultado['total_reportes']} reportes en {resultado['total_buckets']} buckets")
+    assert (resultado["total_reportes"], resultado["total_buckets"], resultado["total_errores"]) == (12, 2, 1)
+    primero, segundo = resultado["buckets"]
+    assert primero["cantidad"] == 8 and primero["ejemplos"][:2] == ["npe-0", "npe-1"]
+    assert primero["primera_vez"] < primero["ultima_vez"]
+    assert primero["diagnostico"]["tipo_crash"] == "NullPointerException"
+    assert segundo["cantidad"] == 4 and segundo["diagnostico"]["tipo_crash"] == "OutOfMemoryError"
+
+    assert "error" in agrupar_crashes()
+    assert "error" in agrupar_crashes(directorio="/no/existe")
+
+    print("✓ agrupar_crashes funciona correctamente")
+
+
+def test_almacen_crashes():
+    """Prueba el registro incremental y las consultas del almacén de crashes"""
+
+    print("\n[TEST] Almacén de crashes")
+    print("-" * 70)
+
+    import shutil
+    from mobile.analizar_crash import consultar_crashes, registrar_crashes
+
+    npe = "App version: {v}\njava.lang.NullPointerException: {i}\n    at com.app.Perfil.onCreate(Perfil.java:{i})"
+    oom = "App version: {v}\njava.lang.OutOfMemoryError: {i}\n    at com.app.Galeria.cargar(Galeria.java:{i})"
+    ios = (
+        "Incident Identifier: {i}\nVersion: 4.2.0 (310)\nException Type:  EXC_BAD_ACCESS (SIGSEGV)\n\n"
+        "Thread 0 Crashed:\n0   MiApp   0x0000000102f4a1b8 PerfilViewController.viewDidLoad() + {i}\n"
+    )
+
+    def escribir(carpeta, nombre, texto):
+        with open(os.path.join(carpeta, nombre), "w", encoding="utf-8") as f:
+            f.write(texto)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_almacen = os.path.join(directorio, "almacen", "crashes.sqlite")
+        crashes = os.path.join(directorio, "crashes")
+        os.makedirs(crashes)
+        for i in range(5):
+            escribir(crashes, f"a{i}.txt", npe.format(v="4.1.0", i=i))
+        for i in range(3):
+            escribir(crashes, f"b{i}.txt", npe.format(v="4.2.0", i=i))
+        for i in range(4):
+            escribir(crashes, f"c{i}.log", oom.format(v="4.2.0", i=i))
+        escribir(crashes, "d0.crash", ios.format(i=1))
+
+        primera = registrar_crashes(crashes, ruta_almacen=ruta_almacen)
+        assert (primera["archivos"], primera["nuevos"], primera["buckets_nuevos"]) == (13, 13, 3)
+        assert [v["version_app"] for v in primera["versiones"]] == ["4.1.0", "4.2.0"]
+
+        # Solo se leen los archivos nuevos; una copia de un reporte no cuenta dos veces
+        escribir(crashes, "c4.log", oom.format(v="4.2.0", i=4))
+        shutil.copy(os.path.join(crashes, "a0.txt"), os.path.join(crashes, "copia.txt"))
+        segunda = registrar_crashes(crashes, ruta_almacen=ruta_almacen)
+        print(f"Segunda pasada: {segunda['sin_cambios']} sin cambios, {segunda['nuevos']} nuevo, "
+              f"{segunda['repetidos']} repetido")
+        assert (segunda["sin_cambios"], segunda["nuevos"], segunda["repetidos"], segunda["buckets_nuevos"]) == (13, 1, 1, 0)
+
+        # Reportes sueltos, con la versión por parámetro
+        sueltos = registrar_crashes(reportes=[oom.format(v="", i=9).split("\n", 1)[1]], version_app="4.3.0",
+                                    ruta_almacen=ruta_almacen)
+        assert sueltos["nuevos"] == 1 and sueltos["versiones"][-1] == {"version_app": "4.3.0", "reportes": 1, "buckets": 1}
+
+        todos = consultar_crashes(ruta_almacen=ruta_almacen)
+        assert (todos["total_reportes"], todos["total_buckets"]) == (15, 3)
+        assert [b["cantidad"] for b in todos["buckets"]] == [8, 6, 1]
+
+        nuevos = consultar_crashes("4.2.0", solo_nuevos=True, ruta_almacen=ruta_almacen)
+        assert nuevos["total_buckets"] == 2, "El NullPointerException ya estaba en 4.1.0"
+        oom_bucket = nuevos["buckets"][0]
+        assert oom_bucket["cantidad"] == 5 and oom_bucket["versiones"] == {"4.2.0": 5, "4.3.0": 1}
+        assert oom_bucket["diagnostico"]["tipo_crash"] == "OutOfMemoryError"
+        assert nuevos["buckets"][1]["plataforma"] == "ios"
+
+        ios_solo = consultar_crashes(plataforma="iOS", diagnosticar=False, ruta_almacen=ruta_almacen)
+        assert ios_solo["total_reportes"] == 1 and "diagnostico" not in ios_solo["buckets"][0]
+        assert "error" in consultar_crashes(solo_nuevos=True, ruta_almacen=ruta_almacen)
+
+    assert "error" in consultar_crashes(ruta_almacen="/no/existe.sqlite")
+    assert "error" in registrar_crashes("/no/existe")
+
+    print("✓ El almacén de crashes funciona correctamente")
+
+
+def test_palabras_clave():
+    """Prueba el motor de palabras clave compartido"""
+
+    print("\n[TEST] Motor de palabras clave")
+    print("-" * 70)
+
+    import random
+    from mobile.analizar_crash import analizar_crash_log
+    from skills_infra.palabras_clave import MotorPalabrasClave
+
+    motor = MotorPalabrasClave({
+        "api": ["endpoint", "http", ("status code", 2)],
+        "webapp": ["html", "web"],
+        "mobile": ["android", "crash"],
+    })
+    assert motor.puntuar("El ENDPOINT devuelve Status Code 503") == {"api": 3, "webapp": 0, "mobile": 0}
+    assert motor.mejor("crash en la web con html y android") == "webapp", "Empate: gana el primer grupo"
+    assert motor.mejor("sin palabras clave") is None
+    assert motor.primero("android y luego http") == "api"
+    assert motor.encontradas("html de la web y android") == {"webapp": ["html", "web"], "mobile": ["android"]}
+    assert MotorPalabrasClave({"a": ["he", "she", "hers"]}).ocurrencias("ushers") == [
+        (1, "she", "a"), (2, "he", "a"), (2, "hers", "a")
+    ]
+
+    # El autómata da los mismos resultados que buscar palabra por palabra
+    azar = random.Random(0)
+    for _ in range(200):
+        grupos = {g: ["".join(azar.choice("abc") for _ in range(azar.randint(1, 4))) for _ in range(3)] for g in "xyz"}
+        texto = "".join(azar.choice("abcd") for _ in range(azar.randint(0, 30)))
+        por_palabra = MotorPalabrasClave(grupos, automata=False)
+        automata = MotorPalabrasClave(grupos, automata=True)
+        assert por_palabra.puntuar(texto) == automata.puntuar(texto)
+        assert por_palabra.encontradas(texto) == automata.encontradas(texto)
+        assert por_palabra.primero(texto) == automata.primero(texto)
+        assert por_palabra.contiene(texto) == automata.contiene(texto)
+
+    # analizar_crash_log respeta el orden de la tabla: NullPointerException antes que IllegalStateException
+    traza = "java.lang.IllegalStateException: wrapped\nCaused by: java.lang.NullPointerException\n    at com.app.A.b(A.java:1)"
+    assert analizar_crash_log(traza)["tipo_crash"] == "NullPointerException"
+
+    print("✓ El motor de palabras clave funciona correctamente")
+
+
+def test_permisos_difusos():
+    """Prueba el índice difuso de las skills de permisos"""
+
+    print("\n[TEST] Búsqueda difusa de permisos")
+    print("-" * 70)
+
+    from mobile.check_permisos import diagnosticar_problema_permisos, verificar_permisos_requeridos
+    from skills_infra.indice_difuso import IndiceDifuso
+
+    indice = IndiceDifuso([
+        ("android", "camara no funciona", ["camera not working"]),
+        ("android", "permiso denegado", []),
+        ("ios", "camara no funciona", []),
+    ])
+    assert indice.mejor("CÁMARA no funciona", grupo="android").puntaje == 1.0
+    assert indice.mejor("camera not working", grupo="android").nombre == "camera not working"
+    assert indice.mejor("los permisos fueron denegados", grupo="android", dentro_del_texto=True).clave == "permiso denegado"
+    assert [c.grupo for c in indice.buscar("camara no funciona")] == ["android", "ios"]
+    assert indice.buscar("bluetooth", grupo="android") == []
+
+    # Exacta, sin acentos, por alias y con errores de tipeo
+    assert "funcionalidad_detectada" not in verificar_permisos_requeridos("Camara", "Android")
+    ubicacion = verificar_permisos_requeridos("GPS", "iOS")
+    assert ubicacion["funcionalidad_detectada"] == "ubicacion" and ubicacion["keys_requeridas"]
+    assert verificar_permisos_requeridos("notificacion", "Android")["funcionalidad_detectada"] == "notificaciones"
+    sugerido = verificar_permisos_requeridos("camra", "Android")
+    print(f"'camra': {sugerido['sugerencias']}")
+    assert "error" in sugerido and sugerido["sugerencias"][0]["funcionalidad"] == "camara"
+    assert "error" in verificar_permisos_requeridos("camara", "Windows")
+
+    diagnostico = diagnosticar_problema_permisos("Desde ayer la cámara queda en negro", "android")
+    assert diagnostico["problema_detectado"] == "camara no funciona", diagnostico
+    assert diagnostico["documentacion"].startswith("https://developer.android.com")
+    assert diagnosticar_problema_permisos("no me llegan las notificaciones push", "iOS")["problema_detectado"] == \
+        "notificaciones no llegan"
+    # Con dos problemas presentes gana el primero de la tabla y el otro queda como alternativa
+    ambos = diagnosticar_problema_permisos("permiso denegado y la camara no funciona")
+    assert ambos["problema_detectado"] == "permiso denegado"
+    assert ambos["otros_posibles"][0]["problema"] == "camara no funciona"
+    sin_detectar = diagnosticar_problema_permisos("la app no funciona")
+    assert sin_detectar["problema_detectado"] == "No se pudo detectar automáticamente"
+    assert all(c["puntaje"] < 0.7 for c in sin_detectar["problemas_similares"])
+
+    print("✓ La búsqueda difusa de permisos funciona correctamente")
+
+
+def test_pool_skills():
+    """Prueba el pool de SkillManagers por producto"""
+
+    print("\n[TEST] Pool de skills por producto")
+    print("-" * 70)
+
+    from instantneo import InstantNeo
+    from skills_infra.pool_skills import PoolSkills
+
+    carpeta = str(Path(__file__).parent)
+    pool = PoolSkills(carpeta, ["api", "mobile"])
+    assert pool.productos == ("api", "mobile") and "webapp" not in pool
+    assert set(PoolSkills(carpeta).productos) == {"api", "mobile", "webapp"}, "Por defecto, todas las subcarpetas"
+
+    agente = InstantNeo(provider="openai", api_key="sin-uso", model="gpt-4o-mini", role_setup="Soporte")
+    assert pool.activar(agente, "api") is agente.skill_manager
+    assert "verificar_endpoint" in agente.get_tool_names()
+    pool.activar(agente, "mobile")
+    assert "analizar_crash_log" in agente.get_tool_names()
+    assert "verificar_endpoint" not in agente.get_tool_names()
+    assert pool.activar(agente, "api") is pool.manager("api"), "Se reutiliza el mismo manager, sin recargar"
+
+    try:
+        pool.activar(agente, "webapp")
+        raise AssertionError("Debería fallar con un producto fuera del pool")
+    except KeyError:
+        pass
+    try:
+        PoolSkills(carpeta, ["no_existe"])
+        raise AssertionError("Debería fallar con una carpeta inexistente")
+    except FileNotFoundError:
+        pass
+
+    print("✓ El pool de skills funciona correctamente")
+
+
+def test_manifiesto_skills():
+    """Prueba la carga perezosa de skills desde un manifiesto"""
+
+    print("\n[TEST] Manifiesto de skills")
+    print("-" * 70)
+
+    import warnings
+    from instantneo.skills import SkillManager
+    from skills_infra.manifiesto import ARCHIVO_MANIFIESTO, generar_manifiesto, registrar_desde_manifiesto
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        marca = os.path.join(carpeta, "importado.txt")
+        ruta_skill = os.path.join(carpeta, "duplicar.py")
+        with open(ruta_skill, "w", encoding="utf-8") as archivo:
+            archivo.write(
+                "from instantneo.skills import skill\n"
+                f"open({marca!r}, 'a').write('x')\n\n"
+                "@skill(description='Duplica un número', tags=['prueba'])\n"
+                "def duplicar(numero: int) -> int:\n"
+                "    return numero * 2\n"
+            )
+        manifiesto = generar_manifiesto(carpeta)
+        assert [e["nombre"] for e in manifiesto["skills"]] == ["duplicar"]
+        assert os.path.exists(os.path.join(carpeta, ARCHIVO_MANIFIESTO))
+        os.remove(marca)
+
+        completo = SkillManager()
+        completo.load_skills.from_folder(carpeta)
+        os.remove(marca)
+
+        perezoso = SkillManager()
+        assert registrar_desde_manifiesto(perezoso, carpeta) == ["duplicar"]
+        assert not os.path.exists(marca), "Registrar no debe importar el módulo"
+        assert perezoso.get_schemas() == completo.get_schemas()
+        assert perezoso.get_tools_by_tag("prueba") == ["duplicar"]
+
+        proxy = perezoso.get_tool_by_name("duplicar")
+        assert proxy(21) == 42 and proxy(numero=5) == 10
+        with open(marca) as archivo:
+            assert archivo.read() == "x", "El módulo se importa una sola vez"
+
+        # Un archivo modificado después de generar el manifiesto avisa al importarse
+        with open(ruta_skill, "a", encoding="utf-8") as archivo:
+            archivo.write("\n# cambio\n")
+        otro = os.path.join(carpeta, "copia")
+        os.mkdir(otro)
+        with open(ruta_skill, encoding="utf-8") as origen, open(os.path.join(otro, "duplicar.py"), "w", encoding="utf-8") as copia:
+            copia.write(origen.read())
+        manager = SkillManager()
+        registrar_desde_manifiesto(manager, otro, os.path.join(carpeta, ARCHIVO_MANIFIESTO))
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            assert manager.get_tool_by_name("duplicar")(1) == 2
+        assert any("cambió" in str(aviso.message) for aviso in avisos)
+
+    print("✓ El manifiesto de skills funciona correctamente")
+
+
+def test_cache_esquemas():
+    """Prueba el cache persistente de esquemas de skills"""
+
+    print("\n[TEST] Cache de esquemas de skills")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from skills_infra.cache_esquemas import CacheEsquemas
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        skills = os.path.join(carpeta, "skills")
+        os.mkdir(skills)
+        marca = os.path.join(carpeta, "importado.txt")
+        ruta_skill = os.path.join(skills, "triplicar.py")
+        codigo = (
+            "from instantneo.skills import skill\n"
+            f"open({marca!r}, 'a').write('x')\n\n"
+            "@skill(description='Triplica un número')\n"
+            "def triplicar(numero: int) -> int:\n"
+            "    return numero * 3\n"
+        )
+        with open(ruta_skill, "w", encoding="utf-8") as archivo:
+            archivo.write(codigo)
+        ruta_cache = os.path.join(carpeta, "esquemas.sqlite")
+
+        with CacheEsquemas(ruta_cache) as cache:
+            primero = SkillManager()
+            assert cache.cargar_carpeta(primero, skills) == {"desde_cache": 0, "importados": 1}
+            assert len(cache) == 1
+        os.remove(marca)
+
+        # Otro proceso (otra conexión) con el archivo sin cambios no importa nada
+        with CacheEsquemas(ruta_cache) as cache:
+            segundo = SkillManager()
+            assert cache.cargar_carpeta(segundo, skills) == {"desde_cache": 1, "importados": 0}
+            assert not os.path.exists(marca)
+            assert segundo.get_schemas() == primero.get_schemas()
+            assert segundo.get_tool_by_name("triplicar")(numero=4) == 12
+            assert os.path.exists(marca)
+
+            # Un archivo modificado se vuelve a importar y reemplaza su entrada
+            with open(ruta_skill, "w", encoding="utf-8") as archivo:
+                archivo.write(codigo.replace("Triplica un número", "Multiplica un número por tres"))
+            tercero = SkillManager()
+            assert cache.cargar_carpeta(tercero, skills) == {"desde_cache": 0, "importados": 1}
+            assert len(cache) == 1
+            assert tercero.get_schemas()[0]["function"]["description"] == "Multiplica un número por tres"
+
+    print("✓ El cache de esquemas funciona correctamente")
+
+
+def test_recuperacion_skills():
+    """Prueba la selección de skills relevantes con BM25"""
+
+    print("\n[TEST] Recuperación de skills")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from skills_infra.recuperacion_skills import IndiceSkills, palabras_relevantes
+
+    assert palabras_relevantes("Las Desviaciones de los números") == ["desviacion", "numero"]
+
+    biblioteca = Path(__file__).parent.parent / "skills_biblioteca"
+    manager = SkillManager()
+    for carpeta in ("basicas", "estadisticas", "ml"):
+        manager.load_skills.from_folder(str(biblioteca / carpeta))
+    indice = IndiceSkills(manager)
+    assert len(indice) == 5
+
+    assert indice.buscar("¿Cuál es la mediana de estos valores?", k=1)[0][0] == "calcular_mediana"
+    assert indice.buscar("calcula la DESVIACIÓN estándar", k=1)[0][0] == "calcular_desviacion_estandar"
+    assert indice.buscar("regresión lineal entre x e y", k=2)[0][0] == "regresion_lineal_simple"
+    assert indice.buscar("hola, ¿qué tal?") == []
+
+    seleccion = indice.seleccionar("suma de la lista", k=2)
+    assert seleccion.skills[0] == "sumar_lista" and len(seleccion.skills) <= 2
+    assert 0 < seleccion.tokens_enviadas < seleccion.tokens_todas
+    assert seleccion.tokens_ahorrados == seleccion.tokens_todas - seleccion.tokens_enviadas
+    assert 0 < seleccion.ahorro < 1
+
+    # Registrar otra carpeta rearma el índice en la próxima búsqueda
+    manager.load_skills.from_folder(str(Path(__file__).parent / "mobile"))
+    assert indice.buscar("stack trace del crash en Android", k=1)[0][0] == "analizar_crash_log"
+    assert len(indice) == 12
+
+    print("✓ La recuperación de skills funciona correctamente")
+
+
+def test_indice_tags():
+    """Prueba el índice de tags con bitsets y sus expresiones booleanas"""
+
+    print("\n[TEST] Índice de tags")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from skills_infra.indice_tags import SkillManagerConTags
+
+    base, indexado = SkillManager(), SkillManagerConTags()
+    for manager in (base, indexado):
+        manager.load_skills.from_folder(str(Path(__file__).parent / "mobile"))
+    assert len(indexado.indice_tags) == 7
+
+    def a_mano(filtro):
+        return [
+            metadata["name"] for metadata in base.get_all_skills_metadata().values()
+            if filtro(set(metadata.get("tags", ())))
+        ]
+
+    for tag in ("crash", "permissions", "performance", "inexistente"):
+        assert sorted(indexado.get_skills_by_tag(tag)) == sorted(base.get_skills_by_tag(tag))
+    consultas = [
+        ("crash and performance", lambda t: "crash" in t and "performance" in t),
+        ("permissions or performance", lambda t: "permissions" in t or "performance" in t),
+        ("debugging and not crash", lambda t: "debugging" in t and "crash" not in t),
+        ("NOT (crash OR tools) and troubleshooting", lambda t: not ({"crash", "tools"} & t) and "troubleshooting" in t),
+    ]
+    for expresion, filtro in consultas:
+        assert sorted(indexado.filtrar_por_tags(expresion)) == sorted(a_mano(filtro)), expresion
+    assert indexado.filtrar_por_tags("crash and inexistente") == []
+    claves = indexado.filtrar_por_tags("permissions", return_keys=True)
+    assert len(claves) == 2 and all(clave in indexado.registry for clave in claves)
+
+    # Quitar y actualizar metadata mantienen el índice al día
+    quitada = indexado.filtrar_por_tags("crash and performance")[0]
+    assert indexado.remove_skill(quitada)
+    assert quitada not in indexado.filtrar_por_tags("crash")
+    clave = next(iter(claves))
+    assert indexado.update_skill_metadata(clave, {"tags": ["revisado"]})
+    assert indexado.filtrar_por_tags("revisado") == [clave.rpartition(".")[2]]
+    assert len(indexado.filtrar_por_tags("permissions")) == 1
+    indexado.clear_registry()
+    assert len(indexado.indice_tags) == 0 and indexado.filtrar_por_tags("mobile") == []
+
+    # Desactivar una skill activada desde un sub-manager la quita del índice
+    indexado.load_skills.from_manager(SkillManager(name="movil", skills_from_folders=[str(Path(__file__).parent / "mobile")]))
+    indexado.activate("analizar_crash_log")
+    assert indexado.filtrar_por_tags("crash") == ["analizar_crash_log"]
+    assert indexado.deactivate("analizar_crash_log")
+    assert len(indexado.indice_tags) == 0 and indexado.filtrar_por_tags("crash", return_keys=True) == {}
+
+    for invalida in ("", "crash and", "(crash or tools", "crash)", "and crash", "crash tools"):
+        try:
+            indexado.filtrar_por_tags(invalida)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expresión aceptada: {invalida!r}")
+
+    print("✓ El índice de tags funciona correctamente")
+
+
+def test_vistas_skills():
+    """Prueba las vistas de SkillManager con copia al escribir"""
+
+    print("\n[TEST] Vistas de skills")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from instantneo.skills.skill_manager_operations import SkillManagerOperations
+    from skills_infra.vistas_skills import OperacionesVista
+
+    carpetas = Path(__file__).parent
+    movil = SkillManager(skills_from_folders=[str(carpetas / "mobile")])
+    web = SkillManager(skills_from_folders=[str(carpetas / "webapp")])
+    crashes = SkillManager()
+    for nombre in movil.get_skills_by_tag("crash"):
+        crashes.register_tool(movil.get_skill_by_name(nombre))
+
+    # Mismo resultado que SkillManagerOperations, también encadenando vistas
+    for operacion, managers in [
+        ("union", (movil, web)), ("intersection", (movil, crashes)),
+        ("difference", (movil, crashes)), ("symmetric_difference", (crashes, web)),
+    ]:
+        copia = getattr(SkillManagerOperations, operacion)(*managers)
+        vista = getattr(OperacionesVista, operacion)(*managers)
+        assert not vista.materializada
+        assert dict(vista.registry) == copia.registry, operacion
+        assert sorted(vista.get_skill_names()) == sorted(copia.get_skill_names())
+        # Las búsquedas por nombre se resuelven sin armar el registry completo
+        for nombre in copia.get_skill_names() + ["inexistente"]:
+            assert vista.get_skill_by_name(nombre) is copia.get_skill_by_name(nombre), nombre
+            assert vista.get_skill_metadata_by_name(nombre) == copia.get_skill_metadata_by_name(nombre)
+            assert (nombre in vista.registry_by_name) == (nombre in copia.registry_by_name)
+        assert dict(vista.registry_by_name) == copia.registry_by_name and not vista.duplicates
+        assert not vista.materializada
+    catalogo = OperacionesVista.difference(OperacionesVista.union(movil, web), crashes)
+    assert sorted(catalogo.get_skill_names()) == sorted(
+        set(movil.get_skill_names()) - set(crashes.get_skill_names()) | set(web.get_skill_names())
+    )
+    assert catalogo.get_skills_by_tag("crash") == []
+
+    # Sin modificarla sigue a sus padres
+    antes = len(catalogo.registry)
+    web.remove_skill("validar_html")
+    assert len(catalogo.registry) == antes - 1 and not catalogo.materializada
+    assert catalogo.get_skill_by_name("validar_html") is None and "validar_html" not in catalogo.registry_by_name
+
+    # Modificarla la materializa sin tocar a los padres
+    clave = next(clave for clave in catalogo.registry if clave.endswith(".verificar_permisos_requeridos"))
+    original = movil.registry[clave]
+    assert catalogo.update_skill_metadata(clave, {"tags": ["cliente"]})
+    assert catalogo.materializada
+    assert catalogo.get_skills_by_tag("cliente") == ["verificar_permisos_requeridos"]
+    assert "cliente" not in original.tool_metadata["tags"] and movil.registry[clave] is original
+    assert catalogo.remove_skill("verificar_permisos_requeridos")
+    assert "verificar_permisos_requeridos" in movil.get_skill_names()
+    web.remove_skill("auditar_sitio_web")
+    assert "auditar_sitio_web" in catalogo.get_skill_names()
+
+    print("✓ Las vistas de skills funcionan correctamente")
+
+
+def test_registro_compacto():
+    """Prueba el registro compacto de skills desde un manifiesto"""
+
+    print("\n[TEST] Registro compacto")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from skills_infra.manifiesto import generar_manifiesto, registrar_desde_manifiesto
+    from skills_infra.registro_compacto import SkillCompacta, SkillManagerCompacto
+
+    carpeta = str(Path(__file__).parent / "mobile")
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "skills.manifiesto.json")
+        generar_manifiesto(carpeta, ruta)
+        proxies = SkillManager()
+        registrar_desde_manifiesto(proxies, carpeta, ruta)
+        compacto = SkillManagerCompacto()
+        nombres = compacto.registrar_manifiesto(carpeta, ruta)
+
+    assert sorted(nombres) == sorted(proxies.get_skill_names())
+    assert compacto.get_all_skills_metadata() == proxies.get_all_skills_metadata()
+    assert sorted(compacto.get_skills_by_tag("permissions")) == sorted(proxies.get_skills_by_tag("permissions"))
+
+    # Las partes iguales de la metadata son el mismo objeto
+    skills = list(compacto.registry.values())
+    assert all(isinstance(skill, SkillCompacta) for skill in skills)
+    tags = {}
+    for skill in skills:
+        claves, valores = skill._metadata
+        tags.setdefault(tuple(valores[claves.index("tags")]), []).append(valores[claves.index("tags")])
+    assert any(len(iguales) > 1 and all(t is iguales[0] for t in iguales) for iguales in tags.values())
+
+    # Llamarla importa la skill real
+    verificar = compacto.get_skill_by_name("verificar_permisos_requeridos")
+    assert verificar.__module__ == "check_permisos" and verificar.__doc__.startswith("Verifica")
+    resultado = verificar(funcionalidad="camara", plataforma="android")
+    assert "android.permission.CAMERA" in resultado["permisos_requeridos"]
+
+    # El dict de metadata es una copia; update_skill_metadata la reemplaza
+    verificar.tool_metadata["tags"].append("ignorado")
+    assert compacto.get_skills_by_tag("ignorado") == []
+    assert compacto.update_skill_metadata("check_permisos.verificar_permisos_requeridos", {"tags": ["revisado"]})
+    assert compacto.get_skills_by_tag("revisado") == ["verificar_permisos_requeridos"]
+
+    print("✓ El registro compacto funciona correctamente")
+
+
+def test_prefetch_skills():
+    """Prueba la predicción y precarga de skills de la biblioteca"""
+
+    print("\n[TEST] Prefetch de skills")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager
+    from skills_infra.prefetch_skills import PrefetchSkills
+
+    biblioteca = Path(__file__).parent.parent / "skills_biblioteca"
+    prefetch = PrefetchSkills(str(biblioteca))
+    assert len(prefetch) == 5
+
+    prediccion = prefetch.predecir("Calcula la desviación estándar de estos números: 10, 20, 30")
+    assert prediccion == [("calcular_desviacion_estandar", str(biblioteca / "estadisticas" / "desviacion_std.py"))]
+    assert prefetch.predecir("Calcula la regresión lineal para x=[1,2,3] e y=[2,4,6]")[0][0] == "regresion_lineal_simple"
+    assert prefetch.predecir("Hola, ¿cómo estás?") == []
+
+    manager = SkillManager()
+    manager.load_skills.from_folder(str(biblioteca / "basicas"))
+    assert prefetch.precargar(manager, "Calcula el promedio de 1, 2 y 3") == []
+    cargados = prefetch.precargar(manager, "¿Cuál es la mediana de 3, 1, 2?")
+    assert [os.path.basename(ruta) for ruta in cargados] == ["mediana.py"]
+    assert "calcular_mediana" in manager.get_skill_names()
+    assert prefetch.precargar(manager, "¿Y la mediana de 5, 4?") == []
+
+    print("✓ El prefetch de skills funciona correctamente")
+
+
+def test_metricas():
+    """Prueba las métricas por skill de SkillManagerConMetricas"""
+
+    print("\n[TEST] Métricas por skill")
+    print("-" * 70)
+
+    import json
+    from skills_infra.metricas import LIMITES_SEGUNDOS, SkillManagerConMetricas
+
+    manager = SkillManagerConMetricas()
+    manager.load_skills.from_folder(str(Path(__file__).parent.parent / "skills_biblioteca" / "basicas"))
+    promedio = manager.get_skill_by_name("calcular_promedio")
+    for numeros in ([1, 2, 3], [4, 5], [6]):
+        assert promedio(numeros) == sum(numeros) / len(numeros)
+    try:
+        promedio([])
+    except ValueError:
+        pass
+    manager.get_skill_by_name("sumar_lista")([1, 2])
+
+    # El envoltorio conserva la metadata y el tracking de la última llamada
+    assert promedio.tool_metadata is promedio.__wrapped__.tool_metadata
+    assert isinstance(promedio.get_last_call()["exception"], ValueError)
+    assert manager.update_skill_metadata("promedio.calcular_promedio", {"version": "2.0"})
+    assert promedio.__wrapped__.tool_metadata["version"] == "2.0"
+
+    metricas = manager.metricas["promedio.calcular_promedio"]
+    assert metricas.llamadas == 4 and metricas.errores == {"ValueError": 1}
+    assert sum(metricas.buckets) == 4 and 0 < metricas.percentil(0.5) <= metricas.percentil(0.99)
+
+    snapshot = json.loads(manager.metricas.snapshot_json())
+    assert len(snapshot["limites_segundos"]) == len(LIMITES_SEGUNDOS)
+    assert {skill["skill"]: skill["llamadas"] for skill in snapshot["skills"]} == {"calcular_promedio": 4, "sumar_lista": 1}
+
+    texto = manager.metricas.exportar_prometheus()
+    etiquetas = 'skill="calcular_promedio",modulo="promedio"'
+    assert f"skill_llamadas_total{{{etiquetas}}} 4" in texto
+    assert f'skill_errores_total{{{etiquetas},excepcion="ValueError"}} 1' in texto
+    assert f'skill_duracion_segundos_bucket{{{etiquetas},le="+Inf"}} 4' in texto
+    assert f"skill_duracion_segundos_count{{{etiquetas}}} 4" in texto
+
+    # Volver a registrar la skill medida no la mide dos veces
+    manager.register_tool(promedio)
+    manager.get_skill_by_name("calcular_promedio")([1])
+    assert metricas.llamadas == 5
+
+    print("✓ Las métricas por skill funcionan correctamente")
+
+
+def test_historial_skills():
+    """Prueba el historial de llamadas por skill de SkillManagerConHistorial"""
+
+    print("\n[TEST] Historial de llamadas")
+    print("-" * 70)
+
+    from skills_infra.historial import HistorialSkill, SkillManagerConHistorial
+
+    manager = SkillManagerConHistorial(muestreo=4, capacidad_muestras=8)
+    manager.load_skills.from_folder(str(Path(__file__).parent.parent / "skills_biblioteca" / "basicas"))
+    assert manager.historiales == {}
+
+    # Se activa desde la metadata: la skill queda envuelta en el registry
+    assert manager.update_skill_metadata("promedio.calcular_promedio", {"historial": 16})
+    promedio = manager.get_skill_by_name("calcular_promedio")
+    assert manager.registry["promedio.calcular_promedio"] is promedio
+    assert promedio.tool_metadata["historial"] == 16
+    for numero in range(40):
+        try:
+            promedio([numero] if numero % 5 else [])
+        except ValueError:
+            pass
+
+    historial = manager.historial("calcular_promedio")
+    llamadas = historial.llamadas()
+    assert len(historial) == len(llamadas) == 16
+    assert [llamada.secuencia for llamada in llamadas] == list(range(39, 23, -1))
+    fallas = historial.fallas(100)
+    assert [llamada.secuencia for llamada in fallas] == [35, 30, 25]
+    # Las fallas siempre quedan en las muestras, con sus argumentos y la excepción
+    assert all(llamada.muestreada and llamada.args == ([],) for llamada in fallas)
+    assert isinstance(fallas[0].resultado, ValueError) and fallas[0].excepcion == "ValueError"
+    assert [llamada.resultado for llamada in llamadas if llamada.muestreada and llamada.ok] == [36, 32, 28, 24]
+    assert manager.ultimas_fallas(2) == fallas[:2]
+    assert historial.ultimas(3, excepcion="KeyError") == []
+
+    # get_last_call() sigue funcionando y desactivarlo desenvuelve la skill
+    assert promedio.get_last_call()["result"] == 39
+    manager.update_skill_metadata("promedio.calcular_promedio", {"historial": False})
+    assert not hasattr(manager.get_skill_by_name("calcular_promedio"), "historial_skill")
+    assert manager.historial("promedio.calcular_promedio") is historial
+
+    try:
+        HistorialSkill("x.y", capacidad=0)
+        assert False, "capacidad=0 debería fallar"
+    except ValueError:
+        pass
+
+    print("✓ El historial de llamadas funciona correctamente")
+
+
+def test_skill_rapida():
+    """Prueba las skills con tracking opcional o muestreado"""
+
+    print("\n[TEST] Skills sin tracking")
+    print("-" * 70)
+
+    from instantneo.skills import SkillManager, skill
+    from skills_infra.skill_rapida import skill_rapida
+
+    def sumar(a: int, b: int) -> int:
+        """Suma dos números enteros."""
+        return a + b
+
+    esperada = skill(description="Suma dos números", tags=["matematicas"])(sumar).tool_metadata
+
+    # Sin tracking la skill es la función original, con la misma metadata que @skill
+    rapida = skill_rapida(description="Suma dos números", tags=["matematicas"])(sumar)
+    assert rapida is sumar and rapida(2, 3) == 5
+    assert rapida.get_last_call() is None and rapida.get_last_result() is None
+    assert rapida.tool_metadata == dict(esperada, track=False, sample_rate=0.0)
+
+    def multiplicar(a: int, b: int) -> int:
+        return a * b
+
+    muestreada = skill_rapida(description="Multiplica", sample_rate=0.25)(multiplicar)
+    assert muestreada.tool_metadata["track"] is True
+    for numero in range(6):
+        assert muestreada(numero, 10) == numero * 10
+    # Se trackearon las llamadas 0 y 4
+    assert muestreada.get_last_params() == {"args": (4, 10), "kwargs": {}}
+
+    def restar(a: int, b: int) -> int:
+        return a - b
+
+    completa = skill_rapida(description="Resta", track=True)(restar)
+    assert completa(5, 3) == 2 and completa.get_last_result() == 2
+
+    manager = SkillManager()
+    for funcion in (rapida, muestreada, completa):
+        manager.register_skill(funcion)
+    assert sorted(manager.get_skill_names()) == ["multiplicar", "restar", "sumar"]
+    assert manager.get_skill_metadata_by_name("sumar")["description"] == "Suma dos números"
+
+    try:
+        skill_rapida(sample_rate=2)
+        assert False, "sample_rate=2 debería fallar"
+    except ValueError:
+        pass
+
+    print("✓ Las skills sin tracking funcionan correctamente")
+
+
+def test_ejecucion_aislada():
+    """Prueba la ejecución de skills con isolation="process" en un pool de procesos"""
+
+    print("\n[TEST] Ejecución aislada")
+    print("-" * 70)
+
+    from skills_infra.ejecucion_aislada import ERROR_PROCESO, ERROR_TIMEOUT, SkillManagerAislado, skill_aislada
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "skills_lentas.py")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(
+                "import os\n"
+                "import time\n"
+                "from instantneo.skills import skill\n\n"
+                "@skill(description='Espera', isolation='process', timeout=0.5)\n"
+                "def esperar(segundos: float) -> int:\n"
+                "    time.sleep(segundos)\n"
+                "    return os.getpid()\n\n"
+                "@skill(description='Termina el proceso', isolation='process')\n"
+                "def terminar() -> None:\n"
+                "    os._exit(3)\n"
+            )
+
+        manager = SkillManagerAislado(procesos=1, max_tareas=2)
+        try:
+            manager.load_skills.from_folder(str(Path(__file__).parent.parent / "skills_biblioteca" / "ml"))
+            manager.load_skills.from_file(ruta)
+            assert manager.pool is not None and len(manager.pool.pids()) == 1
+
+            # La regresión se ejecuta en el trabajador; sus errores llegan como en el proceso del agente
+            regresion = manager.get_skill_by_name("regresion_lineal_simple")
+            assert regresion.tool_metadata["isolation"] == "process"
+            resultado = regresion([1, 2, 3], [2, 4, 6])
+            assert abs(resultado["pendiente"] - 2) < 1e-9 and abs(resultado["intercepto"]) < 1e-9
+            try:
+                regresion([1], [2])
+                assert False, "la regresión con un punto debería fallar"
+            except ValueError:
+                pass
+
+            # Después de max_tareas el trabajador se reemplaza
+            esperar = manager.get_skill_by_name("esperar")
+            pid = esperar(0)
+            assert pid != os.getpid() and manager.pool.pids() == [pid]
+            assert esperar(0) == pid
+            assert esperar(0) != pid
+
+            # Un timeout mata al trabajador y devuelve un error estructurado
+            inicio = time.perf_counter()
+            error = esperar(5)
+            assert time.perf_counter() - inicio < 3
+            assert error["error"] == ERROR_TIMEOUT and error["skill"] == "esperar" and error["timeout_segundos"] == 0.5
+            assert isinstance(esperar(0), int)
+
+            error = manager.get_skill_by_name("terminar")()
+            assert error["error"] == ERROR_PROCESO and error["codigo_salida"] == 3
+            assert isinstance(esperar(0), int)
+        finally:
+            manager.cerrar()
+
+        # Los proxies del manifiesto se ejecutan desde el archivo de la skill, no desde manifiesto.py
+        from skills_infra.manifiesto import generar_manifiesto, registrar_desde_manifiesto
+        from skills_infra.registro_compacto import SkillManagerCompacto
+
+        carpeta = str(Path(__file__).parent / "webapp")
+        generar_manifiesto(carpeta, os.path.join(directorio, "webapp.json"))
+        manager, compacto = SkillManagerAislado(procesos=1), SkillManagerCompacto()
+        try:
+            registrar_desde_manifiesto(manager, carpeta, os.path.join(directorio, "webapp.json"))
+            validar = manager.get_skill_by_name("validar_html")
+            assert validar.pool_aislado is manager.pool
+            resultado = validar("<html><body><div><p>Hola</div></body></html>")
+            assert resultado["html_valido"] is False and resultado["total_errores"] == 1, resultado
+
+            compacto.registrar_manifiesto(carpeta, os.path.join(directorio, "webapp.json"))
+            compacta = skill_aislada(compacto.get_skill_by_name("validar_html"), manager.pool)
+            assert compacta("<html><body><div><p>Hola</div></body></html>") == resultado
+        finally:
+            manager.cerrar()
+
+    print("✓ La ejecución aislada funciona correctamente")
+
+
+def main():
+    print("=" * 70)
+    print("PRUEBA DE SKILLS MULTI-PRODUCTO")
+    print("=" * 70)
+
+    test_logs_indexados()
+    test_verificar_endpoint()
+    test_verificar_endpoints_lote()
+    test_tablas_conocimiento()
+    test_validar_html()
+    test_documento_html()
+    test_analizar_codigo_javascript()
+    test_auditar_sitio_web()
+    test_cache_auditoria()
+    test_agrupar_crashes()
+    test_almacen_crashes()
+    test_palabras_clave()
+    test_permisos_difusos()
+    test_pool_skills()
+    test_manifiesto_skills()
+    test_cache_esquemas()
+    test_recuperacion_skills()
+    test_indice_tags()
+    test_vistas_skills()
+    test_registro_compacto()
+    test_prefetch_skills()
+    test_metricas()
+    test_historial_skills()
+    test_skill_rapida()
+    test_ejecucion_aislada()
+
+    print("\n" + "=" * 70)
+    print("✓ TODAS LAS SKILLS PASARON LAS PRUEBAS")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"\n✗ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
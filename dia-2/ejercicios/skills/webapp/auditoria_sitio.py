@@ -0,0 +1,127 @@
+"""Skills para auditar sitios web completos"""
+
+from instantneo.skills import skill
+from pathlib import Path
+import os
+import sys
+import time
+
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
+
+from skills_infra.archivos import listar_archivos
+from skills_infra.auditoria_web import ReporteAuditoria, auditar_con_cache, auditar_en_paralelo, cargar_modulo
+from skills_infra.cache_resultados import RUTA_CACHE_POR_DEFECTO, CacheResultados, version_de_fuentes
+
+# Extensión -> tipo de archivo auditado
+TIPOS_ARCHIVO = {".html": "html", ".htm": "html", ".js": "js", ".mjs": "js", ".cjs": "js"}
+
+# Subir al cambiar la forma de puntuar; los cambios en el código fuente de las
+# skills y de skills_infra ya invalidan el cache por sí solos
+VERSION_AUDITORIA = 1
+
+
+def _skills_webapp():
+    """
+    Carga validar_html.py y debug_javascript.py por ruta. Se hace dentro de una
+    función para que from_folder() no registre sus skills como parte de este módulo.
+    """
+    carpeta = Path(__file__).resolve().parent
+    return cargar_modulo(str(carpeta / "validar_html.py")), cargar_modulo(str(carpeta / "debug_javascript.py"))
+
+
+def version_analizador() -> str:
+    """Versión de la auditoría según el código y los datos de webapp/ y skills_infra/."""
+    carpeta = Path(__file__).resolve().parent
+    fuentes = [*carpeta.glob("*.py"), *carpeta.glob("*.datos.json"), *Path(_RUTA_EJERCICIOS, "skills_infra").glob("*.py")]
+    return version_de_fuentes(fuentes, prefijo=f"auditoria_sitio-{VERSION_AUDITORIA}")
+
+
+def auditar_archivo(ruta: str) -> dict:
+    """
+    Audita un archivo HTML o JavaScript con las skills de webapp.
+
+    Args:
+        ruta: Archivo a auditar
+
+    Returns:
+        Diccionario con ruta, tipo, puntuacion (0-100) y hallazgos, del más grave al más leve
+    """
+    modulo_html, modulo_js = _skills_webapp()
+    tipo = TIPOS_ARCHIVO[os.path.splitext(ruta)[1].lower()]
+
+    if tipo == "html":
+        with open(ruta, "r", encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        validacion = modulo_html.validar_html(html)
+        seo = modulo_html.analizar_seo_html(html)
+        puntuacion = round((validacion["puntuacion_accesibilidad"] + seo["puntuacion_seo"]) / 2)
+        hallazgos = validacion["errores"] + seo["problemas_criticos"] + validacion["warnings"] + seo["recomendaciones"]
+    else:
+        analisis = modulo_js.analizar_codigo_javascript(archivo=ruta)
+        if "error" in analisis:
+            return {"ruta": ruta, "error": analisis["error"]}
+        # Misma escala que puntuacion_accesibilidad de validar_html
+        puntuacion = max(0, 100 - (analisis["total_errores"] * 20 + analisis["total_warnings"] * 5))
+        hallazgos = analisis["errores"] + analisis["warnings"] + analisis["sugerencias"]
+
+    return {"ruta": ruta, "tipo": tipo, "puntuacion": puntuacion, "hallazgos": hallazgos}
+
+
+@skill(
+    description="Audita en paralelo todos los archivos HTML y JavaScript de un directorio y devuelve un reporte compacto",
+    tags=["webapp", "debugging", "html", "javascript", "seo", "performance"]
+)
+def auditar_sitio_web(
+    directorio: str,
+    procesos: int = 0,
+    top_peores: int = 10,
+    usar_cache: bool = True,
+    ruta_cache: str = ""
+) -> dict:
+    """
+    Audita un sitio estático completo (por ejemplo la carpeta de build) con
+    validar_html, analizar_seo_html y analizar_codigo_javascript, repartiendo
+    los archivos entre varios procesos.
+
+    Con cache, solo se analizan los archivos cuyo contenido cambió desde la
+    última auditoría (o todos si cambió el código de las skills).
+
+    Args:
+        directorio: Carpeta a recorrer recursivamente
+        procesos: Procesos a usar; 0 usa todos los CPUs disponibles
+        top_peores: Cantidad de peores archivos a incluir en el reporte
+        usar_cache: Reutilizar resultados de auditorías anteriores
+        ruta_cache: Archivo SQLite del cache (por defecto en ~/.cache/skills_infra)
+
+    Returns:
+        Reporte con totales por tipo, archivos analizados y tomados del cache,
+        puntuación media, peores archivos, archivos por regla incumplida y
+        errores de lectura
+    """
+    if not os.path.isdir(directorio):
+        return {"error": f"No se encontró el directorio '{directorio}'"}
+
+    inicio = time.perf_counter()
+    rutas = listar_archivos(directorio, TIPOS_ARCHIVO)
+    if not rutas:
+        return {"error": f"No hay archivos HTML ni JavaScript en '{directorio}'"}
+
+    reporte = ReporteAuditoria(directorio)
+    if usar_cache:
+        version = version_analizador()
+        with CacheResultados(ruta_cache or RUTA_CACHE_POR_DEFECTO) as cache:
+            for resultado in auditar_con_cache(rutas, __file__, "auditar_archivo", cache, version, procesos=procesos):
+                reporte.agregar(resultado)
+            cache.purgar_otras_versiones(version)
+    else:
+        for resultado in auditar_en_paralelo(rutas, __file__, "auditar_archivo", procesos=procesos):
+            reporte.agregar(resultado)
+
+    return {
+        **reporte.resumen(top_peores),
+        "duracion_segundos": round(time.perf_counter() - inicio, 2)
+    }
@@ -1,96 +1,23 @@
 """Skills para debugging de JavaScript"""
 
 from instantneo.skills import skill
-import re
+from pathlib import Path
+import sys
 
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
 
-@skill(
-    description="Analiza código JavaScript en busca de errores comunes y malas prácticas",
-    tags=["webapp", "debugging", "javascript"]
-)
-def analizar_codigo_javascript(js_codigo: str) -> dict:
-    """
-    Analiza código JavaScript buscando errores comunes y code smells.
-
-    Args:
-        js_codigo: Código JavaScript a analizar
-
-    Returns:
-        Diccionario con análisis de código y problemas encontrados
-    """
-    errores = []
-    warnings = []
-    sugerencias = []
-
-    # Verificar uso de var en lugar de let/const
-    var_usage = re.findall(r'\bvar\s+\w+', js_codigo)
-    if var_usage:
-        warnings.append(f"Uso de 'var' encontrado ({len(var_usage)} veces). Considera usar 'let' o 'const'")
-
-    # Verificar console.log olvidados
-    console_logs = re.findall(r'console\.log\(', js_codigo)
-    if console_logs:
-        sugerencias.append(f"Encontrados {len(console_logs)} console.log() - considera removerlos en producción")
-
-    # Verificar == en lugar de ===
-    loose_equality = re.findall(r'[^=!<>]==[^=]', js_codigo)
-    if loose_equality:
-        warnings.append(f"Uso de '==' encontrado ({len(loose_equality)} veces). Usa '===' para comparación estricta")
-
-    # Verificar funciones sin nombre (difíciles de debuggear)
-    anonymous_funcs = re.findall(r'function\s*\(', js_codigo)
-    if anonymous_funcs:
-        sugerencias.append(f"{len(anonymous_funcs)} funciones anónimas - considera nombrarlas para mejor debugging")
-
-    # Verificar callbacks anidados (callback hell)
-    lineas = js_codigo.split('\n')
-    max_indentation = 0
-    for linea in lineas:
-        if linea.strip():
-            espacios = len(linea) - len(linea.lstrip())
-            max_indentation = max(max_indentation, espacios)
-
-    if max_indentation > 16:  # 4 niveles de indentación
-        warnings.append("Indentación muy profunda detectada - posible 'callback hell'. Considera usar Promises o async/await")
-
-    # Verificar try/catch sin manejo
-    try_blocks = re.findall(r'try\s*{[^}]*}\s*catch\s*\([^)]*\)\s*{([^}]*)}', js_codigo, re.DOTALL)
-    for catch_block in try_blocks:
-        if not catch_block.strip() or catch_block.strip() == '':
-            errores.append("Bloque catch vacío encontrado - los errores están siendo silenciados")
-
-    # Verificar uso de eval (peligroso)
-    if re.search(r'\beval\s*\(', js_codigo):
-        errores.append("Uso de eval() detectado - esto es un riesgo de seguridad")
-
-    return {
-        "codigo_limpio": len(errores) == 0 and len(warnings) == 0,
-        "total_errores": len(errores),
-        "total_warnings": len(warnings),
-        "total_sugerencias": len(sugerencias),
-        "errores": errores,
-        "warnings": warnings,
-        "sugerencias": sugerencias,
-        "calidad_codigo": "ALTA" if len(errores) == 0 and len(warnings) <= 2 else "MEDIA" if len(errores) == 0 else "BAJA"
-    }
+from skills_infra.lexer_js import AnalizadorJS, analizar_archivo
+from skills_infra.tablas import cargar_tablas, ruta_datos
 
+VERSION_DATOS = 1
 
-@skill(
-    description="Explica errores comunes de JavaScript y cómo solucionarlos",
-    tags=["webapp", "debugging", "javascript", "troubleshooting"]
-)
-def explicar_error_javascript(tipo_error: str, mensaje_error: str = "") -> dict:
-    """
-    Proporciona explicación y soluciones para errores comunes de JavaScript.
-
-    Args:
-        tipo_error: Tipo de error (TypeError, ReferenceError, SyntaxError, etc.)
-        mensaje_error: Mensaje de error completo (opcional)
-
-    Returns:
-        Diccionario con explicación y soluciones
-    """
-    errores_comunes = {
+# Base de conocimiento, construida una sola vez al importar (ver skills_infra.tablas)
+TABLAS = cargar_tablas(ruta_datos(__file__), VERSION_DATOS, {
+    "errores_javascript": {
         "TypeError": {
             "explicacion": "Ocurre cuando un valor no es del tipo esperado",
             "causas_comunes": [
@@ -156,16 +83,126 @@ def explicar_error_javascript(tipo_error: str, mensaje_error: str = "") -> dict:
                 "Usar valores por defecto: const value = obj?.prop || 'default'"
             ]
         }
+    },
+    "herramientas_debugging": [
+        "Chrome DevTools / Firefox Developer Tools",
+        "console.log() estratégico",
+        "debugger; statement",
+        "Source maps para código minificado"
+    ]
+})
+
+
+@skill(
+    description="Analiza código JavaScript en busca de errores comunes y malas prácticas",
+    tags=["webapp", "debugging", "javascript"]
+)
+def analizar_codigo_javascript(js_codigo: str = "", archivo: str = "") -> dict:
+    """
+    Analiza código JavaScript buscando errores comunes y code smells.
+
+    El código se recorre una sola vez con un lexer que ignora strings, template
+    literals, regex y comentarios, así que sirve también para bundles
+    minificados de varios MB. Con ``archivo`` se lee por bloques.
+
+    Args:
+        js_codigo: Código JavaScript a analizar
+        archivo: Ruta a un archivo .js a analizar en lugar de js_codigo (opcional)
+
+    Returns:
+        Diccionario con análisis de código, problemas encontrados y sus líneas
+    """
+    if archivo:
+        try:
+            analizador = analizar_archivo(archivo)
+        except OSError as e:
+            return {"error": f"No se pudo leer '{archivo}': {e}"}
+    else:
+        analizador = AnalizadorJS()
+        analizador.feed(js_codigo)
+        analizador.close()
+
+    conteos = analizador.conteos
+    lineas = analizador.lineas
+    errores = []
+    warnings = []
+    sugerencias = []
+
+    # Verificar uso de var en lugar de let/const
+    if conteos["var"]:
+        warnings.append(f"Uso de 'var' encontrado ({conteos['var']} veces, {_lineas(lineas['var'])}). Considera usar 'let' o 'const'")
+
+    # Verificar console.log olvidados
+    if conteos["console_log"]:
+        sugerencias.append(f"Encontrados {conteos['console_log']} console.log() ({_lineas(lineas['console_log'])}) - considera removerlos en producción")
+
+    # Verificar == en lugar de ===
+    if conteos["igualdad_debil"]:
+        warnings.append(f"Uso de '==' encontrado ({conteos['igualdad_debil']} veces, {_lineas(lineas['igualdad_debil'])}). Usa '===' para comparación estricta")
+
+    # Verificar funciones sin nombre (difíciles de debuggear)
+    if conteos["funciones_anonimas"]:
+        sugerencias.append(f"{conteos['funciones_anonimas']} funciones anónimas ({_lineas(lineas['funciones_anonimas'])}) - considera nombrarlas para mejor debugging")
+
+    # Verificar callbacks anidados (callback hell)
+    if analizador.sangria_maxima > 16:  # 4 niveles de indentación
+        warnings.append(f"Indentación muy profunda detectada (línea {analizador.linea_sangria_maxima}) - posible 'callback hell'. Considera usar Promises o async/await")
+
+    # Verificar try/catch sin manejo
+    if conteos["catch_vacio"] == 1:
+        errores.append(f"Bloque catch vacío encontrado ({_lineas(lineas['catch_vacio'])}) - los errores están siendo silenciados")
+    elif conteos["catch_vacio"]:
+        errores.append(f"Bloques catch vacíos encontrados ({conteos['catch_vacio']} veces, {_lineas(lineas['catch_vacio'])}) - los errores están siendo silenciados")
+
+    # Verificar uso de eval (peligroso)
+    if conteos["eval"]:
+        errores.append(f"Uso de eval() detectado ({_lineas(lineas['eval'])}) - esto es un riesgo de seguridad")
+
+    return {
+        "codigo_limpio": len(errores) == 0 and len(warnings) == 0,
+        "total_errores": len(errores),
+        "total_warnings": len(warnings),
+        "total_sugerencias": len(sugerencias),
+        "errores": errores,
+        "warnings": warnings,
+        "sugerencias": sugerencias,
+        "ubicaciones": {hallazgo: list(lineas[hallazgo]) for hallazgo in conteos if conteos[hallazgo]},
+        "lineas_analizadas": analizador.lineas_totales,
+        "calidad_codigo": "ALTA" if len(errores) == 0 and len(warnings) <= 2 else "MEDIA" if len(errores) == 0 else "BAJA"
     }
 
+
+def _lineas(numeros: list, maximo: int = 5) -> str:
+    """Formatea números de línea como 'línea 3' o 'líneas 3, 8, 12, ...'."""
+    texto = ", ".join(str(n) for n in numeros[:maximo])
+    if len(numeros) > maximo:
+        texto += ", ..."
+    return f"línea {texto}" if len(numeros) == 1 else f"líneas {texto}"
+
+
+@skill(
+    description="Explica errores comunes de JavaScript y cómo solucionarlos",
+    tags=["webapp", "debugging", "javascript", "troubleshooting"]
+)
+def explicar_error_javascript(tipo_error: str, mensaje_error: str = "") -> dict:
+    """
+    Proporciona explicación y soluciones para errores comunes de JavaScript.
+
+    Args:
+        tipo_error: Tipo de error (TypeError, ReferenceError, SyntaxError, etc.)
+        mensaje_error: Mensaje de error completo (opcional)
+
+    Returns:
+        Diccionario con explicación y soluciones
+    """
     # Detectar tipo de error del mensaje si no se especificó
     if not tipo_error and mensaje_error:
-        for error_tipo in errores_comunes.keys():
+        for error_tipo in TABLAS["errores_javascript"]:
             if error_tipo in mensaje_error:
                 tipo_error = error_tipo
                 break
 
-    info = errores_comunes.get(
+    info = TABLAS["errores_javascript"].get(
         tipo_error,
         {
             "explicacion": "Error JavaScript genérico",
@@ -178,12 +215,7 @@ def explicar_error_javascript(tipo_error: str, mensaje_error: str = "") -> dict:
         "tipo_error": tipo_error,
         "mensaje_original": mensaje_error,
         "explicacion": info["explicacion"],
-        "causas_comunes": info["causas_comunes"],
-        "soluciones_recomendadas": info["soluciones"],
-        "herramientas_debugging": [
-            "Chrome DevTools / Firefox Developer Tools",
-            "console.log() estratégico",
-            "debugger; statement",
-            "Source maps para código minificado"
-        ]
+        "causas_comunes": list(info["causas_comunes"]),
+        "soluciones_recomendadas": list(info["soluciones"]),
+        "herramientas_debugging": list(TABLAS["herramientas_debugging"])
     }
@@ -1,59 +1,48 @@
 """Skills para validación de HTML y estructura web"""
 
 from instantneo.skills import skill
-import re
+from pathlib import Path
+import sys
 
+# skills_infra vive en dia-2/ejercicios. Se agrega al path porque
+# load_skills.from_folder() carga este archivo como módulo suelto.
+_RUTA_EJERCICIOS = str(Path(__file__).resolve().parents[2])
+if _RUTA_EJERCICIOS not in sys.path:
+    sys.path.insert(0, _RUTA_EJERCICIOS)
 
-@skill(
-    description="Valida la estructura HTML en busca de errores comunes y problemas de accesibilidad",
-    tags=["webapp", "debugging", "html", "accessibility"]
-)
-def validar_html(html_codigo: str) -> dict:
-    """
-    Valida código HTML en busca de errores estructurales y problemas de accesibilidad.
+from skills_infra.documento_html import DocumentoHTML, obtener_documento
 
-    Args:
-        html_codigo: Código HTML a validar
 
-    Returns:
-        Diccionario con errores y warnings encontrados
-    """
+def _resultado_validacion(documento: DocumentoHTML) -> dict:
+    """Arma la respuesta de validar_html a partir del documento parseado."""
     errores = []
     warnings = []
 
-    # Verificar etiquetas sin cerrar
-    etiquetas_abiertas = re.findall(r'<(\w+)[^>]*>', html_codigo)
-    etiquetas_cerradas = re.findall(r'</(\w+)>', html_codigo)
-
-    # Etiquetas que no necesitan cierre
-    auto_cerradas = {'img', 'br', 'hr', 'input', 'meta', 'link'}
-
-    for tag in etiquetas_abiertas:
-        if tag not in auto_cerradas and etiquetas_abiertas.count(tag) > etiquetas_cerradas.count(tag):
-            errores.append(f"Etiqueta <{tag}> no está cerrada correctamente")
+    # Etiquetas sin cerrar: una entrada por etiqueta, no por aparición
+    for tag, veces in documento.sin_cerrar.items():
+        detalle = f" ({veces} veces)" if veces > 1 else ""
+        errores.append(f"Etiqueta <{tag}> no está cerrada correctamente{detalle}")
 
     # Verificar imágenes sin alt
-    imgs_sin_alt = re.findall(r'<img(?![^>]*alt=)[^>]*>', html_codigo)
-    if imgs_sin_alt:
-        warnings.append(f"Encontradas {len(imgs_sin_alt)} imágenes sin atributo alt (problema de accesibilidad)")
+    if documento.imgs_sin_alt:
+        warnings.append(f"Encontradas {documento.imgs_sin_alt} imágenes sin atributo alt (problema de accesibilidad)")
 
     # Verificar inputs sin label
-    inputs = re.findall(r'<input[^>]*>', html_codigo)
-    labels = re.findall(r'<label[^>]*>', html_codigo)
-    if len(inputs) > len(labels):
-        warnings.append(f"{len(inputs) - len(labels)} inputs sin label asociado (problema de accesibilidad)")
+    inputs = len(documento.inputs)
+    labels = len(documento.labels)
+    if inputs > labels:
+        warnings.append(f"{inputs - labels} inputs sin label asociado (problema de accesibilidad)")
 
     # Verificar headings en orden
-    h1_count = len(re.findall(r'<h1[^>]*>', html_codigo))
+    h1_count = documento.contar("h1")
     if h1_count == 0:
         warnings.append("No se encontró etiqueta <h1> (importante para SEO)")
     elif h1_count > 1:
         warnings.append(f"Múltiples etiquetas <h1> encontradas ({h1_count}). Se recomienda solo una por página")
 
     # Verificar enlaces sin texto
-    enlaces_vacios = re.findall(r'<a[^>]*>\s*</a>', html_codigo)
-    if enlaces_vacios:
-        errores.append(f"{len(enlaces_vacios)} enlaces sin texto de contenido")
+    if documento.enlaces_vacios:
+        errores.append(f"{documento.enlaces_vacios} enlaces sin texto de contenido")
 
     return {
         "html_valido": len(errores) == 0,
@@ -65,6 +54,29 @@ def validar_html(html_codigo: str) -> dict:
     }
 
 
+@skill(
+    description="Valida la estructura HTML en busca de errores comunes y problemas de accesibilidad",
+    tags=["webapp", "debugging", "html", "accessibility"],
+    isolation="process",
+    timeout=10
+)
+def validar_html(html_codigo: str) -> dict:
+    """
+    Valida código HTML en busca de errores estructurales y problemas de accesibilidad.
+
+    Recorre el documento una sola vez con una pila de elementos abiertos,
+    así que el costo crece linealmente con el tamaño de la página. El
+    documento parseado se comparte con analizar_seo_html.
+
+    Args:
+        html_codigo: Código HTML a validar
+
+    Returns:
+        Diccionario con errores y warnings encontrados
+    """
+    return _resultado_validacion(obtener_documento(html_codigo))
+
+
 @skill(
     description="Analiza el SEO básico de una página HTML",
     tags=["webapp", "seo", "optimization"]
@@ -73,22 +85,25 @@ def analizar_seo_html(html_codigo: str) -> dict:
     """
     Analiza aspectos básicos de SEO en código HTML.
 
+    Consulta el mismo documento parseado que validar_html, así que analizar
+    una página con ambas skills cuesta un único parseo.
+
     Args:
         html_codigo: Código HTML a analizar
 
     Returns:
         Diccionario con análisis SEO y recomendaciones
     """
+    documento = obtener_documento(html_codigo)
     problemas = []
     recomendaciones = []
     puntos_positivos = []
 
     # Verificar title
-    title_match = re.search(r'<title>([^<]+)</title>', html_codigo)
-    if not title_match:
+    title_text = documento.titulo
+    if not title_text:
         problemas.append("Falta etiqueta <title>")
     else:
-        title_text = title_match.group(1)
         if len(title_text) < 30:
             recomendaciones.append(f"Title muy corto ({len(title_text)} caracteres). Recomendado: 50-60")
         elif len(title_text) > 60:
@@ -97,11 +112,10 @@ def analizar_seo_html(html_codigo: str) -> dict:
             puntos_positivos.append("Title tiene longitud óptima")
 
     # Verificar meta description
-    meta_desc = re.search(r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']+)["\']', html_codigo)
-    if not meta_desc:
+    desc_text = documento.metas.get("description")
+    if not desc_text:
         problemas.append("Falta meta description")
     else:
-        desc_text = meta_desc.group(1)
         if len(desc_text) < 120:
             recomendaciones.append(f"Meta description corta ({len(desc_text)} caracteres). Recomendado: 150-160")
         elif len(desc_text) > 160:
@@ -110,14 +124,14 @@ def analizar_seo_html(html_codigo: str) -> dict:
             puntos_positivos.append("Meta description tiene longitud óptima")
 
     # Verificar meta viewport (mobile-friendly)
-    if re.search(r'<meta\s+name=["\']viewport["\']', html_codigo):
+    if "viewport" in documento.metas:
         puntos_positivos.append("Tiene meta viewport configurado (mobile-friendly)")
     else:
         problemas.append("Falta meta viewport (no optimizado para móviles)")
 
     # Verificar estructura de headings
-    h1_count = len(re.findall(r'<h1[^>]*>', html_codigo))
-    h2_count = len(re.findall(r'<h2[^>]*>', html_codigo))
+    h1_count = documento.contar("h1")
+    h2_count = documento.contar("h2")
 
     if h1_count == 1:
         puntos_positivos.append("Tiene exactamente un H1 (óptimo)")
@@ -8,7 +8,9 @@ from typing import List, Dict
 @skill(
     name="regresion_lineal_simple",
     description="Calcula la regresión lineal simple (y = mx + b) dados dos conjuntos de datos",
-    tags=["ml", "machine_learning", "estadisticas", "regresion"]
+    tags=["ml", "machine_learning", "estadisticas", "regresion"],
+    isolation="process",
+    timeout=30
 )
 def regresion_lineal_simple(x: List[float], y: List[float]) -> Dict[str, float]:
     """
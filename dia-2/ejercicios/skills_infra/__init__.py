@@ -0,0 +1,34 @@
+"""
+Infraestructura para Skills
+===========================
+
+Módulos de soporte que usan las skills de ``skills/`` y los ejercicios del Día 2.
+No contiene funciones decoradas con ``@skill``: solo motores reutilizables.
+
+- indice_logs: Índice en disco para consultas repetidas sobre un mismo log
+- almacen_crashes: Almacén SQLite de buckets de crashes por versión y plataforma
+- lexer_js: Lexer JavaScript de una sola pasada para analizar bundles grandes
+- archivos: Listado recursivo de archivos por extensión compartido por las skills que recorren carpetas
+- auditoria_web: Auditoría de directorios repartida en un pool de procesos
+- cache_esquemas: Cache SQLite de la metadata de skills por archivo, mtime y versión de instantneo
+- cache_resultados: Cache SQLite de resultados por hash de contenido y versión del analizador
+- cliente_http: Cliente HTTP asíncrono con pool keep-alive y tiempos por fase
+- documento_html: Documento HTML parseado una vez y compartido entre skills
+- ejecucion_aislada: Pool de procesos con timeout, límite de memoria y reciclado para skills con isolation="process"
+- firmas_crash: Firmas normalizadas de stack traces y agrupamiento de crashes en buckets
+- historial: Buffer circular con las últimas llamadas de cada skill y muestras de sus argumentos
+- indice_difuso: Índice invertido ponderado para buscar claves y alias en texto libre
+- indice_tags: Índice de tags con bitsets y expresiones AND/OR/NOT sobre el registry
+- manifiesto: Manifiesto de skills generado fuera de línea y proxies de carga perezosa
+- metricas: Llamadas, errores por excepción e histogramas de latencia por skill, en Prometheus y JSON
+- palabras_clave: Motor de palabras clave por grupo, con Aho-Corasick para listas grandes
+- pool_skills: Un SkillManager precargado por producto, activable por ticket sin recargar
+- prefetch_skills: Predicción BM25 de las skills de la biblioteca que necesita un query, para precargarlas
+- recuperacion_skills: Índice BM25 para enviar al modelo solo las k skills más relevantes por prompt
+- registro_compacto: Registro de skills con __slots__ y metadata congelada y compartida para bibliotecas grandes
+- servidor_stub: Servidor HTTP local para pruebas y benchmarks
+- skill_rapida: Decorador como @skill con el tracking de la última llamada opcional o muestreado
+- tablas: Tablas de conocimiento inmutables con archivo de datos opcional
+- validador_html: Validador HTML de una sola pasada con pila de elementos
+- vistas_skills: Unión, intersección y diferencias de SkillManagers como vistas con copia al escribir
+"""
@@ -0,0 +1,408 @@
+"""
+Almacén persistente de crashes
+==============================
+
+Guarda en SQLite los buckets de ``firmas_crash`` y cuántas veces apareció cada
+uno por versión de la app y plataforma, para que cada sesión de triage no tenga
+que volver a procesar todos los reportes:
+
+    with AlmacenCrashes(RUTA_ALMACEN_POR_DEFECTO) as almacen:
+        almacen.registrar_directorio("crashes/")          # solo lee archivos nuevos o modificados
+        for bucket in almacen.top_buckets("4.2.0", solo_nuevos=True):
+            print(bucket["cantidad"], bucket["tipo_excepcion"], bucket["versiones"])
+
+Tablas:
+
+- ``buckets``: una fila por firma, con el stack trace representativo
+- ``ocurrencias``: cantidad y primera/última aparición por (versión, plataforma, firma)
+- ``reportes``: hash de cada reporte registrado, para no contarlo dos veces
+- ``archivos``: tamaño y mtime de cada archivo leído, para no volver a leerlo
+
+Las consultas solo leen ``ocurrencias`` y ``buckets``; los stack traces
+completos nunca salen del almacén salvo el representante de cada bucket.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .archivos import listar_archivos
+from .cache_resultados import _PARAMETROS_POR_CONSULTA, RUTA_CACHE_POR_DEFECTO, abrir_sqlite
+from .firmas_crash import TOP_FRAMES, firma_crash
+
+RUTA_ALMACEN_POR_DEFECTO = os.path.join(os.path.dirname(RUTA_CACHE_POR_DEFECTO), "crashes.sqlite")
+
+# Archivos que se leen como reportes al registrar un directorio
+EXTENSIONES_CRASH = (".txt", ".log", ".crash", ".trace")
+
+# Versión asignada a los reportes que no la indican
+VERSION_DESCONOCIDA = "desconocida"
+
+# Bytes del comienzo de un reporte donde se buscan versión y plataforma
+_TAMANO_ENCABEZADO = 4096
+
+_RE_VERSION = re.compile(
+    r"^\s*(?:app[ _]?version|version[ _]?name|versi[oó]n(?: de la app)?)\s*[:=]\s*v?([0-9][\w.\-]*)",
+    re.IGNORECASE | re.MULTILINE
+)
+_RE_IOS = re.compile(r"^(?:Incident Identifier|Exception Type|Hardware Model):|^Thread \d+ Crashed:", re.MULTILINE)
+_RE_ANDROID = re.compile(r"^(?:FATAL EXCEPTION|\s*at\s+[\w$.<>]+\()", re.MULTILINE)
+_RE_PARTES_VERSION = re.compile(r"[.\-+_ ]")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    firma TEXT PRIMARY KEY,
+    plataforma TEXT NOT NULL,
+    tipo_excepcion TEXT NOT NULL,
+    frames TEXT NOT NULL,
+    representante TEXT NOT NULL,
+    cantidad INTEGER NOT NULL,
+    primera_vez REAL NOT NULL,
+    ultima_vez REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ocurrencias (
+    version_app TEXT NOT NULL,
+    plataforma TEXT NOT NULL,
+    firma TEXT NOT NULL,
+    cantidad INTEGER NOT NULL,
+    primera_vez REAL NOT NULL,
+    ultima_vez REAL NOT NULL,
+    PRIMARY KEY (version_app, plataforma, firma)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ocurrencias_por_firma ON ocurrencias (firma, version_app);
+CREATE TABLE IF NOT EXISTS reportes (
+    hash TEXT PRIMARY KEY,
+    firma TEXT NOT NULL,
+    version_app TEXT NOT NULL,
+    momento REAL NOT NULL,
+    origen TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS archivos (
+    ruta TEXT PRIMARY KEY,
+    tamano INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def clave_version(version: str) -> tuple:
+    """Clave de orden natural: "4.10.0" va después de "4.9.1"."""
+    return tuple(
+        (0, int(parte), "") if parte.isdigit() else (1, 0, parte)
+        for parte in _RE_PARTES_VERSION.split(version) if parte
+    )
+
+
+def metadatos_reporte(texto: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Versión de la app y plataforma que se deducen del encabezado de un reporte.
+
+    Returns:
+        (versión, "ios" o "android"), con None en lo que no se pudo deducir
+    """
+    encabezado = texto[:_TAMANO_ENCABEZADO]
+    match = _RE_VERSION.search(encabezado)
+    if _RE_IOS.search(encabezado):
+        plataforma = "ios"
+    elif _RE_ANDROID.search(encabezado):
+        plataforma = "android"
+    else:
+        plataforma = None
+    return (match.group(1) if match else None), plataforma
+
+
+def _hash_reporte(stack_trace: str) -> str:
+    return hashlib.blake2b(stack_trace.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+
+class AlmacenCrashes:
+    """
+    Buckets de crashes y sus ocurrencias por versión y plataforma.
+
+    Args:
+        ruta: Archivo SQLite; se crea junto con su carpeta si no existe
+        top_frames: Frames de la app que forman la firma (ver ``firma_crash``);
+            debe ser el mismo en todas las sesiones sobre un mismo almacén
+        prefijos_app: Paquetes o imágenes de la app (ver ``firma_crash``)
+    """
+
+    def __init__(
+        self,
+        ruta: str = RUTA_ALMACEN_POR_DEFECTO,
+        top_frames: int = TOP_FRAMES,
+        prefijos_app: Sequence[str] = ()
+    ):
+        self.ruta = ruta
+        self.top_frames = top_frames
+        self.prefijos_app = tuple(prefijos_app)
+        self._conexion = abrir_sqlite(ruta)
+        self._conexion.executescript(_ESQUEMA)
+
+    def _existentes(self, tabla: str, columna: str, valores: Iterable[str]) -> set:
+        """Cuáles de ``valores`` ya están en ``tabla.columna`` (consultas por grupos)."""
+        valores = list(valores)
+        existentes = set()
+        for i in range(0, len(valores), _PARAMETROS_POR_CONSULTA):
+            grupo = valores[i:i + _PARAMETROS_POR_CONSULTA]
+            marcas = ",".join("?" * len(grupo))
+            filas = self._conexion.execute(f"SELECT {columna} FROM {tabla} WHERE {columna} IN ({marcas})", grupo)
+            existentes.update(fila[0] for fila in filas)
+        return existentes
+
+    def registrar(self, reportes: Iterable[dict]) -> dict:
+        """
+        Registra reportes en una sola transacción. Un reporte con el mismo texto
+        que otro ya registrado no se vuelve a contar.
+
+        Args:
+            reportes: Dicts con "stack_trace" y opcionalmente "version_app",
+                "plataforma", "momento" (timestamp; por defecto, ahora) y "origen".
+                Sin versión o plataforma se deducen del encabezado del reporte
+                (y si no, quedan como VERSION_DESCONOCIDA y "android").
+
+        Returns:
+            {"nuevos", "repetidos", "buckets_nuevos"}
+        """
+        ahora = time.time()
+        por_hash = {}
+        for reporte in reportes:
+            por_hash.setdefault(_hash_reporte(reporte["stack_trace"]), reporte)
+        ya_registrados = self._existentes("reportes", "hash", por_hash)
+
+        filas_reportes = []
+        buckets: Dict[str, list] = {}
+        ocurrencias: Dict[tuple, list] = {}
+        for hash_reporte, reporte in por_hash.items():
+            if hash_reporte in ya_registrados:
+                continue
+            stack_trace = reporte["stack_trace"]
+            version, plataforma = metadatos_reporte(stack_trace)
+            version = reporte.get("version_app") or version or VERSION_DESCONOCIDA
+            plataforma = (reporte.get("plataforma") or plataforma or "android").lower()
+            momento = float(reporte.get("momento") or ahora)
+
+            firma = firma_crash(stack_trace, plataforma, self.top_frames, self.prefijos_app)
+            filas_reportes.append((hash_reporte, firma.firma, version, momento, str(reporte.get("origen", ""))))
+
+            bucket = buckets.get(firma.firma)
+            if bucket is None:
+                buckets[firma.firma] = [firma, stack_trace, 1, momento, momento]
+            else:
+                bucket[2] += 1
+                bucket[3], bucket[4] = min(bucket[3], momento), max(bucket[4], momento)
+            clave = (version, firma.plataforma, firma.firma)
+            ocurrencia = ocurrencias.get(clave)
+            if ocurrencia is None:
+                ocurrencias[clave] = [1, momento, momento]
+            else:
+                ocurrencia[0] += 1
+                ocurrencia[1], ocurrencia[2] = min(ocurrencia[1], momento), max(ocurrencia[2], momento)
+
+        buckets_nuevos = len(buckets) - len(self._existentes("buckets", "firma", buckets))
+        with self._conexion:
+            self._conexion.executemany("INSERT INTO reportes VALUES (?, ?, ?, ?, ?)", filas_reportes)
+            self._conexion.executemany(
+                "INSERT INTO buckets VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (firma) DO UPDATE SET"
+                " cantidad = cantidad + excluded.cantidad,"
+                " primera_vez = min(primera_vez, excluded.primera_vez),"
+                " ultima_vez = max(ultima_vez, excluded.ultima_vez)",
+                [
+                    (firma.firma, firma.plataforma, firma.tipo_excepcion, json.dumps(firma.frames),
+                     representante, cantidad, primera, ultima)
+                    for firma, representante, cantidad, primera, ultima in buckets.values()
+                ]
+            )
+            self._conexion.executemany(
+                "INSERT INTO ocurrencias VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (version_app, plataforma, firma) DO UPDATE SET"
+                " cantidad = cantidad + excluded.cantidad,"
+                " primera_vez = min(primera_vez, excluded.primera_vez),"
+                " ultima_vez = max(ultima_vez, excluded.ultima_vez)",
+                [clave + tuple(valores) for clave, valores in ocurrencias.items()]
+            )
+
+        return {
+            "nuevos": len(filas_reportes),
+            "repetidos": len(por_hash) - len(filas_reportes),
+            "buckets_nuevos": buckets_nuevos
+        }
+
+    def registrar_directorio(
+        self,
+        directorio: str,
+        version_app: str = "",
+        plataforma: str = "",
+        extensiones: Iterable[str] = EXTENSIONES_CRASH
+    ) -> dict:
+        """
+        Registra los reportes de un directorio (uno por archivo). Los archivos ya
+        leídos que no cambiaron de tamaño ni de mtime se saltean sin abrirlos.
+
+        Args:
+            directorio: Carpeta a recorrer recursivamente
+            version_app: Versión para los reportes que no la declaran
+            plataforma: Plataforma para los reportes en los que no se puede deducir
+            extensiones: Extensiones de los archivos de crash
+
+        Returns:
+            {"archivos", "sin_cambios", "nuevos", "repetidos", "buckets_nuevos", "errores"}
+        """
+        rutas = [os.path.abspath(ruta) for ruta in listar_archivos(directorio, extensiones)]
+        conocidos = {}
+        for i in range(0, len(rutas), _PARAMETROS_POR_CONSULTA):
+            grupo = rutas[i:i + _PARAMETROS_POR_CONSULTA]
+            marcas = ",".join("?" * len(grupo))
+            for ruta, tamano, mtime_ns in self._conexion.execute(
+                f"SELECT ruta, tamano, mtime_ns FROM archivos WHERE ruta IN ({marcas})", grupo
+            ):
+                conocidos[ruta] = (tamano, mtime_ns)
+
+        reportes, leidos, errores = [], [], []
+        for ruta in rutas:
+            try:
+                estado = os.stat(ruta)
+                if conocidos.get(ruta) == (estado.st_size, estado.st_mtime_ns):
+                    continue
+                with open(ruta, "r", encoding="utf-8", errors="replace") as f:
+                    stack_trace = f.read()
+            except OSError as e:
+                errores.append({"origen": os.path.relpath(ruta, directorio), "error": str(e)})
+                continue
+            # Lo que declara el propio reporte tiene prioridad sobre los parámetros
+            version, plataforma_reporte = metadatos_reporte(stack_trace)
+            reportes.append({
+                "stack_trace": stack_trace,
+                "version_app": version or version_app,
+                "plataforma": plataforma_reporte or plataforma,
+                "momento": estado.st_mtime,
+                "origen": os.path.relpath(ruta, directorio)
+            })
+            leidos.append((ruta, estado.st_size, estado.st_mtime_ns))
+
+        resultado = self.registrar(reportes)
+        with self._conexion:
+            self._conexion.executemany("INSERT OR REPLACE INTO archivos VALUES (?, ?, ?)", leidos)
+
+        return {
+            "archivos": len(rutas),
+            "sin_cambios": len(rutas) - len(leidos) - len(errores),
+            **resultado,
+            "errores": errores
+        }
+
+    def versiones(self, plataforma: str = "") -> List[dict]:
+        """Versiones registradas, de la más antigua a la más nueva, con reportes y buckets de cada una."""
+        filtro, parametros = ("WHERE plataforma = ?", [plataforma.lower()]) if plataforma else ("", [])
+        filas = self._conexion.execute(
+            f"SELECT version_app, SUM(cantidad), COUNT(DISTINCT firma) FROM ocurrencias {filtro} GROUP BY version_app",
+            parametros
+        ).fetchall()
+        return [
+            {"version_app": version, "reportes": reportes, "buckets": buckets}
+            for version, reportes, buckets in sorted(filas, key=lambda fila: clave_version(fila[0]))
+        ]
+
+    def _filtro(self, version_app: str, plataforma: str, solo_nuevos: bool) -> Tuple[str, list]:
+        condiciones, parametros = [], []
+        if version_app:
+            condiciones.append("o.version_app = ?")
+            parametros.append(version_app)
+        if plataforma:
+            condiciones.append("o.plataforma = ?")
+            parametros.append(plataforma.lower())
+        if solo_nuevos:
+            if not version_app:
+                raise ValueError("solo_nuevos requiere indicar version_app")
+            # Nuevo en una versión: no apareció en ninguna versión anterior
+            anteriores = [
+                v["version_app"] for v in self.versiones()
+                if clave_version(v["version_app"]) < clave_version(version_app)
+            ]
+            if anteriores:
+                marcas = ",".join("?" * len(anteriores))
+                condiciones.append(
+                    "NOT EXISTS (SELECT 1 FROM ocurrencias p"
+                    f" WHERE p.firma = o.firma AND p.version_app IN ({marcas}))"
+                )
+                parametros.extend(anteriores)
+        return (" WHERE " + " AND ".join(condiciones) if condiciones else ""), parametros
+
+    def top_buckets(
+        self,
+        version_app: str = "",
+        plataforma: str = "",
+        solo_nuevos: bool = False,
+        limite: int = 10
+    ) -> List[dict]:
+        """
+        Buckets más frecuentes.
+
+        Args:
+            version_app: Contar solo las ocurrencias de esta versión
+            plataforma: Contar solo las ocurrencias de esta plataforma
+            solo_nuevos: Solo buckets que no aparecieron en versiones anteriores
+                a ``version_app`` (que es obligatoria en ese caso)
+            limite: Cantidad máxima de buckets
+
+        Returns:
+            Por bucket: firma, plataforma, tipo_excepcion, frames, cantidad y
+            primera/última aparición dentro del filtro, y reportes por versión
+        """
+        filtro, parametros = self._filtro(version_app, plataforma, solo_nuevos)
+        filas = self._conexion.execute(
+            "SELECT o.firma, b.plataforma, b.tipo_excepcion, b.frames,"
+            " SUM(o.cantidad), MIN(o.primera_vez), MAX(o.ultima_vez)"
+            f" FROM ocurrencias o JOIN buckets b ON b.firma = o.firma{filtro}"
+            " GROUP BY o.firma ORDER BY SUM(o.cantidad) DESC, MIN(o.primera_vez), o.firma LIMIT ?",
+            parametros + [max(0, limite)]
+        ).fetchall()
+
+        por_version: Dict[str, Counter] = {fila[0]: Counter() for fila in filas}
+        for i in range(0, len(filas), _PARAMETROS_POR_CONSULTA):
+            grupo = [fila[0] for fila in filas[i:i + _PARAMETROS_POR_CONSULTA]]
+            marcas = ",".join("?" * len(grupo))
+            for firma, version, cantidad in self._conexion.execute(
+                f"SELECT firma, version_app, cantidad FROM ocurrencias WHERE firma IN ({marcas})", grupo
+            ):
+                por_version[firma][version] += cantidad
+
+        return [
+            {
+                "firma": firma,
+                "plataforma": plataforma_bucket,
+                "tipo_excepcion": tipo,
+                "frames": json.loads(frames),
+                "cantidad": cantidad,
+                "primera_vez": primera,
+                "ultima_vez": ultima,
+                "versiones": dict(sorted(por_version[firma].items(), key=lambda item: clave_version(item[0])))
+            }
+            for firma, plataforma_bucket, tipo, frames, cantidad, primera, ultima in filas
+        ]
+
+    def contar(self, version_app: str = "", plataforma: str = "", solo_nuevos: bool = False) -> dict:
+        """Reportes y buckets distintos que cumplen el filtro (mismos argumentos que ``top_buckets``)."""
+        filtro, parametros = self._filtro(version_app, plataforma, solo_nuevos)
+        reportes, buckets = self._conexion.execute(
+            f"SELECT COALESCE(SUM(o.cantidad), 0), COUNT(DISTINCT o.firma) FROM ocurrencias o{filtro}",
+            parametros
+        ).fetchone()
+        return {"reportes": reportes, "buckets": buckets}
+
+    def representante(self, firma: str) -> Optional[str]:
+        """Stack trace del primer reporte registrado en el bucket."""
+        fila = self._conexion.execute("SELECT representante FROM buckets WHERE firma = ?", (firma,)).fetchone()
+        return fila[0] if fila else None
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    def __enter__(self) -> "AlmacenCrashes":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
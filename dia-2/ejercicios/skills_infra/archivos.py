@@ -0,0 +1,44 @@
+"""
+Recorrido de directorios
+========================
+
+Listado recursivo de archivos por extensión que comparten las skills que
+analizan carpetas completas (auditoría de builds web, lotes de crashes):
+
+    rutas = listar_archivos("dist", {".html", ".js"})
+
+El orden es estable entre corridas y se omiten las carpetas ocultas y las que
+nunca forman parte de lo que se analiza (``CARPETAS_IGNORADAS``).
+"""
+
+import os
+from typing import Iterable, List
+
+# Carpetas que nunca forman parte de lo que se analiza
+CARPETAS_IGNORADAS = frozenset({"node_modules", "__pycache__"})
+
+
+def listar_archivos(raiz: str, extensiones: Iterable[str]) -> List[str]:
+    """
+    Lista recursivamente los archivos de ``raiz`` con alguna de las extensiones,
+    en orden estable. Omite carpetas ocultas y ``CARPETAS_IGNORADAS``.
+
+    Args:
+        raiz: Directorio a recorrer
+        extensiones: Extensiones con punto, por ejemplo {".html", ".js"}
+
+    Returns:
+        Rutas de los archivos encontrados
+    """
+    extensiones = {extension.lower() for extension in extensiones}
+    rutas = []
+    for carpeta, subcarpetas, archivos in os.walk(raiz):
+        subcarpetas[:] = sorted(
+            nombre for nombre in subcarpetas
+            if nombre not in CARPETAS_IGNORADAS and not nombre.startswith(".")
+        )
+        rutas.extend(
+            os.path.join(carpeta, nombre) for nombre in sorted(archivos)
+            if os.path.splitext(nombre)[1].lower() in extensiones
+        )
+    return rutas
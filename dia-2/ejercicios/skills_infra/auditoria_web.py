@@ -0,0 +1,267 @@
+"""
+Auditoría web en paralelo
+=========================
+
+Recorre un directorio de build estático, reparte los archivos en lotes entre un
+pool de procesos y junta los resultados en un reporte compacto: puntuación
+media, peores páginas y cantidad de archivos que incumplen cada regla.
+
+Cada proceso carga una vez el módulo que define la función de auditoría y la
+aplica archivo por archivo:
+
+    rutas = listar_archivos("dist", {".html", ".js"})
+    reporte = ReporteAuditoria("dist")
+    for resultado in auditar_en_paralelo(rutas, "skills/webapp/auditoria_sitio.py", "auditar_archivo"):
+        reporte.agregar(resultado)
+    print(reporte.resumen())
+
+La función se indica por ruta de archivo y nombre, no como objeto: los módulos
+cargados con ``load_skills.from_folder()`` no quedan en ``sys.modules`` y los
+procesos hijos no podrían importarla.
+
+La función de auditoría recibe la ruta de un archivo y devuelve un dict con
+``ruta``, ``tipo``, ``puntuacion`` (0-100) y ``hallazgos`` (mensajes de las
+skills), o con ``ruta`` y ``error`` si no pudo analizarlo.
+
+``auditar_con_cache`` hace lo mismo pero solo analiza los archivos cuyo contenido
+no está en un ``CacheResultados`` para la versión indicada del analizador.
+"""
+
+import importlib.util
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .cache_resultados import CacheResultados, hash_archivo
+
+# Archivos por tarea enviada al pool
+TAMANO_LOTE = 32
+
+# Límites del reporte
+MAX_REGLAS = 25
+MAX_HALLAZGOS_POR_PAGINA = 3
+MAX_ERRORES_LISTADOS = 20
+
+_RE_DETALLE = re.compile(r"\s*\([^)]+\)")
+_RE_NUMERO = re.compile(r"\b\d+\b")
+
+# Módulos ya cargados en este proceso, por ruta absoluta
+_modulos: Dict[str, object] = {}
+# Función de auditoría del proceso actual (la fija _inicializar)
+_funcion: Optional[Callable[[str], dict]] = None
+
+
+def cargar_modulo(ruta: str):
+    """
+    Carga un archivo .py por ruta, una sola vez por proceso.
+
+    Args:
+        ruta: Ruta al archivo .py
+
+    Returns:
+        El módulo cargado
+    """
+    ruta = str(Path(ruta).resolve())
+    modulo = _modulos.get(ruta)
+    if modulo is None:
+        spec = importlib.util.spec_from_file_location(f"_auditoria_{Path(ruta).stem}", ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        _modulos[ruta] = modulo
+    return modulo
+
+
+def _inicializar(ruta_modulo: str, nombre_funcion: str) -> None:
+    global _funcion
+    _funcion = getattr(cargar_modulo(ruta_modulo), nombre_funcion)
+
+
+def _auditar_lote(rutas: List[str]) -> List[dict]:
+    resultados = []
+    for ruta in rutas:
+        try:
+            resultados.append(_funcion(ruta))
+        except Exception as e:  # Un archivo problemático no debe tumbar el lote entero
+            resultados.append({"ruta": ruta, "error": f"{type(e).__name__}: {e}"})
+    return resultados
+
+
+def auditar_en_paralelo(
+    rutas: List[str],
+    ruta_modulo: str,
+    nombre_funcion: str,
+    procesos: int = 0,
+    tamano_lote: int = TAMANO_LOTE
+) -> Iterator[dict]:
+    """
+    Aplica la función de auditoría a cada archivo repartiendo lotes entre procesos.
+
+    Los resultados llegan a medida que terminan los lotes, no en el orden de ``rutas``.
+
+    Args:
+        rutas: Archivos a auditar
+        ruta_modulo: Archivo .py que define la función de auditoría
+        nombre_funcion: Nombre de la función dentro del módulo
+        procesos: Procesos del pool; 0 usa todos los CPUs y 1 audita en este proceso
+        tamano_lote: Archivos por tarea
+
+    Yields:
+        El resultado de la función para cada archivo
+    """
+    lotes = [rutas[i:i + tamano_lote] for i in range(0, len(rutas), tamano_lote)]
+    procesos = min(procesos or os.cpu_count() or 1, len(lotes))
+
+    if procesos <= 1:
+        _inicializar(ruta_modulo, nombre_funcion)
+        for lote in lotes:
+            yield from _auditar_lote(lote)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=procesos,
+        initializer=_inicializar,
+        initargs=(ruta_modulo, nombre_funcion)
+    ) as pool:
+        for futuro in as_completed([pool.submit(_auditar_lote, lote) for lote in lotes]):
+            yield from futuro.result()
+
+
+def auditar_con_cache(
+    rutas: List[str],
+    ruta_modulo: str,
+    nombre_funcion: str,
+    cache: CacheResultados,
+    version: str,
+    procesos: int = 0,
+    tamano_lote: int = TAMANO_LOTE
+) -> Iterator[dict]:
+    """
+    Como ``auditar_en_paralelo``, pero reutiliza los resultados guardados para
+    el mismo contenido y versión del analizador. Solo los archivos nuevos o
+    modificados van al pool; sus resultados (salvo los errores) se guardan en
+    ``cache`` al terminar.
+
+    Los resultados que vienen del cache llevan ``"en_cache": True``.
+
+    Args:
+        rutas: Archivos a auditar
+        ruta_modulo: Archivo .py que define la función de auditoría
+        nombre_funcion: Nombre de la función dentro del módulo
+        cache: Cache de resultados abierto
+        version: Versión del analizador (ver ``version_de_fuentes``)
+        procesos: Procesos del pool; 0 usa todos los CPUs y 1 audita en este proceso
+        tamano_lote: Archivos por tarea
+
+    Yields:
+        El resultado de cada archivo, primero los que estaban en cache
+    """
+    hashes = {}
+    for ruta in rutas:
+        try:
+            hashes[ruta] = hash_archivo(ruta)
+        except OSError:
+            pass  # Que lo reporte la función de auditoría al intentar leerlo
+    guardados = cache.buscar(hashes.values(), version)
+
+    pendientes = []
+    for ruta in rutas:
+        resultado = guardados.get(hashes.get(ruta))
+        if resultado is None:
+            pendientes.append(ruta)
+        else:
+            yield {**resultado, "ruta": ruta, "en_cache": True}
+
+    nuevos = []
+    try:
+        for resultado in auditar_en_paralelo(pendientes, ruta_modulo, nombre_funcion, procesos, tamano_lote):
+            if "error" not in resultado and resultado["ruta"] in hashes:
+                guardado = {clave: valor for clave, valor in resultado.items() if clave != "ruta"}
+                nuevos.append((hashes[resultado["ruta"]], guardado))
+            yield resultado
+    finally:
+        # Lo analizado se guarda aunque el consumidor corte la iteración antes
+        cache.guardar(nuevos, version)
+
+
+def regla_de(mensaje: str) -> str:
+    """
+    Normaliza un hallazgo para contarlo como regla: quita los detalles entre
+    paréntesis (líneas, cantidades) y reemplaza los números por N.
+
+    Ejemplo: "Encontrados 3 console.log() (línea 6) - ..." -> "Encontrados N console.log() - ..."
+    """
+    return _RE_NUMERO.sub("N", _RE_DETALLE.sub("", mensaje)).strip()
+
+
+class ReporteAuditoria:
+    """
+    Acumula resultados de auditoría y arma el resumen para el agente.
+
+    Attributes:
+        raiz: Directorio auditado; las rutas del reporte son relativas a él
+        total: Archivos auditados sin error
+        por_tipo: Tipo de archivo -> cantidad
+        reglas: Regla -> archivos que la incumplen
+        errores: Archivos que no se pudieron auditar, como {"ruta", "error"}
+        desde_cache: Archivos cuyo resultado vino del cache
+    """
+
+    def __init__(self, raiz: str):
+        self.raiz = raiz
+        self.total = 0
+        self.por_tipo: Counter = Counter()
+        self.reglas: Counter = Counter()
+        self.errores: List[dict] = []
+        self.desde_cache = 0
+        self._suma_puntuaciones = 0
+        self._paginas: List[tuple] = []
+
+    def agregar(self, resultado: dict) -> None:
+        ruta = os.path.relpath(resultado["ruta"], self.raiz)
+        if "error" in resultado:
+            self.errores.append({"ruta": ruta, "error": resultado["error"]})
+            return
+
+        self.total += 1
+        self.desde_cache += bool(resultado.get("en_cache"))
+        self.por_tipo[resultado["tipo"]] += 1
+        self._suma_puntuaciones += resultado["puntuacion"]
+        hallazgos = resultado["hallazgos"]
+        self.reglas.update({regla_de(hallazgo) for hallazgo in hallazgos})
+        if hallazgos:
+            self._paginas.append((resultado["puntuacion"], ruta, resultado["tipo"], hallazgos[:MAX_HALLAZGOS_POR_PAGINA]))
+
+    def resumen(self, top_peores: int = 10) -> dict:
+        """
+        Args:
+            top_peores: Cantidad de peores archivos a listar
+
+        Returns:
+            Diccionario compacto con totales, peores archivos, reglas y errores
+        """
+        # Orden por puntuación y luego por ruta, para que el reporte no dependa
+        # del orden en que terminaron los procesos
+        self._paginas.sort()
+        return {
+            "directorio": self.raiz,
+            "total_archivos": self.total,
+            "analizados": self.total - self.desde_cache,
+            "desde_cache": self.desde_cache,
+            "por_tipo": dict(self.por_tipo),
+            "puntuacion_media": round(self._suma_puntuaciones / self.total, 1) if self.total else None,
+            "archivos_con_hallazgos": len(self._paginas),
+            "peores": [
+                {"ruta": ruta, "tipo": tipo, "puntuacion": puntuacion, "hallazgos": list(hallazgos)}
+                for puntuacion, ruta, tipo, hallazgos in self._paginas[:top_peores]
+            ],
+            "reglas": [
+                {"regla": regla, "archivos": archivos}
+                for regla, archivos in sorted(self.reglas.items(), key=lambda item: (-item[1], item[0]))[:MAX_REGLAS]
+            ],
+            "total_reglas": len(self.reglas),
+            "total_errores": len(self.errores),
+            "errores": sorted(self.errores, key=lambda e: e["ruta"])[:MAX_ERRORES_LISTADOS]
+        }
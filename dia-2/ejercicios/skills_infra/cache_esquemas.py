@@ -0,0 +1,139 @@
+"""
+Cache persistente de esquemas de skills
+=======================================
+
+Cada proceso que carga una carpeta con ``from_folder()`` importa sus módulos, y
+``@skill`` inspecciona firma, type hints y docstring de cada función para armar
+su esquema. Este cache guarda en SQLite la metadata de las skills de cada
+archivo, con clave ``(ruta, mtime, tamaño, versión de instantneo)``: mientras el
+archivo no cambie, las cargas siguientes registran proxies de
+``skills_infra.manifiesto`` con esa metadata sin importar ni inspeccionar nada.
+El módulo real se importa recién en la primera llamada a una de sus skills.
+
+    cache = CacheEsquemas()
+    cache.cargar_carpeta(agente.skill_manager, "skills_biblioteca/estadisticas")
+
+A diferencia del manifiesto, no hay que regenerar nada: un archivo modificado
+se vuelve a importar en la próxima carga y su entrada se reemplaza.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Tuple
+
+from .cache_resultados import abrir_sqlite
+from .manifiesto import VERSION_MANIFIESTO, archivos_de_skills, crear_proxy, describir_archivo
+
+RUTA_CACHE_ESQUEMAS = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "skills_infra",
+    "esquemas.sqlite"
+)
+
+# Máximo de parámetros por consulta (SQLite admite 999 en versiones antiguas)
+_PARAMETROS_POR_CONSULTA = 900
+
+
+def version_instantneo() -> str:
+    """Versión instalada de instantneo: otra versión puede generar otros esquemas."""
+    try:
+        from importlib.metadata import version
+        return version("instantneo")
+    except Exception:
+        return "desconocida"
+
+
+class CacheEsquemas:
+    """
+    Metadata de las skills de cada archivo, válida mientras no cambien su
+    mtime, su tamaño ni la versión de instantneo.
+
+    Args:
+        ruta: Archivo SQLite; se crea junto con su carpeta si no existe
+    """
+
+    def __init__(self, ruta: str = RUTA_CACHE_ESQUEMAS):
+        self.ruta = ruta
+        self.version = f"{version_instantneo()}-m{VERSION_MANIFIESTO}"
+        self._conexion = abrir_sqlite(ruta)
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS esquemas ("
+            " ruta TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " tamano INTEGER NOT NULL,"
+            " version TEXT NOT NULL,"
+            " entradas TEXT NOT NULL,"
+            " guardado REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conexion.commit()
+
+    def _buscar(self, firmas: Dict[str, Tuple[int, int]]) -> Dict[str, list]:
+        """Ruta -> entradas, solo para las rutas cuya firma y versión coinciden."""
+        rutas = list(firmas)
+        vigentes = {}
+        for i in range(0, len(rutas), _PARAMETROS_POR_CONSULTA):
+            grupo = rutas[i:i + _PARAMETROS_POR_CONSULTA]
+            filas = self._conexion.execute(
+                f"SELECT ruta, mtime_ns, tamano, entradas FROM esquemas"
+                f" WHERE version = ? AND ruta IN ({','.join('?' * len(grupo))})",
+                [self.version, *grupo]
+            )
+            for ruta, mtime_ns, tamano, entradas in filas:
+                if firmas[ruta] == (mtime_ns, tamano):
+                    vigentes[ruta] = json.loads(entradas)
+        return vigentes
+
+    def cargar_archivos(self, manager, rutas: Iterable[str]) -> Dict[str, int]:
+        """
+        Registra en el manager las skills de los archivos: proxies para los que
+        están en cache; para el resto importa el módulo, registra sus skills
+        reales y guarda su metadata (todo en una transacción).
+
+        Un archivo que no se puede importar propaga su excepción.
+
+        Args:
+            manager: SkillManager (por ejemplo ``agente.skill_manager``)
+            rutas: Archivos .py de skills
+
+        Returns:
+            {"desde_cache": archivos en cache, "importados": archivos importados}
+        """
+        firmas = {}
+        for ruta in rutas:
+            estado = os.stat(ruta)
+            firmas[os.path.abspath(ruta)] = (estado.st_mtime_ns, estado.st_size)
+        vigentes = self._buscar(firmas)
+
+        nuevas = []
+        for ruta, (mtime_ns, tamano) in firmas.items():
+            if ruta in vigentes:
+                for entrada in vigentes[ruta]:
+                    manager.register_tool(crear_proxy(os.path.dirname(ruta), entrada))
+                continue
+            skills, entradas = describir_archivo(ruta)
+            for funcion in skills:
+                manager.register_tool(funcion)
+            nuevas.append((ruta, mtime_ns, tamano, self.version, json.dumps(entradas, ensure_ascii=False), time.time()))
+
+        if nuevas:
+            with self._conexion:
+                self._conexion.executemany("INSERT OR REPLACE INTO esquemas VALUES (?, ?, ?, ?, ?, ?)", nuevas)
+        return {"desde_cache": len(vigentes), "importados": len(nuevas)}
+
+    def cargar_carpeta(self, manager, carpeta: str) -> Dict[str, int]:
+        """Como ``cargar_archivos`` con los archivos de skills de la carpeta (sin los test_*.py)."""
+        return self.cargar_archivos(manager, [os.path.join(carpeta, nombre) for nombre in archivos_de_skills(carpeta)])
+
+    def __len__(self) -> int:
+        return self._conexion.execute("SELECT COUNT(*) FROM esquemas").fetchone()[0]
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    def __enter__(self) -> "CacheEsquemas":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
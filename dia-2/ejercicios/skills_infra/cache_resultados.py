@@ -0,0 +1,169 @@
+"""
+Cache persistente de resultados de análisis
+===========================================
+
+Guarda en SQLite el resultado de analizar un archivo, con clave
+``(hash del contenido, versión del analizador)``. Entre dos deploys la mayoría
+de los archivos no cambian: con el hash se reconocen aunque cambien de ruta o de
+fecha de modificación, y con la versión se invalida todo cuando cambia el
+código que los analiza.
+
+    cache = CacheResultados(RUTA_CACHE_POR_DEFECTO)
+    version = version_de_fuentes(["skills/webapp/validar_html.py"], prefijo="auditoria-1")
+    hashes = {ruta: hash_archivo(ruta) for ruta in rutas}
+    guardados = cache.buscar(hashes.values(), version)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+# Ubicación por defecto, fuera del directorio auditado (que suele regenerarse en cada build)
+RUTA_CACHE_POR_DEFECTO = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "skills_infra",
+    "resultados.sqlite"
+)
+
+# Tamaño de bloque al calcular hashes
+TAMANO_BLOQUE = 1024 * 1024
+
+# Máximo de parámetros por consulta (SQLite admite 999 en versiones antiguas)
+_PARAMETROS_POR_CONSULTA = 900
+
+
+def abrir_sqlite(ruta: str) -> sqlite3.Connection:
+    """
+    Abre (o crea, junto con su carpeta) una base SQLite en modo WAL, pensada
+    para escrituras en lote y lecturas concurrentes desde otros procesos.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    return conexion
+
+
+def hash_archivo(ruta: str) -> str:
+    """Hash blake2b (128 bits, hexadecimal) del contenido de un archivo."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(TAMANO_BLOQUE), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+def version_de_fuentes(rutas: Iterable[str], prefijo: str = "") -> str:
+    """
+    Versión de un analizador a partir del contenido de sus archivos fuente:
+    cambia en cuanto se edita cualquiera de ellos.
+
+    Args:
+        rutas: Archivos de los que depende el resultado (código y datos)
+        prefijo: Nombre y versión manual del analizador, por ejemplo "auditoria-1"
+
+    Returns:
+        Versión como "prefijo-hash"
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for ruta in sorted(str(Path(r).resolve()) for r in rutas):
+        digest.update(Path(ruta).name.encode())
+        digest.update(Path(ruta).read_bytes())
+    return f"{prefijo}-{digest.hexdigest()}" if prefijo else digest.hexdigest()
+
+
+class CacheResultados:
+    """
+    Resultados (dicts serializables a JSON) guardados por hash y versión.
+
+    Args:
+        ruta: Archivo SQLite; se crea junto con su carpeta si no existe
+    """
+
+    def __init__(self, ruta: str = RUTA_CACHE_POR_DEFECTO):
+        self.ruta = ruta
+        self._conexion = abrir_sqlite(ruta)
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS resultados ("
+            " hash TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " resultado TEXT NOT NULL,"
+            " guardado REAL NOT NULL,"
+            " PRIMARY KEY (hash, version)"
+            ") WITHOUT ROWID"
+        )
+        self._conexion.commit()
+
+    def buscar(self, hashes: Iterable[str], version: str) -> Dict[str, dict]:
+        """
+        Args:
+            hashes: Hashes de contenido a buscar
+            version: Versión del analizador
+
+        Returns:
+            Hash -> resultado, solo para los que están en cache
+        """
+        pendientes = list(set(hashes))
+        encontrados = {}
+        for i in range(0, len(pendientes), _PARAMETROS_POR_CONSULTA):
+            grupo = pendientes[i:i + _PARAMETROS_POR_CONSULTA]
+            marcas = ",".join("?" * len(grupo))
+            filas = self._conexion.execute(
+                f"SELECT hash, resultado FROM resultados WHERE version = ? AND hash IN ({marcas})",
+                [version, *grupo]
+            )
+            for hash_contenido, resultado in filas:
+                encontrados[hash_contenido] = json.loads(resultado)
+        return encontrados
+
+    def guardar(self, resultados: Iterable[Tuple[str, dict]], version: str) -> int:
+        """
+        Guarda resultados en una sola transacción.
+
+        Args:
+            resultados: Pares (hash, resultado)
+            version: Versión del analizador
+
+        Returns:
+            Cantidad de resultados guardados
+        """
+        ahora = time.time()
+        filas = [
+            (hash_contenido, version, json.dumps(resultado, ensure_ascii=False), ahora)
+            for hash_contenido, resultado in resultados
+        ]
+        with self._conexion:
+            self._conexion.executemany("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)", filas)
+        return len(filas)
+
+    def purgar_otras_versiones(self, version: str) -> int:
+        """
+        Borra los resultados de versiones anteriores del mismo analizador: las que
+        comparten el nombre de ``version`` (todo hasta el primer "-"). Las de otros
+        analizadores que usen el mismo archivo no se tocan.
+
+        Returns:
+            Cantidad de resultados borrados
+        """
+        prefijo = version.split("-", 1)[0] + "-" if "-" in version else ""
+        with self._conexion:
+            return self._conexion.execute(
+                "DELETE FROM resultados WHERE version != ? AND substr(version, 1, ?) = ?",
+                (version, len(prefijo), prefijo)
+            ).rowcount
+
+    def __len__(self) -> int:
+        return self._conexion.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    def __enter__(self) -> "CacheResultados":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
@@ -0,0 +1,355 @@
+"""
+Cliente HTTP asíncrono con pool de conexiones
+=============================================
+
+Cliente HTTP/1.1 mínimo sobre ``asyncio`` (sin dependencias externas) pensado
+para verificar endpoints:
+
+- Pool de conexiones keep-alive por host
+- Límite de solicitudes concurrentes por host
+- Timeout por solicitud
+- Tiempos medidos por fase: DNS, conexión (TCP + TLS), TTFB y total
+
+Las skills son síncronas, así que ``ejecutar()`` corre las corrutinas en un
+event loop persistente en segundo plano. De esa forma las conexiones del pool
+sobreviven entre una llamada a la skill y la siguiente.
+"""
+
+import asyncio
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+USER_AGENT = "instantneo-curso/verificar-endpoint"
+
+# Respuestas que nunca llevan cuerpo
+_SIN_CUERPO = {204, 304}
+
+ClaveHost = Tuple[str, str, int]
+
+
+@dataclass
+class MedicionHTTP:
+    """Resultado de una solicitud HTTP con sus tiempos por fase (en milisegundos)."""
+    url: str
+    metodo: str
+    status: Optional[int] = None
+    dns_ms: float = 0.0
+    conexion_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+    bytes_recibidos: int = 0
+    conexion_reutilizada: bool = False
+    error: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def tiempos(self) -> Dict[str, float]:
+        return {
+            "dns": round(self.dns_ms, 2),
+            "conexion": round(self.conexion_ms, 2),
+            "ttfb": round(self.ttfb_ms, 2),
+            "total": round(self.total_ms, 2),
+        }
+
+
+class _Conexion:
+    """Conexión abierta a un host, reutilizable mientras el servidor la mantenga viva."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.ultimo_uso = time.monotonic()
+
+    def esta_viva(self, keepalive_max: float) -> bool:
+        if self.writer.is_closing() or self.reader.at_eof():
+            return False
+        return time.monotonic() - self.ultimo_uso < keepalive_max
+
+    def cerrar(self) -> None:
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+class _ConexionCaida(Exception):
+    """La conexión reutilizada se cerró antes de recibir respuesta (reintentable)."""
+
+
+class ClienteHTTP:
+    """
+    Cliente HTTP/1.1 con pool keep-alive y límite de concurrencia por host.
+
+    Args:
+        limite_por_host: Máximo de solicitudes simultáneas (y de conexiones) por host
+        timeout: Timeout por defecto de cada solicitud, en segundos
+        keepalive_max: Segundos que una conexión libre puede esperar para reutilizarse
+        verificar_tls: Si False, no valida certificados (solo para entornos de prueba)
+    """
+
+    def __init__(
+        self,
+        limite_por_host: int = 6,
+        timeout: float = 10.0,
+        keepalive_max: float = 30.0,
+        verificar_tls: bool = True,
+    ):
+        if limite_por_host < 1:
+            raise ValueError("limite_por_host debe ser al menos 1")
+        self.limite_por_host = limite_por_host
+        self.timeout = timeout
+        self.keepalive_max = keepalive_max
+        self._contexto_tls = ssl.create_default_context()
+        if not verificar_tls:
+            self._contexto_tls.check_hostname = False
+            self._contexto_tls.verify_mode = ssl.CERT_NONE
+        self._libres: Dict[ClaveHost, Deque[_Conexion]] = {}
+        self._semaforos: Dict[ClaveHost, asyncio.Semaphore] = {}
+        self.conexiones_creadas = 0  # Total creadas; las cerradas no se descuentan
+
+    # ------------------------------------------------------------------
+    # Pool
+    # ------------------------------------------------------------------
+
+    def _semaforo(self, clave: ClaveHost) -> asyncio.Semaphore:
+        # Se crea dentro del event loop que lo va a usar
+        if clave not in self._semaforos:
+            self._semaforos[clave] = asyncio.Semaphore(self.limite_por_host)
+        return self._semaforos[clave]
+
+    def _tomar_libre(self, clave: ClaveHost) -> Optional[_Conexion]:
+        libres = self._libres.get(clave)
+        while libres:
+            conexion = libres.pop()
+            if conexion.esta_viva(self.keepalive_max):
+                return conexion
+            conexion.cerrar()
+        return None
+
+    def _devolver(self, clave: ClaveHost, conexion: _Conexion) -> None:
+        conexion.ultimo_uso = time.monotonic()
+        self._libres.setdefault(clave, deque()).append(conexion)
+
+    async def _conectar(self, clave: ClaveHost, medicion: MedicionHTTP) -> _Conexion:
+        esquema, host, puerto = clave
+        loop = asyncio.get_running_loop()
+
+        inicio = time.perf_counter()
+        direcciones = await loop.getaddrinfo(host, puerto, type=socket.SOCK_STREAM)
+        medicion.dns_ms = (time.perf_counter() - inicio) * 1000
+        familia, _, _, _, direccion = direcciones[0]
+
+        inicio = time.perf_counter()
+        reader, writer = await asyncio.open_connection(
+            host=direccion[0],
+            port=direccion[1],
+            family=familia,
+            ssl=self._contexto_tls if esquema == "https" else None,
+            server_hostname=host if esquema == "https" else None,
+        )
+        medicion.conexion_ms = (time.perf_counter() - inicio) * 1000
+        self.conexiones_creadas += 1
+        return _Conexion(reader, writer)
+
+    async def cerrar(self) -> None:
+        """Cierra todas las conexiones libres del pool."""
+        for libres in self._libres.values():
+            while libres:
+                libres.pop().cerrar()
+
+    # ------------------------------------------------------------------
+    # Solicitudes
+    # ------------------------------------------------------------------
+
+    async def solicitar(
+        self,
+        url: str,
+        metodo: str = "GET",
+        headers: Optional[Dict[str, str]] = None,
+        cuerpo: bytes = b"",
+        timeout: Optional[float] = None,
+    ) -> MedicionHTTP:
+        """
+        Realiza una solicitud y mide sus tiempos. Nunca lanza excepciones de red:
+        los fallos se reportan en ``MedicionHTTP.error``.
+
+        Args:
+            url: URL http:// o https:// a consultar
+            metodo: Método HTTP
+            headers: Headers adicionales
+            cuerpo: Cuerpo de la solicitud
+            timeout: Timeout en segundos (por defecto el del cliente)
+
+        Returns:
+            MedicionHTTP con status, tiempos y error si lo hubo
+        """
+        metodo = metodo.upper()
+        medicion = MedicionHTTP(url=url, metodo=metodo)
+        partes = urlsplit(url)
+        if partes.scheme not in ("http", "https") or not partes.hostname:
+            medicion.error = f"URL no soportada: '{url}'"
+            return medicion
+
+        puerto = partes.port or (443 if partes.scheme == "https" else 80)
+        clave = (partes.scheme, partes.hostname, puerto)
+        ruta = partes.path or "/"
+        if partes.query:
+            ruta += "?" + partes.query
+
+        inicio = time.perf_counter()
+        try:
+            async with self._semaforo(clave):
+                # La espera por un cupo del host no cuenta como latencia del endpoint
+                inicio = time.perf_counter()
+                await asyncio.wait_for(
+                    self._solicitar_con_reintento(clave, ruta, metodo, headers or {}, cuerpo, medicion, inicio),
+                    timeout if timeout is not None else self.timeout,
+                )
+        except asyncio.TimeoutError:
+            medicion.error = "timeout"
+        except socket.gaierror as e:
+            medicion.error = f"dns: {e}"
+        except ConnectionRefusedError:
+            medicion.error = "conexion rechazada"
+        except ssl.SSLError as e:
+            medicion.error = f"tls: {e}"
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            medicion.error = f"{type(e).__name__}: {e}"
+        medicion.total_ms = (time.perf_counter() - inicio) * 1000
+        return medicion
+
+    async def _solicitar_con_reintento(self, clave, ruta, metodo, headers, cuerpo, medicion, inicio) -> None:
+        conexion = self._tomar_libre(clave)
+        if conexion is not None:
+            medicion.conexion_reutilizada = True
+            try:
+                await self._intercambio(clave, conexion, ruta, metodo, headers, cuerpo, medicion, inicio)
+                return
+            except _ConexionCaida:
+                # El servidor cerró la conexión keep-alive: se reintenta una vez con una nueva
+                medicion.conexion_reutilizada = False
+
+        conexion = await self._conectar(clave, medicion)
+        await self._intercambio(clave, conexion, ruta, metodo, headers, cuerpo, medicion, inicio)
+
+    async def _intercambio(self, clave, conexion, ruta, metodo, headers, cuerpo, medicion, inicio) -> None:
+        _, host, puerto = clave
+        encabezados = {
+            "Host": host if puerto in (80, 443) else f"{host}:{puerto}",
+            "User-Agent": USER_AGENT,
+            "Accept": "*/*",
+            "Connection": "keep-alive",
+        }
+        encabezados.update(headers)
+        if cuerpo or metodo in ("POST", "PUT", "PATCH"):
+            encabezados["Content-Length"] = str(len(cuerpo))
+        solicitud = f"{metodo} {ruta} HTTP/1.1\r\n" + "".join(
+            f"{nombre}: {valor}\r\n" for nombre, valor in encabezados.items()
+        ) + "\r\n"
+
+        reutilizable = False
+        try:
+            conexion.writer.write(solicitud.encode("latin-1") + cuerpo)
+            await conexion.writer.drain()
+
+            linea_estado = await conexion.reader.readline()
+            if not linea_estado:
+                if medicion.conexion_reutilizada:
+                    raise _ConexionCaida()
+                raise ConnectionResetError("el servidor cerró la conexión sin responder")
+            medicion.ttfb_ms = (time.perf_counter() - inicio) * 1000
+
+            partes_estado = linea_estado.decode("latin-1").split(None, 2)
+            if len(partes_estado) < 2 or not partes_estado[0].startswith("HTTP/"):
+                raise ValueError(f"respuesta HTTP inválida: {linea_estado[:80]!r}")
+            medicion.status = int(partes_estado[1])
+
+            while True:
+                linea = await conexion.reader.readline()
+                if linea in (b"\r\n", b"\n", b""):
+                    break
+                nombre, _, valor = linea.decode("latin-1").partition(":")
+                medicion.headers[nombre.strip().lower()] = valor.strip()
+
+            reutilizable = await self._leer_cuerpo(conexion, metodo, medicion)
+            if medicion.headers.get("connection", "").lower() == "close" or partes_estado[0] == "HTTP/1.0":
+                reutilizable = False
+        except ConnectionResetError:
+            if medicion.conexion_reutilizada and medicion.status is None:
+                raise _ConexionCaida()
+            raise
+        finally:
+            if reutilizable:
+                self._devolver(clave, conexion)
+            else:
+                conexion.cerrar()
+
+    async def _leer_cuerpo(self, conexion: _Conexion, metodo: str, medicion: MedicionHTTP) -> bool:
+        """Consume el cuerpo de la respuesta. Devuelve True si la conexión queda reutilizable."""
+        if metodo == "HEAD" or medicion.status in _SIN_CUERPO or 100 <= (medicion.status or 0) < 200:
+            return True
+
+        reader = conexion.reader
+        if medicion.headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                tamano = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if tamano == 0:
+                    # Trailers opcionales hasta la línea vacía
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return True
+                await reader.readexactly(tamano + 2)
+                medicion.bytes_recibidos += tamano
+
+        if "content-length" in medicion.headers:
+            restante = int(medicion.headers["content-length"])
+            while restante > 0:
+                bloque = await reader.read(min(restante, 65536))
+                if not bloque:
+                    raise asyncio.IncompleteReadError(b"", restante)
+                restante -= len(bloque)
+                medicion.bytes_recibidos += len(bloque)
+            return True
+
+        # Sin longitud conocida: el cuerpo termina cuando el servidor cierra
+        while True:
+            bloque = await reader.read(65536)
+            if not bloque:
+                return False
+            medicion.bytes_recibidos += len(bloque)
+
+
+# ----------------------------------------------------------------------
+# Event loop persistente para usar el cliente desde código síncrono
+# ----------------------------------------------------------------------
+
+_bucle: Optional[asyncio.AbstractEventLoop] = None
+_cliente: Optional[ClienteHTTP] = None
+_candado = threading.Lock()
+
+
+def _obtener_bucle() -> asyncio.AbstractEventLoop:
+    global _bucle
+    with _candado:
+        if _bucle is None or _bucle.is_closed():
+            _bucle = asyncio.new_event_loop()
+            hilo = threading.Thread(target=_bucle.run_forever, name="cliente-http", daemon=True)
+            hilo.start()
+        return _bucle
+
+
+def ejecutar(corrutina: Awaitable[Any]) -> Any:
+    """Ejecuta una corrutina en el event loop de fondo y espera su resultado."""
+    return asyncio.run_coroutine_threadsafe(corrutina, _obtener_bucle()).result()
+
+
+def cliente_compartido() -> ClienteHTTP:
+    """Cliente único del proceso, cuyo pool se reutiliza entre llamadas a las skills."""
+    global _cliente
+    with _candado:
+        if _cliente is None:
+            _cliente = ClienteHTTP()
+        return _cliente
@@ -0,0 +1,204 @@
+"""
+Documento HTML compartido
+=========================
+
+Modelo de una página HTML construido en una sola pasada y compartido por todas
+las skills de webapp: conteo de etiquetas, elementos sin cerrar, outline de
+headings, title, mapa de metas y listas de imágenes, inputs, labels y enlaces.
+
+``obtener_documento`` lo cachea por hash del contenido, así que auditar una
+página con ``validar_html`` y ``analizar_seo_html`` cuesta un único parseo:
+
+    documento = obtener_documento(html_codigo)
+    print(documento.titulo, documento.contar("h2"), documento.metas.get("description"))
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Tuple
+
+from .tablas import congelar
+from .validador_html import ValidadorHTML
+
+# Documentos distintos que se mantienen en memoria
+TAMANO_CACHE = 64
+
+# Elementos cuyo texto se guarda en el documento
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_CON_TEXTO = frozenset({"title", "a"} | set(_HEADINGS))
+
+
+@dataclass(frozen=True)
+class DocumentoHTML:
+    """
+    Representación inmutable de una página HTML.
+
+    Attributes:
+        etiquetas: Etiqueta -> cantidad de aperturas
+        sin_cerrar: Etiqueta -> elementos que nunca se cerraron
+        titulo: Texto del primer <title>, o None si no hay
+        encabezados: Outline de headings como tuplas (nivel, texto)
+        metas: name/property/http-equiv (en minúsculas) -> content; "charset" si se declara
+        imagenes: Atributos de cada <img>
+        inputs: Atributos de cada <input>
+        labels: Atributos de cada <label>
+        enlaces: Cada <a> como {"href", "texto", "vacio"}; solo cuenta como
+            vacío un enlace cerrado sin texto ni elementos dentro
+    """
+
+    etiquetas: Mapping[str, int]
+    sin_cerrar: Mapping[str, int]
+    titulo: Optional[str]
+    encabezados: Tuple[Tuple[int, str], ...]
+    metas: Mapping[str, str]
+    imagenes: Tuple[Mapping[str, Optional[str]], ...]
+    inputs: Tuple[Mapping[str, Optional[str]], ...]
+    labels: Tuple[Mapping[str, Optional[str]], ...]
+    enlaces: Tuple[Mapping[str, object], ...]
+
+    def contar(self, etiqueta: str) -> int:
+        return self.etiquetas.get(etiqueta, 0)
+
+    @property
+    def imgs_sin_alt(self) -> int:
+        return sum(1 for img in self.imagenes if "alt" not in img)
+
+    @property
+    def enlaces_vacios(self) -> int:
+        return sum(1 for enlace in self.enlaces if enlace["vacio"])
+
+    @classmethod
+    def desde_html(cls, html: str) -> "DocumentoHTML":
+        return cls.desde_partes([html])
+
+    @classmethod
+    def desde_partes(cls, partes: Iterable[str]) -> "DocumentoHTML":
+        """Construye el documento alimentando el parser bloque a bloque."""
+        parser = _ParserDocumento()
+        for parte in partes:
+            parser.feed(parte)
+        parser.close()
+        return parser.documento()
+
+
+class _ParserDocumento(ValidadorHTML):
+    """ValidadorHTML que además guarda texto, metas y atributos."""
+
+    def __init__(self):
+        super().__init__()
+        self.titulo = None
+        self.encabezados = []
+        self.metas = {}
+        # Atributos de cada elemento listado en el documento, por etiqueta
+        self.atributos = {"img": [], "input": [], "label": []}
+        self.enlaces = []
+        # Elementos con texto abiertos: [etiqueta, partes de texto, atributos, tiene hijos]
+        self._capturas = []
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        if self._capturas:
+            self._capturas[-1][3] = True
+
+        atributos = dict(attrs)
+        if tag in self.atributos:
+            self.atributos[tag].append(atributos)
+        elif tag == "meta":
+            nombre = atributos.get("name") or atributos.get("property") or atributos.get("http-equiv")
+            if nombre:
+                self.metas.setdefault(nombre.lower(), atributos.get("content") or "")
+            if atributos.get("charset"):
+                self.metas.setdefault("charset", atributos["charset"])
+
+        if tag in _CON_TEXTO:
+            self._capturas.append([tag, [], atributos, False])
+
+    def handle_data(self, data):
+        super().handle_data(data)
+        for captura in self._capturas:
+            captura[1].append(data)
+
+    def _al_terminar(self, etiqueta, cerrado):
+        # Los elementos con texto están todos en la pila, así que salen en orden LIFO
+        if etiqueta not in _CON_TEXTO:
+            return
+        _, partes, atributos, tiene_hijos = self._capturas.pop()
+        texto = " ".join("".join(partes).split())
+        if etiqueta == "title":
+            if self.titulo is None:
+                self.titulo = texto
+        elif etiqueta == "a":
+            self.enlaces.append({
+                "href": atributos.get("href"),
+                "texto": texto,
+                "vacio": cerrado and not texto and not tiene_hijos
+            })
+        else:
+            self.encabezados.append((_HEADINGS[etiqueta], texto))
+
+    def documento(self) -> DocumentoHTML:
+        return DocumentoHTML(
+            etiquetas=congelar(self.etiquetas),
+            sin_cerrar=congelar(self.sin_cerrar),
+            titulo=self.titulo,
+            encabezados=congelar(self.encabezados),
+            metas=congelar(self.metas),
+            imagenes=congelar(self.atributos["img"]),
+            inputs=congelar(self.atributos["input"]),
+            labels=congelar(self.atributos["label"]),
+            enlaces=congelar(self.enlaces),
+        )
+
+
+_cache: "OrderedDict[bytes, DocumentoHTML]" = OrderedDict()
+_candado = threading.Lock()
+_estadisticas = {"aciertos": 0, "fallos": 0}
+
+
+def _hash(html: str) -> bytes:
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def obtener_documento(html: str) -> DocumentoHTML:
+    """
+    Devuelve el documento parseado, reutilizando el de una llamada anterior
+    con el mismo contenido.
+
+    Args:
+        html: Código HTML completo
+
+    Returns:
+        DocumentoHTML inmutable, compartido entre llamadas
+    """
+    clave = _hash(html)
+    with _candado:
+        documento = _cache.get(clave)
+        if documento is not None:
+            _cache.move_to_end(clave)
+            _estadisticas["aciertos"] += 1
+            return documento
+        _estadisticas["fallos"] += 1
+
+    # El parseo va fuera del candado: dos hilos con el mismo HTML pueden parsearlo
+    # a la vez, pero ninguno bloquea a los que consultan otros documentos
+    documento = DocumentoHTML.desde_html(html)
+    with _candado:
+        _cache[clave] = documento
+        _cache.move_to_end(clave)
+        while len(_cache) > TAMANO_CACHE:
+            _cache.popitem(last=False)
+    return documento
+
+
+def estadisticas_cache() -> dict:
+    """Aciertos, fallos y documentos en cache de obtener_documento."""
+    with _candado:
+        return {**_estadisticas, "documentos": len(_cache)}
+
+
+def limpiar_cache() -> None:
+    with _candado:
+        _cache.clear()
+        _estadisticas.update(aciertos=0, fallos=0)
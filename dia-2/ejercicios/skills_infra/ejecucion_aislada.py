@@ -0,0 +1,334 @@
+"""
+Ejecución de skills en procesos aislados
+========================================
+
+Una regresión sobre muchos datos o un HTML patológico en ``validar_html``
+bloquea el hilo del agente y no hay forma de cancelar la llamada. Las skills
+con ``isolation="process"`` en la metadata se pueden ejecutar en un pool de
+procesos trabajadores creados de antemano:
+
+    @skill(description="...", isolation="process", timeout=10)
+    def regresion_lineal_simple(x, y): ...
+
+    sm = SkillManagerAislado(procesos=2, memoria_mb=512)
+    sm.load_skills.from_folder("skills_biblioteca/ml")
+    agente = InstantNeo(..., skills=sm)
+
+Cada llamada tiene un tiempo máximo (``timeout`` de la skill o el del pool)
+que incluye la espera por un trabajador libre. Si se agota, el trabajador se
+mata y se reemplaza, y la skill devuelve un error estructurado en lugar de
+bloquear al agente:
+
+    {"error": "timeout", "skill": "regresion_lineal_simple", "mensaje": "...", "timeout_segundos": 10}
+
+Los trabajadores se reciclan cada ``max_tareas`` llamadas y después de pasar
+el límite de memoria. Como en ``auditoria_web``, la skill se indica a los
+trabajadores por archivo y nombre: las cargadas con ``from_folder()`` no
+están en ``sys.modules``. Las registradas desde un manifiesto (proxies,
+``CacheEsquemas``, ``SkillCompacta``) usan el archivo de su entrada y el
+módulo se importa solo en los trabajadores.
+"""
+
+import atexit
+import functools
+import inspect
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from instantneo.skills import SkillManager
+
+from .auditoria_web import cargar_modulo
+
+try:
+    import resource
+except ImportError:  # Windows: sin límite de memoria por proceso
+    resource = None
+
+PROCESOS = 2
+TIMEOUT = 30.0
+MAX_TAREAS = 100
+AISLAMIENTO_PROCESO = "process"
+
+ERROR_TIMEOUT = "timeout"
+ERROR_MEMORIA = "memoria"
+ERROR_PROCESO = "proceso_terminado"
+
+
+def _memoria_virtual() -> int:
+    """Bytes de memoria virtual del proceso actual (0 si no se puede leer)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _trabajador(conexion, memoria_mb: Optional[int], max_tareas: int) -> None:
+    """Bucle de un proceso trabajador: ejecuta hasta ``max_tareas`` llamadas y termina."""
+    if memoria_mb and resource is not None:
+        # Memoria que puede pedir además de la que ya tiene al arrancar
+        limite = _memoria_virtual() + memoria_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+    for _ in range(max_tareas):
+        try:
+            mensaje = conexion.recv()
+        except (EOFError, OSError):
+            return
+        if mensaje is None:
+            return
+        ruta, nombre, args, kwargs = mensaje
+        try:
+            respuesta = ("ok", getattr(cargar_modulo(ruta), nombre)(*args, **kwargs))
+        except MemoryError:
+            respuesta = (ERROR_MEMORIA, None)
+        except Exception as e:
+            respuesta = ("excepcion", e)
+        try:
+            conexion.send(respuesta)
+        except Exception as e:  # Resultado o excepción que no se pueden serializar
+            conexion.send(("excepcion", RuntimeError(f"{type(e).__name__}: {e}")))
+        if respuesta[0] == ERROR_MEMORIA:
+            return
+
+
+class _Trabajador:
+    __slots__ = ("proceso", "conexion", "tareas")
+
+    def __init__(self, proceso, conexion):
+        self.proceso = proceso
+        self.conexion = conexion
+        self.tareas = 0
+
+
+class PoolAislado:
+    """
+    Pool de procesos trabajadores que ejecutan skills por archivo y nombre.
+
+    Los procesos se crean al construir el pool. Es seguro usarlo desde varios
+    hilos: cada llamada toma un trabajador libre y lo devuelve al terminar.
+
+    Args:
+        procesos: Cantidad de trabajadores
+        timeout: Segundos máximos por llamada, incluida la espera por un trabajador
+        memoria_mb: Memoria que cada trabajador puede pedir además de la que
+            tiene al arrancar (None sin límite; sin efecto en Windows)
+        max_tareas: Llamadas que atiende un trabajador antes de reemplazarlo
+        contexto: Método de inicio de multiprocessing ("fork", "spawn",
+            "forkserver"); None usa el de la plataforma
+    """
+
+    def __init__(
+        self,
+        procesos: int = PROCESOS,
+        timeout: float = TIMEOUT,
+        memoria_mb: Optional[int] = None,
+        max_tareas: int = MAX_TAREAS,
+        contexto: Optional[str] = None
+    ):
+        if procesos < 1 or max_tareas < 1:
+            raise ValueError("procesos y max_tareas deben ser positivos")
+        self.procesos = procesos
+        self.timeout = timeout
+        self.memoria_mb = memoria_mb
+        self.max_tareas = max_tareas
+        self._contexto = multiprocessing.get_context(contexto)
+        self._libres: "queue.Queue[_Trabajador]" = queue.Queue()
+        self._todos: List[_Trabajador] = []
+        self._lock = threading.Lock()
+        self._cerrado = False
+        for _ in range(procesos):
+            self._libres.put(self._iniciar())
+        atexit.register(self.cerrar)
+
+    def _iniciar(self) -> _Trabajador:
+        propia, del_hijo = self._contexto.Pipe()
+        proceso = self._contexto.Process(
+            target=_trabajador, args=(del_hijo, self.memoria_mb, self.max_tareas), daemon=True
+        )
+        proceso.start()
+        del_hijo.close()
+        trabajador = _Trabajador(proceso, propia)
+        with self._lock:
+            self._todos.append(trabajador)
+        return trabajador
+
+    def _descartar(self, trabajador: _Trabajador, matar: bool = False) -> None:
+        if matar and trabajador.proceso.is_alive():
+            trabajador.proceso.kill()
+        trabajador.conexion.close()
+        trabajador.proceso.join(timeout=1.0)
+        with self._lock:
+            if trabajador in self._todos:
+                self._todos.remove(trabajador)
+
+    def _devolver(self, trabajador: _Trabajador) -> None:
+        if self._cerrado:
+            self._descartar(trabajador, matar=True)
+        elif trabajador.tareas >= self.max_tareas or not trabajador.proceso.is_alive():
+            self._descartar(trabajador)
+            self._libres.put(self._iniciar())
+        else:
+            self._libres.put(trabajador)
+
+    def ejecutar(
+        self,
+        ruta: str,
+        nombre: str,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Ejecuta la función ``nombre`` del archivo ``ruta`` en un trabajador.
+
+        Returns:
+            El resultado de la función, o un dict con ``error`` (``"timeout"``,
+            ``"memoria"`` o ``"proceso_terminado"``), ``skill`` y ``mensaje``
+            si no terminó
+
+        Raises:
+            La excepción que lanzó la función (RuntimeError si no se pudo
+            enviar entre procesos)
+        """
+        if self._cerrado:
+            raise RuntimeError("El pool de ejecución aislada está cerrado")
+        timeout = self.timeout if timeout is None else timeout
+        limite = time.monotonic() + timeout
+        try:
+            trabajador = self._libres.get(timeout=timeout)
+        except queue.Empty:
+            return _error(ERROR_TIMEOUT, nombre, f"No hubo un proceso libre en {timeout} s", timeout_segundos=timeout)
+
+        try:
+            trabajador.conexion.send((ruta, nombre, tuple(args), dict(kwargs or {})))
+            trabajador.tareas += 1
+            if not trabajador.conexion.poll(max(0.0, limite - time.monotonic())):
+                self._descartar(trabajador, matar=True)
+                self._libres.put(self._iniciar())
+                return _error(ERROR_TIMEOUT, nombre, f"La skill no terminó en {timeout} s y se detuvo",
+                              timeout_segundos=timeout)
+            estado, valor = trabajador.conexion.recv()
+        except (EOFError, OSError):
+            trabajador.proceso.join(timeout=1.0)
+            codigo = trabajador.proceso.exitcode
+            self._descartar(trabajador, matar=True)
+            self._libres.put(self._iniciar())
+            return _error(ERROR_PROCESO, nombre, f"El proceso de la skill terminó inesperadamente (código {codigo})",
+                          codigo_salida=codigo)
+        except BaseException:
+            # El trabajador quedó con una llamada a medias: no se puede reutilizar
+            self._descartar(trabajador, matar=True)
+            self._libres.put(self._iniciar())
+            raise
+
+        if estado == ERROR_MEMORIA:
+            trabajador.proceso.join(timeout=1.0)
+        self._devolver(trabajador)
+        if estado == "ok":
+            return valor
+        if estado == ERROR_MEMORIA:
+            return _error(ERROR_MEMORIA, nombre, f"La skill superó el límite de memoria ({self.memoria_mb} MB)",
+                          memoria_mb=self.memoria_mb)
+        raise valor
+
+    def pids(self) -> List[int]:
+        with self._lock:
+            return [trabajador.proceso.pid for trabajador in self._todos]
+
+    def cerrar(self) -> None:
+        """Termina los trabajadores libres; los ocupados terminan al devolverse."""
+        if self._cerrado:
+            return
+        self._cerrado = True
+        atexit.unregister(self.cerrar)
+        while True:
+            try:
+                trabajador = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                trabajador.conexion.send(None)
+            except OSError:
+                pass
+            self._descartar(trabajador, matar=False)
+
+    def __enter__(self) -> "PoolAislado":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+def _error(tipo: str, skill: str, mensaje: str, **detalles) -> Dict[str, Any]:
+    return dict({"error": tipo, "skill": skill, "mensaje": mensaje}, **detalles)
+
+
+def skill_aislada(func: Callable, pool: PoolAislado, timeout: Optional[float] = None) -> Callable:
+    """
+    Envoltorio de la skill que la ejecuta en ``pool``. Comparte con la skill su
+    ``__dict__``; ``get_last_call()`` queda en el proceso trabajador.
+
+    Los proxies del manifiesto y las ``SkillCompacta`` se envían por su
+    ``ruta_archivo``, sin importar el módulo en el proceso del agente.
+
+    Raises:
+        ValueError: Si la skill no está definida a nivel de módulo en un archivo
+    """
+    # El __code__ del envoltorio de @skill es el de instantneo: el archivo es el de la función original
+    original = inspect.unwrap(func)
+    ruta = getattr(original, "ruta_archivo", None)
+    # Un proxy sin ruta_archivo tiene el __code__ del módulo que lo creó, no el de la skill
+    if ruta is None and not hasattr(original, "cargar") and original.__qualname__ == original.__name__:
+        ruta = original.__code__.co_filename
+    if ruta is None or not os.path.isfile(ruta):
+        raise ValueError(f"La skill '{func.__name__}' debe estar definida a nivel de módulo en un archivo .py")
+    nombre = func.__name__
+
+    def aislada(*args, **kwargs):
+        return pool.ejecutar(ruta, nombre, args, kwargs, timeout)
+
+    functools.update_wrapper(aislada, func)
+    aislada.pool_aislado = pool
+    return aislada
+
+
+class SkillManagerAislado(SkillManager):
+    """
+    SkillManager que ejecuta en un ``PoolAislado`` las skills con
+    ``isolation="process"`` en la metadata (con su ``timeout``, si lo tienen).
+    El resto se ejecuta en el proceso del agente, como siempre.
+
+    El pool se crea al registrar la primera skill aislada.
+
+    Args:
+        procesos, timeout, memoria_mb, max_tareas: Como en ``PoolAislado``
+    """
+
+    def __init__(
+        self,
+        *args,
+        procesos: int = PROCESOS,
+        timeout: float = TIMEOUT,
+        memoria_mb: Optional[int] = None,
+        max_tareas: int = MAX_TAREAS,
+        **kwargs
+    ):
+        self.pool: Optional[PoolAislado] = None
+        self._opciones_pool = {"procesos": procesos, "timeout": timeout, "memoria_mb": memoria_mb, "max_tareas": max_tareas}
+        super().__init__(*args, **kwargs)
+
+    def register_tool(self, func) -> None:
+        metadata = getattr(func, "tool_metadata", None) or getattr(func, "skill_metadata", None) or {}
+        if metadata.get("isolation") == AISLAMIENTO_PROCESO and getattr(func, "pool_aislado", None) is None:
+            if self.pool is None:
+                self.pool = PoolAislado(**self._opciones_pool)
+            func = skill_aislada(func, self.pool, metadata.get("timeout"))
+        super().register_tool(func)
+
+    def cerrar(self) -> None:
+        if self.pool is not None:
+            self.pool.cerrar()
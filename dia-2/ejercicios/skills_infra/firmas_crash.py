@@ -0,0 +1,272 @@
+"""
+Firmas y buckets de crashes
+===========================
+
+Agrupa miles de reportes de crash en unos pocos buckets. Cada reporte se reduce
+a una firma estable: el tipo de excepción más los primeros frames de la app,
+normalizados para que dos ocurrencias del mismo bug coincidan aunque cambien
+las direcciones de memoria, los números de línea o los nombres que el
+compilador genera para lambdas y clases anónimas.
+
+    agrupador = AgrupadorCrashes("Android", prefijos_app=["com.miapp."])
+    for reporte in reportes:
+        agrupador.agregar(reporte["stack_trace"], momento=reporte["fecha"])
+    for bucket in agrupador.buckets()[:10]:
+        print(bucket.cantidad, bucket.firma.tipo_excepcion, bucket.firma.frames)
+
+Así el diagnóstico (que es lo caro y lo que ocupa contexto del agente) se
+hace una vez por bucket, sobre su reporte representativo, y no una vez por crash.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Frames de la app que forman la firma
+TOP_FRAMES = 5
+
+# Ejemplos (origen de cada reporte) que se guardan por bucket
+MAX_EJEMPLOS = 5
+
+# Frames normalizados que se recuerdan: el mismo bug repite los mismos frames
+TAMANO_CACHE_FRAMES = 65536
+
+# Paquetes de la plataforma: sus frames no identifican un bug de la app
+PAQUETES_SISTEMA_ANDROID = (
+    "java.", "javax.", "jdk.", "sun.", "kotlin.", "kotlinx.", "android.", "androidx.",
+    "com.android.", "com.google.android.", "dalvik.", "libcore.",
+)
+IMAGENES_SISTEMA_IOS = frozenset({
+    "dyld", "CoreFoundation", "Foundation", "UIKit", "UIKitCore", "GraphicsServices",
+    "QuartzCore", "CFNetwork", "CoreData", "SwiftUI", "Combine",
+})
+
+# --- Android ---
+_RE_FRAME_ANDROID = re.compile(r"^[ \t]*at[ \t]+([\w$.<>/-]+)\(", re.MULTILINE)
+_RE_EXCEPCION_ANDROID = re.compile(r"((?:[A-Za-z_$][\w$]*\.)*[A-Z][\w$]*(?:Exception|Error|Throwable))\b")
+_RE_CAUSA = re.compile(r"^\s*Caused by:", re.MULTILINE)
+
+# --- iOS ---
+# "3   MiApp   0x0000000102f4a1b8 ViewController.viewDidLoad() + 312 (ViewController.swift:42)"
+_RE_FRAME_IOS = re.compile(r"^\s*\d+\s+(\S+)\s+0x[0-9a-fA-F]+\s*(.*)$")
+_RE_HILO_CRASH = re.compile(r"^Thread \d+(?: name: .*)? Crashed:.*$", re.MULTILINE)
+_RE_TIPO_IOS = re.compile(r"^Exception Type:\s*(\S+)", re.MULTILINE)
+_RE_NS_EXCEPCION = re.compile(r"uncaught exception '(\w+)'")
+_RE_FATAL_SWIFT = re.compile(r"Fatal error: ([^:\n]+)", re.IGNORECASE)
+
+# --- Normalización de frames, en este orden ---
+_NORMALIZACIONES = (
+    (re.compile(r"/?0x[0-9a-fA-F]+"), ""),                          # direcciones de memoria
+    (re.compile(r"\s*\+\s*\d+"), ""),                               # offsets "+ 312"
+    (re.compile(r"\s*\([^()]*:\d+\)"), ""),                         # "(Archivo.swift:42)"
+    (re.compile(r"\$\$(?:ExternalSynthetic)?Lambda(?:\$\d+)?\d*"), "$$Lambda"),
+    (re.compile(r"\$\d+"), "$"),                                    # clases anónimas y lambda$x$0
+    (re.compile(r"(closure|implicit closure) #\d+"), r"\1"),       # closures de Swift
+)
+
+
+@dataclass(frozen=True)
+class FirmaCrash:
+    """
+    Identidad de un crash.
+
+    Attributes:
+        firma: Hash hexadecimal estable de plataforma, tipo y frames
+        plataforma: "android" o "ios"
+        tipo_excepcion: Excepción o señal, por ejemplo "java.lang.NullPointerException"
+        frames: Frames normalizados que forman la firma, del más interno al más externo
+    """
+    firma: str
+    plataforma: str
+    tipo_excepcion: str
+    frames: Tuple[str, ...]
+
+
+@dataclass
+class BucketCrash:
+    """
+    Crashes con la misma firma.
+
+    Attributes:
+        firma: Firma común
+        cantidad: Reportes en el bucket
+        primera_vez / ultima_vez: Momento (timestamp) del primer y último reporte
+        representante: Stack trace del primer reporte, para diagnosticarlo
+        ejemplos: Origen de hasta MAX_EJEMPLOS reportes (archivo o id)
+    """
+    firma: FirmaCrash
+    cantidad: int = 0
+    primera_vez: Optional[float] = None
+    ultima_vez: Optional[float] = None
+    representante: str = ""
+    ejemplos: List[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=TAMANO_CACHE_FRAMES)
+def normalizar_frame(frame: str) -> str:
+    """
+    Quita de un frame lo que cambia entre builds u ocurrencias.
+
+    Ejemplo: "com.app.Lista$1.lambda$onClick$0" -> "com.app.Lista$.lambda$onClick$"
+    """
+    for patron, reemplazo in _NORMALIZACIONES:
+        frame = patron.sub(reemplazo, frame)
+    return frame.strip()
+
+
+def _seccion_android(stack_trace: str) -> str:
+    """La excepción raíz: el último "Caused by:" con frames propios, o el trace completo."""
+    if "Caused by:" not in stack_trace:
+        return stack_trace
+    causas = [m.start() for m in _RE_CAUSA.finditer(stack_trace)]
+    for inicio in reversed(causas):
+        if _RE_FRAME_ANDROID.search(stack_trace, inicio):
+            return stack_trace[inicio:]
+    return stack_trace
+
+
+def _analizar_android(stack_trace: str, top: int, prefijos_app: Tuple[str, ...]) -> Tuple[str, List[str], List[str]]:
+    seccion = _seccion_android(stack_trace)
+    match = _RE_EXCEPCION_ANDROID.search(seccion)
+    tipo = match.group(1) if match else "Desconocido"
+
+    # Se recorre hasta juntar `top` frames de la app; solo esos se normalizan
+    frames, de_la_app = [], []
+    for match in _RE_FRAME_ANDROID.finditer(seccion):
+        frame = match.group(1)
+        if prefijos_app:
+            es_app = frame.startswith(prefijos_app)
+        else:
+            es_app = not frame.startswith(PAQUETES_SISTEMA_ANDROID)
+        if es_app:
+            de_la_app.append(normalizar_frame(frame))
+            if len(de_la_app) == top:
+                break
+        elif len(frames) < top:
+            frames.append(normalizar_frame(frame))
+    return tipo, frames, de_la_app
+
+
+def _analizar_ios(stack_trace: str, top: int, prefijos_app: Tuple[str, ...]) -> Tuple[str, List[str], List[str]]:
+    match = _RE_NS_EXCEPCION.search(stack_trace)
+    if match:
+        tipo = match.group(1)
+    else:
+        match = _RE_TIPO_IOS.search(stack_trace) or _RE_FATAL_SWIFT.search(stack_trace)
+        tipo = match.group(1).strip() if match else "Desconocido"
+
+    # Solo el hilo que crasheó; sin encabezado de hilos se toma el trace completo
+    match = _RE_HILO_CRASH.search(stack_trace)
+    lineas = stack_trace[match.end():].lstrip("\n").split("\n") if match else stack_trace.split("\n")
+
+    frames, de_la_app = [], []
+    for linea in lineas:
+        match = _RE_FRAME_IOS.match(linea)
+        if not match:
+            if (frames or de_la_app) and not linea.strip():
+                break  # Fin del bloque del hilo
+            continue
+        imagen = match.group(1)
+        if prefijos_app:
+            es_app = imagen.startswith(prefijos_app)
+        else:
+            es_app = imagen not in IMAGENES_SISTEMA_IOS and not imagen.startswith(("lib", "dyld"))
+        if not es_app and len(frames) >= top:
+            continue
+        simbolo = normalizar_frame(match.group(2))
+        frame = f"{imagen}!{simbolo}" if simbolo else imagen
+        if es_app:
+            de_la_app.append(frame)
+            if len(de_la_app) == top:
+                break
+        else:
+            frames.append(frame)
+    return tipo, frames, de_la_app
+
+
+def firma_crash(
+    stack_trace: str,
+    plataforma: str = "Android",
+    top_frames: int = TOP_FRAMES,
+    prefijos_app: Sequence[str] = ()
+) -> FirmaCrash:
+    """
+    Calcula la firma de un stack trace.
+
+    Args:
+        stack_trace: Texto del crash (logcat de Android o crash report de iOS)
+        plataforma: "Android" o "iOS"
+        top_frames: Frames de la app que entran en la firma
+        prefijos_app: Paquetes (Android) o imágenes (iOS) de la app; si se omiten
+            se usa todo lo que no sea de la plataforma
+
+    Returns:
+        La firma; si no hay frames de la app se usan los primeros frames del trace
+    """
+    plataforma = plataforma.lower()
+    if plataforma == "ios":
+        tipo, frames, de_la_app = _analizar_ios(stack_trace, top_frames, tuple(prefijos_app))
+    else:
+        plataforma = "android"
+        tipo, frames, de_la_app = _analizar_android(stack_trace, top_frames, tuple(prefijos_app))
+
+    seleccion = tuple(de_la_app or frames)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update("\n".join((plataforma, tipo) + seleccion).encode())
+    return FirmaCrash(digest.hexdigest(), plataforma, tipo, seleccion)
+
+
+class AgrupadorCrashes:
+    """
+    Agrupa reportes de crash por firma.
+
+    Args:
+        plataforma: "Android" o "iOS"
+        top_frames: Frames de la app que entran en la firma
+        prefijos_app: Paquetes o imágenes de la app (ver ``firma_crash``)
+    """
+
+    def __init__(self, plataforma: str = "Android", top_frames: int = TOP_FRAMES, prefijos_app: Sequence[str] = ()):
+        self.plataforma = plataforma
+        self.top_frames = top_frames
+        self.prefijos_app = tuple(prefijos_app)
+        self.total = 0
+        self._buckets: Dict[str, BucketCrash] = {}
+
+    def agregar(self, stack_trace: str, momento: Optional[float] = None, origen: str = "") -> FirmaCrash:
+        """
+        Args:
+            stack_trace: Texto del crash
+            momento: Timestamp del reporte, si se conoce
+            origen: Archivo o id del reporte, para citarlo como ejemplo
+
+        Returns:
+            La firma del reporte
+        """
+        firma = firma_crash(stack_trace, self.plataforma, self.top_frames, self.prefijos_app)
+        bucket = self._buckets.get(firma.firma)
+        if bucket is None:
+            bucket = self._buckets[firma.firma] = BucketCrash(firma, representante=stack_trace)
+
+        self.total += 1
+        bucket.cantidad += 1
+        if momento is not None:
+            if bucket.primera_vez is None or momento < bucket.primera_vez:
+                bucket.primera_vez = momento
+            if bucket.ultima_vez is None or momento > bucket.ultima_vez:
+                bucket.ultima_vez = momento
+        if origen and len(bucket.ejemplos) < MAX_EJEMPLOS:
+            bucket.ejemplos.append(origen)
+        return firma
+
+    def buckets(self) -> List[BucketCrash]:
+        """Buckets del más frecuente al menos frecuente (a igual cantidad, el más antiguo primero)."""
+        return sorted(
+            self._buckets.values(),
+            key=lambda b: (-b.cantidad, b.primera_vez if b.primera_vez is not None else float("inf"), b.firma.firma)
+        )
+
+    def __len__(self) -> int:
+        return len(self._buckets)
@@ -0,0 +1,319 @@
+"""
+Historial de llamadas por skill
+===============================
+
+``get_last_call()`` guarda solo la última llamada de cada skill: cuando algo
+falla bajo carga, se pierde todo lo anterior. ``HistorialSkill`` guarda las
+últimas ``capacidad`` llamadas en un buffer circular de arrays preasignados
+(inicio, duración, estado, tipo de excepción) y los argumentos y el resultado
+de una de cada ``muestreo`` llamadas, y de todas las que fallan, en un segundo
+buffer más chico. Una vez lleno, registrar una llamada sobrescribe posiciones:
+los buffers no crecen.
+
+El historial es opcional por skill. ``SkillManagerConHistorial`` envuelve las
+skills con ``historial`` en la metadata (``True`` o la capacidad):
+
+    @skill(description="...", historial=512)
+    def consultar_endpoint(url: str) -> dict: ...
+
+    sm = SkillManagerConHistorial()
+    sm.register_skill(consultar_endpoint)
+    sm.update_skill_metadata("modulo.otra_skill", {"historial": True})   # activarlo después
+    ...
+    sm.ultimas_fallas(100)
+"""
+
+import array
+import functools
+import heapq
+import inspect
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from instantneo.skills import SkillManager
+
+CAPACIDAD = 1024
+# Se guardan los argumentos y el resultado de 1 de cada MUESTREO llamadas exitosas
+MUESTREO = 16
+CAPACIDAD_MUESTRAS = 64
+
+_OK, _ERROR = 0, 1
+
+
+@dataclass(frozen=True)
+class LlamadaRegistrada:
+    """
+    Una llamada del historial. ``args``, ``kwargs`` y ``resultado`` (o la
+    excepción) solo están si la llamada quedó en las muestras.
+    """
+
+    clave: str
+    secuencia: int
+    inicio: float
+    duracion: float
+    ok: bool
+    excepcion: Optional[str] = None
+    muestreada: bool = False
+    args: Optional[tuple] = None
+    kwargs: Optional[Dict[str, Any]] = None
+    resultado: Any = None
+
+
+class HistorialSkill:
+    """
+    Buffer circular con las últimas llamadas de una skill.
+
+    Cada llamada toma su posición con ``next()`` de un ``itertools.count``,
+    atómico con el GIL, así que registrar no usa locks. La secuencia de cada
+    posición se escribe al final: quien lee descarta las posiciones que
+    cambiaron mientras las copiaba.
+
+    Args:
+        clave: Clave "modulo.nombre" de la skill
+        capacidad: Llamadas que se conservan
+        muestreo: Se guardan los argumentos y el resultado de 1 de cada
+            ``muestreo`` llamadas exitosas (y de todas las fallidas)
+        capacidad_muestras: Muestras que se conservan
+    """
+
+    def __init__(
+        self,
+        clave: str,
+        capacidad: int = CAPACIDAD,
+        muestreo: int = MUESTREO,
+        capacidad_muestras: int = CAPACIDAD_MUESTRAS
+    ):
+        if capacidad < 1 or muestreo < 1 or capacidad_muestras < 1:
+            raise ValueError("capacidad, muestreo y capacidad_muestras deben ser positivos")
+        self.clave = clave
+        self.capacidad = capacidad
+        self.muestreo = muestreo
+        self.capacidad_muestras = capacidad_muestras
+        # time.time() de cuando perf_counter() valía 0: una sola lectura de reloj por llamada
+        self._origen = time.time() - time.perf_counter()
+        self._contador = itertools.count()
+        self._secuencias = array.array("q", [-1]) * capacidad
+        self._inicios = array.array("d", [0.0]) * capacidad
+        self._duraciones = array.array("d", [0.0]) * capacidad
+        self._estados = array.array("b", [_OK]) * capacidad
+        self._excepciones: List[Optional[str]] = [None] * capacidad
+
+        self._contador_muestras = itertools.count()
+        self._muestras_secuencias = array.array("q", [-1]) * capacidad_muestras
+        self._muestras_args: List[Optional[tuple]] = [None] * capacidad_muestras
+        self._muestras_kwargs: List[Optional[Dict[str, Any]]] = [None] * capacidad_muestras
+        self._muestras_resultados: List[Any] = [None] * capacidad_muestras
+
+    def registrar(self, inicio: float, duracion: float, args: tuple, kwargs: Dict[str, Any],
+                  resultado: Any = None, excepcion: Optional[BaseException] = None) -> None:
+        """
+        Args:
+            inicio: ``time.perf_counter()`` al empezar la llamada
+            duracion: Segundos que duró
+            args, kwargs: Argumentos de la llamada
+            resultado: Valor devuelto, si no falló
+            excepcion: Excepción lanzada, si falló
+        """
+        secuencia = next(self._contador)
+        posicion = secuencia % self.capacidad
+        self._secuencias[posicion] = -1
+        self._inicios[posicion] = inicio
+        self._duraciones[posicion] = duracion
+        if excepcion is None:
+            self._estados[posicion] = _OK
+            self._excepciones[posicion] = None
+        else:
+            self._estados[posicion] = _ERROR
+            self._excepciones[posicion] = type(excepcion).__name__
+        self._secuencias[posicion] = secuencia
+
+        if excepcion is not None or secuencia % self.muestreo == 0:
+            muestra = next(self._contador_muestras) % self.capacidad_muestras
+            self._muestras_secuencias[muestra] = -1
+            self._muestras_args[muestra] = args
+            self._muestras_kwargs[muestra] = kwargs
+            self._muestras_resultados[muestra] = resultado if excepcion is None else excepcion
+            self._muestras_secuencias[muestra] = secuencia
+
+    def _muestras(self) -> Dict[int, tuple]:
+        antes = self._muestras_secuencias[:]
+        args, kwargs, resultados = self._muestras_args[:], self._muestras_kwargs[:], self._muestras_resultados[:]
+        despues = self._muestras_secuencias[:]
+        return {
+            secuencia: (args[posicion], kwargs[posicion], resultados[posicion])
+            for posicion, secuencia in enumerate(antes)
+            if secuencia >= 0 and despues[posicion] == secuencia
+        }
+
+    def llamadas(self) -> List[LlamadaRegistrada]:
+        """Las llamadas del buffer, de la más reciente a la más vieja."""
+        return self.ultimas(self.capacidad)
+
+    def __len__(self) -> int:
+        return sum(1 for secuencia in self._secuencias if secuencia >= 0)
+
+    def ultimas(self, n: int = 100, solo_fallas: bool = False, excepcion: Optional[str] = None) -> List[LlamadaRegistrada]:
+        """
+        Las últimas ``n`` llamadas, de la más reciente a la más vieja.
+
+        Args:
+            n: Cantidad máxima
+            solo_fallas: Solo las que lanzaron una excepción
+            excepcion: Solo las que lanzaron ese tipo de excepción ("ValueError")
+        """
+        antes = self._secuencias[:]
+        inicios, duraciones = self._inicios[:], self._duraciones[:]
+        estados, excepciones = self._estados[:], self._excepciones[:]
+        despues = self._secuencias[:]
+        muestras = self._muestras()
+
+        llamadas: List[LlamadaRegistrada] = []
+        # Se filtra sobre los arrays y solo se arman las llamadas que se devuelven
+        for posicion in sorted(range(self.capacidad), key=antes.__getitem__, reverse=True):
+            secuencia = antes[posicion]
+            if secuencia < 0 or len(llamadas) >= n:
+                break
+            if despues[posicion] != secuencia:
+                continue
+            if (solo_fallas and estados[posicion] == _OK) or (excepcion is not None and excepciones[posicion] != excepcion):
+                continue
+            muestra = muestras.get(secuencia)
+            llamadas.append(LlamadaRegistrada(
+                clave=self.clave,
+                secuencia=secuencia,
+                inicio=self._origen + inicios[posicion],
+                duracion=duraciones[posicion],
+                ok=estados[posicion] == _OK,
+                excepcion=excepciones[posicion],
+                muestreada=muestra is not None,
+                args=muestra[0] if muestra else None,
+                kwargs=muestra[1] if muestra else None,
+                resultado=muestra[2] if muestra else None,
+            ))
+        return llamadas
+
+    def fallas(self, n: int = 100) -> List[LlamadaRegistrada]:
+        return self.ultimas(n, solo_fallas=True)
+
+
+def con_historial(func: Callable, historial: HistorialSkill) -> Callable:
+    """
+    Envoltorio de la skill que registra cada llamada en ``historial``. Comparte
+    con la skill su ``__dict__`` y deja la original en ``__wrapped__``.
+    """
+    registrar = historial.registrar
+    reloj = time.perf_counter
+
+    if inspect.iscoroutinefunction(func):
+        async def registrada(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = await func(*args, **kwargs)
+            except Exception as error:
+                registrar(inicio, reloj() - inicio, args, kwargs, excepcion=error)
+                raise
+            registrar(inicio, reloj() - inicio, args, kwargs, resultado)
+            return resultado
+    else:
+        def registrada(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = func(*args, **kwargs)
+            except Exception as error:
+                registrar(inicio, reloj() - inicio, args, kwargs, excepcion=error)
+                raise
+            registrar(inicio, reloj() - inicio, args, kwargs, resultado)
+            return resultado
+
+    functools.update_wrapper(registrada, func)
+    registrada.historial_skill = historial
+    return registrada
+
+
+class SkillManagerConHistorial(SkillManager):
+    """
+    SkillManager que guarda el historial de las skills con ``historial`` en su
+    metadata: ``True`` para la capacidad por defecto o un entero. Activarlo o
+    desactivarlo con ``update_skill_metadata()`` envuelve o desenvuelve la
+    skill en el registry.
+
+    Los historiales (``self.historiales``, por clave) se conservan al quitar o
+    desactivar la skill.
+
+    Args:
+        muestreo: Como en ``HistorialSkill``, para todas las skills
+        capacidad_muestras: Como en ``HistorialSkill``, para todas las skills
+    """
+
+    def __init__(self, *args, muestreo: int = MUESTREO, capacidad_muestras: int = CAPACIDAD_MUESTRAS, **kwargs):
+        self.historiales: Dict[str, HistorialSkill] = {}
+        self.muestreo = muestreo
+        self.capacidad_muestras = capacidad_muestras
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _capacidad(func: Callable) -> Optional[int]:
+        metadata = getattr(func, "tool_metadata", None) or getattr(func, "skill_metadata", None) or {}
+        valor = metadata.get("historial")
+        if not valor:
+            return None
+        return CAPACIDAD if valor is True else int(valor)
+
+    def _preparar(self, func: Callable) -> Callable:
+        """La skill envuelta según su metadata (o sin envolver, si no pide historial)."""
+        original = func
+        while getattr(original, "historial_skill", None) is not None:
+            original = original.__wrapped__
+        capacidad = self._capacidad(original)
+        if capacidad is None:
+            return original
+        clave = f"{original.__module__}.{original.__name__}"
+        historial = self.historiales.get(clave)
+        if historial is None or historial.capacidad != capacidad:
+            historial = self.historiales[clave] = HistorialSkill(
+                clave, capacidad, self.muestreo, self.capacidad_muestras
+            )
+        if getattr(func, "historial_skill", None) is historial:
+            return func
+        return con_historial(original, historial)
+
+    def register_tool(self, func) -> None:
+        super().register_tool(self._preparar(func))
+
+    def update_tool_metadata(self, key: str, new_metadata: Dict[str, Any]) -> bool:
+        actualizada = super().update_tool_metadata(key, new_metadata)
+        if actualizada and "historial" in new_metadata:
+            anterior = self.registry[key]
+            nueva = self._preparar(anterior)
+            if nueva is not anterior:
+                self.registry[key] = nueva
+                for indice in (self.registry_by_name, self.duplicates):
+                    if anterior.__name__ in indice:
+                        indice[anterior.__name__] = [
+                            nueva if funcion is anterior else funcion for funcion in indice[anterior.__name__]
+                        ]
+        return actualizada
+
+    def historial(self, nombre: str) -> HistorialSkill:
+        """
+        El historial de la skill, por clave "modulo.nombre" o por nombre.
+
+        Raises:
+            KeyError: Si la skill no tiene historial
+        """
+        if nombre in self.historiales:
+            return self.historiales[nombre]
+        for clave, historial in self.historiales.items():
+            if clave.rpartition(".")[2] == nombre:
+                return historial
+        raise KeyError(f"La skill '{nombre}' no tiene historial")
+
+    def ultimas_fallas(self, n: int = 100) -> List[LlamadaRegistrada]:
+        """Las últimas ``n`` llamadas fallidas de todas las skills, de la más reciente a la más vieja."""
+        por_skill = [historial.fallas(n) for historial in self.historiales.values()]
+        return list(itertools.islice(heapq.merge(*por_skill, key=lambda llamada: -llamada.inicio), n))
+
+    # Los alias de SkillManager apuntan a los métodos de la clase base
+    update_skill_metadata = update_tool_metadata
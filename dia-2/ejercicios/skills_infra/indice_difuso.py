@@ -0,0 +1,296 @@
+"""
+Índice difuso de claves
+=======================
+
+Busca entre las claves de una base de conocimiento (y sus alias) la que mejor
+coincide con un texto libre, tolerando acentos, mayúsculas, plurales, errores
+de tipeo y palabras de más:
+
+    indice = IndiceDifuso([
+        ("android", "camara no funciona", ["camera not working"]),
+        ("android", "ubicacion no disponible", ["gps no funciona"]),
+    ])
+    indice.buscar("La cámara no funciona desde ayer", grupo="android", dentro_del_texto=True)
+    # [Coincidencia(grupo="android", clave="camara no funciona", nombre="camara no funciona", puntaje=1.0)]
+
+Es un índice invertido palabra -> nombres, separado por grupo, donde cada palabra
+pesa según su IDF: las que aparecen en muchos nombres ("no", "de") casi no cuentan.
+Por eso cada nombre se indexa solo con sus palabras más raras, las justas para
+que cualquier consulta que llegue al puntaje mínimo comparta al menos una, y las
+palabras comunes de la consulta no traen media base como candidata.
+
+Cada palabra de la consulta se compara además con el vocabulario de la base por
+trigramas ("camra" ~ "camara", "permisos" ~ "permiso"), con otro índice invertido
+y una cache por palabra, porque las consultas repiten mucho vocabulario. Una
+variante cuenta con su similitud, no como la palabra exacta: "camra" sola puntúa
+0.545 contra "camara", así que quien exige un puntaje mayor (como las skills de
+permisos, con 0.6) la recibe como sugerencia y no como coincidencia.
+"""
+
+import math
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Puntaje mínimo por defecto para considerar que hay coincidencia
+PUNTAJE_MINIMO = 0.5
+
+# Similitud (Dice de trigramas) para tomar una palabra como variante de otra
+SIMILITUD_PALABRAS = 0.5
+
+# Palabras más cortas solo coinciden exactas: en ellas un trigrama es media palabra
+LONGITUD_MINIMA_DIFUSA = 4
+
+# Variantes por palabra de la consulta y palabras recordadas en la cache
+MAX_VARIANTES = 3
+TAMANO_CACHE_VARIANTES = 10000
+
+# Decimales de los puntajes devueltos
+DECIMALES_PUNTAJE = 3
+
+
+@dataclass(frozen=True)
+class Coincidencia:
+    """
+    Resultado de una búsqueda.
+
+    Attributes:
+        grupo: Grupo de la entrada, por ejemplo la plataforma
+        clave: Clave de la entrada en la base de conocimiento
+        nombre: Clave o alias que coincidió
+        puntaje: Entre 0 y 1; 1 es una coincidencia exacta
+    """
+    grupo: Hashable
+    clave: str
+    nombre: str
+    puntaje: float
+
+
+def normalizar_texto(texto: str) -> str:
+    """Minúsculas, sin acentos y con cualquier signo convertido en un solo espacio."""
+    sin_acentos = unicodedata.normalize("NFKD", texto.lower())
+    caracteres = (c if c.isalnum() else " " for c in sin_acentos if not unicodedata.combining(c))
+    return " ".join("".join(caracteres).split())
+
+
+def trigramas(palabra: str) -> FrozenSet[str]:
+    """Trigramas de una palabra normalizada, con un espacio en cada extremo."""
+    relleno = f" {palabra} "
+    return frozenset(relleno[i:i + 3] for i in range(len(relleno) - 2))
+
+
+class IndiceDifuso:
+    """
+    Índice invertido ponderado sobre claves y alias.
+
+    Args:
+        entradas: Tripletas (grupo, clave, alias). La clave también se indexa
+            como nombre; el orden de las entradas desempata puntajes iguales.
+        minimo: Puntaje mínimo que podrá pedirse a ``buscar``; cuanto más alto,
+            menos palabras se indexan por nombre y más rápidas son las búsquedas
+        similitud_palabras: Similitud mínima entre una palabra de la consulta y
+            una del vocabulario para tomarla como variante
+    """
+
+    def __init__(
+        self,
+        entradas: Iterable[Tuple[Hashable, str, Iterable[str]]],
+        minimo: float = PUNTAJE_MINIMO,
+        similitud_palabras: float = SIMILITUD_PALABRAS
+    ):
+        if not 0 < minimo <= 1:
+            raise ValueError(f"El puntaje mínimo debe estar entre 0 y 1: {minimo}")
+        self.minimo = minimo
+        self.similitud_palabras = similitud_palabras
+
+        # Por nombre: (posición de la entrada, grupo, clave, nombre) y sus palabras
+        self._nombres: List[Tuple[int, Hashable, str, str]] = []
+        self._palabras: List[FrozenSet[str]] = []
+        self._entradas = 0
+        for posicion, (grupo, clave, alias) in enumerate(entradas):
+            self._entradas += 1
+            for nombre in dict.fromkeys((clave, *alias)):
+                palabras = frozenset(normalizar_texto(nombre).split())
+                if palabras:
+                    self._nombres.append((posicion, grupo, clave, nombre))
+                    self._palabras.append(palabras)
+
+        frecuencia = Counter(palabra for palabras in self._palabras for palabra in palabras)
+        cantidad = len(self._palabras)
+        self._idf: Dict[str, float] = {p: math.log(1 + cantidad / n) for p, n in frecuencia.items()}
+        # Una palabra de la consulta que no está en la base pesa como la más rara
+        self._idf_desconocida = math.log(1 + cantidad) if cantidad else 1.0
+
+        # Cada nombre se indexa con sus palabras más raras. Con cobertura >= m el
+        # peso en común es al menos m*peso: las palabras comunes que suman menos
+        # que eso no alcanzan solas y no hace falta indexarlas. Dice >= m solo
+        # garantiza m*peso/2, así que las palabras entre ambos cortes van a un
+        # índice aparte que solo consultan las búsquedas por Dice.
+        self._pesos: List[float] = []
+        self._indices: Dict[Hashable, Dict[str, List[int]]] = {}
+        self._indices_dice: Dict[Hashable, Dict[str, List[int]]] = {}
+        for identificador, ((_, grupo, _, _), palabras) in enumerate(zip(self._nombres, self._palabras)):
+            peso = sum(self._idf[p] for p in palabras)
+            self._pesos.append(peso)
+            indice = self._indices.setdefault(grupo, {})
+            indice_dice = self._indices_dice.setdefault(grupo, {})
+            resto = 0.0
+            for palabra in sorted(palabras, key=lambda p: (self._idf[p], p)):
+                resto += self._idf[palabra]
+                if resto >= minimo * peso - 1e-9:
+                    indice.setdefault(palabra, []).append(identificador)
+                elif resto >= minimo * peso / 2 - 1e-9:
+                    indice_dice.setdefault(palabra, []).append(identificador)
+
+        # Vocabulario por trigramas, con el mismo recorte: para Dice >= s entre
+        # palabras hacen falta c >= s*t/(2-s) trigramas en común, así que basta
+        # indexar los t-c+1 más raros de cada palabra
+        self._trigramas = {p: trigramas(p) for p in self._idf if len(p) >= LONGITUD_MINIMA_DIFUSA}
+        frecuencia_trigramas = Counter(tri for tris in self._trigramas.values() for tri in tris)
+        self._vocabulario: Dict[str, List[str]] = {}
+        for palabra, tris in self._trigramas.items():
+            necesarios = max(1, math.ceil(similitud_palabras * len(tris) / (2 - similitud_palabras) - 1e-9))
+            raros = sorted(tris, key=lambda tri: (frecuencia_trigramas[tri], tri))
+            for tri in raros[:len(tris) - necesarios + 1]:
+                self._vocabulario.setdefault(tri, []).append(palabra)
+        self._variantes: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+
+    def __len__(self) -> int:
+        return self._entradas
+
+    def grupos(self) -> List[Hashable]:
+        return list(self._indices)
+
+    def variantes(self, palabra: str) -> Tuple[Tuple[str, float], ...]:
+        """
+        Palabras del vocabulario parecidas a una palabra normalizada.
+
+        Returns:
+            Hasta MAX_VARIANTES pares (palabra, similitud) de mayor a menor
+            similitud; la propia palabra, si está en la base, con similitud 1
+        """
+        conocidas = self._variantes.get(palabra)
+        if conocidas is not None:
+            return conocidas
+
+        similares: Dict[str, float] = {}
+        if palabra in self._idf:
+            similares[palabra] = 1.0
+        if len(palabra) >= LONGITUD_MINIMA_DIFUSA:
+            tris = trigramas(palabra)
+            candidatas: Set[str] = set()
+            for tri in tris:
+                palabras = self._vocabulario.get(tri)
+                if palabras:
+                    candidatas.update(palabras)
+            candidatas.discard(palabra)
+            for candidata in candidatas:
+                otros = self._trigramas[candidata]
+                similitud = 2 * len(tris & otros) / (len(tris) + len(otros))
+                if similitud >= self.similitud_palabras:
+                    similares[candidata] = similitud
+        conocidas = tuple(sorted(similares.items(), key=lambda par: (-par[1], par[0]))[:MAX_VARIANTES])
+
+        if len(self._variantes) >= TAMANO_CACHE_VARIANTES:
+            self._variantes.clear()
+        self._variantes[palabra] = conocidas
+        return conocidas
+
+    def buscar(
+        self,
+        consulta: str,
+        grupo: Optional[Hashable] = None,
+        limite: int = 5,
+        minimo: Optional[float] = None,
+        dentro_del_texto: bool = False
+    ) -> List[Coincidencia]:
+        """
+        Args:
+            consulta: Texto a buscar
+            grupo: Buscar solo en ese grupo; None busca en todos
+            limite: Máximo de resultados, uno por clave
+            minimo: Puntaje mínimo de los resultados; por defecto, y como piso,
+                el del índice
+            dentro_del_texto: Si la consulta es un texto libre que puede mencionar
+                la clave entre otras palabras (una descripción de un problema).
+                El puntaje es entonces la parte (ponderada) de las palabras del
+                nombre que aparece en la consulta: un nombre presente tal cual
+                puntúa 1. Si es False la consulta es el nombre buscado y se
+                compara con el coeficiente de Dice ponderado.
+
+        Returns:
+            Coincidencias de mayor a menor puntaje (a igual puntaje, en el orden
+            de las entradas)
+        """
+        minimo = self.minimo if minimo is None else max(minimo, self.minimo)
+        idf = self._idf
+
+        # Palabra del vocabulario -> mayor similitud con alguna palabra de la consulta
+        presentes: Dict[str, float] = {}
+        peso_consulta = 0.0
+        for palabra in set(normalizar_texto(consulta).split()):
+            variantes = self.variantes(palabra)
+            if not variantes:
+                peso_consulta += self._idf_desconocida
+                continue
+            peso_consulta += idf[variantes[0][0]]
+            for variante, similitud in variantes:
+                if similitud > presentes.get(variante, 0.0):
+                    presentes[variante] = similitud
+        if not presentes:
+            return []
+
+        grupos = [grupo] if grupo is not None else list(self._indices)
+        indices = [self._indices.get(g, {}) for g in grupos]
+        if not dentro_del_texto:
+            indices += [self._indices_dice.get(g, {}) for g in grupos]
+        candidatos: Set[int] = set()
+        for indice in indices:
+            for palabra in presentes:
+                identificadores = indice.get(palabra)
+                if identificadores:
+                    candidatos.update(identificadores)
+
+        # Peso con que aporta cada palabra presente, ya multiplicado por su similitud
+        aportes = {palabra: idf[palabra] * similitud for palabra, similitud in presentes.items()}
+        aporte = aportes.__getitem__
+        claves_presentes = frozenset(presentes)
+        pesos, palabras_nombres = self._pesos, self._palabras
+
+        # Cotas que descartan candidatos sin mirar sus palabras. Cobertura: un
+        # nombre que pesa más que todo lo presente dividido m no llega al mínimo.
+        # Dice: tampoco uno tan liviano que 2*peso/(peso+peso_consulta) < m.
+        if dentro_del_texto:
+            peso_suficiente, peso_maximo = 0.0, sum(aportes.values()) / minimo + 1e-9
+        else:
+            peso_suficiente, peso_maximo = minimo * peso_consulta / (2 - minimo) - 1e-9, math.inf
+        mejores: Dict[Tuple[Hashable, str], Tuple[float, int, str]] = {}
+        for identificador in candidatos:
+            peso = pesos[identificador]
+            if peso < peso_suficiente or peso > peso_maximo:
+                continue
+            comunes = sum(map(aporte, palabras_nombres[identificador] & claves_presentes))
+            if dentro_del_texto:
+                puntaje = comunes / peso
+            else:
+                puntaje = min(1.0, 2 * comunes / (peso + peso_consulta))
+            if puntaje < minimo - 1e-9:
+                continue
+            # Redondeado para que el orden de la suma no rompa los empates
+            puntaje = round(puntaje, DECIMALES_PUNTAJE)
+            posicion, grupo_nombre, clave, nombre = self._nombres[identificador]
+            actual = mejores.get((grupo_nombre, clave))
+            if actual is None or puntaje > actual[0]:
+                mejores[(grupo_nombre, clave)] = (puntaje, posicion, nombre)
+
+        ordenadas = sorted(mejores.items(), key=lambda item: (-item[1][0], item[1][1]))
+        return [
+            Coincidencia(grupo_nombre, clave, nombre, puntaje)
+            for (grupo_nombre, clave), (puntaje, _, nombre) in ordenadas[:limite]
+        ]
+
+    def mejor(self, consulta: str, **opciones) -> Optional[Coincidencia]:
+        """La mejor coincidencia de ``buscar``, o None."""
+        resultado = self.buscar(consulta, limite=1, **opciones)
+        return resultado[0] if resultado else None
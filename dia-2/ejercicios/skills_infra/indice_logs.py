@@ -0,0 +1,342 @@
+"""
+Índice en disco para logs de API
+================================
+
+Construye en una sola pasada un índice disperso timestamp -> byte offset y
+listas de posiciones (posting lists) por nivel y por componente. El índice se
+guarda junto al log (``<log>.idx.json``) y se invalida cuando cambian el
+tamaño o el mtime del archivo.
+
+Las consultas posteriores hacen búsqueda binaria sobre el índice y leen
+directamente las líneas necesarias desde el archivo mapeado en memoria.
+Se asume un log append-only ordenado cronológicamente, como los de API.
+"""
+
+import heapq
+import json
+import mmap
+import os
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+VERSION_INDICE = 1
+
+# Cada cuántas líneas con timestamp se guarda una marca en el índice disperso
+PASO_INDICE = 128
+
+SUFIJO_INDICE = ".idx.json"
+
+PATRON_TIMESTAMP = re.compile(rb"^\s*\[?(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})")
+PATRON_NIVEL = re.compile(rb"\b(ERROR|WARN(?:ING)?|INFO|DEBUG|CRITICAL|FATAL|TRACE)\b", re.IGNORECASE)
+PATRON_COMPONENTE = re.compile(rb"\[([A-Za-z][\w./-]*)\]")
+PATRON_MOMENTO = re.compile(r"^(?:(\d{4}-\d{2}-\d{2})[T ])?(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+
+
+def _timestamp_de_linea(linea: bytes) -> Optional[str]:
+    """Devuelve el timestamp normalizado ('YYYY-MM-DD HH:MM:SS') de una línea, si tiene."""
+    match = PATRON_TIMESTAMP.match(linea)
+    if not match:
+        return None
+    return f"{match.group(1).decode()} {match.group(2).decode()}"
+
+
+def _nivel_de_linea(linea: bytes) -> Optional[str]:
+    match = PATRON_NIVEL.search(linea)
+    if not match:
+        return None
+    nivel = match.group(1).decode().upper()
+    return "WARNING" if nivel == "WARN" else nivel
+
+
+def _componente_de_linea(linea: bytes) -> Optional[str]:
+    match = PATRON_COMPONENTE.search(linea)
+    if not match:
+        return None
+    return match.group(1).decode().lower()
+
+
+class IndiceLogs:
+    """
+    Índice disperso de un archivo de log.
+
+    Attributes:
+        ruta_log: Ruta del archivo de log indexado
+        tamano: Tamaño en bytes del log al momento de indexar
+        mtime_ns: mtime del log al momento de indexar
+        total_lineas: Número de líneas del log
+        marcas_ts: Timestamps de las marcas del índice disperso (ordenados)
+        marcas_offset: Byte offset de cada marca
+        niveles: Offsets de línea por nivel (ERROR, WARNING, ...)
+        componentes: Offsets de línea por componente ([auth], [db], ...)
+    """
+
+    def __init__(self, ruta_log: str):
+        self.ruta_log = ruta_log
+        self.tamano = 0
+        self.mtime_ns = 0
+        self.total_lineas = 0
+        self.primera_fecha: Optional[str] = None
+        self.marcas_ts: List[str] = []
+        self.marcas_offset: List[int] = []
+        self.niveles: Dict[str, List[int]] = {}
+        self.componentes: Dict[str, List[int]] = {}
+
+    # ------------------------------------------------------------------
+    # Construcción y persistencia
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def construir(cls, ruta_log: str) -> "IndiceLogs":
+        """Recorre el log una sola vez y construye el índice."""
+        indice = cls(ruta_log)
+        stat = os.stat(ruta_log)
+        indice.tamano = stat.st_size
+        indice.mtime_ns = stat.st_mtime_ns
+
+        lineas_con_ts = 0
+        offset = 0
+        with open(ruta_log, "rb") as archivo:
+            for linea in archivo:
+                indice.total_lineas += 1
+                ts = _timestamp_de_linea(linea)
+                if ts is not None:
+                    if indice.primera_fecha is None:
+                        indice.primera_fecha = ts[:10]
+                    # Solo se marca si no retrocede respecto de la última marca, para
+                    # que la búsqueda binaria sobre las marcas siga siendo válida
+                    if lineas_con_ts % PASO_INDICE == 0 and (not indice.marcas_ts or ts >= indice.marcas_ts[-1]):
+                        indice.marcas_ts.append(ts)
+                        indice.marcas_offset.append(offset)
+                    lineas_con_ts += 1
+
+                nivel = _nivel_de_linea(linea)
+                if nivel:
+                    indice.niveles.setdefault(nivel, []).append(offset)
+                componente = _componente_de_linea(linea)
+                if componente:
+                    indice.componentes.setdefault(componente, []).append(offset)
+                offset += len(linea)
+
+        return indice
+
+    @staticmethod
+    def ruta_indice(ruta_log: str) -> str:
+        return ruta_log + SUFIJO_INDICE
+
+    def guardar(self) -> str:
+        """Guarda el índice junto al log de forma atómica."""
+        ruta = self.ruta_indice(self.ruta_log)
+        datos = {
+            "version": VERSION_INDICE,
+            "tamano": self.tamano,
+            "mtime_ns": self.mtime_ns,
+            "total_lineas": self.total_lineas,
+            "primera_fecha": self.primera_fecha,
+            "marcas_ts": self.marcas_ts,
+            "marcas_offset": self.marcas_offset,
+            "niveles": self.niveles,
+            "componentes": self.componentes,
+        }
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, separators=(",", ":"))
+        os.replace(temporal, ruta)
+        return ruta
+
+    @classmethod
+    def cargar(cls, ruta_log: str) -> Optional["IndiceLogs"]:
+        """Carga el índice guardado si existe y sigue siendo válido para el log."""
+        ruta = cls.ruta_indice(ruta_log)
+        try:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            return None
+
+        indice = cls(ruta_log)
+        indice.tamano = datos.get("tamano", -1)
+        indice.mtime_ns = datos.get("mtime_ns", -1)
+        if datos.get("version") != VERSION_INDICE or not indice.es_vigente():
+            return None
+
+        indice.total_lineas = datos["total_lineas"]
+        indice.primera_fecha = datos["primera_fecha"]
+        indice.marcas_ts = datos["marcas_ts"]
+        indice.marcas_offset = datos["marcas_offset"]
+        indice.niveles = datos["niveles"]
+        indice.componentes = datos["componentes"]
+        return indice
+
+    def es_vigente(self) -> bool:
+        """True si el log no cambió (mismo tamaño y mtime) desde que se indexó."""
+        try:
+            stat = os.stat(self.ruta_log)
+        except OSError:
+            return False
+        return stat.st_size == self.tamano and stat.st_mtime_ns == self.mtime_ns
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def normalizar_momento(self, texto: str, es_fin: bool = False) -> Optional[str]:
+        """
+        Convierte 'YYYY-MM-DD HH:MM[:SS]' o 'HH:MM[:SS]' al formato del índice.
+
+        Si solo se indica la hora se usa la fecha de la primera entrada del log.
+        Si se omiten los segundos, el fin del rango incluye el minuto completo.
+        """
+        if not texto:
+            return None
+        match = PATRON_MOMENTO.match(texto.strip())
+        if not match:
+            raise ValueError(f"Formato de fecha/hora no reconocido: '{texto}'")
+        fecha, hora, minuto, segundo = match.groups()
+        fecha = fecha or self.primera_fecha or "0000-00-00"
+        if segundo is None:
+            segundo = "59" if es_fin else "00"
+        return f"{fecha} {int(hora):02d}:{minuto}:{segundo}"
+
+    def _rango_offsets(self, desde: Optional[str], hasta: Optional[str]) -> Tuple[int, int]:
+        """Acota por búsqueda binaria el rango de bytes que puede contener [desde, hasta]."""
+        inicio = 0
+        fin = self.tamano
+        if desde:
+            i = bisect_left(self.marcas_ts, desde)
+            if i > 0:
+                inicio = self.marcas_offset[i - 1]
+        if hasta:
+            j = bisect_right(self.marcas_ts, hasta)
+            if j < len(self.marcas_offset):
+                fin = self.marcas_offset[j]
+        return inicio, fin
+
+    def _postings(self, nivel: str, componente: str) -> Optional[List[int]]:
+        """Offsets candidatos según los filtros de nivel/componente (None = sin filtro)."""
+        listas = []
+        if nivel:
+            nivel = nivel.upper()
+            nivel = "WARNING" if nivel == "WARN" else nivel
+            listas.append(self.niveles.get(nivel, []))
+        if componente:
+            componente = componente.lower()
+            if componente in self.componentes:
+                listas.append(self.componentes[componente])
+            else:
+                similares = [v for k, v in self.componentes.items() if componente in k]
+                listas.append(list(heapq.merge(*similares)))
+        if not listas:
+            return None
+        listas.sort(key=len)
+        resultado = listas[0]
+        for otra in listas[1:]:
+            conjunto = set(otra)
+            resultado = [offset for offset in resultado if offset in conjunto]
+        return resultado
+
+    def consultar(
+        self,
+        desde: str = "",
+        hasta: str = "",
+        nivel: str = "",
+        componente: str = "",
+        limite: int = 200,
+    ) -> Dict[str, object]:
+        """
+        Devuelve las líneas que cumplen los filtros leyendo solo lo necesario del log.
+
+        Args:
+            desde: Inicio del rango temporal (inclusive)
+            hasta: Fin del rango temporal (inclusive)
+            nivel: Nivel de log (ERROR, WARNING, INFO, ...)
+            componente: Componente entre corchetes en la línea (auth, db, ...)
+            limite: Máximo de líneas a devolver
+
+        Returns:
+            Diccionario con el total de coincidencias y las primeras líneas
+        """
+        ts_desde = self.normalizar_momento(desde)
+        ts_hasta = self.normalizar_momento(hasta, es_fin=True)
+        inicio, fin = self._rango_offsets(ts_desde, ts_hasta)
+        candidatos = self._postings(nivel, componente)
+
+        coincidencias: List[str] = []
+        total = 0
+        if self.tamano == 0:
+            return {"total": 0, "lineas": coincidencias}
+
+        with open(self.ruta_log, "rb") as archivo, \
+                mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+
+            def leer_linea(offset: int) -> Tuple[bytes, int]:
+                salto = datos.find(b"\n", offset)
+                final = len(datos) if salto == -1 else salto + 1
+                return datos[offset:final], final
+
+            def en_rango(ts: Optional[str]) -> bool:
+                if ts is None:
+                    return not (ts_desde or ts_hasta)
+                if ts_desde and ts < ts_desde:
+                    return False
+                if ts_hasta and ts > ts_hasta:
+                    return False
+                return True
+
+            if candidatos is not None:
+                # Solo se visitan las líneas de las posting lists dentro del rango
+                desde_i = bisect_left(candidatos, inicio)
+                hasta_i = bisect_left(candidatos, fin)
+                for offset in candidatos[desde_i:hasta_i]:
+                    linea, _ = leer_linea(offset)
+                    if en_rango(_timestamp_de_linea(linea)):
+                        total += 1
+                        if len(coincidencias) < limite:
+                            coincidencias.append(linea.decode("utf-8", errors="replace").rstrip())
+            else:
+                # Recorrido secuencial acotado; las líneas sin timestamp
+                # (continuaciones, stack traces) heredan el de la anterior
+                offset = inicio
+                ts_actual = None
+                while offset < fin:
+                    linea, offset = leer_linea(offset)
+                    ts = _timestamp_de_linea(linea)
+                    if ts is not None:
+                        ts_actual = ts
+                        if ts_hasta and ts > ts_hasta:
+                            break
+                    if en_rango(ts_actual):
+                        total += 1
+                        if len(coincidencias) < limite:
+                            coincidencias.append(linea.decode("utf-8", errors="replace").rstrip())
+
+        return {"total": total, "lineas": coincidencias}
+
+
+# Índices ya cargados en este proceso, para no releer el JSON en cada consulta
+_INDICES_EN_MEMORIA: Dict[str, IndiceLogs] = {}
+
+
+def obtener_indice(ruta_log: str) -> Tuple[IndiceLogs, bool]:
+    """
+    Devuelve el índice vigente del log, construyéndolo solo si hace falta.
+
+    Returns:
+        Tupla (indice, reconstruido) donde reconstruido indica si hubo que recorrer el log
+    """
+    ruta_log = os.path.abspath(ruta_log)
+    indice = _INDICES_EN_MEMORIA.get(ruta_log)
+    if indice is not None and indice.es_vigente():
+        return indice, False
+
+    indice = IndiceLogs.cargar(ruta_log)
+    reconstruido = indice is None
+    if reconstruido:
+        indice = IndiceLogs.construir(ruta_log)
+        try:
+            indice.guardar()
+        except OSError:
+            pass  # Directorio de solo lectura: el índice en memoria sigue sirviendo
+
+    _INDICES_EN_MEMORIA[ruta_log] = indice
+    return indice, reconstruido
@@ -0,0 +1,274 @@
+"""
+Índice de tags con bitsets
+==========================
+
+``get_skills_by_tag()`` recorre todo el registry por cada tag, y combinar tags
+(geometría Y 2d, pero NO 3d) obliga a filtrar a mano. ``IndiceTags`` asigna a
+cada skill un bit y guarda por tag un entero con los bits de sus skills: una
+expresión booleana de tags se resuelve con ``&``, ``|`` y ``~`` sobre esos
+enteros, sin recorrer el registry.
+
+``SkillManagerConTags`` es un SkillManager que mantiene el índice al registrar,
+quitar o actualizar skills (incluido ``from_folder()``, que registra con
+``register_tool``):
+
+    sm = SkillManagerConTags()
+    sm.load_skills.from_folder("skills/webapp")
+    sm.filtrar_por_tags("debugging and (javascript or html) and not performance")
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from instantneo.skills import SkillManager
+
+_RE_SIMBOLOS = re.compile(r"[()]|[^\s()]+")
+_OPERADORES = {"and", "or", "not"}
+# Posiciones libres toleradas, además de una por cada clave indexada, antes de renumerar
+POSICIONES_LIBRES_MAXIMAS = 64
+
+
+# Byte -> posiciones de sus bits en 1
+_BITS_POR_BYTE = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _bits(bitset: int) -> List[int]:
+    """Posiciones de los bits en 1, de menor a mayor."""
+    # Aislar el bit menor con b & -b copia el entero completo en cada paso. Con
+    # pocos bits en 1, find() sobre el texto binario salta los ceros en C; con
+    # muchos conviene recorrer los bytes con una tabla
+    binario = bin(bitset)[:1:-1]
+    if binario.count("1") * 8 > len(binario):
+        posiciones: List[int] = []
+        for indice, byte in enumerate(bitset.to_bytes(len(binario) // 8 + 1, "little")):
+            if byte:
+                base = indice * 8
+                posiciones.extend([base + bit for bit in _BITS_POR_BYTE[byte]])
+        return posiciones
+    posiciones = []
+    posicion = binario.find("1")
+    while posicion >= 0:
+        posiciones.append(posicion)
+        posicion = binario.find("1", posicion + 1)
+    return posiciones
+
+
+class IndiceTags:
+    """
+    Bitset por tag sobre un conjunto de claves (las del registry del SkillManager).
+
+    Cada clave nueva recibe la posición siguiente, así que los resultados salen
+    en orden de registro. Las posiciones de claves quitadas quedan libres hasta
+    que son mayoría; entonces se renumeran las claves restantes.
+    """
+
+    def __init__(self):
+        self._posiciones: Dict[str, int] = {}
+        self._claves: List[Optional[str]] = []
+        self._tags_de: Dict[str, frozenset] = {}
+        self._por_tag: Dict[str, int] = {}
+        self._todas = 0
+
+    def __len__(self) -> int:
+        return len(self._posiciones)
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._posiciones
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(tag for tag, bitset in self._por_tag.items() if bitset)
+
+    def agregar(self, clave: str, tags: Iterable[str]) -> None:
+        """Indexa la clave con sus tags; si ya estaba, reemplaza sus tags y conserva su posición."""
+        tags = frozenset(tags)
+        posicion = self._posiciones.get(clave)
+        if posicion is None:
+            posicion = self._posiciones[clave] = len(self._claves)
+            self._claves.append(clave)
+        else:
+            self._apagar(posicion, self._tags_de[clave])
+        bit = 1 << posicion
+        self._tags_de[clave] = tags
+        for tag in tags:
+            self._por_tag[tag] = self._por_tag.get(tag, 0) | bit
+        self._todas |= bit
+
+    def _apagar(self, posicion: int, tags: Iterable[str]) -> None:
+        mascara = ~(1 << posicion)
+        for tag in tags:
+            self._por_tag[tag] &= mascara
+        self._todas &= mascara
+
+    def quitar(self, clave: str) -> bool:
+        posicion = self._posiciones.pop(clave, None)
+        if posicion is None:
+            return False
+        self._apagar(posicion, self._tags_de.pop(clave))
+        self._claves[posicion] = None
+        # Con muchas posiciones libres los bitsets crecen sin necesidad: se renumera
+        if len(self._claves) > 2 * len(self._posiciones) + POSICIONES_LIBRES_MAXIMAS:
+            self._compactar()
+        return True
+
+    def _compactar(self) -> None:
+        tags_de = self._tags_de
+        self.limpiar()
+        for clave, tags in tags_de.items():
+            self.agregar(clave, tags)
+
+    def limpiar(self) -> None:
+        self.__init__()
+
+    def bitset_tag(self, tag: str) -> int:
+        return self._por_tag.get(tag, 0)
+
+    def bitset(self, expresion: str) -> int:
+        """
+        Resuelve una expresión de tags a un bitset de claves.
+
+        La expresión combina tags con ``and``, ``or``, ``not`` y paréntesis
+        (``not`` liga más que ``and``, que liga más que ``or``). Los operadores
+        no distinguen mayúsculas; los tags sí. Un tag sin skills es el conjunto vacío.
+
+        Raises:
+            ValueError: Si la expresión está mal formada
+        """
+        simbolos = _RE_SIMBOLOS.findall(expresion)
+        if not simbolos:
+            raise ValueError("Expresión de tags vacía")
+        posicion = 0
+
+        def siguiente() -> Optional[str]:
+            return simbolos[posicion] if posicion < len(simbolos) else None
+
+        def operador() -> Optional[str]:
+            simbolo = siguiente()
+            return simbolo.lower() if simbolo is not None and simbolo.lower() in _OPERADORES else None
+
+        def disyuncion() -> int:
+            nonlocal posicion
+            resultado = conjuncion()
+            while operador() == "or":
+                posicion += 1
+                resultado |= conjuncion()
+            return resultado
+
+        def conjuncion() -> int:
+            nonlocal posicion
+            resultado = negacion()
+            while operador() == "and":
+                posicion += 1
+                resultado &= negacion()
+            return resultado
+
+        def negacion() -> int:
+            nonlocal posicion
+            simbolo = siguiente()
+            if simbolo is None:
+                raise ValueError(f"Expresión de tags incompleta: {expresion!r}")
+            if operador() == "not":
+                posicion += 1
+                return self._todas & ~negacion()
+            if operador() is not None:
+                raise ValueError(f"Falta un tag antes de '{simbolo}' en {expresion!r}")
+            posicion += 1
+            if simbolo == "(":
+                resultado = disyuncion()
+                if siguiente() != ")":
+                    raise ValueError(f"Falta ')' en {expresion!r}")
+                posicion += 1
+                return resultado
+            if simbolo == ")":
+                raise ValueError(f"')' sin abrir en {expresion!r}")
+            return self.bitset_tag(simbolo)
+
+        resultado = disyuncion()
+        if posicion != len(simbolos):
+            raise ValueError(f"Sobra '{simbolos[posicion]}' en {expresion!r}")
+        return resultado
+
+    def claves(self, expresion: Union[str, int]) -> List[str]:
+        """Claves que cumplen la expresión (o que están en el bitset), en orden de registro."""
+        bitset = self.bitset(expresion) if isinstance(expresion, str) else expresion
+        return [self._claves[posicion] for posicion in _bits(bitset)]
+
+
+class SkillManagerConTags(SkillManager):
+    """
+    SkillManager con un ``IndiceTags`` (``self.indice_tags``) siempre al día
+    con el registry.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.indice_tags = IndiceTags()
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _tags(funcion: Callable) -> List[str]:
+        metadata = getattr(funcion, "tool_metadata", None) or getattr(funcion, "skill_metadata", None) or {}
+        return metadata.get("tags") or []
+
+    def register_tool(self, func) -> None:
+        super().register_tool(func)
+        self.indice_tags.agregar(f"{func.__module__}.{func.__name__}", self._tags(func))
+
+    def remove_tool(self, name: str, module: Optional[str] = None) -> bool:
+        candidatas = {f"{funcion.__module__}.{name}" for funcion in self.registry_by_name.get(name, ())}
+        if module:
+            candidatas.add(f"{module}.{name}")
+        quitada = super().remove_tool(name, module)
+        for clave in candidatas:
+            if clave not in self.registry:
+                self.indice_tags.quitar(clave)
+        return quitada
+
+    def clear_registry(self) -> None:
+        super().clear_registry()
+        self.indice_tags.limpiar()
+
+    def update_tool_metadata(self, key: str, new_metadata: Dict) -> bool:
+        actualizada = super().update_tool_metadata(key, new_metadata)
+        if actualizada:
+            self.indice_tags.agregar(key, self._tags(self.registry[key]))
+        return actualizada
+
+    def deactivate(self, name: str) -> bool:
+        # La clase base quita del registry las skills de la activación sin pasar por remove_tool
+        registro = self._active_items.get(name)
+        candidatas = list(registro.tool_registry_keys) if registro is not None else []
+        desactivado = super().deactivate(name)
+        for clave in candidatas:
+            if clave not in self.registry:
+                self.indice_tags.quitar(clave)
+        return desactivado
+
+    def get_tools_by_tag(self, tag: str, return_keys: bool = False) -> Union[List[str], Dict]:
+        """Como en SkillManager, pero resuelto con el índice en lugar de recorrer el registry."""
+        return self._resultado(self.indice_tags.claves(self.indice_tags.bitset_tag(tag)), return_keys)
+
+    def filtrar_por_tags(self, expresion: str, return_keys: bool = False) -> Union[List[str], Dict]:
+        """
+        Skills que cumplen una expresión de tags, por ejemplo
+        ``"geometry and 2d"`` o ``"(math or text) and not algebra"``.
+
+        Returns:
+            Nombres en orden de registro, o clave -> función si ``return_keys``
+
+        Raises:
+            ValueError: Si la expresión está mal formada
+        """
+        return self._resultado(self.indice_tags.claves(expresion), return_keys)
+
+    def _resultado(self, claves: List[str], return_keys: bool) -> Union[List[str], Dict]:
+        # Por si el registry se modificó sin pasar por los métodos de esta clase
+        claves = [clave for clave in claves if clave in self.registry]
+        if return_keys:
+            return {clave: self.registry[clave] for clave in claves}
+        # La clave es "modulo.nombre"; los duplicados de nombre aparecen una vez
+        return list(dict.fromkeys(clave.rpartition(".")[2] for clave in claves))
+
+    # Los alias de SkillManager apuntan a los métodos de la clase base
+    remove_skill = remove_tool
+    update_skill_metadata = update_tool_metadata
+    get_skills_by_tag = get_tools_by_tag
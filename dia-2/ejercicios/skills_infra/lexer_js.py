@@ -0,0 +1,297 @@
+"""
+Lexer JavaScript de una sola pasada
+===================================
+
+Tokeniza código JavaScript saltando strings, template literals, regex y
+comentarios, y junta en ese único recorrido los hallazgos de la skill
+``analizar_codigo_javascript``, cada uno con sus números de línea:
+
+- var: declaraciones con ``var``
+- console_log: llamadas a ``console.log(``
+- igualdad_debil: comparaciones con ``==``
+- funciones_anonimas: ``function (`` sin nombre
+- catch_vacio: bloques ``catch`` sin contenido
+- eval: llamadas a ``eval(``
+
+El código se puede consumir por bloques, así que un bundle de varios MB no
+necesita estar entero en memoria:
+
+    analizador = AnalizadorJS()
+    for bloque in bloques:
+        analizador.feed(bloque)
+    analizador.close()
+    print(analizador.conteos, analizador.lineas["igualdad_debil"])
+"""
+
+import re
+from typing import Dict, List
+
+# Tamaño de bloque al leer archivos
+TAMANO_BLOQUE = 64 * 1024
+
+# Líneas que se guardan por tipo de hallazgo; el resto solo se cuenta
+MAX_LINEAS_POR_HALLAZGO = 50
+
+HALLAZGOS = ("var", "console_log", "igualdad_debil", "funciones_anonimas", "catch_vacio", "eval")
+
+# Después de estas palabras una "/" abre un regex, no una división
+_PALABRAS_ANTES_DE_EXPRESION = frozenset({
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+})
+
+_PUNTUACION_TRAMO = ".,;:?<>+-%&|^~[]"
+
+# Palabras que los hallazgos o la detección de regex necesitan ver como token propio
+_PALABRAS_CLAVE = _PALABRAS_ANTES_DE_EXPRESION | {"var", "function", "eval", "catch", "console", "log"}
+
+_RE_CODIGO = re.compile(r"""
+    (?P<simple>[(){};,])
+    # Tramo de identificadores, números y puntuación que no dispara ningún
+    # hallazgo: se consume de una vez y de él solo importa el último carácter
+  | (?P<tramo>(?:
+        (?!(?:""" + "|".join(sorted(_PALABRAS_CLAVE)) + r""")(?![\w$\u0080-\uffff]))
+        [A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*
+      | \d[\w.]*
+      | [""" + re.escape(_PUNTUACION_TRAMO) + r"""]
+    )+)
+  | (?P<espacio>\s+)
+  | (?P<comentario>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<cadena>"(?:[^"\\\n]+|\\[\s\S])*"?|'(?:[^'\\\n]+|\\[\s\S])*'?)
+  | (?P<plantilla>`)
+  | (?P<id>[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*)
+  | (?P<numero>\.?\d[\w.]*)
+  | (?P<barra>/)
+  | (?P<puntuacion>===|!==|==|!=|=>|\?\.|\?\?|&&|\|\||\+\+|--|\*\*|\.\.\.|[^\s\w])
+""", re.VERBOSE)
+
+# Grupos de _RE_CODIGO que se tratan como otro tipo de token
+_TIPO_TOKEN = {"simple": "puntuacion", "barra": "puntuacion", "cadena": "valor", "numero": "valor"}
+
+# Cuerpo de un template literal hasta el cierre, una sustitución ${ o el fin del texto
+_RE_PLANTILLA = re.compile(r"(?:[^`\\$]+|\\[\s\S]|\$(?!\{))*(`|\$\{)?")
+
+_RE_REGEX = re.compile(r"/(?:[^/\\\[\n]+|\\.|\[(?:[^\]\\\n]+|\\.)*\])+/[A-Za-z]*")
+
+
+class AnalizadorJS:
+    """
+    Lexer incremental que acumula hallazgos sobre código JavaScript.
+
+    Attributes:
+        conteos: Hallazgo -> cantidad de apariciones
+        lineas: Hallazgo -> primeras líneas donde aparece
+        lineas_totales: Líneas de código leídas
+        sangria_maxima: Mayor indentación (en caracteres) de una línea de código
+        linea_sangria_maxima: Línea con la mayor indentación
+    """
+
+    def __init__(self):
+        self.conteos: Dict[str, int] = {hallazgo: 0 for hallazgo in HALLAZGOS}
+        self.lineas: Dict[str, List[int]] = {hallazgo: [] for hallazgo in HALLAZGOS}
+        self.lineas_totales = 1
+        self.sangria_maxima = 0
+        self.linea_sangria_maxima = 0
+
+        self._buffer = ""
+        self._en_plantilla = False
+        # Profundidad de llaves en la que se abrió cada sustitución ${ pendiente
+        self._sustituciones: List[int] = []
+        self._llaves = 0
+        # Últimos tres tokens significativos como (valor, tipo)
+        self._previos = [("", ""), ("", ""), ("", "")]
+        self._al_inicio_de_linea = True
+        self._sangria = 0
+        # Seguimiento de catch: estado, línea, paréntesis abiertos y si hubo comentario
+        self._catch = None
+        self._linea_catch = 0
+        self._parentesis_catch = 0
+        self._comentario_en_catch = False
+        self._cerrado = False
+
+    def feed(self, texto: str) -> None:
+        """Agrega un bloque de código y procesa todo lo que ya es seguro tokenizar."""
+        self._buffer += texto
+        self._procesar(final=False)
+
+    def close(self) -> None:
+        """Procesa lo que quedó pendiente al final del código."""
+        if not self._cerrado:
+            self._procesar(final=True)
+            self._cerrado = True
+
+    def _registrar(self, hallazgo: str, linea: int) -> None:
+        self.conteos[hallazgo] += 1
+        if len(self.lineas[hallazgo]) < MAX_LINEAS_POR_HALLAZGO:
+            self.lineas[hallazgo].append(linea)
+
+    def _procesar(self, final: bool) -> None:
+        # Bucle caliente: el estado se copia a variables locales y se guarda al salir
+        texto = self._buffer
+        fin = len(texto)
+        pos = 0
+        linea = self.lineas_totales
+        llaves = self._llaves
+        sustituciones = self._sustituciones
+        en_plantilla = self._en_plantilla
+        (valor_3, _), (valor_2, _), (valor_1, tipo_1) = self._previos
+        match_codigo = _RE_CODIGO.match
+        registrar = self._registrar
+
+        while pos < fin:
+            if en_plantilla:
+                m = _RE_PLANTILLA.match(texto, pos)
+                cierre = m.group(1)
+                if cierre is None and not final:
+                    break  # El template sigue en el próximo bloque
+                linea += texto.count("\n", pos, m.end())
+                pos = m.end()
+                if cierre is None:
+                    continue
+                en_plantilla = False
+                self._al_inicio_de_linea = False
+                if cierre == "${":
+                    sustituciones.append(llaves)
+                    valor, tipo = "${", "puntuacion"
+                else:
+                    valor, tipo = "`", "valor"
+            else:
+                m = match_codigo(texto, pos)
+                if m.end() == fin and not final:
+                    break  # El token podría continuar en el próximo bloque
+                tipo = m.lastgroup
+                valor = m.group()
+
+                if tipo == "espacio":
+                    saltos = valor.count("\n")
+                    if saltos:
+                        self._al_inicio_de_linea = True
+                        self._sangria = len(valor) - valor.rfind("\n") - 1
+                        linea += saltos
+                    elif self._al_inicio_de_linea:
+                        self._sangria += len(valor)
+                    pos += len(valor)
+                    continue
+
+                if tipo == "barra" and (
+                    valor_1 in _PALABRAS_ANTES_DE_EXPRESION if tipo_1 == "id"
+                    else valor_1 not in (")", "]", "}") if tipo_1 == "puntuacion"
+                    else tipo_1 == ""
+                ):
+                    regex = _RE_REGEX.match(texto, pos)
+                    if regex is None:
+                        if not final and texto.find("\n", pos) == -1:
+                            break
+                    elif regex.end() == fin and not final:
+                        break
+                    else:
+                        tipo, valor = "valor", regex.group()
+
+                if self._al_inicio_de_linea:
+                    self._medir_sangria(linea)
+                pos += len(valor)
+
+                if tipo == "comentario":
+                    if self._catch == "cuerpo":
+                        self._comentario_en_catch = True
+                    linea += valor.count("\n")
+                    continue
+                if tipo == "tramo":
+                    if valor_1 == "var" and tipo_1 == "id" and valor_2 != "." and valor[0] not in _PUNTUACION_TRAMO:
+                        registrar("var", linea)
+                    if self._catch is not None:
+                        self._seguir_catch(valor, tipo, valor_1, linea)
+                    # Un tramo de varios tokens no deja contexto para los hallazgos,
+                    # solo su último carácter para decidir entre regex y división
+                    if len(valor) == 1:
+                        valor_3, valor_2 = valor_2, valor_1
+                    else:
+                        valor_3 = valor_2 = ""
+                    if valor[-1] in _PUNTUACION_TRAMO:
+                        valor_1, tipo_1 = valor[-1], "puntuacion"
+                    else:
+                        valor_1, tipo_1 = "", "valor"
+                    continue
+                if tipo == "plantilla":
+                    en_plantilla = True
+                    continue
+                tipo = _TIPO_TOKEN.get(tipo, tipo)
+
+                if tipo == "puntuacion":
+                    if valor == "{":
+                        llaves += 1
+                    elif valor == "}":
+                        if sustituciones and sustituciones[-1] == llaves:
+                            # Cierra una sustitución ${...}: el template continúa
+                            sustituciones.pop()
+                            en_plantilla = True
+                        else:
+                            llaves -= 1
+                    elif valor == "==":
+                        registrar("igualdad_debil", linea)
+                    elif valor == "(":
+                        if valor_1 == "function" or (valor_1 == "*" and valor_2 == "function"):
+                            registrar("funciones_anonimas", linea)
+                        elif valor_1 == "eval" and tipo_1 == "id" and valor_2 != ".":
+                            registrar("eval", linea)
+                        elif valor_1 == "log" and valor_2 == "." and valor_3 == "console":
+                            registrar("console_log", linea)
+                elif tipo == "id" and valor_1 == "var" and tipo_1 == "id" and valor_2 != ".":
+                    registrar("var", linea)
+
+            if self._catch is not None or valor == "catch":
+                self._seguir_catch(valor, tipo, valor_1, linea)
+            valor_3, valor_2, valor_1, tipo_1 = valor_2, valor_1, valor, tipo
+
+        self._buffer = texto[pos:]
+        self.lineas_totales = linea
+        self._llaves = llaves
+        self._en_plantilla = en_plantilla
+        self._previos = [(valor_3, ""), (valor_2, ""), (valor_1, tipo_1)]
+
+    def _medir_sangria(self, linea: int) -> None:
+        if self._sangria > self.sangria_maxima:
+            self.sangria_maxima = self._sangria
+            self.linea_sangria_maxima = linea
+        self._al_inicio_de_linea = False
+        self._sangria = 0
+
+    def _seguir_catch(self, valor: str, tipo: str, valor_1: str, linea: int) -> None:
+        estado = self._catch
+        self._catch = None
+        if estado == "cuerpo":
+            if valor == "}" and not self._comentario_en_catch:
+                self._registrar("catch_vacio", self._linea_catch)
+        elif estado == "catch":
+            if valor == "(":
+                self._catch, self._parentesis_catch = "parametros", 1
+            elif valor == "{":
+                self._catch, self._comentario_en_catch = "cuerpo", False
+        elif estado == "parametros":
+            self._parentesis_catch += {"(": 1, ")": -1}.get(valor, 0)
+            self._catch = "parametros" if self._parentesis_catch else "bloque"
+        elif estado == "bloque" and valor == "{":
+            self._catch, self._comentario_en_catch = "cuerpo", False
+
+        if tipo == "id" and valor == "catch" and valor_1 != ".":
+            # .catch() de una Promise no es un bloque catch
+            self._catch, self._linea_catch = "catch", linea
+
+
+def analizar_archivo(ruta: str, tamano_bloque: int = TAMANO_BLOQUE) -> AnalizadorJS:
+    """
+    Analiza un archivo JavaScript leyéndolo por bloques.
+
+    Args:
+        ruta: Archivo a analizar
+        tamano_bloque: Caracteres por bloque
+
+    Returns:
+        AnalizadorJS ya cerrado
+    """
+    analizador = AnalizadorJS()
+    with open(ruta, "r", encoding="utf-8", errors="replace") as f:
+        for bloque in iter(lambda: f.read(tamano_bloque), ""):
+            analizador.feed(bloque)
+    analizador.close()
+    return analizador
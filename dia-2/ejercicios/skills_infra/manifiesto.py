@@ -0,0 +1,201 @@
+"""
+Manifiesto de skills para carga perezosa
+========================================
+
+``load_skills.from_folder()`` importa todos los módulos de la carpeta solo para
+encontrar las funciones con ``@skill``, y con ellos todo lo que importan y arman
+al cargarse. El manifiesto guarda, generado una vez fuera de línea, lo que el
+SkillManager necesita para ofrecer cada skill al modelo (nombre, descripción,
+tags, esquema de parámetros) y el archivo donde está:
+
+    python -m skills_infra.manifiesto skills/mobile      # escribe skills/mobile/skills.manifiesto.json
+
+    registrar_desde_manifiesto(agente.skill_manager, "skills/mobile")
+
+Cada skill se registra como un proxy liviano con la misma metadata; el módulo
+real se importa en la primera llamada a alguna de sus skills (una sola vez por
+archivo). Si el archivo cambió desde que se generó el manifiesto se emite un
+warning: la metadata que vio el modelo puede no coincidir con la función.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import warnings
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ARCHIVO_MANIFIESTO = "skills.manifiesto.json"
+VERSION_MANIFIESTO = 1
+
+# Ruta absoluta del archivo -> módulo ya importado por algún proxy
+_modulos: Dict[str, ModuleType] = {}
+_candado = threading.Lock()
+
+
+def _hash_archivo(ruta: str) -> str:
+    with open(ruta, "rb") as archivo:
+        return hashlib.sha256(archivo.read()).hexdigest()
+
+
+def _importar(ruta: str) -> ModuleType:
+    """Importa un archivo de skills igual que from_folder(): por ruta, con su nombre base."""
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    finally:
+        del sys.modules[nombre]
+    return modulo
+
+
+def _skills_del_modulo(modulo: ModuleType) -> Dict[str, Callable]:
+    """Funciones con ``@skill`` definidas en el módulo (no las que importa de otro)."""
+    return {
+        nombre: atributo for nombre, atributo in vars(modulo).items()
+        if callable(atributo) and hasattr(atributo, "tool_metadata") and atributo.__module__ == modulo.__name__
+    }
+
+
+def archivos_de_skills(carpeta: str) -> List[str]:
+    """Archivos .py de la carpeta que pueden tener skills (sin los test_*.py), ordenados."""
+    return [
+        nombre for nombre in sorted(os.listdir(carpeta))
+        if nombre.endswith(".py") and not nombre.startswith("test_")
+    ]
+
+
+def describir_archivo(ruta: str) -> Tuple[List[Callable], List[Dict[str, Any]]]:
+    """
+    Importa un archivo de skills.
+
+    Returns:
+        Sus skills (por nombre) y la entrada de manifiesto de cada una
+    """
+    sha256 = _hash_archivo(ruta)
+    skills = [funcion for _, funcion in sorted(_skills_del_modulo(_importar(ruta)).items())]
+    entradas = [
+        {
+            "nombre": funcion.__name__,
+            "archivo": os.path.basename(ruta),
+            "sha256": sha256,
+            "metadata": funcion.tool_metadata,
+        }
+        for funcion in skills
+    ]
+    return skills, entradas
+
+
+def generar_manifiesto(carpeta: str, destino: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Importa cada archivo .py de la carpeta y escribe el manifiesto de sus skills.
+
+    A diferencia de from_folder(), un archivo que no se puede importar corta la
+    generación en lugar de quedar fuera del manifiesto sin aviso.
+
+    Args:
+        carpeta: Carpeta de skills (por ejemplo skills/api o skills_biblioteca/basicas)
+        destino: Ruta del manifiesto; por defecto ``<carpeta>/skills.manifiesto.json``
+
+    Returns:
+        El manifiesto escrito
+    """
+    skills = []
+    for nombre_archivo in archivos_de_skills(carpeta):
+        skills.extend(describir_archivo(os.path.join(carpeta, nombre_archivo))[1])
+
+    manifiesto = {"version": VERSION_MANIFIESTO, "skills": skills}
+    with open(destino or os.path.join(carpeta, ARCHIVO_MANIFIESTO), "w", encoding="utf-8") as archivo:
+        json.dump(manifiesto, archivo, ensure_ascii=False, indent=2)
+    return manifiesto
+
+
+def cargar_manifiesto(ruta: str) -> Dict[str, Any]:
+    """
+    Raises:
+        ValueError: Si el archivo no es un manifiesto de esta versión
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        manifiesto = json.load(archivo)
+    if not isinstance(manifiesto, dict) or manifiesto.get("version") != VERSION_MANIFIESTO:
+        raise ValueError(f"{ruta} no es un manifiesto de skills versión {VERSION_MANIFIESTO}")
+    return manifiesto
+
+
+def cargar_skill(carpeta: str, archivo: str, nombre: str, sha256: str) -> Callable:
+    """
+    Skill real ``nombre`` de ``carpeta/archivo``. El módulo se importa una sola
+    vez por proceso; si su hash no es ``sha256`` se emite un warning.
+
+    Raises:
+        RuntimeError: Si el archivo ya no define la skill
+    """
+    ruta = os.path.abspath(os.path.join(carpeta, archivo))
+    with _candado:
+        modulo = _modulos.get(ruta)
+        if modulo is None:
+            if _hash_archivo(ruta) != sha256:
+                warnings.warn(f"{archivo} cambió desde que se generó el manifiesto de {carpeta}")
+            modulo = _modulos[ruta] = _importar(ruta)
+    funcion = _skills_del_modulo(modulo).get(nombre)
+    if funcion is None:
+        raise RuntimeError(f"{archivo} ya no define la skill '{nombre}': regenerar el manifiesto")
+    return funcion
+
+
+def crear_proxy(carpeta: str, entrada: Dict[str, Any]) -> Callable:
+    """
+    Función con la metadata de la skill que importa el módulo real al llamarla.
+
+    El proxy expone ``cargar()``, que devuelve la skill real (importándola si
+    hace falta), y ``ruta_archivo``, el archivo que la define.
+    """
+    nombre = entrada["nombre"]
+    real: List[Callable] = []
+
+    def cargar() -> Callable:
+        if not real:
+            real.append(cargar_skill(carpeta, entrada["archivo"], nombre, entrada["sha256"]))
+        return real[0]
+
+    def proxy(*args, **kwargs):
+        return cargar()(*args, **kwargs)
+
+    proxy.__name__ = proxy.__qualname__ = nombre
+    proxy.__module__ = os.path.splitext(entrada["archivo"])[0]
+    proxy.__doc__ = entrada["metadata"].get("description")
+    proxy.tool_metadata = proxy.skill_metadata = entrada["metadata"]
+    proxy.cargar = cargar
+    proxy.ruta_archivo = os.path.abspath(os.path.join(carpeta, entrada["archivo"]))
+    return proxy
+
+
+def registrar_desde_manifiesto(manager, carpeta: str, ruta_manifiesto: Optional[str] = None) -> List[str]:
+    """
+    Registra en el manager un proxy por cada skill del manifiesto, sin importar nada.
+
+    Args:
+        manager: SkillManager (por ejemplo ``agente.skill_manager``)
+        carpeta: Carpeta de skills desde la que se generó el manifiesto
+        ruta_manifiesto: Por defecto ``<carpeta>/skills.manifiesto.json``
+
+    Returns:
+        Nombres de las skills registradas
+    """
+    manifiesto = cargar_manifiesto(ruta_manifiesto or os.path.join(carpeta, ARCHIVO_MANIFIESTO))
+    nombres = []
+    for entrada in manifiesto["skills"]:
+        manager.register_tool(crear_proxy(carpeta, entrada))
+        nombres.append(entrada["nombre"])
+    return nombres
+
+
+if __name__ == "__main__":
+    for carpeta_skills in sys.argv[1:]:
+        generado = generar_manifiesto(carpeta_skills)
+        print(f"{os.path.join(carpeta_skills, ARCHIVO_MANIFIESTO)}: {len(generado['skills'])} skills")
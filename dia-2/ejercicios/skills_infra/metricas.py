@@ -0,0 +1,270 @@
+"""
+Métricas por skill
+==================
+
+``get_last_call()`` solo guarda la última llamada de cada skill: no dice
+cuántas veces se llamó, cuántas falló ni cuánto tiempo se lleva. Un
+``SkillManagerConMetricas`` envuelve cada skill al registrarla y acumula por
+skill (clave "modulo.nombre") la cantidad de llamadas, los errores por tipo de
+excepción y un histograma de latencias con límites fijos log-lineales: del 1
+al 9 en cada potencia de diez, de 10 µs a 100 s.
+
+    sm = SkillManagerConMetricas()
+    sm.load_skills.from_folder("skills/api")
+    agente = InstantNeo(..., skills=sm)
+    ...
+    sm.metricas.exportar_prometheus()   # formato de texto de Prometheus
+    sm.metricas.snapshot_json()         # skills ordenadas por tiempo total
+
+Las métricas sobreviven a ``remove_tool()`` y ``clear_registry()`` hasta
+``metricas.reiniciar()``, como los contadores de Prometheus.
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional
+
+from instantneo.skills import SkillManager
+
+# 1e-05, 2e-05, ..., 9e-05, 0.0001, ..., 9.0, 10.0, ..., 90.0, 100.0
+LIMITES_SEGUNDOS = tuple(
+    float(f"{mantisa}e{exponente}") for exponente in range(-5, 2) for mantisa in range(1, 10)
+) + (100.0,)
+
+
+class MetricasSkill:
+    """
+    Contadores de una skill. ``buckets[i]`` cuenta las llamadas que duraron
+    hasta ``LIMITES_SEGUNDOS[i]`` (y más que el límite anterior); el último,
+    las que duraron más de 100 s.
+    """
+
+    __slots__ = ("clave", "llamadas", "errores", "segundos", "buckets", "_lock")
+
+    def __init__(self, clave: str):
+        self.clave = clave
+        self.llamadas = 0
+        self.errores: Dict[str, int] = {}
+        self.segundos = 0.0
+        self.buckets = [0] * (len(LIMITES_SEGUNDOS) + 1)
+        self._lock = threading.Lock()
+
+    @property
+    def nombre(self) -> str:
+        return self.clave.rpartition(".")[2]
+
+    @property
+    def modulo(self) -> str:
+        return self.clave.rpartition(".")[0]
+
+    def registrar(self, duracion: float, error: Optional[str] = None) -> None:
+        indice = bisect_left(LIMITES_SEGUNDOS, duracion)
+        with self._lock:
+            self.llamadas += 1
+            self.segundos += duracion
+            self.buckets[indice] += 1
+            if error is not None:
+                self.errores[error] = self.errores.get(error, 0) + 1
+
+    def percentil(self, proporcion: float) -> Optional[float]:
+        """
+        Cota superior de la latencia del percentil (``0.99`` para p99): el
+        límite del bucket donde cae. ``None`` sin llamadas; ``inf`` si cae en
+        el bucket de más de 100 s.
+        """
+        if not self.llamadas:
+            return None
+        objetivo = proporcion * self.llamadas
+        acumuladas = 0
+        for indice, cantidad in enumerate(self.buckets):
+            acumuladas += cantidad
+            if cantidad and acumuladas >= objetivo:
+                return LIMITES_SEGUNDOS[indice] if indice < len(LIMITES_SEGUNDOS) else float("inf")
+        return float("inf")
+
+    def copiar(self) -> "MetricasSkill":
+        """Copia consistente de los contadores, para exportar sin frenar las llamadas."""
+        copia = MetricasSkill(self.clave)
+        with self._lock:
+            copia.llamadas = self.llamadas
+            copia.errores = dict(self.errores)
+            copia.segundos = self.segundos
+            copia.buckets = list(self.buckets)
+        return copia
+
+
+def _escapar_etiqueta(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricasSkills:
+    """Las ``MetricasSkill`` de un SkillManager, por clave "modulo.nombre"."""
+
+    def __init__(self):
+        self._por_clave: Dict[str, MetricasSkill] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._por_clave)
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._por_clave
+
+    def __getitem__(self, clave: str) -> MetricasSkill:
+        return self._por_clave[clave]
+
+    def de(self, clave: str) -> MetricasSkill:
+        """Las métricas de la clave, creándolas si no existen."""
+        metricas = self._por_clave.get(clave)
+        if metricas is None:
+            with self._lock:
+                metricas = self._por_clave.setdefault(clave, MetricasSkill(clave))
+        return metricas
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            self._por_clave = {}
+
+    def copias(self) -> List[MetricasSkill]:
+        """Copia de las métricas de cada skill, de la que más tiempo lleva a la que menos."""
+        copias = [metricas.copiar() for metricas in list(self._por_clave.values())]
+        return sorted(copias, key=lambda metricas: (-metricas.segundos, metricas.clave))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict serializable con los límites del histograma y, por skill, de
+            la que más tiempo lleva a la que menos: llamadas, errores por tipo,
+            segundos totales, proporción del tiempo total, p50, p99 y buckets
+        """
+        copias = self.copias()
+        total = sum(metricas.segundos for metricas in copias)
+        return {
+            "limites_segundos": list(LIMITES_SEGUNDOS),
+            "segundos_total": total,
+            "skills": [
+                {
+                    "clave": metricas.clave,
+                    "skill": metricas.nombre,
+                    "modulo": metricas.modulo,
+                    "llamadas": metricas.llamadas,
+                    "errores": metricas.errores,
+                    "segundos": metricas.segundos,
+                    "proporcion_del_tiempo": metricas.segundos / total if total else 0.0,
+                    "p50": metricas.percentil(0.5),
+                    "p99": metricas.percentil(0.99),
+                    "buckets": metricas.buckets,
+                }
+                for metricas in copias
+            ],
+        }
+
+    def snapshot_json(self, indent: Optional[int] = None) -> str:
+        # json escribiría "Infinity" para un p99 de más de 100 s, que no es JSON válido
+        snapshot = self.snapshot()
+        for skill in snapshot["skills"]:
+            for percentil in ("p50", "p99"):
+                if skill[percentil] == float("inf"):
+                    skill[percentil] = None
+        return json.dumps(snapshot, ensure_ascii=False, indent=indent)
+
+    def exportar_prometheus(self, prefijo: str = "skill") -> str:
+        """
+        Las métricas en el formato de texto de exposición de Prometheus:
+        ``<prefijo>_llamadas_total``, ``<prefijo>_errores_total`` (con la
+        etiqueta ``excepcion``) y el histograma ``<prefijo>_duracion_segundos``,
+        con las etiquetas ``skill`` y ``modulo``.
+        """
+        copias = sorted(self.copias(), key=lambda metricas: metricas.clave)
+        llamadas = f"{prefijo}_llamadas_total"
+        errores = f"{prefijo}_errores_total"
+        duracion = f"{prefijo}_duracion_segundos"
+        lineas = [
+            f"# HELP {llamadas} Llamadas a la skill.",
+            f"# TYPE {llamadas} counter",
+        ]
+        etiquetas = {
+            metricas.clave: f'skill="{_escapar_etiqueta(metricas.nombre)}",modulo="{_escapar_etiqueta(metricas.modulo)}"'
+            for metricas in copias
+        }
+        for metricas in copias:
+            lineas.append(f"{llamadas}{{{etiquetas[metricas.clave]}}} {metricas.llamadas}")
+
+        lineas += [f"# HELP {errores} Llamadas a la skill que lanzaron una excepción.", f"# TYPE {errores} counter"]
+        for metricas in copias:
+            for excepcion, cantidad in sorted(metricas.errores.items()):
+                lineas.append(
+                    f'{errores}{{{etiquetas[metricas.clave]},excepcion="{_escapar_etiqueta(excepcion)}"}} {cantidad}'
+                )
+
+        lineas += [f"# HELP {duracion} Duración de las llamadas a la skill.", f"# TYPE {duracion} histogram"]
+        for metricas in copias:
+            etiqueta = etiquetas[metricas.clave]
+            acumuladas = 0
+            for limite, cantidad in zip(LIMITES_SEGUNDOS, metricas.buckets):
+                acumuladas += cantidad
+                lineas.append(f'{duracion}_bucket{{{etiqueta},le="{limite!r}"}} {acumuladas}')
+            lineas.append(f'{duracion}_bucket{{{etiqueta},le="+Inf"}} {metricas.llamadas}')
+            lineas.append(f"{duracion}_sum{{{etiqueta}}} {metricas.segundos!r}")
+            lineas.append(f"{duracion}_count{{{etiqueta}}} {metricas.llamadas}")
+        return "\n".join(lineas) + "\n"
+
+
+def medir_skill(func: Callable, metricas: MetricasSkill) -> Callable:
+    """
+    Envoltorio de la skill que registra cada llamada en ``metricas``. Comparte
+    con la skill su ``__dict__`` (``tool_metadata``, ``get_last_call``...) y
+    deja la original en ``__wrapped__``.
+    """
+    registrar = metricas.registrar
+    reloj = time.perf_counter
+
+    if inspect.iscoroutinefunction(func):
+        async def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = await func(*args, **kwargs)
+            except Exception as error:
+                registrar(reloj() - inicio, type(error).__name__)
+                raise
+            registrar(reloj() - inicio)
+            return resultado
+    else:
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = func(*args, **kwargs)
+            except Exception as error:
+                registrar(reloj() - inicio, type(error).__name__)
+                raise
+            registrar(reloj() - inicio)
+            return resultado
+
+    functools.update_wrapper(medida, func)
+    medida.metricas_skill = metricas
+    return medida
+
+
+class SkillManagerConMetricas(SkillManager):
+    """
+    SkillManager que registra cada skill envuelta con ``medir_skill``, con las
+    métricas de todas en ``self.metricas``.
+
+    El registry guarda los envoltorios: ``tool_metadata`` es el mismo dict que
+    el de la skill, así que ``update_skill_metadata()`` y los esquemas no
+    cambian.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.metricas = MetricasSkills()
+        super().__init__(*args, **kwargs)
+
+    def register_tool(self, func) -> None:
+        metricas = self.metricas.de(f"{func.__module__}.{func.__name__}")
+        if getattr(func, "metricas_skill", None) is not metricas:
+            func = medir_skill(func, metricas)
+        super().register_tool(func)
@@ -0,0 +1,207 @@
+"""
+Motor de palabras clave
+=======================
+
+Detecta qué palabras clave de varios grupos aparecen en un texto y puntúa cada
+grupo. Lo usan el ruteo de tickets por producto, la detección de frases de
+"no puedo" del agente auto-expansivo y la clasificación de crashes:
+
+    motor = MotorPalabrasClave({
+        "api": ["endpoint", "http", ("status code", 2)],
+        "mobile": ["android", "crash"],
+    })
+    motor.puntuar("El endpoint devuelve status code 503")   # {"api": 3, "mobile": 0}
+    motor.mejor("La app crashea en Android")                 # "mobile"
+
+Las tablas se preparan una vez al construir el motor. Para buscar, con pocas
+palabras conviene preguntar ``palabra in texto`` por cada una (la búsqueda de
+subcadenas de CPython está en C); a partir de ``UMBRAL_AUTOMATA`` palabras se
+construye un autómata de Aho-Corasick, que recorre el texto una sola vez sin
+importar cuántas palabras haya. ``benchmarks/bench_palabras_clave.py`` mide
+dónde se cruzan.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+# Palabras a partir de las cuales el autómata le gana a buscar una por una
+UMBRAL_AUTOMATA = 100
+
+PalabraConPeso = Union[str, Tuple[str, float]]
+
+
+class _Automata:
+    """
+    Autómata de Aho-Corasick con las transiciones de fallo ya resueltas: cada
+    carácter del texto es una sola consulta a un dict.
+    """
+
+    def __init__(self, palabras: Iterable[str]):
+        hijos: List[Dict[str, int]] = [{}]
+        salidas: List[Tuple[str, ...]] = [()]
+        for palabra in palabras:
+            estado = 0
+            for caracter in palabra:
+                siguiente = hijos[estado].get(caracter)
+                if siguiente is None:
+                    siguiente = hijos[estado][caracter] = len(hijos)
+                    hijos.append({})
+                    salidas.append(())
+                estado = siguiente
+            salidas[estado] += (palabra,)
+
+        # Recorrido en anchura: el fallo de cada estado ya está resuelto al llegar a sus hijos
+        transiciones: List[Dict[str, int]] = [dict(hijos[0])]
+        transiciones.extend({} for _ in range(len(hijos) - 1))
+        fallos = [0] * len(hijos)
+        pendientes = deque(hijos[0].values())
+        while pendientes:
+            estado = pendientes.popleft()
+            transiciones[estado] = {**transiciones[fallos[estado]], **hijos[estado]}
+            salidas[estado] += salidas[fallos[estado]]
+            for caracter, hijo in hijos[estado].items():
+                fallos[hijo] = transiciones[fallos[estado]].get(caracter, 0) if estado else 0
+                pendientes.append(hijo)
+
+        self._transiciones = transiciones
+        self._salidas = salidas
+
+    def presentes(self, texto: str, hasta_la_primera: bool = False) -> Set[str]:
+        transiciones, salidas = self._transiciones, self._salidas
+        encontradas = set()
+        estado = 0
+        for caracter in texto:
+            estado = transiciones[estado].get(caracter, 0)
+            if salidas[estado]:
+                encontradas.update(salidas[estado])
+                if hasta_la_primera:
+                    break
+        return encontradas
+
+    def ocurrencias(self, texto: str) -> List[Tuple[int, str]]:
+        transiciones, salidas = self._transiciones, self._salidas
+        resultado = []
+        estado = 0
+        for fin, caracter in enumerate(texto, 1):
+            estado = transiciones[estado].get(caracter, 0)
+            for palabra in salidas[estado]:
+                resultado.append((fin - len(palabra), palabra))
+        return resultado
+
+
+class MotorPalabrasClave:
+    """
+    Palabras clave agrupadas, con peso opcional por palabra.
+
+    Args:
+        grupos: Grupo -> palabras, en orden de prioridad (gana el primero en
+            empates y en ``primero``). Cada palabra es un str (peso 1) o un par
+            (palabra, peso). Una palabra puede estar en varios grupos.
+        ignorar_mayusculas: Comparar en minúsculas
+        automata: Forzar (True) o evitar (False) el autómata; por defecto se
+            usa a partir de ``UMBRAL_AUTOMATA`` palabras
+    """
+
+    def __init__(
+        self,
+        grupos: Mapping[str, Iterable[PalabraConPeso]],
+        ignorar_mayusculas: bool = True,
+        automata: Optional[bool] = None
+    ):
+        self.ignorar_mayusculas = ignorar_mayusculas
+        self.grupos = tuple(grupos)
+        # Palabra -> [(grupo, peso)], en el orden de las tablas
+        self._pesos: Dict[str, List[Tuple[str, float]]] = {}
+        for grupo, palabras in grupos.items():
+            for palabra in palabras:
+                palabra, peso = (palabra, 1) if isinstance(palabra, str) else palabra
+                if not palabra:
+                    raise ValueError(f"Palabra clave vacía en el grupo '{grupo}'")
+                if ignorar_mayusculas:
+                    palabra = palabra.lower()
+                self._pesos.setdefault(palabra, []).append((grupo, peso))
+        self._palabras = tuple(self._pesos)
+
+        if automata is None:
+            automata = len(self._palabras) >= UMBRAL_AUTOMATA
+        self._usa_automata = automata
+        self._automata = _Automata(self._palabras) if automata else None
+
+    def __len__(self) -> int:
+        return len(self._palabras)
+
+    def _normalizar(self, texto: str) -> str:
+        return texto.lower() if self.ignorar_mayusculas else texto
+
+    def _presentes(self, texto: str) -> Set[str]:
+        texto = self._normalizar(texto)
+        if self._usa_automata:
+            return self._automata.presentes(texto)
+        return {palabra for palabra in self._palabras if palabra in texto}
+
+    def contiene(self, texto: str) -> bool:
+        """True si aparece al menos una palabra clave (deja de buscar en la primera)."""
+        texto = self._normalizar(texto)
+        if self._usa_automata:
+            return bool(self._automata.presentes(texto, hasta_la_primera=True))
+        return any(palabra in texto for palabra in self._palabras)
+
+    def encontradas(self, texto: str) -> Dict[str, List[str]]:
+        """
+        Returns:
+            Grupo -> palabras que aparecen en el texto, solo para los grupos con
+            alguna; grupos y palabras en el orden de las tablas
+        """
+        presentes = self._presentes(texto)
+        resultado: Dict[str, List[str]] = {}
+        for palabra in self._palabras:
+            if palabra in presentes:
+                for grupo, _ in self._pesos[palabra]:
+                    resultado.setdefault(grupo, []).append(palabra)
+        return {grupo: resultado[grupo] for grupo in self.grupos if grupo in resultado}
+
+    def puntuar(self, texto: str) -> Dict[str, float]:
+        """
+        Returns:
+            Grupo -> suma de los pesos de sus palabras que aparecen en el texto
+            (cada palabra cuenta una vez aunque se repita), para todos los grupos
+        """
+        puntajes = dict.fromkeys(self.grupos, 0)
+        for palabra in self._presentes(texto):
+            for grupo, peso in self._pesos[palabra]:
+                puntajes[grupo] += peso
+        return puntajes
+
+    def mejor(self, texto: str) -> Optional[str]:
+        """Grupo con mayor puntaje (en empate, el primero), o None si no aparece ninguna palabra."""
+        puntajes = self.puntuar(texto)
+        grupo = max(self.grupos, key=lambda g: puntajes[g], default=None)
+        return grupo if grupo is not None and puntajes[grupo] > 0 else None
+
+    def primero(self, texto: str) -> Optional[str]:
+        """Primer grupo, en el orden de las tablas, con alguna palabra en el texto."""
+        if self._usa_automata:
+            return next(iter(self.encontradas(texto)), None)
+        # Las palabras están en el orden de su primer grupo: la primera presente
+        # decide, sin buscar el resto
+        texto = self._normalizar(texto)
+        for palabra in self._palabras:
+            if palabra in texto:
+                return self._pesos[palabra][0][0]
+        return None
+
+    def ocurrencias(self, texto: str) -> List[Tuple[int, str, str]]:
+        """
+        Todas las apariciones, incluso superpuestas, en una pasada del autómata
+        (se construye en la primera llamada si el motor no lo usa).
+
+        Returns:
+            (posición de inicio, palabra, grupo) ordenadas por posición de fin
+        """
+        if self._automata is None:
+            self._automata = _Automata(self._palabras)
+        return [
+            (inicio, palabra, grupo)
+            for inicio, palabra in self._automata.ocurrencias(self._normalizar(texto))
+            for grupo, _ in self._pesos[palabra]
+        ]
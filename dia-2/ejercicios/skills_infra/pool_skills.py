@@ -0,0 +1,94 @@
+"""
+Pool de SkillManagers por producto
+==================================
+
+El agente multi-producto del ejercicio 4 limpiaba el registry y volvía a cargar
+la carpeta del producto en cada ticket: ``from_folder()`` ejecuta de nuevo cada
+módulo (y todo lo que arma al importarse: tablas, índices, motores) e inspecciona
+sus funciones. El pool carga cada carpeta una sola vez, en su propio
+SkillManager, y atender un ticket solo cambia cuál usa el agente:
+
+    pool = PoolSkills("skills", ["api", "webapp", "mobile"])
+    pool.activar(agente, "mobile")      # agente.skill_manager es el de mobile
+    agente.run(...)
+
+Los managers se comparten entre tickets: registrar o quitar skills en el agente
+modifica el manager del producto activo para los tickets siguientes.
+"""
+
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+from instantneo.skills import SkillManager
+
+
+class PoolSkills:
+    """
+    Un SkillManager por subcarpeta de skills, cargado al construir el pool.
+
+    Args:
+        carpeta_base: Carpeta con una subcarpeta de skills por producto
+        productos: Subcarpetas a cargar, en orden; por defecto todas las que
+            no empiezan con "_" ni "." (en orden alfabético)
+
+    Raises:
+        FileNotFoundError: Si falta la carpeta base o la de algún producto
+    """
+
+    def __init__(self, carpeta_base: str, productos: Optional[Iterable[str]] = None):
+        if not os.path.isdir(carpeta_base):
+            raise FileNotFoundError(f"No existe la carpeta de skills: {carpeta_base}")
+        if productos is None:
+            productos = sorted(
+                nombre for nombre in os.listdir(carpeta_base)
+                if not nombre.startswith(("_", ".")) and os.path.isdir(os.path.join(carpeta_base, nombre))
+            )
+
+        self.carpeta_base = carpeta_base
+        self._managers: Dict[str, SkillManager] = {}
+        for producto in productos:
+            ruta = os.path.join(carpeta_base, producto)
+            if not os.path.isdir(ruta):
+                raise FileNotFoundError(f"No existe la carpeta de skills de '{producto}': {ruta}")
+            manager = SkillManager()
+            manager.load_skills.from_folder(ruta)
+            self._managers[producto] = manager
+
+    @property
+    def productos(self) -> Tuple[str, ...]:
+        return tuple(self._managers)
+
+    def __contains__(self, producto: str) -> bool:
+        return producto in self._managers
+
+    def __len__(self) -> int:
+        return len(self._managers)
+
+    def manager(self, producto: str) -> SkillManager:
+        """
+        Raises:
+            KeyError: Si el producto no está en el pool
+        """
+        try:
+            return self._managers[producto]
+        except KeyError:
+            raise KeyError(f"Producto sin skills en el pool: '{producto}'") from None
+
+    def activar(self, agente, producto: str) -> SkillManager:
+        """
+        Hace que el agente use las skills del producto, sin importar nada.
+
+        Args:
+            agente: Instancia de InstantNeo
+            producto: Producto del pool
+
+        Returns:
+            El SkillManager que quedó activo
+
+        Raises:
+            KeyError: Si el producto no está en el pool
+        """
+        manager = self.manager(producto)
+        # InstantNeo.skill_manager es un alias de solo lectura de capabilities
+        agente.capabilities = manager
+        return manager
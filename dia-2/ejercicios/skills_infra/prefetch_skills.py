@@ -0,0 +1,100 @@
+"""
+Precarga predictiva de skills
+=============================
+
+El agente auto-expansivo del ejercicio 05 se entera de que le falta una skill
+cuando el modelo responde que no puede: esa llamada se pierde y la consulta se
+repite después de cargar la skill. ``PrefetchSkills`` indexa con BM25
+(``IndiceSkills``) todas las skills de la biblioteca en un SkillManager aparte,
+sin dárselas al agente. Antes de la primera llamada carga con
+``skill_manager.load_skills.from_file`` solo los archivos de las skills que
+coinciden con la consulta:
+
+    prefetch = PrefetchSkills("skills_biblioteca")
+    prefetch.precargar(agente, "Calcula la desviación estándar de 10, 20, 30")
+    # ["skills_biblioteca/estadisticas/desviacion_std.py"]
+
+Una skill se predice si su puntaje BM25 llega a ``PUNTAJE_MINIMO`` y a
+``PROPORCION_DEL_MEJOR`` del mejor puntaje de la consulta.
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+from instantneo.skills import SkillManager
+
+from .manifiesto import archivos_de_skills
+from .recuperacion_skills import IndiceSkills
+
+K_PREFETCH = 2
+# Calibrado con skills_biblioteca: la skill correcta puntúa de 2.4 a 10 y las
+# coincidencias sueltas ("calcula", números) quedan por debajo de 2
+PUNTAJE_MINIMO = 2.0
+PROPORCION_DEL_MEJOR = 0.5
+
+
+class PrefetchSkills:
+    """
+    Índice de una biblioteca de skills que predice qué archivos cargar para una consulta.
+
+    Args:
+        biblioteca_path: Carpeta con archivos de skills y subcarpetas (un nivel)
+        k: Máximo de skills a predecir por consulta
+        puntaje_minimo: Puntaje BM25 mínimo de una skill predicha
+    """
+
+    def __init__(self, biblioteca_path: str, k: int = K_PREFETCH, puntaje_minimo: float = PUNTAJE_MINIMO):
+        self.biblioteca_path = str(biblioteca_path)
+        self.k = k
+        self.puntaje_minimo = puntaje_minimo
+
+        carpetas = [self.biblioteca_path] + [
+            os.path.join(self.biblioteca_path, nombre) for nombre in sorted(os.listdir(self.biblioteca_path))
+            if os.path.isdir(os.path.join(self.biblioteca_path, nombre)) and not nombre.startswith(("_", "."))
+        ]
+        self._manager = SkillManager()
+        # Nombre de skill -> archivo que la define
+        self._archivos: Dict[str, str] = {}
+        for carpeta in carpetas:
+            for nombre_archivo in archivos_de_skills(carpeta):
+                ruta = os.path.join(carpeta, nombre_archivo)
+                for clave in self._manager.load_skills.from_file(ruta):
+                    self._archivos.setdefault(clave.rpartition(".")[2], ruta)
+        self.indice = IndiceSkills(self._manager)
+
+    def __len__(self) -> int:
+        return len(self._archivos)
+
+    def predecir(self, consulta: str) -> List[Tuple[str, str]]:
+        """
+        Returns:
+            Pares (skill, archivo) que probablemente necesita la consulta, del más
+            probable al menos; vacío si ninguna skill coincide lo suficiente
+        """
+        encontradas = self.indice.buscar(consulta, self.k)
+        if not encontradas:
+            return []
+        minimo = max(self.puntaje_minimo, encontradas[0][1] * PROPORCION_DEL_MEJOR)
+        return [(nombre, self._archivos[nombre]) for nombre, puntaje in encontradas if puntaje >= minimo]
+
+    def precargar(self, agente, consulta: str) -> List[str]:
+        """
+        Carga en el agente los archivos de las skills predichas que todavía no tiene.
+
+        Args:
+            agente: Instancia de InstantNeo o SkillManager
+            consulta: Query del usuario
+
+        Returns:
+            Archivos cargados (vacío si el agente ya tenía todo lo predicho)
+        """
+        manager = getattr(agente, "skill_manager", agente)
+        disponibles = set(manager.get_tool_names())
+        cargados: List[str] = []
+        for nombre, ruta in self.predecir(consulta):
+            if nombre in disponibles or ruta in cargados:
+                continue
+            manager.load_skills.from_file(ruta)
+            cargados.append(ruta)
+            disponibles.update(manager.get_tool_names())
+        return cargados
@@ -0,0 +1,202 @@
+"""
+Recuperación de skills por relevancia (BM25)
+============================================
+
+``agente.run(prompt)`` envía al modelo el esquema de todas las skills
+registradas: con unos cientos son miles de tokens de prompt en cada llamada.
+``IndiceSkills`` indexa nombre, descripción, tags, docstring y descripción de
+parámetros de cada skill del SkillManager, y para cada prompt elige las ``k``
+más relevantes por BM25, que se pasan con el parámetro ``skills=`` de ``run()``:
+
+    indice = IndiceSkills(agente.skill_manager)
+    respuesta, seleccion = ejecutar_con_skills_relevantes(agente, prompt, indice, k=5)
+    seleccion.skills              # ("calcular_mediana", ...)
+    seleccion.tokens_ahorrados    # tokens de esquema que no se enviaron
+
+Los tokens se estiman como caracteres del esquema JSON / ``CARACTERES_POR_TOKEN``,
+sin depender del tokenizer de cada proveedor. El índice se rearma solo si cambian
+las skills registradas en el manager.
+"""
+
+import inspect
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .indice_difuso import normalizar_texto
+
+K_POR_DEFECTO = 5
+# Parámetros estándar de BM25: saturación de frecuencia y normalización por longitud
+K1 = 1.2
+B = 0.75
+# Veces que cuentan las palabras del nombre y de los tags frente a las del texto
+PESO_NOMBRE = 3
+PESO_TAGS = 2
+CARACTERES_POR_TOKEN = 4
+# Palabras que no distinguen una skill de otra
+PALABRAS_VACIAS = frozenset(
+    "a al como con de del el en es la las lo los o para por que se si sin su un una uno y "
+    "the of to and or in for is an on with by".split()
+)
+
+
+def palabras_relevantes(texto: str) -> List[str]:
+    """Palabras normalizadas, sin las vacías y con una raíz mínima de plurales ("listas" -> "lista")."""
+    palabras = []
+    for palabra in normalizar_texto(texto).split():
+        if palabra in PALABRAS_VACIAS:
+            continue
+        if len(palabra) > 4 and palabra.endswith("es") and palabra[-3] not in "aeiou":
+            palabra = palabra[:-2]
+        elif len(palabra) > 3 and palabra.endswith("s"):
+            palabra = palabra[:-1]
+        palabras.append(palabra)
+    return palabras
+
+
+def texto_de_skill(funcion: Any, metadata: Dict[str, Any]) -> Tuple[str, str, str]:
+    """(nombre, tags, resto del texto indexable) de una skill registrada."""
+    parametros = metadata.get("parameters") or {}
+    texto = [metadata.get("description") or "", inspect.getdoc(funcion) or ""]
+    texto.extend(f"{nombre} {info.get('description', '')}" for nombre, info in parametros.items() if isinstance(info, dict))
+    return metadata.get("name") or funcion.__name__, " ".join(metadata.get("tags") or ()), " ".join(texto)
+
+
+def tokens_de_esquema(metadata: Dict[str, Any]) -> int:
+    """Tokens estimados del esquema que ``run()`` le envía al modelo para una skill."""
+    from instantneo.utils.tool_utils import format_tool
+    esquema = json.dumps(format_tool(metadata), ensure_ascii=False)
+    return math.ceil(len(esquema) / CARACTERES_POR_TOKEN)
+
+
+@dataclass(frozen=True)
+class SeleccionSkills:
+    """Skills elegidas para un prompt y los tokens de esquema que implican."""
+
+    skills: Tuple[str, ...]
+    puntajes: Tuple[float, ...]
+    tokens_todas: int
+    tokens_enviadas: int
+
+    @property
+    def tokens_ahorrados(self) -> int:
+        return self.tokens_todas - self.tokens_enviadas
+
+    @property
+    def ahorro(self) -> float:
+        """Fracción de los tokens de esquema que no se enviaron (0 a 1)."""
+        return self.tokens_ahorrados / self.tokens_todas if self.tokens_todas else 0.0
+
+
+class IndiceSkills:
+    """
+    Índice BM25 de las skills registradas en un SkillManager.
+
+    Args:
+        manager: SkillManager a indexar (por ejemplo ``agente.skill_manager``)
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._claves: FrozenSet[str] = frozenset()
+        self._construir()
+
+    def _construir(self) -> None:
+        registro = self.manager.get_tools_with_keys()
+        metadatas = self.manager.get_all_tools_metadata()
+        self._claves = frozenset(registro)
+
+        # Una entrada por nombre: get_tool_by_name() resuelve duplicados por nombre igual
+        self._nombres: List[str] = []
+        self._tokens: Dict[str, int] = {}
+        frecuencias: List[Counter] = []
+        for clave, funcion in registro.items():
+            metadata = metadatas[clave]
+            nombre, tags, texto = texto_de_skill(funcion, metadata)
+            if nombre in self._tokens:
+                continue
+            self._nombres.append(nombre)
+            self._tokens[nombre] = tokens_de_esquema(metadata) if "parameters" in metadata else 0
+            frecuencia = Counter(palabras_relevantes(texto))
+            for palabra in palabras_relevantes(nombre):
+                frecuencia[palabra] += PESO_NOMBRE
+            for palabra in palabras_relevantes(tags):
+                frecuencia[palabra] += PESO_TAGS
+            frecuencias.append(frecuencia)
+
+        cantidad = len(frecuencias)
+        longitudes = [sum(frecuencia.values()) for frecuencia in frecuencias]
+        promedio = sum(longitudes) / cantidad if cantidad else 0.0
+        documentos = Counter(palabra for frecuencia in frecuencias for palabra in frecuencia)
+
+        # Palabra -> [(posición de la skill, aporte BM25 de la palabra a esa skill)]
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        for posicion, (frecuencia, longitud) in enumerate(zip(frecuencias, longitudes)):
+            normalizacion = K1 * (1 - B + B * longitud / promedio)
+            for palabra, veces in frecuencia.items():
+                idf = math.log(1 + (cantidad - documentos[palabra] + 0.5) / (documentos[palabra] + 0.5))
+                aporte = idf * veces * (K1 + 1) / (veces + normalizacion)
+                self._postings.setdefault(palabra, []).append((posicion, aporte))
+        self._tokens_todas = sum(self._tokens.values())
+
+    def _actualizar(self) -> None:
+        if self.manager.get_tools_with_keys().keys() != self._claves:
+            self._construir()
+
+    def __len__(self) -> int:
+        self._actualizar()
+        return len(self._nombres)
+
+    def buscar(self, consulta: str, k: int = K_POR_DEFECTO) -> List[Tuple[str, float]]:
+        """
+        Returns:
+            Hasta ``k`` pares (skill, puntaje BM25) con puntaje > 0, del más
+            relevante al menos (en empate, por orden de registro)
+        """
+        self._actualizar()
+        puntajes: Dict[int, float] = {}
+        for palabra in set(palabras_relevantes(consulta)):
+            for posicion, aporte in self._postings.get(palabra, ()):
+                puntajes[posicion] = puntajes.get(posicion, 0.0) + aporte
+        mejores = sorted(puntajes.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [(self._nombres[posicion], round(puntaje, 4)) for posicion, puntaje in mejores]
+
+    def seleccionar(self, consulta: str, k: int = K_POR_DEFECTO) -> SeleccionSkills:
+        """Las ``k`` skills más relevantes para la consulta, con el ahorro de tokens de esquema."""
+        encontradas = self.buscar(consulta, k)
+        skills = tuple(nombre for nombre, _ in encontradas)
+        return SeleccionSkills(
+            skills=skills,
+            puntajes=tuple(puntaje for _, puntaje in encontradas),
+            tokens_todas=self._tokens_todas,
+            tokens_enviadas=sum(self._tokens[nombre] for nombre in skills),
+        )
+
+
+def ejecutar_con_skills_relevantes(
+    agente,
+    prompt: str,
+    indice: Optional[IndiceSkills] = None,
+    k: int = K_POR_DEFECTO,
+    **parametros_run
+) -> Tuple[Any, SeleccionSkills]:
+    """
+    Ejecuta ``agente.run(prompt, skills=...)`` con solo las ``k`` skills más
+    relevantes. Si ninguna comparte palabras con el prompt, se ejecuta sin skills.
+
+    Args:
+        agente: Instancia de InstantNeo
+        prompt: Prompt del usuario
+        indice: Índice del manager del agente; si no se pasa se arma uno
+        k: Máximo de skills a enviar
+        **parametros_run: Otros parámetros de ``run()``
+
+    Returns:
+        (respuesta de run(), selección con el ahorro de tokens)
+    """
+    if indice is None:
+        indice = IndiceSkills(agente.skill_manager)
+    seleccion = indice.seleccionar(prompt, k)
+    return agente.run(prompt, skills=list(seleccion.skills), **parametros_run), seleccion
@@ -0,0 +1,197 @@
+"""
+Registro compacto de skills
+===========================
+
+Cada skill registrada lleva su metadata como dicts y listas propios: con miles
+de skills generadas desde plantillas, los mismos tags, nombres de parámetros,
+tipos y descripciones de parámetros (y claves propias como
+``supported_formats``) se repiten en cada una, en cada proceso worker.
+
+``SkillCompacta`` es un registro con ``__slots__`` que guarda la metadata
+congelada en tuplas: las claves y los tags son strings internados y las partes
+iguales entre skills (la lista de tags, un parámetro, una descripción) son el
+mismo objeto. Los dicts se arman recién al pedirlos (``tool_metadata``,
+``get_all_skills_metadata()``, el esquema que ``run()`` envía al modelo).
+Como los proxies de ``skills_infra.manifiesto``, importa el módulo real en la
+primera llamada.
+
+    sm = SkillManagerCompacto()
+    sm.registrar_manifiesto("skills/mobile")    # skills.manifiesto.json de la carpeta
+"""
+
+import os
+import sys
+from types import CodeType
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from instantneo.skills import SkillManager
+
+from .manifiesto import ARCHIVO_MANIFIESTO, cargar_manifiesto, cargar_skill
+
+
+class _Mapa(tuple):
+    """
+    Dict congelado: ``(claves, valores)``. La tupla de claves internadas es la
+    misma para todos los dicts con esas claves en ese orden.
+    """
+
+    __slots__ = ()
+
+
+def _congelar(valor: Any, compartidos: Dict[Hashable, Any], internar: bool = False) -> Tuple[Any, Hashable]:
+    """
+    (valor congelado, clave de deduplicación). La clave incluye los tipos para
+    no confundir valores iguales de distinto tipo (``[1]`` y ``[True]``,
+    ``{"a": 1}`` y ``[["a", 1]]``).
+    """
+    if isinstance(valor, str):
+        if internar:
+            return sys.intern(valor), valor
+        return compartidos.setdefault(valor, valor), valor
+    if isinstance(valor, dict):
+        claves, valores, claves_items = [], [], []
+        for clave, item in valor.items():
+            clave = sys.intern(clave) if isinstance(clave, str) else clave
+            # Los tags se internan como las claves: son pocos y se repiten en toda la biblioteca
+            congelado, clave_item = _congelar(item, compartidos, internar=clave == "tags")
+            claves.append(clave)
+            valores.append(congelado)
+            claves_items.append(clave_item)
+        claves = _congelar(claves, compartidos)[0]
+        clave_mapa = (dict, claves, tuple(claves_items))
+        return compartidos.setdefault(clave_mapa, _Mapa((claves, tuple(valores)))), clave_mapa
+    if isinstance(valor, (list, tuple)):
+        items, claves = [], []
+        for item in valor:
+            congelado, clave_item = _congelar(item, compartidos, internar)
+            items.append(congelado)
+            claves.append(clave_item)
+        clave_lista = (list, tuple(claves))
+        return compartidos.setdefault(clave_lista, tuple(items)), clave_lista
+    return valor, (type(valor), valor)
+
+
+def _descongelar(valor: Any) -> Any:
+    if isinstance(valor, _Mapa):
+        return {clave: _descongelar(item) for clave, item in zip(*valor)}
+    if isinstance(valor, tuple):
+        return [_descongelar(item) for item in valor]
+    return valor
+
+
+class ArchivoSkills:
+    """Datos de un archivo de skills, compartidos por todas sus ``SkillCompacta``."""
+
+    __slots__ = ("carpeta", "archivo", "modulo", "sha256", "codigo")
+
+    def __init__(self, carpeta: str, archivo: str, sha256: str):
+        self.carpeta = carpeta
+        self.archivo = archivo
+        self.modulo = sys.intern(os.path.splitext(archivo)[0])
+        self.sha256 = sha256
+        # register_tool() solo lee co_filename, para avisar de nombres duplicados
+        self.codigo = compile("", os.path.join(carpeta, archivo), "exec")
+
+
+# __doc__ y __module__ de cada SkillCompacta son los de su skill (como en el
+# proxy del manifiesto, que es una función), por eso son propiedades y la clase
+# se documenta aquí: registro de una skill con metadata congelada y el archivo
+# de donde importarla al llamarla. ``cargar()`` devuelve la skill real y
+# ``ruta_archivo`` el archivo que la define, como en el proxy.
+class SkillCompacta:
+    __slots__ = ("__name__", "__qualname__", "archivo", "_metadata", "_real")
+
+    def __init__(self, nombre: str, archivo: ArchivoSkills, metadata: _Mapa):
+        self.__name__ = self.__qualname__ = sys.intern(nombre)
+        self.archivo = archivo
+        self._metadata = metadata
+        self._real: Optional[Callable] = None
+
+    @property
+    def __module__(self) -> str:
+        return self.archivo.modulo
+
+    @property
+    def __doc__(self) -> Optional[str]:
+        claves, valores = self._metadata
+        return valores[claves.index("description")] if "description" in claves else None
+
+    @property
+    def __code__(self) -> CodeType:
+        return self.archivo.codigo
+
+    @property
+    def ruta_archivo(self) -> str:
+        return os.path.abspath(os.path.join(self.archivo.carpeta, self.archivo.archivo))
+
+    @property
+    def tool_metadata(self) -> Dict[str, Any]:
+        """Dict nuevo en cada acceso: modificarlo no cambia la skill (ver ``actualizar_metadata``)."""
+        return _descongelar(self._metadata)
+
+    skill_metadata = tool_metadata
+
+    def actualizar_metadata(self, nueva: Dict[str, Any]) -> None:
+        metadata = self.tool_metadata
+        metadata.update(nueva)
+        self._metadata = _congelar(metadata, {})[0]
+
+    def cargar(self) -> Callable:
+        if self._real is None:
+            archivo = self.archivo
+            self._real = cargar_skill(archivo.carpeta, archivo.archivo, self.__name__, archivo.sha256)
+        return self._real
+
+    def __call__(self, *args, **kwargs):
+        return self.cargar()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<SkillCompacta {self.archivo.modulo}.{self.__name__}>"
+
+
+def crear_compactas(carpeta: str, entradas: List[Dict[str, Any]]) -> List[SkillCompacta]:
+    """
+    Una ``SkillCompacta`` por entrada de manifiesto, compartiendo las partes
+    iguales de la metadata entre todas.
+    """
+    compartidos: Dict[Hashable, Any] = {}
+    archivos: Dict[Tuple[str, str], ArchivoSkills] = {}
+    skills = []
+    for entrada in entradas:
+        clave_archivo = (entrada["archivo"], entrada["sha256"])
+        archivo = archivos.get(clave_archivo)
+        if archivo is None:
+            archivo = archivos[clave_archivo] = ArchivoSkills(carpeta, *clave_archivo)
+        skills.append(SkillCompacta(entrada["nombre"], archivo, _congelar(entrada["metadata"], compartidos)[0]))
+    return skills
+
+
+class SkillManagerCompacto(SkillManager):
+    """
+    SkillManager para bibliotecas grandes de ``SkillCompacta``. Acepta también
+    skills comunes; ``update_tool_metadata`` vuelve a congelar la metadata de
+    las compactas en lugar de modificar un dict que se descarta.
+    """
+
+    def registrar_manifiesto(self, carpeta: str, ruta_manifiesto: Optional[str] = None) -> List[str]:
+        """
+        Como ``manifiesto.registrar_desde_manifiesto``, con ``SkillCompacta``.
+
+        Returns:
+            Nombres de las skills registradas
+        """
+        manifiesto = cargar_manifiesto(ruta_manifiesto or os.path.join(carpeta, ARCHIVO_MANIFIESTO))
+        skills = crear_compactas(carpeta, manifiesto["skills"])
+        for skill in skills:
+            self.register_tool(skill)
+        return [skill.__name__ for skill in skills]
+
+    def update_tool_metadata(self, key: str, new_metadata: Dict[str, Any]) -> bool:
+        funcion = self.registry.get(key)
+        if isinstance(funcion, SkillCompacta):
+            funcion.actualizar_metadata(new_metadata)
+            return True
+        return super().update_tool_metadata(key, new_metadata)
+
+    # Los alias de SkillManager apuntan a los métodos de la clase base
+    update_skill_metadata = update_tool_metadata
@@ -0,0 +1,141 @@
+"""
+Servidor HTTP local para pruebas y benchmarks
+=============================================
+
+Servidor HTTP/1.1 con keep-alive que corre en un hilo de fondo, para probar
+``verificar_endpoint`` sin salir a internet.
+
+Rutas:
+    /status/<codigo>     Responde con ese código de estado
+    /lento/<ms>          Espera <ms> milisegundos y responde 200
+    /cerrar              Responde 200 con "Connection: close"
+    cualquier otra       Responde 200 con un JSON pequeño
+
+Uso:
+    with ServidorStub() as servidor:
+        verificar_endpoint(servidor.url("/status/503"))
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Manejador(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeceras y cuerpo salen en dos escrituras: sin esto, Nagle + ACK retrasado
+    # agregan ~40ms a cada respuesta sobre una conexión keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # Una instancia del manejador por conexión TCP
+        with self.server.candado:
+            self.server.conexiones += 1
+            self.server.sockets_activos.add(self.connection)
+
+    def finish(self):
+        with self.server.candado:
+            self.server.sockets_activos.discard(self.connection)
+        super().finish()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _responder(self):
+        with self.server.candado:
+            self.server.solicitudes += 1
+
+        longitud = int(self.headers.get("Content-Length") or 0)
+        if longitud:
+            self.rfile.read(longitud)
+
+        partes = [p for p in self.path.split("?")[0].split("/") if p]
+        status = 200
+        cerrar = False
+        if len(partes) == 2 and partes[0] == "status" and partes[1].isdigit():
+            status = int(partes[1])
+        elif len(partes) == 2 and partes[0] == "lento" and partes[1].isdigit():
+            time.sleep(int(partes[1]) / 1000)
+        elif partes == ["cerrar"]:
+            cerrar = True
+
+        cuerpo = b"" if self.command == "HEAD" else json.dumps(
+            {"path": self.path, "metodo": self.command, "status": status}
+        ).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        if cerrar:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        if cuerpo and status not in (204, 304):
+            self.wfile.write(cuerpo)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = do_OPTIONS = _responder
+
+
+class _Servidor(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Un cliente que corta por timeout no es un error del servidor
+        pass
+
+
+class ServidorStub:
+    """
+    Servidor HTTP local en un puerto libre.
+
+    Attributes:
+        conexiones: Conexiones TCP aceptadas (permite verificar el keep-alive)
+        solicitudes: Solicitudes HTTP atendidas
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 0):
+        self._servidor = _Servidor((host, puerto), _Manejador)
+        self._servidor.candado = threading.Lock()
+        self._servidor.sockets_activos = set()
+        self._servidor.conexiones = 0
+        self._servidor.solicitudes = 0
+        self._hilo = None
+
+    @property
+    def puerto(self) -> int:
+        return self._servidor.server_address[1]
+
+    @property
+    def conexiones(self) -> int:
+        return self._servidor.conexiones
+
+    @property
+    def solicitudes(self) -> int:
+        return self._servidor.solicitudes
+
+    def url(self, ruta: str = "/") -> str:
+        return f"http://127.0.0.1:{self.puerto}{ruta}"
+
+    def iniciar(self) -> "ServidorStub":
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, name="servidor-stub", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self) -> None:
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        # Cierra también las conexiones keep-alive que siguen abiertas
+        with self._servidor.candado:
+            for conexion in list(self._servidor.sockets_activos):
+                try:
+                    conexion.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def __enter__(self) -> "ServidorStub":
+        return self.iniciar()
+
+    def __exit__(self, *exc) -> None:
+        self.detener()
@@ -0,0 +1,90 @@
+"""
+Skills sin tracking para llamadas en lote
+=========================================
+
+El envoltorio de ``@skill`` guarda en un contextvar los argumentos, el
+resultado y la excepción de cada llamada (``get_last_call()``). En skills
+mínimas como ``sumar`` o una conversión de unidades, llamadas millones de
+veces en lote, ese registro cuesta más que la función.
+
+``skill_rapida`` arma la misma metadata que ``@skill`` (con ``track`` y
+``sample_rate`` agregados) y decide cuánto trackear:
+
+    @skill_rapida(description="Convierte Celsius a Fahrenheit")                  # sin envoltorio
+    @skill_rapida(description="Suma dos números", sample_rate=0.01)             # 1 de cada 100 llamadas
+    @skill_rapida(description="Divide dos números", track=True)                 # igual que @skill
+
+Sin tracking, la skill es la función original con la metadata como atributo:
+llamarla no cuesta nada extra y ``get_last_call()`` devuelve ``None``.
+"""
+
+import functools
+import inspect
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+from instantneo.skills import skill
+
+
+def skill_rapida(
+    description: Optional[str] = None,
+    parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+    tags: Optional[List[str]] = None,
+    version: Optional[str] = "1.0",
+    track: bool = False,
+    sample_rate: Optional[float] = None,
+    **additional_metadata
+) -> Callable[[Callable], Callable]:
+    """
+    Como ``@skill``, con el tracking de la última llamada opcional.
+
+    Args:
+        description, parameters, tags, version: Como en ``@skill``
+        track: ``True`` trackea todas las llamadas, como ``@skill``
+        sample_rate: Proporción de llamadas trackeadas, de 0 a 1; tiene
+            prioridad sobre ``track``. Se trackea 1 de cada
+            ``round(1 / sample_rate)`` llamadas, sin azar
+        **additional_metadata: Metadata adicional, como en ``@skill``
+
+    Raises:
+        ValueError: Si ``sample_rate`` no está entre 0 y 1
+    """
+    if sample_rate is None:
+        sample_rate = 1.0 if track else 0.0
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"sample_rate debe estar entre 0 y 1: {sample_rate}")
+    track = sample_rate > 0
+
+    def decorador(func: Callable) -> Callable:
+        trackeada = skill(
+            description, parameters, tags, version, track=track, sample_rate=sample_rate, **additional_metadata
+        )(func)
+        if sample_rate >= 1.0:
+            return trackeada
+
+        if sample_rate == 0.0:
+            rapida = func
+            rapida.get_last_call = rapida.get_last_result = rapida.get_last_params = lambda: None
+        else:
+            periodo = max(1, round(1 / sample_rate))
+            contador = itertools.count()
+            if inspect.iscoroutinefunction(func):
+                async def rapida(*args, **kwargs):
+                    if next(contador) % periodo:
+                        return await func(*args, **kwargs)
+                    return await trackeada(*args, **kwargs)
+            else:
+                def rapida(*args, **kwargs):
+                    if next(contador) % periodo:
+                        return func(*args, **kwargs)
+                    return trackeada(*args, **kwargs)
+            functools.update_wrapper(rapida, func)
+            # La última llamada trackeada, no necesariamente la última
+            rapida.get_last_call = trackeada.get_last_call
+            rapida.get_last_result = trackeada.get_last_result
+            rapida.get_last_params = trackeada.get_last_params
+
+        rapida.tool_metadata = rapida.skill_metadata = trackeada.tool_metadata
+        return rapida
+
+    return decorador
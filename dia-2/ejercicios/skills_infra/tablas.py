@@ -0,0 +1,119 @@
+"""
+Tablas de conocimiento inmutables
+=================================
+
+Las skills de debugging consultan bases de conocimiento estáticas (códigos HTTP,
+errores de JavaScript, permisos, crashes...). Este módulo las construye una sola
+vez al importar la skill y las congela para que ninguna llamada pueda modificarlas.
+
+Opcionalmente, las tablas se pueden sobrescribir con un archivo de datos
+versionado junto a la skill (``<modulo>.datos.json``):
+
+    {"version": 1, "tablas": {"diagnosticos_http": {...}}}
+
+Si el archivo no existe se usan las tablas definidas en el código; si existe pero
+no es válido o su versión no coincide, se emite un warning y también se usan
+las del código.
+"""
+
+import json
+import os
+import warnings
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+SUFIJO_DATOS = ".datos.json"
+
+
+def congelar(valor: Any) -> Any:
+    """
+    Convierte recursivamente dicts en MappingProxyType y listas en tuplas.
+
+    Args:
+        valor: Estructura de dicts, listas y escalares
+
+    Returns:
+        La misma estructura, inmutable
+    """
+    if isinstance(valor, Mapping):
+        return MappingProxyType({clave: congelar(v) for clave, v in valor.items()})
+    if isinstance(valor, (list, tuple)):
+        return tuple(congelar(v) for v in valor)
+    return valor
+
+
+def descongelar(valor: Any) -> Any:
+    """
+    Inversa de congelar: devuelve dicts y listas nuevos, serializables a JSON.
+
+    Args:
+        valor: Estructura congelada
+
+    Returns:
+        Copia mutable de la estructura
+    """
+    if isinstance(valor, Mapping):
+        return {clave: descongelar(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [descongelar(v) for v in valor]
+    return valor
+
+
+def ruta_datos(archivo_modulo: str) -> Path:
+    """Ruta del archivo de datos opcional de una skill: ``<modulo>.datos.json``."""
+    ruta = Path(archivo_modulo)
+    return ruta.with_name(ruta.stem + SUFIJO_DATOS)
+
+
+def _ajustar_claves(tabla: Mapping, referencia: Mapping) -> dict:
+    # JSON solo admite claves string: si la tabla del código usa enteros
+    # (por ejemplo códigos HTTP), se convierten de vuelta
+    if referencia and all(isinstance(clave, int) for clave in referencia):
+        return {int(clave): valor for clave, valor in tabla.items()}
+    return dict(tabla)
+
+
+def cargar_tablas(ruta: Path, version: int, por_defecto: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Construye las tablas de una skill, sobrescritas por su archivo de datos si existe.
+
+    Args:
+        ruta: Archivo de datos versionado (puede no existir)
+        version: Versión de datos que espera el código de la skill
+        por_defecto: Tablas definidas en el código, por nombre
+
+    Returns:
+        Mapping inmutable nombre -> tabla congelada
+    """
+    tablas = dict(por_defecto)
+
+    if os.path.exists(ruta):
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+            if datos.get("version") != version:
+                raise ValueError(f"versión {datos.get('version')!r}, se esperaba {version}")
+            for nombre, tabla in datos.get("tablas", {}).items():
+                if nombre not in tablas:
+                    raise ValueError(f"tabla desconocida '{nombre}'")
+                tablas[nombre] = _ajustar_claves(tabla, por_defecto[nombre])
+        except (OSError, ValueError, AttributeError) as e:
+            warnings.warn(f"Se ignora el archivo de datos {ruta}: {e}")
+            tablas = dict(por_defecto)
+
+    return congelar(tablas)
+
+
+def exportar_tablas(ruta: Path, version: int, tablas: Mapping[str, Any]) -> None:
+    """
+    Escribe las tablas a un archivo de datos versionado, listo para editarse.
+
+    Args:
+        ruta: Archivo de destino
+        version: Versión de datos a registrar
+        tablas: Tablas por nombre (congeladas o no)
+    """
+    contenido = {"version": version, "tablas": descongelar(tablas)}
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(contenido, f, ensure_ascii=False, indent=2)
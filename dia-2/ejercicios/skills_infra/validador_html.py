@@ -0,0 +1,121 @@
+"""
+Validador HTML de una sola pasada
+=================================
+
+Recorre el documento una vez con ``html.parser`` manteniendo una pila de
+elementos abiertos, y junta en esa misma pasada todo lo que revisa la skill
+``validar_html``: etiquetas sin cerrar, imágenes sin alt, inputs y labels,
+cantidad de h1 y enlaces vacíos.
+
+Acepta el documento completo o por partes:
+
+    validador = ValidadorHTML()
+    for bloque in partes:
+        validador.feed(bloque)
+    validador.close()
+    print(validador.sin_cerrar, validador.enlaces_vacios)
+"""
+
+from html.parser import HTMLParser
+from typing import Dict, List
+
+# Elementos vacíos de HTML (no llevan etiqueta de cierre), incluidos los obsoletos
+ELEMENTOS_VACIOS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "source", "track", "wbr", "param", "keygen", "command", "basefont", "frame",
+})
+
+
+class ValidadorHTML(HTMLParser):
+    """
+    Parser incremental que acumula los hallazgos de validación.
+
+    Attributes:
+        sin_cerrar: Etiqueta -> cantidad de elementos que nunca se cerraron,
+            en el orden en que se detectan
+        etiquetas: Etiqueta -> cantidad de aperturas
+        imgs_sin_alt: Imágenes sin atributo alt
+        inputs: Cantidad de <input>
+        labels: Cantidad de <label>
+        enlaces_vacios: Enlaces <a> sin texto ni elementos dentro
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sin_cerrar: Dict[str, int] = {}
+        self.etiquetas: Dict[str, int] = {}
+        self.imgs_sin_alt = 0
+        self.inputs = 0
+        self.labels = 0
+        self.enlaces_vacios = 0
+        self._pila: List[str] = []
+        # Etiqueta -> elementos abiertos en la pila, para no recorrerla en cada cierre
+        self._abiertas: Dict[str, int] = {}
+        # Por cada <a> abierto, si ya tiene contenido
+        self._enlaces: List[bool] = []
+        self._cerrado = False
+
+    @property
+    def h1(self) -> int:
+        return self.etiquetas.get("h1", 0)
+
+    def _marcar_contenido(self) -> None:
+        if self._enlaces:
+            self._enlaces[-1] = True
+
+    def _desapilar(self, cerrado: bool = True) -> None:
+        etiqueta = self._pila.pop()
+        self._abiertas[etiqueta] -= 1
+        if etiqueta == "a" and not self._enlaces.pop() and cerrado:
+            self.enlaces_vacios += 1
+        if not cerrado:
+            self.sin_cerrar[etiqueta] = self.sin_cerrar.get(etiqueta, 0) + 1
+        self._al_terminar(etiqueta, cerrado)
+
+    def _al_terminar(self, etiqueta: str, cerrado: bool) -> None:
+        """Se llama cada vez que un elemento sale de la pila, cerrado o no."""
+
+    def handle_starttag(self, tag, attrs):
+        self._marcar_contenido()
+        self.etiquetas[tag] = self.etiquetas.get(tag, 0) + 1
+
+        if tag == "img":
+            if not any(nombre == "alt" for nombre, _ in attrs):
+                self.imgs_sin_alt += 1
+        elif tag == "input":
+            self.inputs += 1
+        elif tag == "label":
+            self.labels += 1
+
+        if tag not in ELEMENTOS_VACIOS:
+            self._pila.append(tag)
+            self._abiertas[tag] = self._abiertas.get(tag, 0) + 1
+            if tag == "a":
+                self._enlaces.append(False)
+
+    def handle_startendtag(self, tag, attrs):
+        # <x/> queda cerrado en el acto
+        self.handle_starttag(tag, attrs)
+        if tag not in ELEMENTOS_VACIOS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not self._abiertas.get(tag):
+            # Cierre sin apertura (o de un elemento vacío): no cambia la pila
+            return
+        # Todo lo que quedó abierto por encima del elemento se cerró implícitamente
+        while self._pila[-1] != tag:
+            self._desapilar(cerrado=False)
+        self._desapilar()
+
+    def handle_data(self, data):
+        if self._enlaces and not data.isspace():
+            self._enlaces[-1] = True
+
+    def close(self) -> None:
+        if self._cerrado:
+            return
+        super().close()
+        while self._pila:
+            self._desapilar(cerrado=False)
+        self._cerrado = True
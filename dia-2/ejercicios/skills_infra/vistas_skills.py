@@ -0,0 +1,425 @@
+"""
+Vistas de SkillManager con copia al escribir
+============================================
+
+``SkillManagerOperations.union()`` y compañía crean un SkillManager nuevo y
+registran en él cada skill de los managers de entrada: componer el catálogo de
+cada cliente a partir de bibliotecas grandes copia el registry entero cada vez.
+
+``OperacionesVista`` tiene las mismas operaciones, pero devuelve una
+``VistaSkills``: un SkillManager cuyo registry es una vista sobre los registries
+de sus padres. Crearla no recorre ninguna skill, recorrerla cuesta lo que el
+resultado (la intersección y las diferencias, lo que su primer manager) y miles
+de vistas comparten las mismas funciones. La vista refleja los cambios de sus
+padres hasta que se modifica: registrar, quitar, limpiar o actualizar metadata
+la materializa en un registry propio, sin tocar a los padres.
+
+    cliente = OperacionesVista.difference(
+        OperacionesVista.union(biblioteca_base, extras_cliente),
+        bloqueadas_cliente,
+    )
+    agente.capabilities = cliente
+"""
+
+import copy
+import types
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from instantneo.skills import SkillManager
+from instantneo.skills.skill_manager_operations import SkillManagerOperations
+
+OPERACIONES = ("union", "intersection", "difference", "symmetric_difference")
+
+
+def _tiene_nombre(manager) -> Callable[[str], bool]:
+    """Función que dice si el manager tiene una skill con un nombre, sin materializar vistas."""
+    registro = manager.registry
+    if isinstance(registro, RegistroVista):
+        return registro.tiene_nombre
+    return manager.registry_by_name.__contains__
+
+
+def _como_dict(manager) -> Dict[str, Any]:
+    registro = manager.registry
+    return registro.resultado() if isinstance(registro, RegistroVista) else registro
+
+
+def _de_nombre(manager, nombre: str) -> Dict[str, Any]:
+    """Las entradas del registry del manager con ese nombre de skill, en orden de registro."""
+    registro = manager.registry
+    if isinstance(registro, RegistroVista):
+        return registro.de_nombre(nombre)
+    # register_tool deja cada función en registry_by_name o en duplicates; los
+    # dos pueden tener funciones ya quitadas o reemplazadas en el registry
+    candidatas = manager.registry_by_name.get(nombre, []) + getattr(manager, "duplicates", {}).get(nombre, [])
+    encontradas = {}
+    for funcion in candidatas:
+        clave = f"{funcion.__module__}.{nombre}"
+        if registro.get(clave) is funcion:
+            encontradas[clave] = funcion
+    if len(encontradas) > 1:
+        # Solo con nombres repetidos hace falta recorrer el registry para tener su orden
+        return {clave: funcion for clave, funcion in registro.items() if clave in encontradas}
+    return encontradas
+
+
+def _indices_por_nombre(funciones) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+    """``registry_by_name`` y ``duplicates`` como los arma ``register_tool`` en ese orden."""
+    por_nombre: Dict[str, List[Any]] = {}
+    duplicados: Dict[str, List[Any]] = {}
+    for funcion in funciones:
+        if funcion.__name__ in por_nombre:
+            duplicados.setdefault(funcion.__name__, []).append(funcion)
+        else:
+            por_nombre[funcion.__name__] = [funcion]
+    return por_nombre, duplicados
+
+
+def _copiar_skill(funcion: Callable) -> Callable:
+    """Copia de la skill con su propia metadata; el código y el módulo se comparten."""
+    if isinstance(funcion, types.FunctionType):
+        copia = types.FunctionType(
+            funcion.__code__, funcion.__globals__, funcion.__name__, funcion.__defaults__, funcion.__closure__
+        )
+        copia.__dict__.update(funcion.__dict__)
+        copia.__kwdefaults__ = funcion.__kwdefaults__
+        copia.__module__ = funcion.__module__
+        copia.__qualname__ = funcion.__qualname__
+        copia.__doc__ = funcion.__doc__
+    else:
+        copia = copy.copy(funcion)
+    metadata = getattr(funcion, "tool_metadata", None)
+    if metadata is None:
+        metadata = funcion.skill_metadata
+    copia.tool_metadata = copia.skill_metadata = dict(metadata)
+    return copia
+
+
+class RegistroVista(Mapping):
+    """
+    Registry de solo lectura (clave "modulo.nombre" -> función) que resulta de
+    aplicar una operación de conjunto a los registries de los padres, calculado
+    en cada acceso.
+
+    Como en ``SkillManagerOperations``, la intersección y las diferencias
+    comparan por nombre de skill y toman las funciones del primer manager que
+    las tiene; en la unión, si dos padres tienen la misma clave gana el último.
+    """
+
+    __slots__ = ("operacion", "padres")
+
+    def __init__(self, operacion: str, padres: Sequence):
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {operacion!r}")
+        if operacion in ("difference", "symmetric_difference") and len(padres) != 2:
+            raise ValueError(f"{operacion} necesita exactamente dos managers")
+        self.operacion = operacion
+        self.padres = tuple(padres)
+
+    def tiene_nombre(self, nombre: str) -> bool:
+        padres = self.padres
+        if not padres:
+            return False
+        if self.operacion == "union":
+            return any(_tiene_nombre(padre)(nombre) for padre in padres)
+        if self.operacion == "intersection":
+            return all(_tiene_nombre(padre)(nombre) for padre in padres)
+        en_a, en_b = _tiene_nombre(padres[0])(nombre), _tiene_nombre(padres[1])(nombre)
+        return en_a and not en_b if self.operacion == "difference" else en_a != en_b
+
+    def resultado(self) -> Dict[str, Any]:
+        """
+        El registry resultante como dict nuevo, en una pasada sobre los padres
+        (los de la intersección y las diferencias, solo sobre el primero).
+        """
+        padres = self.padres
+        if self.operacion == "union":
+            # Como register_tool: la clave queda en su primera posición con la última función
+            resultado: Dict[str, Any] = {}
+            for padre in padres:
+                resultado.update(_como_dict(padre))
+            return resultado
+        if not padres:
+            return {}
+        if self.operacion == "intersection":
+            en_todos = [_tiene_nombre(padre) for padre in padres[1:]]
+            return {
+                clave: funcion for clave, funcion in _como_dict(padres[0]).items()
+                if all(tiene(funcion.__name__) for tiene in en_todos)
+            }
+        en_b = _tiene_nombre(padres[1])
+        resultado = {clave: funcion for clave, funcion in _como_dict(padres[0]).items() if not en_b(funcion.__name__)}
+        if self.operacion == "symmetric_difference":
+            en_a = _tiene_nombre(padres[0])
+            resultado.update(
+                (clave, funcion) for clave, funcion in _como_dict(padres[1]).items() if not en_a(funcion.__name__)
+            )
+        return resultado
+
+    def de_nombre(self, nombre: str) -> Dict[str, Any]:
+        """
+        Las entradas del resultado con ese nombre de skill, en el orden de
+        ``resultado()``, sin armar el resultado completo.
+        """
+        padres = self.padres
+        if self.operacion == "union":
+            resultado: Dict[str, Any] = {}
+            for padre in padres:
+                resultado.update(_de_nombre(padre, nombre))
+            return resultado
+        if not padres:
+            return {}
+        if self.operacion == "intersection":
+            if all(_tiene_nombre(padre)(nombre) for padre in padres[1:]):
+                return _de_nombre(padres[0], nombre)
+            return {}
+        en_a, en_b = _tiene_nombre(padres[0])(nombre), _tiene_nombre(padres[1])(nombre)
+        resultado = {} if en_b else _de_nombre(padres[0], nombre)
+        if self.operacion == "symmetric_difference" and not en_a:
+            resultado.update(_de_nombre(padres[1], nombre))
+        return resultado
+
+    def __getitem__(self, clave: str) -> Any:
+        padres = self.padres
+        if self.operacion == "union":
+            for padre in reversed(padres):
+                if clave in padre.registry:
+                    return padre.registry[clave]
+            raise KeyError(clave)
+        origenes = (0, 1) if self.operacion == "symmetric_difference" else (0,)
+        for origen in origenes:
+            if origen < len(padres) and clave in padres[origen].registry:
+                funcion = padres[origen].registry[clave]
+                if self.operacion == "intersection":
+                    incluida = all(_tiene_nombre(padre)(funcion.__name__) for padre in padres[1:])
+                else:
+                    incluida = not _tiene_nombre(padres[1 - origen])(funcion.__name__)
+                if incluida:
+                    return funcion
+        raise KeyError(clave)
+
+    # Recorrer con la Mapping genérica buscaría cada clave en toda la cadena de
+    # vistas: keys(), values() e items() recorren un resultado armado de una vez
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.resultado())
+
+    def __len__(self) -> int:
+        return len(self.resultado())
+
+    def keys(self):
+        return self.resultado().keys()
+
+    def values(self):
+        return self.resultado().values()
+
+    def items(self):
+        return self.resultado().items()
+
+    def __repr__(self) -> str:
+        return f"RegistroVista({self.operacion}, {len(self.padres)} managers)"
+
+
+class _IndicePorNombre(Mapping):
+    """
+    ``registry_by_name`` (o ``duplicates``) de una vista sin materializar:
+    cada nombre se resuelve con ``RegistroVista.de_nombre()`` y solo recorrerlo
+    arma el índice completo.
+    """
+
+    __slots__ = ("vista", "duplicados")
+
+    def __init__(self, vista: RegistroVista, duplicados: bool = False):
+        self.vista = vista
+        self.duplicados = duplicados
+
+    def __getitem__(self, nombre: str) -> List[Any]:
+        funciones = list(self.vista.de_nombre(nombre).values())
+        # Como register_tool: la primera en registry_by_name, el resto en duplicates
+        funciones = funciones[1:] if self.duplicados else funciones[:1]
+        if not funciones:
+            raise KeyError(nombre)
+        return funciones
+
+    def _completo(self) -> Dict[str, List[Any]]:
+        return _indices_por_nombre(self.vista.resultado().values())[1 if self.duplicados else 0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._completo())
+
+    def __len__(self) -> int:
+        return len(self._completo())
+
+    def keys(self):
+        return self._completo().keys()
+
+    def values(self):
+        return self._completo().values()
+
+    def items(self):
+        return self._completo().items()
+
+
+class VistaSkills(SkillManager):
+    """
+    SkillManager cuyo registry es una ``RegistroVista`` hasta la primera
+    modificación, que lo copia a un registry propio (``materializar()``).
+
+    Actualizar la metadata de una skill heredada de los padres la reemplaza en
+    la vista por una copia con su propia metadata: los padres no cambian.
+
+    Args:
+        operacion: Una de ``OPERACIONES``
+        padres: SkillManagers (o vistas) de entrada
+        name, description, global_instructions: Como en SkillManager
+    """
+
+    def __init__(
+        self,
+        operacion: str,
+        padres: Sequence,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        global_instructions: str = ""
+    ):
+        self._vista: Optional[RegistroVista] = RegistroVista(operacion, padres)
+        self._heredadas: Set[str] = set()
+        super().__init__(name=name, description=description, global_instructions=global_instructions)
+
+    # SkillManager.__init__ asigna registry, registry_by_name y duplicates: las
+    # propiedades guardan esos valores y los devuelven una vez materializada
+
+    @property
+    def registry(self) -> Mapping:
+        return self._vista if self._vista is not None else self._registro
+
+    @registry.setter
+    def registry(self, valor: Dict[str, Any]) -> None:
+        self._registro = valor
+
+    @property
+    def registry_by_name(self) -> Mapping:
+        if self._vista is not None:
+            return _IndicePorNombre(self._vista)
+        return self._por_nombre
+
+    @registry_by_name.setter
+    def registry_by_name(self, valor: Dict[str, List[Any]]) -> None:
+        self._por_nombre = valor
+
+    @property
+    def duplicates(self) -> Mapping:
+        if self._vista is not None:
+            return _IndicePorNombre(self._vista, duplicados=True)
+        return self._duplicados
+
+    @duplicates.setter
+    def duplicates(self, valor: Dict[str, List[Any]]) -> None:
+        self._duplicados = valor
+
+    @property
+    def materializada(self) -> bool:
+        return self._vista is None
+
+    def materializar(self) -> None:
+        """Copia el resultado actual a un registry propio; desde ahí no sigue a los padres."""
+        if self._vista is None:
+            return
+        registro = self._vista.resultado()
+        self._vista = None
+        self._registro = registro
+        self._por_nombre, self._duplicados = _indices_por_nombre(registro.values())
+        self._heredadas = set(registro)
+
+    def register_tool(self, func) -> None:
+        self.materializar()
+        super().register_tool(func)
+        self._heredadas.discard(f"{func.__module__}.{func.__name__}")
+
+    def remove_tool(self, name: str, module: Optional[str] = None) -> bool:
+        self.materializar()
+        return super().remove_tool(name, module)
+
+    def clear_registry(self) -> None:
+        # No hace falta copiar lo que se va a borrar
+        self._vista = None
+        self._heredadas = set()
+        self._registro, self._por_nombre, self._duplicados = {}, {}, {}
+
+    def update_tool_metadata(self, key: str, new_metadata: Dict[str, Any]) -> bool:
+        self.materializar()
+        if key in self._heredadas:
+            self._heredadas.discard(key)
+            original = self._registro[key]
+            copia = _copiar_skill(original)
+            self._registro[key] = copia
+            for indice in (self._por_nombre, self._duplicados):
+                funciones = indice.get(copia.__name__, [])
+                indice[copia.__name__] = [copia if funcion is original else funcion for funcion in funciones]
+                if not indice[copia.__name__]:
+                    del indice[copia.__name__]
+        return super().update_tool_metadata(key, new_metadata)
+
+    def deactivate(self, name: str) -> bool:
+        self.materializar()
+        return super().deactivate(name)
+
+    # run() busca cada skill por nombre: la clase base recorre el registry entero
+
+    def get_tool_by_name(self, name: str) -> Union[Any, Dict[str, Any], None]:
+        if self._vista is None:
+            return super().get_tool_by_name(name)
+        coincidencias = self._vista.de_nombre(name)
+        if len(coincidencias) > 1:
+            return coincidencias
+        return next(iter(coincidencias.values()), None)
+
+    def get_tool_metadata_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        if self._vista is None:
+            return super().get_tool_metadata_by_name(name)
+        funcion = next(iter(self._vista.de_nombre(name).values()), None)
+        if funcion is None:
+            return None
+        return funcion.tool_metadata if hasattr(funcion, "tool_metadata") else funcion.skill_metadata
+
+    # Los alias de SkillManager apuntan a los métodos de la clase base
+    remove_skill = remove_tool
+    update_skill_metadata = update_tool_metadata
+    get_skill_by_name = get_tool_by_name
+    get_skill_metadata_by_name = get_tool_metadata_by_name
+
+    def __repr__(self) -> str:
+        estado = "materializada" if self._vista is None else repr(self._vista)
+        return f"VistaSkills({estado})"
+
+
+class OperacionesVista:
+    """Las operaciones de ``SkillManagerOperations``, devolviendo vistas en lugar de copias."""
+
+    @staticmethod
+    def union(*managers) -> VistaSkills:
+        """Todas las skills de los managers; concatena sus instrucciones globales distintas."""
+        instrucciones: List[str] = []
+        for manager in managers:
+            texto = manager.get_global_instructions() if hasattr(manager, "get_global_instructions") else ""
+            if texto and texto not in instrucciones:
+                instrucciones.append(texto)
+        return VistaSkills("union", managers, global_instructions="\n\n".join(instrucciones))
+
+    @staticmethod
+    def intersection(*managers) -> VistaSkills:
+        """Skills cuyo nombre está en todos los managers, tomadas del primero."""
+        return VistaSkills("intersection", managers)
+
+    @staticmethod
+    def difference(base_manager, exclude_manager) -> VistaSkills:
+        """Skills de ``base_manager`` cuyo nombre no está en ``exclude_manager``."""
+        return VistaSkills("difference", (base_manager, exclude_manager))
+
+    @staticmethod
+    def symmetric_difference(manager_a, manager_b) -> VistaSkills:
+        """Skills cuyo nombre está en uno solo de los dos managers."""
+        return VistaSkills("symmetric_difference", (manager_a, manager_b))
+
+    compare = staticmethod(SkillManagerOperations.compare)
@@ -8,16 +8,29 @@ según el contexto, cargando y descargando skills según sea necesario.
 CARACTERÍSTICAS:
 ✓ Detección automática de tipo de producto
 ✓ Carga dinámica de skills específicas por producto
-✓ Limpieza de registry entre cambios
+✓ Un SkillManager por producto, cargado una vez y activado por ticket
 ✓ Procesamiento de múltiples tickets con diferentes contextos
 ✓ BONUS: Modo admin con todas las skills cargadas
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from instantneo import InstantNeo
 from instantneo.skills import SkillManager
 
+# skills_infra vive en dia-2/ejercicios: junto a este archivo si se copia allí,
+# o en la carpeta hermana si se ejecuta desde soluciones/
+for _ruta in (Path(__file__).resolve().parent, Path(__file__).resolve().parents[1] / "ejercicios"):
+    if (_ruta / "skills_infra").is_dir():
+        if str(_ruta) not in sys.path:
+            sys.path.insert(0, str(_ruta))
+        break
+
+from skills_infra.palabras_clave import MotorPalabrasClave
+from skills_infra.pool_skills import PoolSkills
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -68,6 +81,25 @@ tickets = [
 
 # ==================== SOLUCIÓN 1: DETECTAR PRODUCTO ====================
 
+# Palabras clave por tipo de producto. El orden de los productos desempata:
+# con el mismo puntaje gana api, luego webapp, luego mobile.
+# El motor se arma una sola vez, no en cada ticket.
+MOTOR_PRODUCTOS = MotorPalabrasClave({
+    "api": [
+        "endpoint", "api", "rest", "http", "status code",
+        "logs api", "servicio", "backend", "servidor"
+    ],
+    "webapp": [
+        "html", "javascript", "css", "dom", "navegador",
+        "frontend", "página", "web", "accesibilidad", "seo"
+    ],
+    "mobile": [
+        "app", "móvil", "android", "ios", "crash",
+        "permisos", "cámara", "mobile", "smartphone", "tablet"
+    ],
+})
+
+
 def detectar_producto(descripcion_ticket: str) -> str:
     """
     Detecta el tipo de producto basándose en palabras clave en el ticket.
@@ -78,86 +110,53 @@ def detectar_producto(descripcion_ticket: str) -> str:
     Returns:
         "api", "webapp", "mobile" o "desconocido"
     """
-    descripcion = descripcion_ticket.lower()
+    # Cada producto suma un punto por palabra clave que aparece en el ticket
+    # (en minúsculas); gana el de mayor puntaje
+    return MOTOR_PRODUCTOS.mejor(descripcion_ticket) or "desconocido"
 
-    # Definir palabras clave por tipo de producto
-    keywords_api = [
-        "endpoint", "api", "rest", "http", "status code",
-        "logs api", "servicio", "backend", "servidor"
-    ]
-
-    keywords_webapp = [
-        "html", "javascript", "css", "dom", "navegador",
-        "frontend", "página", "web", "accesibilidad", "seo"
-    ]
-
-    keywords_mobile = [
-        "app", "móvil", "android", "ios", "crash",
-        "permisos", "cámara", "mobile", "smartphone", "tablet"
-    ]
 
-    # Contar coincidencias para cada tipo
-    score_api = sum(1 for kw in keywords_api if kw in descripcion)
-    score_webapp = sum(1 for kw in keywords_webapp if kw in descripcion)
-    score_mobile = sum(1 for kw in keywords_mobile if kw in descripcion)
+# ==================== SOLUCIÓN 2: ACTIVAR SKILLS ====================
 
-    # Retornar el tipo con mayor score
-    max_score = max(score_api, score_webapp, score_mobile)
+# Productos con carpeta de skills propia
+PRODUCTOS = ("api", "webapp", "mobile")
 
-    if max_score == 0:
-        return "desconocido"
 
-    if score_api == max_score:
-        return "api"
-    elif score_webapp == max_score:
-        return "webapp"
-    else:
-        return "mobile"
+def crear_pool_skills() -> PoolSkills:
+    """
+    Carga una sola vez las skills de cada producto, cada uno en su SkillManager.
 
+    Returns:
+        Pool con los productos de PRODUCTOS cuya carpeta existe
+    """
+    disponibles = [p for p in PRODUCTOS if os.path.isdir(os.path.join(SKILLS_BASE_PATH, p))]
+    for producto in PRODUCTOS:
+        if producto not in disponibles:
+            print(f"   ⚠️  {producto}/ - carpeta no encontrada, sus tickets no tendrán skills")
+    return PoolSkills(SKILLS_BASE_PATH, disponibles)
 
-# ==================== SOLUCIÓN 2: CARGAR SKILLS ====================
 
-def cargar_skills_producto(skill_manager: SkillManager, producto: str) -> bool:
+def activar_skills_producto(agente: InstantNeo, pool: PoolSkills, producto: str) -> bool:
     """
-    Limpia el registry y carga las skills específicas del producto.
+    Cambia las skills del agente por las del producto, ya cargadas en el pool.
+
+    Antes se limpiaba el registry y se volvía a cargar la carpeta del producto
+    en cada ticket; ahora cambiar de producto no importa ningún módulo.
 
     Args:
-        skill_manager: Instancia del SkillManager del agente
+        agente: Agente que atiende los tickets
+        pool: Pool creado con crear_pool_skills()
         producto: Tipo de producto ("api", "webapp", "mobile")
 
     Returns:
-        True si se cargaron skills, False si no
+        True si el producto tiene skills, False si no
     """
-
-    # 1. Limpiar el registry de skills existentes
-    print(f"   🧹 Limpiando registry...")
-    skills_antes = skill_manager.get_skill_names()
-    print(f"      Skills antes de limpiar: {len(skills_antes)}")
-
-    skill_manager.clear_registry()
-
-    skills_despues_limpiar = skill_manager.get_skill_names()
-    print(f"      Skills después de limpiar: {len(skills_despues_limpiar)}")
-
-    # 2. Construir ruta de carpeta de skills del producto
-    producto_path = os.path.join(SKILLS_BASE_PATH, producto)
-    print(f"   📂 Buscando skills en: {producto_path}")
-
-    # 3. Verificar que existe la carpeta
-    if not os.path.exists(producto_path):
-        print(f"      ❌ ERROR: Carpeta no encontrada")
-        return False
-
-    # 4. Cargar skills de la carpeta
-    try:
-        skill_manager.load_skills.from_folder(producto_path)
-    except Exception as e:
-        print(f"      ❌ ERROR al cargar skills: {e}")
+    if producto not in pool:
+        print(f"      ❌ ERROR: No hay skills cargadas para {producto}")
         return False
 
-    # 5. Verificar que se cargaron skills
+    skill_manager = pool.activar(agente, producto)
     skills_cargadas = skill_manager.get_skill_names()
-    print(f"   ✓ Skills cargadas: {len(skills_cargadas)}")
+    print(f"   ✓ Skills activas: {len(skills_cargadas)}")
 
     if len(skills_cargadas) > 0:
         print(f"      📋 Lista de skills:")
@@ -176,6 +175,15 @@ def procesar_tickets():
     Procesa todos los tickets cambiando las skills dinámicamente.
     """
 
+    # Cargar las skills de todos los productos una sola vez
+    print("📦 Cargando skills por producto...")
+    try:
+        pool = crear_pool_skills()
+    except Exception as e:
+        print(f"   ❌ ERROR al cargar skills: {e}")
+        return
+    print(f"   ✓ Productos listos: {', '.join(pool.productos)}")
+
     # Crear el agente (se reutiliza, solo cambian las skills)
     agente = InstantNeo(
         api_key=API_KEY,
@@ -203,9 +211,9 @@ def procesar_tickets():
             print("   💡 Procesando con skills genéricas...")
             continue
 
-        # 2. Cargar skills del producto
-        print(f"\n🔧 Cargando skills específicas de {producto_detectado.upper()}...")
-        skills_cargadas = cargar_skills_producto(agente.skill_manager, producto_detectado)
+        # 2. Activar las skills del producto
+        print(f"\n🔧 Activando skills específicas de {producto_detectado.upper()}...")
+        skills_cargadas = activar_skills_producto(agente, pool, producto_detectado)
 
         if not skills_cargadas:
             print("   ❌ No se pudieron cargar las skills")
@@ -393,8 +401,8 @@ def main():
 CONCEPTOS APRENDIDOS:
 ✓ Detección dinámica de contexto
 ✓ Carga/descarga de skills según necesidad
-✓ Uso de clear_registry() para limpiar skills
 ✓ Uso de load_skills.from_folder() para carga dinámica
+✓ Un SkillManager precargado por producto en lugar de recargar por ticket
 ✓ Agentes multi-modo que adaptan sus capacidades
 ✓ Gestión eficiente de recursos (solo cargar lo necesario)
 
@@ -420,8 +428,9 @@ NOTAS SOBRE LA IMPLEMENTACIÓN:
    - Se puede mejorar usando embeddings o clasificación con IA
 
 2. CARGA DINÁMICA:
-   - clear_registry() asegura estado limpio
    - from_folder() carga automáticamente todas las skills de una carpeta
+   - Cada carpeta se carga una vez en su propio SkillManager (PoolSkills);
+     por ticket solo se cambia cuál usa el agente, sin volver a importar
    - Manejo robusto de errores
 
 3. PROCESAMIENTO:
@@ -435,7 +444,6 @@ NOTAS SOBRE LA IMPLEMENTACIÓN:
    - Trade-off: más capacidades = más tokens en prompt
 
 5. MEJORAS POSIBLES:
-   - Cache de skills por producto
    - Lazy loading de skills pesadas
    - Métricas de uso de skills
    - Versionado de skills
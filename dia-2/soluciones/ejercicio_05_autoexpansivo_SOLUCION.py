@@ -9,14 +9,29 @@ El agente puede:
 2. Buscar skills en una biblioteca externa
 3. Cargar skills dinámicamente bajo demanda
 4. Reintentar la ejecución con las nuevas capacidades
+5. Con la política "prefetch", predecir y precargar las skills antes de la
+   primera llamada, sin preguntar (python ejercicio_05_autoexpansivo_SOLUCION.py --prefetch)
 """
 
 from instantneo import InstantNeo
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-import re
+from typing import Optional
 from dotenv import load_dotenv
 
+# skills_infra vive en dia-2/ejercicios: junto a este archivo si se copia allí,
+# o en la carpeta hermana si se ejecuta desde soluciones/
+for _ruta in (Path(__file__).resolve().parent, Path(__file__).resolve().parents[1] / "ejercicios"):
+    if (_ruta / "skills_infra").is_dir():
+        if str(_ruta) not in sys.path:
+            sys.path.insert(0, str(_ruta))
+        break
+
+from skills_infra.palabras_clave import MotorPalabrasClave
+from skills_infra.prefetch_skills import PrefetchSkills
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -34,26 +49,10 @@ print(f"🔧 Modelo configurado: {GROQ_MODEL}")
 # ============================================================================
 # SOLUCIÓN 1: Detectar si el agente puede procesar la tarea
 # ============================================================================
-def puede_procesar(respuesta: str) -> bool:
-    """
-    Analiza la respuesta del agente para determinar si puede procesar la tarea
-    o si necesita expandir sus capacidades.
-
-    Parameters
-    ----------
-    respuesta : str
-        La respuesta del agente
 
-    Returns
-    -------
-    bool
-        True si el agente puede procesar (respuesta normal)
-        False si el agente indica que no puede (necesita expansión)
-    """
-    respuesta_lower = respuesta.lower()
-
-    # Frases que indican que el agente NO puede procesar
-    frases_negativas = [
+# Frases que indican que el agente NO puede procesar
+FRASES_NEGATIVAS = MotorPalabrasClave({
+    "no_puede": [
         "no puedo",
         "no tengo",
         "no dispongo",
@@ -67,19 +66,42 @@ def puede_procesar(respuesta: str) -> bool:
         "no es posible",
         "no me es posible"
     ]
+})
 
-    # Si encuentra alguna frase negativa, no puede procesar
-    for frase in frases_negativas:
-        if frase in respuesta_lower:
-            return False
 
-    # Si no encuentra frases negativas, asumimos que puede procesar
-    return True
+def puede_procesar(respuesta: str) -> bool:
+    """
+    Analiza la respuesta del agente para determinar si puede procesar la tarea
+    o si necesita expandir sus capacidades.
+
+    Parameters
+    ----------
+    respuesta : str
+        La respuesta del agente
+
+    Returns
+    -------
+    bool
+        True si el agente puede procesar (respuesta normal)
+        False si el agente indica que no puede (necesita expansión)
+    """
+    # Si encuentra alguna frase negativa (sin importar mayúsculas), no puede
+    # procesar; si no, asumimos que puede
+    return not FRASES_NEGATIVAS.contiene(respuesta)
 
 
 # ============================================================================
 # SOLUCIÓN 2: Buscar skills disponibles en la biblioteca
 # ============================================================================
+
+# Mapeo de archivos a palabras clave, en orden de prioridad
+MAPEO_SKILLS = MotorPalabrasClave({
+    "estadisticas/mediana.py": ["mediana"],
+    "estadisticas/desviacion_std.py": ["desviacion", "std", "estandar"],
+    "ml/regresion_simple.py": ["regresion", "regresión", "lineal"],
+})
+
+
 def buscar_skill_disponible(nombre_skill: str, biblioteca_path: str) -> str:
     """
     Busca un archivo de skill en la biblioteca que coincida con el nombre.
@@ -96,25 +118,11 @@ def buscar_skill_disponible(nombre_skill: str, biblioteca_path: str) -> str:
     str
         Ruta completa al archivo .py que contiene la skill, o None si no se encuentra
     """
-    nombre_lower = nombre_skill.lower()
-
-    # Mapeo de palabras clave a archivos
-    mapeo_skills = {
-        "mediana": "estadisticas/mediana.py",
-        "desviacion": "estadisticas/desviacion_std.py",
-        "std": "estadisticas/desviacion_std.py",
-        "estandar": "estadisticas/desviacion_std.py",
-        "regresion": "ml/regresion_simple.py",
-        "regresión": "ml/regresion_simple.py",
-        "lineal": "ml/regresion_simple.py",
-    }
-
-    # Buscar coincidencia
-    for palabra_clave, archivo_relativo in mapeo_skills.items():
-        if palabra_clave in nombre_lower:
-            ruta_completa = os.path.join(biblioteca_path, archivo_relativo)
-            if os.path.exists(ruta_completa):
-                return ruta_completa
+    # Archivos con alguna palabra clave en el nombre, en orden de prioridad
+    for archivo_relativo in MAPEO_SKILLS.encontradas(nombre_skill):
+        ruta_completa = os.path.join(biblioteca_path, archivo_relativo)
+        if os.path.exists(ruta_completa):
+            return ruta_completa
 
     return None
 
@@ -122,14 +130,51 @@ def buscar_skill_disponible(nombre_skill: str, biblioteca_path: str) -> str:
 # ============================================================================
 # SOLUCIÓN 3: Loop de expansión automática
 # ============================================================================
-def ejecutar_con_autoexpansion(agente: InstantNeo, query: str, biblioteca_path: str, max_intentos: int = 3):
+
+# "interactiva": expande solo ante un rechazo y pregunta antes de cargar
+# "prefetch": precarga las skills predichas y, si igual hay un rechazo, expande sin preguntar
+POLITICAS = ("interactiva", "prefetch")
+
+
+@dataclass
+class EstadisticasAutoexpansion:
+    """Contadores acumulados entre queries para comparar políticas."""
+
+    queries: int = 0
+    llamadas_llm: int = 0
+    archivos_precargados: int = 0
+    expansiones_por_rechazo: int = 0
+    # Queries que respondió la primera llamada gracias a una precarga: sin ella
+    # habrían costado una llamada rechazada y un reintento
+    rondas_ahorradas: int = 0
+
+    def resumen(self) -> str:
+        return (
+            f"{self.queries} queries, {self.llamadas_llm} llamadas al LLM, "
+            f"{self.archivos_precargados} archivos precargados, "
+            f"{self.expansiones_por_rechazo} expansiones por rechazo, "
+            f"{self.rondas_ahorradas} rondas ahorradas"
+        )
+
+
+def ejecutar_con_autoexpansion(
+    agente: InstantNeo,
+    query: str,
+    biblioteca_path: str,
+    max_intentos: int = 3,
+    politica: str = "interactiva",
+    prefetch: Optional[PrefetchSkills] = None,
+    estadisticas: Optional[EstadisticasAutoexpansion] = None,
+):
     """
     Ejecuta un query con capacidad de auto-expansión.
 
-    Si el agente no puede procesar la tarea:
+    Con la política "prefetch", antes de la primera llamada carga las skills
+    que el índice de la biblioteca predice para el query. Si el agente igual
+    no puede procesar la tarea (o con la política "interactiva"):
     1. Detecta qué skill necesita
     2. Busca la skill en la biblioteca
-    3. Pregunta al usuario si desea cargarla
+    3. Pregunta al usuario si desea cargarla (solo en "interactiva")
     4. Carga la skill dinámicamente
     5. Reintenta la ejecución
 
@@ -143,18 +188,47 @@ def ejecutar_con_autoexpansion(agente: InstantNeo, query: str, biblioteca_path:
         Ruta a la biblioteca de skills
     max_intentos : int
         Número máximo de intentos de expansión
+    politica : str
+        Una de POLITICAS
+    prefetch : PrefetchSkills, optional
+        Índice de la biblioteca; conviene armarlo una vez y reusarlo entre queries
+    estadisticas : EstadisticasAutoexpansion, optional
+        Contadores a actualizar
+
+    Returns
+    -------
+    str
+        La respuesta del agente, o None si no pudo completar la tarea
     """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconocida: {politica!r} (opciones: {', '.join(POLITICAS)})")
+    if estadisticas is None:
+        estadisticas = EstadisticasAutoexpansion()
+    estadisticas.queries += 1
+
+    precargados = []
+    if politica == "prefetch":
+        if prefetch is None:
+            prefetch = PrefetchSkills(biblioteca_path)
+        precargados = prefetch.precargar(agente, query)
+        estadisticas.archivos_precargados += len(precargados)
+        if precargados:
+            print(f"\n→ Precarga: {', '.join(os.path.basename(ruta) for ruta in precargados)}")
+
     for intento in range(max_intentos):
         print(f"\n[Intento {intento + 1}/{max_intentos}]")
 
         # Intentar ejecutar el query
         respuesta = agente.run(query)
+        estadisticas.llamadas_llm += 1
 
         # Verificar si el agente puede procesar
         if puede_procesar(respuesta):
+            if intento == 0 and precargados:
+                estadisticas.rondas_ahorradas += 1
             print("\n✓ ÉXITO: El agente completó la tarea")
             print(f"\nRespuesta: {respuesta}")
-            return
+            return respuesta
 
         # El agente no puede procesar - necesita expansión
         print("\n⚠ DETECCIÓN: El agente no puede completar la tarea")
@@ -178,17 +252,19 @@ def ejecutar_con_autoexpansion(agente: InstantNeo, query: str, biblioteca_path:
 
         print(f"→ Skill encontrada en: {ruta_skill}")
 
-        # Preguntar al usuario si desea cargar la skill
-        respuesta_usuario = input("\n¿Desea cargar esta skill? (s/n): ").strip().lower()
+        # Preguntar al usuario si desea cargar la skill (la política prefetch no pregunta)
+        if politica == "interactiva":
+            respuesta_usuario = input("\n¿Desea cargar esta skill? (s/n): ").strip().lower()
 
-        if respuesta_usuario != 's':
-            print("\n✗ Usuario canceló la carga de la skill")
-            break
+            if respuesta_usuario != 's':
+                print("\n✗ Usuario canceló la carga de la skill")
+                break
 
         # Cargar la skill dinámicamente
         try:
             print(f"\n→ Cargando skill desde {ruta_skill}...")
-            agente.load_skills.from_file(ruta_skill)
+            agente.skill_manager.load_skills.from_file(ruta_skill)
+            estadisticas.expansiones_por_rechazo += 1
             print(f"✓ Skill cargada exitosamente")
             print(f"Skills actuales: {agente.get_skill_names()}")
         except Exception as e:
@@ -199,11 +275,23 @@ def ejecutar_con_autoexpansion(agente: InstantNeo, query: str, biblioteca_path:
 
     # Si llegamos aquí, agotamos los intentos
     print(f"\n✗ Se agotaron los {max_intentos} intentos sin completar la tarea")
+    return None
 
 
 # ============================================================================
 # FUNCIÓN BONUS: Detección automática de skill necesaria
 # ============================================================================
+
+# Palabras clave en orden de prioridad ("mediana" antes que "media")
+SKILLS_KEYWORDS = MotorPalabrasClave({
+    "regresion": ["regresion", "regresión", "regression"],
+    "desviacion": ["desviacion", "desviación", "std", "estandar", "estándar", "standard deviation"],
+    "mediana": ["mediana", "median"],
+    "promedio": ["promedio", "media", "average", "mean"],
+    "suma": ["suma", "sum"],
+})
+
+
 def detectar_skill_necesaria(query: str, respuesta_agente: str) -> str:
     """
     Analiza el query y la respuesta del agente para determinar automáticamente
@@ -221,22 +309,7 @@ def detectar_skill_necesaria(query: str, respuesta_agente: str) -> str:
     str
         Nombre de la skill necesaria, o None si no se puede determinar
     """
-    texto_completo = (query + " " + respuesta_agente).lower()
-
-    # Palabras clave en orden de prioridad
-    skills_keywords = [
-        ("regresion|regresión|regression", "regresion"),
-        ("desviacion|desviación|std|estandar|estándar|standard deviation", "desviacion"),
-        ("mediana|median", "mediana"),
-        ("promedio|media|average|mean", "promedio"),
-        ("suma|sum", "suma"),
-    ]
-
-    for patron, skill_name in skills_keywords:
-        if re.search(patron, texto_completo):
-            return skill_name
-
-    return None
+    return SKILLS_KEYWORDS.primero(query + " " + respuesta_agente)
 
 
 # ============================================================================
@@ -255,9 +328,11 @@ def main():
         return
 
     BIBLIOTECA_PATH = Path(__file__).parent / "skills_biblioteca"
+    politica = "prefetch" if "--prefetch" in sys.argv[1:] else "interactiva"
 
     print("=" * 70)
     print("EJERCICIO 05: AGENTE AUTO-EXPANSIVO - SOLUCIÓN")
+    print(f"Política: {politica}")
     print("=" * 70)
 
     # Crear agente con solo skills básicas
@@ -271,7 +346,7 @@ def main():
     # Cargar solo skills básicas al inicio
     skills_basicas = BIBLIOTECA_PATH / "basicas"
     if skills_basicas.exists():
-        agente.load_skills.from_folder(str(skills_basicas))
+        agente.skill_manager.load_skills.from_folder(str(skills_basicas))
         print(f"\n✓ Skills básicas cargadas desde: {skills_basicas}")
     else:
         print(f"\n⚠ ADVERTENCIA: No se encontró la carpeta de skills básicas en {skills_basicas}")
@@ -279,6 +354,11 @@ def main():
     print(f"\nSkills iniciales: {agente.get_skill_names()}")
     print("\n" + "=" * 70)
 
+    # El índice de la biblioteca se arma una vez y se reusa en cada query
+    opciones = {"politica": politica, "estadisticas": EstadisticasAutoexpansion()}
+    if politica == "prefetch":
+        opciones["prefetch"] = PrefetchSkills(str(BIBLIOTECA_PATH))
+
     # ========================================================================
     # QUERY 1: Promedio (debe funcionar - ya tiene la skill)
     # ========================================================================
@@ -287,7 +367,8 @@ def main():
     ejecutar_con_autoexpansion(
         agente,
         "Calcula el promedio de estos números: 10, 20, 30, 40, 50",
-        str(BIBLIOTECA_PATH)
+        str(BIBLIOTECA_PATH),
+        **opciones
     )
 
     # ========================================================================
@@ -299,7 +380,8 @@ def main():
     ejecutar_con_autoexpansion(
         agente,
         "Calcula la desviación estándar de estos números: 10, 20, 30, 40, 50",
-        str(BIBLIOTECA_PATH)
+        str(BIBLIOTECA_PATH),
+        **opciones
     )
 
     # ========================================================================
@@ -311,13 +393,15 @@ def main():
     ejecutar_con_autoexpansion(
         agente,
         "Calcula la regresión lineal simple para x=[1,2,3,4,5] y y=[2,4,6,8,10]",
-        str(BIBLIOTECA_PATH)
+        str(BIBLIOTECA_PATH),
+        **opciones
     )
 
     # Mostrar skills finales
     print("\n" + "=" * 70)
     print(f"\nSkills finales: {agente.get_skill_names()}")
     print(f"\nExpansión exitosa: {len(agente.get_skill_names())} skills cargadas")
+    print(f"\nEstadísticas: {opciones['estadisticas'].resumen()}")
     print("\n" + "=" * 70)
 
 
@@ -333,7 +417,7 @@ CÓMO FUNCIONA:
    - Esto indica que el agente necesita expandirse
 
 2. BÚSQUEDA DE SKILLS (buscar_skill_disponible):
-   - Usa un diccionario de mapeo palabra_clave -> archivo
+   - Usa un mapeo archivo -> palabras clave (MotorPalabrasClave)
    - Busca coincidencias en el nombre de la skill
    - Retorna la ruta completa al archivo .py
 
@@ -347,7 +431,7 @@ CÓMO FUNCIONA:
 
 4. BONUS - DETECCIÓN AUTOMÁTICA:
    - Analiza el query y la respuesta del agente
-   - Usa regex para buscar palabras clave
+   - Usa un MotorPalabrasClave (skills_infra) para buscar palabras clave
    - Determina automáticamente qué skill se necesita
 
 FLUJO DE EJECUCIÓN:
@@ -367,6 +451,16 @@ Query 3 (regresión):
   → Pregunta al usuario → Usuario acepta
   → Carga skill → Intento 2: Ejecuta exitosamente
 
+5. POLÍTICA PREFETCH (--prefetch):
+   - PrefetchSkills (skills_infra) indexa con BM25 toda la biblioteca, aparte del agente
+   - Antes de la primera llamada, carga con from_file() los archivos de las skills
+     que mejor coinciden con el query
+   - Query 2 y 3 se responden en la primera llamada: cada una ahorra la llamada
+     rechazada y el reintento
+   - Si la predicción falla, sigue el loop por rechazo, sin preguntar al usuario
+   - EstadisticasAutoexpansion cuenta llamadas al LLM, precargas, expansiones por
+     rechazo y rondas ahorradas
+
 RESULTADO:
 Skills iniciales: ['sumar_lista', 'calcular_promedio']
 Skills finales: ['sumar_lista', 'calcular_promedio', 'calcular_desviacion_estandar', 'regresion_lineal_simple']